@@ -0,0 +1,81 @@
+"""Benchmark — blacklist term matching: per-term str.find vs. Aho–Corasick.
+
+Usage:  python _bench_blacklist.py [pages]
+"""
+
+import random
+import sys
+import time
+
+from api.routers.regions import _accent_fold
+from core.text_utils import accent_fold_with_map
+from core.detection.aho_corasick import AhoCorasick
+
+FIRST = ["Marlowe", "Ombrin", "Velmora", "Halder", "Zoë", "Tessik", "Quentin", "Ångel"]
+LAST = ["Pendry", "Vask", "Quist", "Ångström", "Dubois", "Okafor", "Lindqvist", "Moreau"]
+FILLER = (
+    "the client agreed to the revised schedule and the invoice was settled in full "
+    "after the review meeting with the audit committee and its external advisors"
+).split()
+
+
+def make_terms(n, rng):
+    terms = set()
+    while len(terms) < n:
+        terms.add(f"{rng.choice(FIRST)} {rng.choice(LAST)} {rng.randint(1, 10 ** 6)}")
+    return sorted(terms)
+
+
+def make_page(terms, rng):
+    words = []
+    for _ in range(400):
+        if rng.random() < 0.02:
+            words.extend(rng.choice(terms).split())
+        else:
+            words.append(rng.choice(FILLER))
+    return " ".join(words)
+
+
+def per_term_find(terms, norms):
+    needles = [_accent_fold(t.lower()) for t in terms]
+    hits = 0
+    for full_norm in norms:
+        for needle in needles:
+            i = full_norm.find(needle)
+            while i != -1:
+                hits += 1
+                i = full_norm.find(needle, i + 1)
+    return hits
+
+
+def automaton(matcher, norms):
+    return sum(len(matcher.find_all(full_norm)) for full_norm in norms)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    n_pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(0)
+    print(f"pages={n_pages}")
+    print(f"{'terms':>7} {'str.find':>10} {'build':>9} {'aho-corasick':>13} {'speedup':>8}")
+    for n_terms in (10, 100, 1_000, 10_000):
+        terms = make_terms(n_terms, rng)
+        norms = [accent_fold_with_map(make_page(terms, rng))[0] for _ in range(n_pages)]
+        old_hits, old = timed(per_term_find, terms, norms)
+        matcher, build = timed(AhoCorasick, [_accent_fold(t.lower()) for t in terms])
+        new_hits, scan = timed(automaton, matcher, norms)
+        assert old_hits == new_hits, (old_hits, new_hits)
+        new = build + scan
+        print(
+            f"{n_terms:>7} {old * 1000:>8.1f}ms {build * 1000:>7.1f}ms "
+            f"{new * 1000:>11.1f}ms {old / new:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
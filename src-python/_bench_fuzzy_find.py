@@ -0,0 +1,83 @@
+"""Benchmark — LLM span alignment: plain sliding SequenceMatcher vs.
+_fuzzy_find with exact ratio bounds.
+
+Resolves entity strings that an LLM returned without offsets (re-cased,
+misspelled, re-spaced, or hallucinated) against chunks of page text, the
+way _parse_llm_response does for every finding.
+
+Usage:  python _bench_fuzzy_find.py
+"""
+
+import random
+import time
+from difflib import SequenceMatcher
+
+from core.detection.llm_detector import _fuzzy_find
+
+WORDS = ("le contrat entre la société générale et monsieur jean dupont signé à montréal "
+         "le trois mai par les parties soussignées article annexe bail loyer").split()
+ENTITIES = ["Jean-François Tremblay", "Zoë Ångström-Gagnon", "Club Nautique Jacques-Cartier",
+            "1250 boul. René-Lévesque Ouest", "zoe.angstrom@example.com", "Michael O'Connor"]
+
+
+def old_fuzzy_find(needle, haystack, threshold=0.75):
+    idx = haystack.find(needle)
+    if idx != -1:
+        return idx
+    lower_hay, lower_needle = haystack.lower(), needle.lower()
+    idx = lower_hay.find(lower_needle)
+    if idx != -1:
+        return idx
+    n = len(needle)
+    if n < 3 or n > len(haystack):
+        return None
+    best_ratio, best_idx = 0.0, -1
+    step = max(1, n // 6)
+    for i in range(0, len(haystack) - n + 1, step):
+        ratio = SequenceMatcher(None, lower_needle, haystack[i:i + n].lower()).ratio()
+        if ratio > best_ratio:
+            best_ratio, best_idx = ratio, i
+    if best_idx >= 0 and best_ratio >= threshold * 0.9:
+        for i in range(max(0, best_idx - step), min(len(haystack) - n + 1, best_idx + step + 1)):
+            ratio = SequenceMatcher(None, lower_needle, haystack[i:i + n].lower()).ratio()
+            if ratio > best_ratio:
+                best_ratio, best_idx = ratio, i
+    return best_idx if best_ratio >= threshold else None
+
+
+def mutate(text, rng):
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        chars[rng.randrange(len(chars))] = rng.choice("aeiou ")
+    return "".join(chars)
+
+
+def make_chunk(n_words, rng):
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    for entity in ENTITIES:
+        words.insert(rng.randrange(len(words)), entity)
+    return " ".join(words)
+
+
+def timed(fn, needles, chunk):
+    t0 = time.perf_counter()
+    out = [fn(n, chunk) for n in needles]
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'chunk chars':>12} {'findings':>9} {'old':>9} {'new':>9} {'speedup':>8} {'found':>6}")
+    for n_words, n_findings in ((300, 30), (600, 60), (1200, 120)):
+        chunk = make_chunk(n_words, rng)
+        needles = [mutate(rng.choice(ENTITIES), rng) for _ in range(n_findings)]
+        old, t_old = timed(old_fuzzy_find, needles, chunk)
+        new, t_new = timed(_fuzzy_find, needles, chunk)
+        assert old == new
+        found = sum(r is not None for r in new)
+        print(f"{len(chunk):>12} {n_findings:>9} {t_old * 1000:>7.0f}ms {t_new * 1000:>7.0f}ms "
+              f"{t_old / t_new:>7.1f}x {found:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark — fuzzy highlight-all window search: Counter + SequenceMatcher
+per window vs. FuzzyNeedle.
+
+Replays the fuzzy fallback of ``_highlight_all_impl`` over a document
+whose pages have no exact occurrence of the needle (the case that used
+to pin a core): the old loop built a Counter and, when it passed the
+char-frequency filter, ran SequenceMatcher for every window of five
+sizes.
+
+Usage:  python _bench_fuzzy_highlight.py
+"""
+
+import random
+import time
+from collections import Counter
+from difflib import SequenceMatcher
+
+from api.routers.regions import _CHAR_OVERLAP_MIN_RATIO, _FUZZY_THRESHOLD, _normalize
+from core.detection.fuzzy_match import FuzzyNeedle
+
+WORDS = ("le contrat entre la société générale et monsieur jean dupont signé à montréal "
+         "le trois mai par les parties soussignées club nautique article annexe").split()
+
+
+def make_page(rng, n_words, variant):
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    if variant:
+        words.insert(rng.randrange(n_words), variant)
+    return _normalize(" ".join(words))
+
+
+def sizes_for(needle_len, text_len):
+    sizes = []
+    for tol in (0, 1, 2):
+        if needle_len + tol > text_len:
+            continue
+        sizes.append(needle_len + tol)
+        if tol > 0 and needle_len - tol >= 2:
+            sizes.append(needle_len - tol)
+    return sizes
+
+
+def old_scan(needle, pages):
+    needle_freq = Counter(needle)
+    found = []
+    for pi, text in enumerate(pages):
+        for wlen in sizes_for(len(needle), len(text)):
+            for si in range(len(text) - wlen + 1):
+                chunk = text[si:si + wlen]
+                shared = sum((needle_freq & Counter(chunk)).values())
+                if shared < len(needle) * _CHAR_OVERLAP_MIN_RATIO:
+                    continue
+                if SequenceMatcher(None, needle, chunk).ratio() >= _FUZZY_THRESHOLD:
+                    found.append((pi, si, wlen))
+    return found
+
+
+def new_scan(needle, pages, page_counts):
+    fuzzy = FuzzyNeedle(needle, _FUZZY_THRESHOLD)
+    min_shared = len(needle) * _CHAR_OVERLAP_MIN_RATIO
+    found = []
+    for pi, text in enumerate(pages):
+        if fuzzy.shared_chars(page_counts[pi]) < min_shared:
+            continue
+        for si, wlen in fuzzy.windows(text, sizes_for(len(needle), len(text)), min_shared):
+            found.append((pi, si, wlen))
+    return found
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'needle':>22} {'pages':>6} {'old':>9} {'new':>9} {'speedup':>8} {'hits':>5}")
+    for needle, n_pages in (("jean dupont", 20), ("club nautique gaspe", 20),
+                            ("xavier kowalczyk", 50), ("club nautique gaspe", 50)):
+        variant = needle.replace("a", "o", 1)
+        pages = [make_page(rng, 400, variant if pn % 10 == 0 else None) for pn in range(n_pages)]
+        page_counts = [Counter(p) for p in pages]  # cached per page by highlight-all
+        old, t_old = timed(old_scan, needle, pages)
+        new, t_new = timed(new_scan, needle, pages, page_counts)
+        assert old == new
+        print(f"{needle:>22} {n_pages:>6} {t_old * 1000:>7.0f}ms {t_new * 1000:>7.0f}ms "
+              f"{t_old / t_new:>7.1f}x {len(new):>5}")
+
+
+if __name__ == "__main__":
+    main()
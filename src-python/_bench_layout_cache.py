@@ -0,0 +1,70 @@
+"""Benchmark — layout work per redetect: rebuilt vs. page_layout cache.
+
+Each redetect of a document used to rerun detect_column_bands and
+build_detection_text on every page.  page_layout reuses the stored
+result after checking the page's geometry fingerprint.
+
+Usage:  python _bench_layout_cache.py
+"""
+
+import random
+import time
+
+from core.detection.block_offsets import _compute_block_offsets
+from core.detection.layout import build_detection_text, page_layout
+from core.ingestion.loader import _build_full_text
+from models.schemas import BBox, PageData, TextBlock
+
+WORDS = ["Jean", "Dupont", "12", "rue", "Zoë", "Montréal", "Société", "Générale", "le", "et"]
+
+
+def make_page(pn, n_lines, rng):
+    blocks = []
+    for line in range(n_lines):
+        for col_x in (40.0, 320.0):
+            x = col_x
+            while x < col_x + 240:
+                w = rng.choice(WORDS)
+                y = 30 + 11 * line
+                blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=y, x1=x + 5 * len(w), y1=y + 9)))
+                x += 5 * len(w) + 4
+    return PageData(page_number=pn, width=612, height=792, bitmap_path="",
+                    text_blocks=blocks, full_text=_build_full_text(blocks))
+
+
+def rebuild(pages, offsets):
+    return [build_detection_text(p, bo) for p, bo in zip(pages, offsets)]
+
+
+def cached(pages, offsets):
+    return [page_layout(p, bo).offset_map for p, bo in zip(pages, offsets)]
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    redetects = 5
+    print(f"{'pages':>6} {'blocks/p':>9} {'rebuild':>10} {'cached':>10} {'speedup':>8}   ({redetects} redetects)")
+    for n_pages, n_lines in ((20, 30), (50, 60), (100, 60)):
+        pages = [make_page(pn, n_lines, rng) for pn in range(1, n_pages + 1)]
+        offsets = [_compute_block_offsets(p.text_blocks, p.full_text) for p in pages]
+        expected = rebuild(pages, offsets)
+        assert cached(pages, offsets) == expected  # first detection fills the cache
+        t_old = t_new = 0.0
+        for _ in range(redetects):
+            out, t = timed(rebuild, pages, offsets)
+            t_old += t
+            out, t = timed(cached, pages, offsets)
+            t_new += t
+            assert out == expected
+        n_blocks = len(pages[0].text_blocks)
+        print(f"{n_pages:>6} {n_blocks:>9} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark — _char_offsets_to_line_bboxes per region vs. PageGeometry.
+
+A dense two-column page (~2k blocks) with many regions, as mapped by
+the final step of _merge_detections: one call per region against the
+reusable geometry's batch API.
+
+Usage:  python _bench_line_bboxes.py
+"""
+
+import random
+import time
+
+from core.detection.block_offsets import PageGeometry, _char_offsets_to_line_bboxes, _compute_block_offsets
+from core.ingestion.loader import _build_full_text
+from models.schemas import BBox, TextBlock
+
+WORDS = ["Jean", "Dupont", "12", "rue", "Zoë", "Montréal", "Société", "Générale", "le", "et"]
+
+
+def make_page(n_lines, rng):
+    blocks = []
+    for line in range(n_lines):
+        for col_x in (40.0, 320.0):
+            x = col_x
+            while x < col_x + 240:
+                w = rng.choice(WORDS)
+                y = 30 + 11 * line + rng.uniform(-1, 1)
+                blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=y, x1=x + 5 * len(w), y1=y + 9)))
+                x += 5 * len(w) + 4
+    return blocks, _build_full_text(blocks)
+
+
+def make_spans(n, text_len, rng):
+    spans = []
+    for _ in range(n):
+        start = rng.randrange(text_len)
+        spans.append((start, start + rng.choice([4, 8, 15, 30, 60])))
+    return spans
+
+
+def timed(fn):
+    """(result, best-of-3 seconds)."""
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+
+def main():
+    rng = random.Random(0)
+    blocks, full_text = make_page(70, rng)
+    offsets = _compute_block_offsets(blocks, full_text)
+    print(f"{len(offsets)} blocks")
+    print(f"{'regions':>8} {'per call':>10} {'geometry':>10} {'speedup':>8}")
+    for n in (100, 500, 2_000):
+        spans = make_spans(n, len(full_text), rng)
+        old, t_old = timed(lambda: [_char_offsets_to_line_bboxes(s, e, offsets) for s, e in spans])
+        new, t_new = timed(lambda: PageGeometry(offsets).line_bboxes_many(spans))
+        assert old == new
+        print(f"{n:>8} {t_old * 1000:>8.1f}ms {t_new * 1000:>8.1f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
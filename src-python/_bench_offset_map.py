@@ -0,0 +1,132 @@
+"""Benchmark — char-by-char detection-text offset map vs. run-based OffsetMap.
+
+A dense two-column page: build the detection text and its offset map,
+then translate a batch of detector matches back to full_text.  The old
+path appended one list entry per character and called translate_match
+per match; the new one records one run per word and translates through
+OffsetMap.translate_matches.
+
+Usage:  python _bench_offset_map.py
+"""
+
+import random
+import time
+
+from core.detection.block_offsets import _compute_block_offsets
+from core.detection.layout import (
+    _COL_LINE_JOIN_RATIO,
+    _avg_word_height,
+    build_detection_text,
+    detect_column_bands,
+    translate_match,
+)
+from core.detection.regex_detector import RegexMatch
+from core.ingestion.loader import _build_full_text, _cluster_into_lines
+from models.schemas import BBox, PageData, PIIType, TextBlock
+
+WORDS = ["Jean", "Dupont", "12", "rue", "Zoë", "Montréal", "Société", "Générale", "le", "et"]
+
+
+def make_page(n_lines, rng):
+    blocks = []
+    for line in range(n_lines):
+        for col_x in (40.0, 320.0):
+            x = col_x
+            while x < col_x + 240:
+                w = rng.choice(WORDS)
+                y = 30 + 11 * line
+                blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=y, x1=x + 5 * len(w), y1=y + 9)))
+                x += 5 * len(w) + 4
+    return PageData(page_number=1, width=612, height=792, bitmap_path="",
+                    text_blocks=blocks, full_text=_build_full_text(blocks))
+
+
+def old_build(page, block_offsets):
+    """The per-character assembly build_detection_text used before."""
+    block_ft = {id(blk): (fs, fe) for fs, fe, blk in block_offsets}
+    avg_h = _avg_word_height(page.text_blocks)
+    bands = detect_column_bands(page.text_blocks, page.width)
+    dt_chars, dt_to_ft = [], []
+
+    def _append_block(block):
+        bid = id(block)
+        if bid in block_ft:
+            ft_start, _ = block_ft[bid]
+            for ci, ch in enumerate(block.text):
+                dt_chars.append(ch)
+                dt_to_ft.append(ft_start + ci)
+        else:
+            for ch in block.text:
+                dt_chars.append(ch)
+                dt_to_ft.append(-1)
+
+    def _sep(ch):
+        dt_chars.append(ch)
+        dt_to_ft.append(-1)
+
+    for band_idx, band in enumerate(bands):
+        if band_idx > 0:
+            _sep("\n")
+        prev_bottom = None
+        for line_blocks in _cluster_into_lines(band.blocks):
+            line_top = min(b.bbox.y0 for b in line_blocks)
+            if prev_bottom is not None:
+                _sep("\n" if line_top - prev_bottom > avg_h * _COL_LINE_JOIN_RATIO else " ")
+            for word_idx, block in enumerate(line_blocks):
+                if word_idx > 0:
+                    _sep(" ")
+                _append_block(block)
+            prev_bottom = max(b.bbox.y1 for b in line_blocks)
+    return "".join(dt_chars), dt_to_ft
+
+
+def old_translate(dt_to_ft, full_text, matches):
+    out = []
+    for m in matches:
+        tm = translate_match(m, dt_to_ft, full_text)
+        if tm is not None:
+            out.append(tm)
+    return out
+
+
+def make_matches(n, text_len, rng):
+    out = []
+    for _ in range(n):
+        start = rng.randrange(text_len)
+        out.append(RegexMatch(start=start, end=start + rng.choice([4, 12, 30, 80]),
+                              text="", pii_type=PIIType.PERSON, confidence=0.9))
+    return out
+
+
+def timed(fn, *args):
+    """(result, best-of-5 seconds)."""
+    best = float("inf")
+    for _ in range(5):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'blocks':>7} {'matches':>8} {'stage':>10} {'old':>9} {'new':>9} {'speedup':>8}")
+    for n_lines, n_matches in ((30, 200), (60, 1_000), (60, 5_000)):
+        page = make_page(n_lines, rng)
+        block_offsets = _compute_block_offsets(page.text_blocks, page.full_text)
+        matches = make_matches(n_matches, len(page.full_text), rng)
+        (det_text, dt_to_ft), t_old = timed(old_build, page, block_offsets)
+        om, t_new = timed(build_detection_text, page, block_offsets)
+        assert (det_text, dt_to_ft) == (om.detection_text, list(om.dt_to_ft))
+        rows = [("build", t_old, t_new)]
+        old, t_old = timed(old_translate, dt_to_ft, page.full_text, matches)
+        new, t_new = timed(om.translate_matches, matches, page.full_text)
+        assert old == new
+        rows.append(("translate", t_old, t_new))
+        for stage, t_old, t_new in rows:
+            print(f"{len(page.text_blocks):>7} {n_matches:>8} {stage:>10} {t_old * 1000:>7.1f}ms "
+                  f"{t_new * 1000:>7.1f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark — per-request rebuild of page text structures vs. the cached
+PageTextIndex.
+
+Each interactive blacklist / highlight-all request used to recompute,
+for every page, the block offsets and the normalised text with its
+offset map.  Simulates a series of such requests on a large document.
+
+Usage:  python _bench_page_index.py
+"""
+
+import random
+import time
+
+from api.routers.regions import _normalize_with_map
+from core.text_utils import accent_fold_with_map
+from core.detection.block_offsets import _compute_block_offsets
+from core.detection.page_index import page_text_index
+from models.schemas import BBox, PageData, TextBlock
+
+WORDS = "le contrat entre Société Générale et Zoë Ångström signé à Montréal le 3 mai".split()
+
+
+def make_page(pn, n_blocks, rng):
+    blocks = []
+    x, y = 40.0, 40.0
+    for _ in range(n_blocks):
+        w = rng.choice(WORDS)
+        if x + 6 * len(w) > 570:
+            x, y = 40.0, y + 14
+        blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=y, x1=x + 6 * len(w), y1=y + 10)))
+        x += 6 * len(w) + 4
+    lines, cur, prev_y = [], [], None
+    for b in blocks:
+        if prev_y is not None and b.bbox.y0 != prev_y:
+            lines.append(" ".join(cur))
+            cur = []
+        cur.append(b.text)
+        prev_y = b.bbox.y0
+    lines.append(" ".join(cur))
+    return PageData(page_number=pn, width=612, height=792, bitmap_path="",
+                    text_blocks=blocks, full_text="\n".join(lines))
+
+
+def rebuild(pages):
+    for p in pages:
+        _compute_block_offsets(p.text_blocks, p.full_text)
+        accent_fold_with_map(p.full_text)
+        _normalize_with_map(p.full_text)
+
+
+def cached(pages):
+    for p in pages:
+        index = page_text_index(p)
+        index.text_view(accent_fold_with_map)
+        index.text_view(_normalize_with_map)
+
+
+def timed(fn, pages, requests):
+    t0 = time.perf_counter()
+    for _ in range(requests):
+        fn(pages)
+    return time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    requests = 10
+    print(f"{'pages':>6} {'blocks':>7} {'rebuild':>10} {'cached':>10} {'speedup':>8}   ({requests} requests)")
+    for n_pages, n_blocks in ((20, 300), (100, 400), (200, 500)):
+        pages = [make_page(pn, n_blocks, rng) for pn in range(1, n_pages + 1)]
+        for p in pages:
+            assert page_text_index(p).block_offsets == _compute_block_offsets(p.text_blocks, p.full_text)
+            p._text_index = None
+        t_old = timed(rebuild, pages, requests)
+        t_new = timed(cached, pages, requests)
+        print(f"{n_pages:>6} {n_blocks:>7} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark — partial-ORG propagation: one regex per sub-phrase vs. one
+automaton over all sub-phrases.
+
+Synthetic document with 1k+ organisation mentions.  Sub-phrases come
+from ``_generate_contiguous_subphrases`` exactly as in
+``propagate_partial_org_names``; both searches keep its longest-first
+order and word-boundary checks.  Also times the whole function.
+
+Usage:  python _bench_partial_org.py
+"""
+
+import random
+import time
+
+from core.detection.propagation import (
+    _KeyMatcher,
+    _build_flex_pattern,
+    _generate_contiguous_subphrases,
+    _neutralise_quotes,
+    _strip_accents,
+    propagate_partial_org_names,
+)
+from core.detection.noise_filters import _is_single_word_dict_noise
+from models.schemas import BBox, DetectionSource, PIIRegion, PIIType, PageData, TextBlock
+
+FILLER = (
+    "the supplier shall invoice the client monthly and all amounts are "
+    "payable within thirty days of receipt of the invoice"
+).split()
+PARTS = [
+    "Northern", "Atlantic", "Groupe", "Fonderie", "Société", "Générale",
+    "Maritime", "Logistics", "Holdings", "Pacific", "Laurentian", "Capital",
+    "Boréal", "Transport", "Énergie", "Solutions",
+]
+
+
+def make_orgs(n, rng):
+    return list(dict.fromkeys(
+        " ".join(rng.sample(PARTS, rng.randint(3, 5))) + f" {rng.choice(['Inc.', 'Ltée', 'SA'])}{i}"
+        for i in range(n)
+    ))
+
+
+def make_pages(n_pages, orgs, rng):
+    pages = []
+    for _ in range(n_pages):
+        words = []
+        while sum(len(w) + 1 for w in words) < 3_000:
+            r = rng.random()
+            if r < 0.04:
+                words.append(rng.choice(orgs))
+            elif r < 0.08:
+                org = rng.choice(orgs).split()
+                i = rng.randrange(len(org) - 1)
+                words.append(" ".join(org[i:i + 2]))
+            else:
+                words.append(rng.choice(FILLER))
+        pages.append(" ".join(words))
+    return pages
+
+
+def sub_phrases(orgs):
+    subs = {}
+    for org in orgs:
+        key = " ".join(_strip_accents(_neutralise_quotes(org)).split()).lower()
+        for sub in _generate_contiguous_subphrases(key.split(), min_words=2):
+            subs.setdefault(sub, org)
+    return [s for s, _ in sorted(subs.items(), key=lambda kv: -len(kv[0]))]
+
+
+def _bounded(text, s, e):
+    return not (s > 0 and text[s - 1].isalnum()) and not (e < len(text) and text[e].isalnum())
+
+
+def per_sub_regex(subs, pages):
+    hits = []
+    norm_pages = [_neutralise_quotes(_strip_accents(p)) for p in pages]
+    for si, sub in enumerate(subs):
+        pat = _build_flex_pattern(sub)
+        for pi, norm in enumerate(norm_pages):
+            hits.extend(
+                (pi, si, m.start(), m.end()) for m in pat.finditer(norm)
+                if _bounded(pages[pi], m.start(), m.end())
+            )
+    return sorted(hits)
+
+
+def single_pass(subs, pages):
+    matcher = _KeyMatcher(subs)
+    return sorted(
+        (pi, si, s, e) for pi, page in enumerate(pages)
+        for si, s, e in matcher.find(page) if _bounded(page, s, e)
+    )
+
+
+def as_document(orgs, pages, rng):
+    page_data = []
+    regions = []
+    for pn, text in enumerate(pages, start=1):
+        page_data.append(PageData(
+            page_number=pn, width=612, height=792, bitmap_path="",
+            text_blocks=[TextBlock(text=text, bbox=BBox(x0=20, y0=20, x1=590, y1=770))],
+            full_text=text,
+        ))
+        for org in orgs:
+            at = text.find(org)
+            if at >= 0 and rng.random() < 0.5:
+                regions.append(PIIRegion(
+                    page_number=pn, bbox=BBox(x0=20, y0=20, x1=200, y1=32),
+                    text=org, pii_type=PIIType.ORG, confidence=0.9,
+                    source=DetectionSource.NER, char_start=at, char_end=at + len(org),
+                ))
+    return regions, page_data
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    _is_single_word_dict_noise("warm")   # load dictionaries outside the timings
+    print(f"{'pages':>6} {'mentions':>9} {'subs':>6} {'per-sub':>10} {'1-pass':>10} {'speedup':>8} {'full fn':>9}")
+    for n_pages, n_orgs in ((50, 100), (150, 400)):
+        orgs = make_orgs(n_orgs, rng)
+        pages = make_pages(n_pages, orgs, rng)
+        mentions = sum(p.count(o) for p in pages for o in orgs)
+        subs = sub_phrases(orgs)
+        old, t_old = timed(per_sub_regex, subs, pages)
+        new, t_new = timed(single_pass, subs, pages)
+        assert old == new
+        regions, page_data = as_document(orgs, pages, rng)
+        _out, t_fn = timed(propagate_partial_org_names, regions, page_data)
+        print(
+            f"{n_pages:>6} {mentions:>9} {len(subs):>6} {t_old * 1000:>8.0f}ms "
+            f"{t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x {t_fn * 1000:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark — PII-likelihood prefilter cost vs. the layers it can skip.
+
+Usage:  python _bench_prefilter.py [pages]
+"""
+
+import sys
+import time
+from unittest.mock import patch
+
+from core.config import DetectionSettings
+from core.detection.pipeline import detect_pii_on_page
+from core.detection.prefilter import score_pii_likelihood
+from core.detection.regex_detector import detect_regex
+from core.ingestion.loader import _build_full_text
+from models.schemas import BBox, PageData, TextBlock
+
+BOILERPLATE = [
+    "this agreement shall be governed by the laws applicable to the parties and",
+    "each party shall bear its own costs. unless the context otherwise requires,",
+    "words importing the singular include the plural and vice versa.",
+] * 12
+
+PII = [
+    "Please contact John Smith at john.smith@example.com today.",
+    "His phone number is 555-123-4567 and his SSN is 123-45-6789.",
+    "The meeting with Acme Corporation is scheduled for next week.",
+] * 12
+
+
+def make_page(lines, n):
+    blocks = []
+    for li, line in enumerate(lines):
+        x = 50.0
+        for wi, word in enumerate(line.split()):
+            w = 6.0 * len(word)
+            blocks.append(TextBlock(
+                text=word, bbox=BBox(x0=x, y0=50 + li * 20, x1=x + w, y1=62 + li * 20),
+                line_index=li, word_index=wi,
+            ))
+            x += w + 4
+    return PageData(
+        page_number=n, width=612, height=2000, bitmap_path="/tmp/p.png",
+        text_blocks=blocks, full_text=_build_full_text(blocks),
+    )
+
+
+def slow_llm(text, engine):
+    time.sleep(0.05)  # stand-in for a local LLM call
+    return []
+
+
+def run(pages, settings):
+    t0 = time.perf_counter()
+    with patch("core.detection.pipeline.detect_llm", side_effect=slow_llm):
+        for p in pages:
+            detect_pii_on_page(p, llm_engine=object(), settings=settings)
+    return time.perf_counter() - t0
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = [make_page(BOILERPLATE if i % 2 else PII, i + 1) for i in range(n)]
+
+    t0 = time.perf_counter()
+    for p in pages:
+        score_pii_likelihood(p.full_text, len(detect_regex(p.full_text)))
+    score_ms = (time.perf_counter() - t0) * 1000 / n
+    skipped = sum(
+        score_pii_likelihood(p.full_text, len(detect_regex(p.full_text))).score
+        < DetectionSettings().prefilter_threshold
+        for p in pages
+    )
+
+    base = DetectionSettings.from_config(llm_detection_enabled=True)
+    run(pages[:2], base)  # warm spaCy / regex caches
+    off = run(pages, base.model_copy(update={"prefilter_enabled": False}))
+    on = run(pages, base.model_copy(update={"prefilter_enabled": True}))
+
+    print(f"pages={n}  skipped={skipped}")
+    print(f"score (incl. regex): {score_ms:8.2f} ms/page")
+    print(f"prefilter off:       {off * 1000 / n:8.2f} ms/page")
+    print(f"prefilter on:        {on * 1000 / n:8.2f} ms/page  ({off / on:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark — propagation key search: one regex per key vs. _KeyMatcher.
+
+Synthetic document: pages of ~3k characters of filler with names drawn
+from a pool of distinct people / organisations, searched for every name.
+
+Usage:  python _bench_propagation.py
+"""
+
+import random
+import time
+
+from core.detection.propagation import (
+    _KeyMatcher,
+    _build_flex_pattern,
+    _neutralise_quotes,
+    _strip_accents,
+)
+
+FILLER = (
+    "the agreement between the parties shall remain in force until "
+    "terminated by written notice delivered to the registered address "
+).split()
+
+
+def make_names(n, rng):
+    first = ["Jean", "Marie", "Zoë", "Luc", "Anaïs", "Paul", "Chloé", "Omar"]
+    return [f"{rng.choice(first)} Dupont{i}" for i in range(n)] + [
+        f"Société Nº{i} Inc." for i in range(n // 4)
+    ]
+
+
+def make_pages(n_pages, names, rng):
+    pages = []
+    for _ in range(n_pages):
+        words = []
+        while sum(len(w) + 1 for w in words) < 3_000:
+            if rng.random() < 0.05:
+                words.append(rng.choice(names).replace(" ", rng.choice([" ", "\n"])))
+            else:
+                words.append(rng.choice(FILLER))
+        pages.append(" ".join(words))
+    return pages
+
+
+def normalise_key(name):
+    return " ".join(_strip_accents(_neutralise_quotes(name)).split()).lower()
+
+
+def per_key_regex(keys, pages):
+    hits = []
+    norm_pages = [_neutralise_quotes(_strip_accents(p)) for p in pages]
+    for ki, key in enumerate(keys):
+        pat = _build_flex_pattern(key)
+        for pi, norm in enumerate(norm_pages):
+            hits.extend((pi, ki, m.start(), m.end()) for m in pat.finditer(norm))
+    return sorted(hits)
+
+
+def single_pass(keys, pages):
+    matcher = _KeyMatcher(keys)
+    return sorted(
+        (pi, ki, s, e) for pi, page in enumerate(pages) for ki, s, e in matcher.find(page)
+    )
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'pages':>6} {'keys':>6} {'per-key':>10} {'1-pass':>10} {'speedup':>8}")
+    for n_pages, n_names in ((50, 100), (200, 400), (200, 2_000)):
+        names = make_names(n_names, rng)
+        pages = make_pages(n_pages, names, rng)
+        keys = list(dict.fromkeys(normalise_key(n) for n in names))
+        old, t_old = timed(per_key_regex, keys, pages)
+        new, t_new = timed(single_pass, keys, pages)
+        assert old == new
+        print(f"{n_pages:>6} {len(keys):>6} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark — pairwise vs. RegionIndex dedup of final region lists.
+
+Two passes on synthetic documents:
+
+- char-span containment dedup (propagation): the old pairwise loop vs.
+  ``_drop_contained_regions``;
+- "already covered" checks (blacklist / highlight-all merge): each new
+  bbox tested against a flat list of the page's regions vs. a y-band
+  ``RegionIndex``.
+
+Usage:  python _bench_region_dedup.py
+"""
+
+import random
+import time
+
+from core.detection.propagation import _drop_contained_regions
+from core.detection.region_index import RegionIndex
+from models.schemas import BBox, DetectionSource, PIIRegion, PIIType
+
+TYPES = [PIIType.PERSON, PIIType.ORG, PIIType.ADDRESS]
+
+
+def make_regions(n_pages, per_page, rng):
+    out = []
+    for pn in range(1, n_pages + 1):
+        for _ in range(per_page):
+            start = rng.randrange(3_000)
+            out.append(PIIRegion(
+                page_number=pn, bbox=BBox(x0=0, y0=0, x1=10, y1=10), text="x",
+                pii_type=rng.choice(TYPES), confidence=rng.choice([0.6, 0.8, 0.95]),
+                source=DetectionSource.NER, char_start=start, char_end=start + rng.randint(3, 40),
+            ))
+    return out
+
+
+def pairwise_dedup(regions):
+    buckets = {}
+    for r in regions:
+        buckets.setdefault(r.page_number, []).append(r)
+    dominated = set()
+    for regs in buckets.values():
+        regs = sorted(regs, key=lambda r: -(r.char_end - r.char_start))
+        for i, ri in enumerate(regs):
+            if ri.id in dominated:
+                continue
+            for rj in regs[:i]:
+                if rj.id in dominated:
+                    continue
+                if (rj.pii_type == ri.pii_type and rj.char_start <= ri.char_start
+                        and rj.char_end >= ri.char_end and rj.confidence >= ri.confidence):
+                    dominated.add(ri.id)
+                    break
+    return [r for r in regions if r.id not in dominated]
+
+
+def make_boxes(n, rng):
+    """Word-sized boxes on the lines of an A4 page."""
+    out = []
+    for _ in range(n):
+        x, line = rng.uniform(40, 520), rng.randrange(60)
+        out.append((x, 40 + 12 * line, x + rng.uniform(20, 80), 50 + 12 * line))
+    return out
+
+
+def _covers(b, e):
+    ix0, iy0 = max(b[0], e[0]), max(b[1], e[1])
+    ix1, iy1 = min(b[2], e[2]), min(b[3], e[3])
+    if ix0 < ix1 and iy0 < iy1:
+        return (ix1 - ix0) * (iy1 - iy0) / max((b[2] - b[0]) * (b[3] - b[1]), 1e-6) > 0.4
+    return False
+
+
+def covered_flat(existing, new):
+    spans = list(existing)
+    hits = 0
+    for b in new:
+        if any(_covers(b, e) for e in spans):
+            hits += 1
+        else:
+            spans.append(b)
+    return hits
+
+
+def covered_indexed(existing, new):
+    index = RegionIndex()
+    for e in existing:
+        index.add(e[1], e[3], e)
+    hits = 0
+    for b in new:
+        if any(_covers(b, e) for e in index.overlapping(b[1], b[3])):
+            hits += 1
+        else:
+            index.add(b[1], b[3], b)
+    return hits
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'pass':>10} {'size':>14} {'pairwise':>10} {'index':>10} {'speedup':>8}")
+    for n_pages, per_page in ((20, 200), (50, 1_000), (10, 3_000)):
+        regions = make_regions(n_pages, per_page, rng)
+        old, t_old = timed(pairwise_dedup, regions)
+        (new, _dropped), t_new = timed(_drop_contained_regions, regions)
+        assert [r.id for r in old] == [r.id for r in new]
+        size = f"{n_pages}x{per_page}"
+        print(f"{'contain':>10} {size:>14} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x")
+    for n_existing, n_new in ((500, 500), (2_000, 2_000), (5_000, 5_000)):
+        existing, new = make_boxes(n_existing, rng), make_boxes(n_new, rng)
+        old, t_old = timed(covered_flat, existing, new)
+        out, t_new = timed(covered_indexed, existing, new)
+        assert old == out
+        size = f"{n_existing}+{n_new}"
+        print(f"{'covered':>10} {size:>14} {t_old * 1000:>8.0f}ms {t_new * 1000:>8.0f}ms {t_old / t_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
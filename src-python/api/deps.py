@@ -302,7 +302,8 @@ def config_override(**overrides: Any) -> Generator[None, None, None]:
     """Temporarily override config attributes in a thread-safe manner.
 
     C6: This mutates a global singleton. Must ONLY be used while the
-    config lock is held to prevent concurrent mutations.
+    config lock is held to prevent concurrent mutations.  Detection runs
+    should pass a ``DetectionSettings`` snapshot instead.
     """
     originals = {}
     for key, value in overrides.items():
@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-import os
+import math
 import time as _time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel as _PydanticBaseModel, Field
 
-from core.config import config
+from core.config import DetectionSettings
+from core.detection.detection_config import DETECTION_MAX_WORKERS
 from core.detection.noise_filters import has_legal_suffix as _has_legal_suffix
+from core.detection.page_index import page_text_index
+from core.detection.scheduler import detection_scheduler
+from core.text_utils import accent_fold_with_map
 from models.schemas import (
     BBox,
     DetectionProgressResponse,
@@ -28,18 +33,127 @@ from api.deps import (
     save_doc,
     acquire_detection_lock,
     release_detection_lock,
-    acquire_config_lock,
-    release_config_lock,
-    config_override,
 )
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["detection"])
 
-# P1: max parallel workers for page detection.
-# ThreadPoolExecutor releases GIL during spaCy/PyTorch C-extension work,
-# giving real parallelism for multi-page documents.
-_MAX_DETECTION_WORKERS = min(4, os.cpu_count() or 2)
+# P1: max parallel workers for page detection — now enforced process-wide
+# by the shared detection scheduler rather than per request.
+_MAX_DETECTION_WORKERS = DETECTION_MAX_WORKERS
+
+
+# Accent-stripped, quote-normalised lowercase folding for blacklist
+# matching (a module-level object, so page indexes cache it per page).
+_blacklist_fold_with_map = functools.partial(accent_fold_with_map, quotes=True)
+
+
+async def _detect_pages(
+    doc_id: str,
+    pages: list,
+    *,
+    engine: object | None,
+    language: str | None,
+    settings: DetectionSettings,
+    interactive: bool = False,
+) -> list[PIIRegion]:
+    """Detect PII on *pages* via the shared scheduler, updating progress.
+
+    Each page becomes one scheduler task queued under *doc_id*, so pages
+    of concurrent documents are interleaved fairly and never exceed the
+    process-wide worker bound.  Every page runs with the same *settings*
+    snapshot.  ``detection_progress[doc_id]`` must
+    already be initialised with one ``page_statuses`` entry per page.
+    Results are returned in page order.  With ``settings.fingerprint_reuse``
+    the pages share one ``FingerprintCache`` so repeated lines and
+    duplicate pages reuse earlier results; with ``settings.gazetteer_enabled``
+    they share one ``DocumentGazetteer`` of names found so far.  With
+    either, pages are queued one wave (``DETECTION_WAVE_PAGES``) at a time
+    so each page reuses the results of exactly the earlier waves.  With
+    ``settings.cascade_enabled`` the share of pages the cascade settled
+    without the expensive layers is logged and stored as
+    ``cascade_skip_pct`` in the progress entry.
+    """
+    from core.detection.cascade import CascadeStats
+    from core.detection.fingerprint import FingerprintCache
+    from core.detection.gazetteer import DocumentGazetteer
+    from core.detection.pipeline import detect_pii_on_page
+
+    progress = detection_progress[doc_id]
+    fingerprints = (
+        FingerprintCache() if settings.fingerprint_reuse and len(pages) > 1 else None
+    )
+    gazetteer = (
+        DocumentGazetteer() if settings.gazetteer_enabled and len(pages) > 1 else None
+    )
+    cascade_stats = CascadeStats() if settings.cascade_enabled else None
+
+    def _detect_one(idx: int, page) -> tuple[int, list[PIIRegion]]:
+        progress["page_statuses"][idx]["status"] = "running"
+
+        def _step_cb(step: str) -> None:
+            progress["page_statuses"][idx]["pipeline_step"] = step
+
+        regions = detect_pii_on_page(
+            page, llm_engine=engine,
+            predetected_language=language,
+            progress_callback=_step_cb,
+            settings=settings,
+            fingerprints=fingerprints,
+            gazetteer=gazetteer,
+            page_index=idx,
+            cascade_stats=cascade_stats,
+        )
+        progress["page_statuses"][idx]["status"] = "done"
+        progress["page_statuses"][idx]["regions"] = len(regions)
+        return idx, regions
+
+    # A page reusing shared results must not start before the earlier
+    # waves are done; the gcd makes every cache's wave boundary a barrier.
+    shared = [c for c in (fingerprints, gazetteer) if c is not None]
+    wave = math.gcd(*(c.wave for c in shared)) if shared else max(len(pages), 1)
+    page_results: dict[int, list[PIIRegion]] = {}
+    for first in range(0, len(pages), wave):
+        futures = [
+            detection_scheduler.submit(
+                doc_id,
+                lambda idx=idx, page=page: _detect_one(idx, page),
+                interactive=interactive,
+            )
+            for idx, page in enumerate(pages[first:first + wave], start=first)
+        ]
+        try:
+            for next_done in asyncio.as_completed([asyncio.wrap_future(f) for f in futures]):
+                idx, regions = await next_done
+                page_results[idx] = regions
+                progress["pages_done"] = len(page_results)
+                progress["regions_found"] = sum(len(r) for r in page_results.values())
+                progress["current_page"] = pages[idx].page_number
+                progress["elapsed_seconds"] = _time.time() - progress["_started_at"]
+        except BaseException:
+            # Drop this run's queued pages so they don't hold up other documents
+            for f in futures:
+                f.cancel()
+            raise
+
+    if fingerprints is not None:
+        logger.info("Document %s: fingerprint reuse %s", doc_id, fingerprints.stats())
+    if gazetteer is not None:
+        logger.info("Document %s: gazetteer %s", doc_id, gazetteer.stats())
+    if cascade_stats is not None:
+        cascade_summary = cascade_stats.stats()
+        progress["cascade_skip_pct"] = cascade_summary["skip_pct"]
+        logger.info("Document %s: cascade %s", doc_id, cascade_summary)
+    if settings.paragraph_cache_enabled:
+        from core.detection.paragraph_cache import paragraph_cache
+        logger.info("Document %s: paragraph cache %s", doc_id, paragraph_cache.stats())
+        await asyncio.to_thread(paragraph_cache.save)
+
+    # Reassemble in page order
+    all_regions: list[PIIRegion] = []
+    for idx in sorted(page_results):
+        all_regions.extend(page_results[idx])
+    return all_regions
 
 
 @router.get("/documents/{doc_id}/detection-progress")
@@ -68,7 +182,6 @@ async def get_detection_progress(doc_id: str) -> dict[str, Any]:
 @router.post("/documents/{doc_id}/detect")
 async def detect_pii(doc_id: str) -> dict[str, Any]:
     """Run PII detection on all pages of a document."""
-    import asyncio
     import traceback
 
     doc = get_doc(doc_id)  # 404 before heavy imports
@@ -77,7 +190,7 @@ async def detect_pii(doc_id: str) -> dict[str, Any]:
         raise HTTPException(409, detail="Detection already in progress. Please wait.")
 
     try:
-        from core.detection.pipeline import detect_pii_on_page, propagate_regions_across_pages
+        from core.detection.pipeline import propagate_regions_across_pages
         from core.detection.propagation import propagate_partial_org_names
         from core.detection.language import detect_language
         doc.status = DocumentStatus.DETECTING
@@ -85,26 +198,29 @@ async def detect_pii(doc_id: str) -> dict[str, Any]:
 
         engine = get_active_llm_engine()
         total_pages = len(doc.pages)
+        # Snapshot settings once so a concurrent settings change can't
+        # produce a document detected half with the old values.
+        settings = DetectionSettings.from_config()
 
         # When a specific language is configured, pass it through so
         # per-page detection is skipped.  In auto mode leave it None so
         # each page detects its own language independently (supports
         # mixed-language documents).
         doc_language: str | None = None
-        if config.detection_language and config.detection_language != "auto":
-            doc_language = config.detection_language
+        if settings.detection_language and settings.detection_language != "auto":
+            doc_language = settings.detection_language
 
         # Initialize progress tracker
         # Build the list of pipeline steps that will run for progress display
         _pipeline_steps: list[str] = []
-        if config.regex_enabled:
+        if settings.regex_enabled:
             _pipeline_steps.append("regex")
-        if config.ner_enabled:
+        if settings.ner_enabled:
             _pipeline_steps.append("ner")
             from core.detection.gliner_detector import is_gliner_available as _is_gli
             if _is_gli():
                 _pipeline_steps.append("gliner")
-        if config.llm_detection_enabled and engine is not None:
+        if settings.llm_detection_enabled and engine is not None:
             _pipeline_steps.append("llm")
         _pipeline_steps.append("merge")
 
@@ -124,47 +240,10 @@ async def detect_pii(doc_id: str) -> dict[str, Any]:
             "_started_at": _time.time(),
         }
 
-        def _run_detection() -> list[PIIRegion]:
-            """Run detection on all pages using parallel threads."""
-            progress = detection_progress[doc_id]
-            n_pages = len(doc.pages)
-            workers = min(_MAX_DETECTION_WORKERS, n_pages)
-            page_results: dict[int, list[PIIRegion]] = {}
-
-            def _detect_one(idx: int, page):
-                progress["page_statuses"][idx]["status"] = "running"
-                def _step_cb(step: str) -> None:
-                    progress["page_statuses"][idx]["pipeline_step"] = step
-                regions = detect_pii_on_page(
-                    page, llm_engine=engine,
-                    predetected_language=doc_language,
-                    progress_callback=_step_cb,
-                )
-                progress["page_statuses"][idx]["status"] = "done"
-                progress["page_statuses"][idx]["regions"] = len(regions)
-                return idx, regions
-
-            with ThreadPoolExecutor(max_workers=workers) as pool:
-                futures = {
-                    pool.submit(_detect_one, idx, page): idx
-                    for idx, page in enumerate(doc.pages)
-                }
-                for future in as_completed(futures):
-                    idx, regions = future.result()
-                    page_results[idx] = regions
-                    progress["pages_done"] = len(page_results)
-                    progress["regions_found"] = sum(len(r) for r in page_results.values())
-                    progress["current_page"] = idx + 1
-                    progress["elapsed_seconds"] = _time.time() - progress["_started_at"]
-
-            # Reassemble in page order
-            all_regions: list[PIIRegion] = []
-            for idx in sorted(page_results):
-                all_regions.extend(page_results[idx])
-            return all_regions
-
-        # Run CPU-bound detection in a thread pool
-        all_regions = await asyncio.to_thread(_run_detection)
+        all_regions = await _detect_pages(
+            doc_id, doc.pages, engine=engine, language=doc_language,
+            settings=settings,
+        )
 
         # Propagate: if text was detected on one page, flag it on every
         # other page where it also appears.
@@ -251,142 +330,86 @@ async def redetect_pii(doc_id: str, body: RedetectRequest) -> dict[str, Any]:
     the fresh detections.  Regions on non-scanned pages (when scope is a
     single page) are kept.
     """
-    import asyncio
     import traceback
 
     doc = get_doc(doc_id)  # 404 before heavy imports
 
     if not acquire_detection_lock(doc_id):
         raise HTTPException(409, detail="Detection already in progress. Please wait.")
-    if not acquire_config_lock(doc_id):
-        release_detection_lock(doc_id)
-        raise HTTPException(409, detail="Another detection with custom settings is running. Please wait.")
 
     try:
-        from core.detection.pipeline import detect_pii_on_page, propagate_regions_across_pages
+        from core.detection.pipeline import propagate_regions_across_pages
         from core.detection.propagation import propagate_partial_org_names as _prop_partial_orgs_r
-        from core.detection.language import detect_language as _detect_lang_r
 
-        # Thread-safe config override for this detection run
-        with config_override(
+        # Per-request settings snapshot — the global config is never
+        # mutated, so other documents keep detecting with their own
+        # settings in parallel.
+        settings = DetectionSettings.from_config(
             confidence_threshold=body.confidence_threshold,
             regex_enabled=body.regex_enabled,
             ner_enabled=body.ner_enabled,
             llm_detection_enabled=body.llm_detection_enabled,
             regex_types=body.regex_types,
             ner_types=body.ner_types,
-        ):
-            engine = get_active_llm_engine()
-
-            # Determine which pages to scan
-            pages_to_scan = doc.pages
-            if body.page_number is not None:
-                pages_to_scan = [p for p in doc.pages if p.page_number == body.page_number]
-                if not pages_to_scan:
-                    raise HTTPException(404, detail=f"Page {body.page_number} not found")
-
-            total_pages = len(pages_to_scan)
-
-            # When a specific language is configured, pass it through.
-            # In auto mode leave None so each page detects independently
-            # (correct for mixed-language documents).
-            _redetect_lang: str | None = None
-            if config.detection_language and config.detection_language != "auto":
-                _redetect_lang = config.detection_language
-
-            # Build the list of pipeline steps for progress display
-            _redet_pipeline_steps: list[str] = []
-            if config.regex_enabled:
-                _redet_pipeline_steps.append("regex")
-            if config.ner_enabled:
-                _redet_pipeline_steps.append("ner")
-                from core.detection.gliner_detector import is_gliner_available as _is_gli_r
-                if _is_gli_r():
-                    _redet_pipeline_steps.append("gliner")
-            if config.llm_detection_enabled and engine is not None:
-                _redet_pipeline_steps.append("llm")
-            _redet_pipeline_steps.append("merge")
-
-            # Initialize progress tracker (same format as initial detect)
-            detection_progress[doc_id] = {
-                "doc_id": doc_id,
-                "status": "running",
-                "current_page": 0,
-                "total_pages": total_pages,
-                "pages_done": 0,
-                "regions_found": 0,
-                "elapsed_seconds": 0.0,
-                "pipeline_steps": _redet_pipeline_steps,
-                "page_statuses": [
-                    {"page": p.page_number, "status": "pending", "regions": 0, "pipeline_step": ""}
-                    for p in pages_to_scan
-                ],
-                "_started_at": _time.time(),
-            }
-
-            def _run_redetection() -> list[PIIRegion]:
-                """Run re-detection on selected pages in parallel threads."""
-                progress = detection_progress[doc_id]
-                n = len(pages_to_scan)
-                workers = min(_MAX_DETECTION_WORKERS, n)
-                page_results: dict[int, list[PIIRegion]] = {}
-
-                def _detect_one(idx: int, page):
-                    progress["page_statuses"][idx]["status"] = "running"
-                    def _step_cb(step: str) -> None:
-                        progress["page_statuses"][idx]["pipeline_step"] = step
-                    detected = detect_pii_on_page(
-                        page, llm_engine=engine,
-                        predetected_language=_redetect_lang,
-                        progress_callback=_step_cb,
-                    )
-                    progress["page_statuses"][idx]["status"] = "done"
-                    progress["page_statuses"][idx]["regions"] = len(detected)
-                    return idx, detected
-
-                with ThreadPoolExecutor(max_workers=workers) as pool:
-                    futures = {
-                        pool.submit(_detect_one, idx, page): idx
-                        for idx, page in enumerate(pages_to_scan)
-                    }
-                    for future in as_completed(futures):
-                        idx, detected = future.result()
-                        page_results[idx] = detected
-                        progress["pages_done"] = len(page_results)
-                        progress["regions_found"] = sum(len(r) for r in page_results.values())
-                        progress["current_page"] = pages_to_scan[idx].page_number
-                        progress["elapsed_seconds"] = _time.time() - progress["_started_at"]
-
-                results: list[PIIRegion] = []
-                for idx in sorted(page_results):
-                    results.extend(page_results[idx])
-                return results
-
-            new_regions = await asyncio.to_thread(_run_redetection)
-
-        # ── Normalise apostrophe / quote variants to ASCII ──
-        # So that user input with smart-quotes matches OCR text.
-        import unicodedata as _ud
-        _QUOTE_MAP = str.maketrans({
-            0x2018: "'",  # LEFT SINGLE QUOTATION MARK
-            0x2019: "'",  # RIGHT SINGLE QUOTATION MARK
-            0x201A: "'",  # SINGLE LOW-9 QUOTATION MARK
-            0x02BC: "'",  # MODIFIER LETTER APOSTROPHE
-            0x02BB: "'",  # MODIFIER LETTER TURNED COMMA
-            0xFF07: "'",  # FULLWIDTH APOSTROPHE
-            0x201C: '"',  # LEFT DOUBLE QUOTATION MARK
-            0x201D: '"',  # RIGHT DOUBLE QUOTATION MARK
-            0x201E: '"',  # DOUBLE LOW-9 QUOTATION MARK
-            0xFF02: '"',  # FULLWIDTH QUOTATION MARK
-        })
-
-        def _norm_quotes(s: str) -> str:
-            return s.translate(_QUOTE_MAP)
+        )
+        engine = get_active_llm_engine()
+
+        # Determine which pages to scan
+        pages_to_scan = doc.pages
+        if body.page_number is not None:
+            pages_to_scan = [p for p in doc.pages if p.page_number == body.page_number]
+            if not pages_to_scan:
+                raise HTTPException(404, detail=f"Page {body.page_number} not found")
+
+        total_pages = len(pages_to_scan)
+
+        # When a specific language is configured, pass it through.
+        # In auto mode leave None so each page detects independently
+        # (correct for mixed-language documents).
+        _redetect_lang: str | None = None
+        if settings.detection_language and settings.detection_language != "auto":
+            _redetect_lang = settings.detection_language
+
+        # Build the list of pipeline steps for progress display
+        _redet_pipeline_steps: list[str] = []
+        if settings.regex_enabled:
+            _redet_pipeline_steps.append("regex")
+        if settings.ner_enabled:
+            _redet_pipeline_steps.append("ner")
+            from core.detection.gliner_detector import is_gliner_available as _is_gli_r
+            if _is_gli_r():
+                _redet_pipeline_steps.append("gliner")
+        if settings.llm_detection_enabled and engine is not None:
+            _redet_pipeline_steps.append("llm")
+        _redet_pipeline_steps.append("merge")
+
+        # Initialize progress tracker (same format as initial detect)
+        detection_progress[doc_id] = {
+            "doc_id": doc_id,
+            "status": "running",
+            "current_page": 0,
+            "total_pages": total_pages,
+            "pages_done": 0,
+            "regions_found": 0,
+            "elapsed_seconds": 0.0,
+            "pipeline_steps": _redet_pipeline_steps,
+            "page_statuses": [
+                {"page": p.page_number, "status": "pending", "regions": 0, "pipeline_step": ""}
+                for p in pages_to_scan
+            ],
+            "_started_at": _time.time(),
+        }
+
+        # A single-page redetect is interactive and jumps ahead of
+        # bulk detections queued by other documents.
+        new_regions = await _detect_pages(
+            doc_id, pages_to_scan, engine=engine, language=_redetect_lang,
+            settings=settings, interactive=body.page_number is not None,
+        )
 
         # ── Blacklist: text-search for user-specified terms (highest priority) ──
         blacklist_created = 0
         if body.blacklist_terms:
-            from core.detection.pipeline import _compute_block_offsets
             import uuid as _uuid
             from models.schemas import PIIType as _PIIType, DetectionSource as _DetSource, RegionAction as _RAct
 
@@ -405,113 +428,80 @@ async def redetect_pii(doc_id: str, body: RedetectRequest) -> dict[str, Any]:
 
             bl_regions: list[PIIRegion] = []
 
+            # Accent-stripped, quote-normalised lowercase needles, compiled
+            # once for every page: one Aho-Corasick automaton for exact
+            # matching, or one fuzzy pattern per term.
+            from core.detection.aho_corasick import AhoCorasick
+            bl_needles = [_blacklist_fold_with_map(needle)[0] for needle in bl_terms]
+            _bl_fuzz = body.blacklist_fuzziness
+            _use_fuzzy = _bl_fuzz < 0.98
+            if _use_fuzzy:
+                # Fuzzy matching via the 'regex' module's {e<=N} syntax
+                import regex as _rx
+                bl_fuzzy_patterns = []
+                for nl in bl_needles:
+                    if not nl:
+                        continue
+                    max_errors = max(1, round(len(nl) * (1.0 - _bl_fuzz)))
+                    # Escape the needle for regex, then wrap with fuzzy spec
+                    _escaped = _rx.escape(nl)
+                    bl_fuzzy_patterns.append(_rx.compile(
+                        rf"(?b)({_escaped}){{e<={max_errors}}}",
+                        _rx.IGNORECASE,
+                    ))
+            else:
+                bl_matcher = AhoCorasick(bl_needles)
+
             for page in pages_to_scan:
                 ft = page.full_text
                 if not ft:
                     continue
-                block_offsets = _compute_block_offsets(page.text_blocks, ft)
-
-                # Build accent-stripped, quote-normalised lowercase text with index mapping
-                _nfd = _ud.normalize("NFD", _norm_quotes(ft.lower()))
-                _norm_chars: list[str] = []
-                _n2o: list[int] = []
-                _seen_nfd = 0
-                for _ci in range(len(ft)):
-                    _clen = len(_ud.normalize("NFD", ft[_ci]))
-                    for _ in range(_clen):
-                        if _seen_nfd < len(_nfd) and _ud.category(_nfd[_seen_nfd]) != "Mn":
-                            _norm_chars.append(_nfd[_seen_nfd])
-                            _n2o.append(_ci)
-                        _seen_nfd += 1
-                _n2o.append(len(ft))  # sentinel
-                ft_norm = "".join(_norm_chars)
-
-                for needle in bl_terms:
-                    nl = "".join(
-                        c for c in _ud.normalize("NFD", _norm_quotes(needle.lower()))
-                        if _ud.category(c) != "Mn"
-                    )
-                    nlen = len(nl)
-                    if nlen == 0:
+                _page_index = page_text_index(page)
+                block_offsets = _page_index.block_offsets
+
+                # Accent-stripped, quote-normalised lowercase text with index mapping
+                ft_norm, _n2o = _page_index.text_view(_blacklist_fold_with_map)
+
+                # Normalised (start, end) of every hit, in term order then position
+                if _use_fuzzy:
+                    bl_spans = [
+                        (_fm.start(), _fm.end())
+                        for _fpat in bl_fuzzy_patterns
+                        for _fm in _fpat.finditer(ft_norm, overlapped=False)
+                    ]
+                else:
+                    bl_spans = [
+                        (ni, ni + len(bl_needles[ti]))
+                        for ni, ti in bl_matcher.find_all(ft_norm)
+                    ]
+
+                for ni, ni_end in bl_spans:
+                    idx = _n2o[ni]
+                    m_end = _n2o[min(ni_end, len(_n2o) - 1)]
+
+                    # Map char range → bbox
+                    hits = [blk for cs, ce, blk in block_offsets if ce > idx and cs < m_end]
+                    if not hits:
                         continue
-
-                    # Determine fuzzy vs exact matching
-                    _bl_fuzz = body.blacklist_fuzziness
-                    _use_fuzzy = _bl_fuzz < 0.98
-
-                    if _use_fuzzy:
-                        # Fuzzy matching via the 'regex' module's {e<=N} syntax
-                        import regex as _rx
-                        max_errors = max(1, round(nlen * (1.0 - _bl_fuzz)))
-                        # Escape the needle for regex, then wrap with fuzzy spec
-                        _escaped = _rx.escape(nl)
-                        _fpat = _rx.compile(
-                            rf"(?b)({_escaped}){{e<={max_errors}}}",
-                            _rx.IGNORECASE,
-                        )
-                        for _fm in _fpat.finditer(ft_norm, overlapped=False):
-                            ni = _fm.start()
-                            ni_end = _fm.end()
-                            idx = _n2o[ni]
-                            m_end = _n2o[min(ni_end, len(_n2o) - 1)]
-
-                            # Map char range → bbox
-                            hits = [blk for cs, ce, blk in block_offsets if ce > idx and cs < m_end]
-                            if not hits:
-                                continue
-                            bx0 = max(0.0, min(b.bbox.x0 for b in hits))
-                            by0 = max(0.0, min(b.bbox.y0 for b in hits))
-                            bx1 = min(page.width, max(b.bbox.x1 for b in hits))
-                            by1 = min(page.height, max(b.bbox.y1 for b in hits))
-
-                            r = PIIRegion(
-                                page_number=page.page_number,
-                                bbox=BBox(x0=round(bx0, 2), y0=round(by0, 2),
-                                          x1=round(bx1, 2), y1=round(by1, 2)),
-                                text=ft[idx:m_end],
-                                pii_type=_PIIType.CUSTOM,
-                                confidence=1.0,
-                                source=_DetSource.MANUAL,
-                                action=bl_target_action if bl_target_action else _RAct.PENDING,
-                                char_start=idx,
-                                char_end=m_end,
-                            )
-                            r.id = _uuid.uuid4().hex[:12]
-                            bl_regions.append(r)
-                    else:
-                        # Exact matching (current behaviour)
-                        pos = 0
-                        while True:
-                            ni = ft_norm.find(nl, pos)
-                            if ni == -1:
-                                break
-                            pos = ni + 1
-                            idx = _n2o[ni]
-                            m_end = _n2o[min(ni + nlen, len(_n2o) - 1)]
-
-                            # Map char range → bbox
-                            hits = [blk for cs, ce, blk in block_offsets if ce > idx and cs < m_end]
-                            if not hits:
-                                continue
-                            bx0 = max(0.0, min(b.bbox.x0 for b in hits))
-                            by0 = max(0.0, min(b.bbox.y0 for b in hits))
-                            bx1 = min(page.width, max(b.bbox.x1 for b in hits))
-                            by1 = min(page.height, max(b.bbox.y1 for b in hits))
-
-                            r = PIIRegion(
-                                page_number=page.page_number,
-                                bbox=BBox(x0=round(bx0, 2), y0=round(by0, 2),
-                                          x1=round(bx1, 2), y1=round(by1, 2)),
-                                text=ft[idx:m_end],
-                                pii_type=_PIIType.CUSTOM,
-                                confidence=1.0,
-                                source=_DetSource.MANUAL,
-                                action=bl_target_action if bl_target_action else _RAct.PENDING,
-                                char_start=idx,
-                                char_end=m_end,
-                            )
-                            r.id = _uuid.uuid4().hex[:12]
-                            bl_regions.append(r)
+                    bx0 = max(0.0, min(b.bbox.x0 for b in hits))
+                    by0 = max(0.0, min(b.bbox.y0 for b in hits))
+                    bx1 = min(page.width, max(b.bbox.x1 for b in hits))
+                    by1 = min(page.height, max(b.bbox.y1 for b in hits))
+
+                    r = PIIRegion(
+                        page_number=page.page_number,
+                        bbox=BBox(x0=round(bx0, 2), y0=round(by0, 2),
+                                  x1=round(bx1, 2), y1=round(by1, 2)),
+                        text=ft[idx:m_end],
+                        pii_type=_PIIType.CUSTOM,
+                        confidence=1.0,
+                        source=_DetSource.MANUAL,
+                        action=bl_target_action if bl_target_action else _RAct.PENDING,
+                        char_start=idx,
+                        char_end=m_end,
+                    )
+                    r.id = _uuid.uuid4().hex[:12]
+                    bl_regions.append(r)
 
             blacklist_created = len(bl_regions)
             # Prepend blacklist regions so they get highest priority in merge
@@ -526,7 +516,6 @@ async def redetect_pii(doc_id: str, body: RedetectRequest) -> dict[str, Any]:
         # "L'ESPRIT DU REPRENEURIAT\n(série documentaire…)").  The user's
         # expression should always win — trim the auto-detected region.
         from models.schemas import DetectionSource as _DetSrcTrim
-        from core.detection.pipeline import _compute_block_offsets as _cbo_trim
         from core.text_utils import normalize_for_matching as _nfm
 
         _trim_exprs: list[str] = []
@@ -569,7 +558,7 @@ async def redetect_pii(doc_id: str, body: RedetectRequest) -> dict[str, Any]:
                         # Recompute bbox from the trimmed char range
                         page = next((p for p in pages_to_scan if p.page_number == nr.page_number), None)
                         if page:
-                            _bo = _cbo_trim(page.text_blocks, page.full_text)
+                            _bo = page_text_index(page).block_offsets
                             _hits = [blk for cs, ce, blk in _bo if ce > nr.char_start and cs < nr.char_end]
                             if _hits:
                                 nr.bbox = BBox(
@@ -696,7 +685,6 @@ async def redetect_pii(doc_id: str, body: RedetectRequest) -> dict[str, Any]:
             detection_progress[doc_id]["error"] = str(e)
         raise HTTPException(500, detail="Redetect failed. Check server logs for details.")
     finally:
-        release_config_lock()
         release_detection_lock(doc_id)
 
 
@@ -709,7 +697,6 @@ async def reset_detection(doc_id: str) -> dict[str, Any]:
     just been uploaded.  Use this when persisted data from an older detection
     run is corrupt or stale.
     """
-    import asyncio
     import traceback
 
     doc = get_doc(doc_id)
@@ -718,7 +705,7 @@ async def reset_detection(doc_id: str) -> dict[str, Any]:
         raise HTTPException(409, detail="Detection already in progress. Please wait.")
 
     try:
-        from core.detection.pipeline import detect_pii_on_page, propagate_regions_across_pages
+        from core.detection.pipeline import propagate_regions_across_pages
         from core.detection.propagation import propagate_partial_org_names
         from core.detection.language import detect_language as _detect_lang
 
@@ -731,9 +718,10 @@ async def reset_detection(doc_id: str) -> dict[str, Any]:
 
         # Per-page language detection: only force a single language when
         # the user explicitly chose one (not "auto").
+        settings = DetectionSettings.from_config()
         _reset_lang: str | None = None
-        if config.detection_language and config.detection_language != "auto":
-            _reset_lang = config.detection_language
+        if settings.detection_language and settings.detection_language != "auto":
+            _reset_lang = settings.detection_language
 
         detection_progress[doc_id] = {
             "doc_id": doc_id,
@@ -750,42 +738,10 @@ async def reset_detection(doc_id: str) -> dict[str, Any]:
             "_started_at": _time.time(),
         }
 
-        def _run() -> list[PIIRegion]:
-            """Run fresh detection on all pages using parallel threads."""
-            progress = detection_progress[doc_id]
-            n_pages = len(doc.pages)
-            workers = min(_MAX_DETECTION_WORKERS, n_pages)
-            page_results: dict[int, list[PIIRegion]] = {}
-
-            def _detect_one(idx: int, page):
-                progress["page_statuses"][idx]["status"] = "running"
-                regions = detect_pii_on_page(
-                    page, llm_engine=engine,
-                    predetected_language=_reset_lang,
-                )
-                progress["page_statuses"][idx]["status"] = "done"
-                progress["page_statuses"][idx]["regions"] = len(regions)
-                return idx, regions
-
-            with ThreadPoolExecutor(max_workers=workers) as pool:
-                futures = {
-                    pool.submit(_detect_one, idx, page): idx
-                    for idx, page in enumerate(doc.pages)
-                }
-                for future in as_completed(futures):
-                    idx, regions = future.result()
-                    page_results[idx] = regions
-                    progress["pages_done"] = len(page_results)
-                    progress["regions_found"] = sum(len(r) for r in page_results.values())
-                    progress["current_page"] = idx + 1
-                    progress["elapsed_seconds"] = _time.time() - progress["_started_at"]
-
-            all_regions: list[PIIRegion] = []
-            for idx in sorted(page_results):
-                all_regions.extend(page_results[idx])
-            return all_regions
-
-        all_regions = await asyncio.to_thread(_run)
+        all_regions = await _detect_pages(
+            doc_id, doc.pages, engine=engine, language=_reset_lang,
+            settings=settings,
+        )
         doc.regions = propagate_regions_across_pages(all_regions, doc.pages)
         doc.regions = propagate_partial_org_names(doc.regions, doc.pages)
 
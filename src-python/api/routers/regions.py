@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import logging
 import unicodedata
 import uuid
+from collections import Counter, defaultdict
 from typing import Any, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -193,6 +195,7 @@ async def update_region_text(doc_id: str, region_id: str, req: UpdateTextRequest
 async def reanalyze_region(doc_id: str, region_id: str) -> dict[str, Any]:
     """Re-analyze the content under a region's bounding box."""
     from core.detection.pipeline import reanalyze_bbox
+    from core.detection.scheduler import detection_scheduler
     from core.llm.engine import llm_engine
 
     doc = get_doc(doc_id)
@@ -213,9 +216,15 @@ async def reanalyze_region(doc_id: str, region_id: str) -> dict[str, Any]:
         raise HTTPException(400, f"Page {region.page_number} data not available")
 
     engine = llm_engine if llm_engine.is_loaded() else None
-    # H5: reanalyze_bbox is CPU-bound; run in a thread to avoid blocking the event loop
+    # H5: reanalyze_bbox is CPU-bound; run it on the shared detection
+    # scheduler (ahead of any bulk page detection) to avoid blocking the
+    # event loop.
     try:
-        result = await asyncio.to_thread(reanalyze_bbox, page_data, region.bbox, llm_engine=engine)
+        result = await asyncio.wrap_future(detection_scheduler.submit(
+            doc_id,
+            lambda: reanalyze_bbox(page_data, region.bbox, llm_engine=engine),
+            interactive=True,
+        ))
     except Exception as e:
         logger.exception("reanalyze_bbox failed for region %s", region_id)
         raise HTTPException(500, f"Reanalysis failed: {e}")
@@ -497,134 +506,120 @@ def _blacklist_impl(doc_id: str, req: BlacklistRequest) -> dict[str, Any]:
     if not terms:
         return {"created": 0, "flagged": 0, "regions": []}
 
-    # Build existing-region lookup per page
-    existing_spans: dict[int, list[tuple[float, float, float, float, str, str]]] = {}
-    for r in doc.regions:
+    from core.detection.aho_corasick import AhoCorasick
+    from core.detection.page_index import page_text_index
+    from core.detection.region_index import RegionIndex
+    from core.text_utils import accent_fold_with_map
+
+    # Existing-region lookup per page, indexed by y-band.  The sequence
+    # number keeps "first covering region in document order" semantics.
+    existing_spans: dict[int, RegionIndex] = defaultdict(RegionIndex)
+    regions_by_id: dict[str, PIIRegion] = {}
+    for seq, r in enumerate(doc.regions):
+        regions_by_id.setdefault(r.id, r)
         if r.action == RegionAction.CANCEL:
             continue
-        existing_spans.setdefault(r.page_number, []).append(
-            (r.bbox.x0, r.bbox.y0, r.bbox.x1, r.bbox.y1,
-             r.text.strip().lower(), r.id)
+        existing_spans[r.page_number].add(
+            r.bbox.y0, r.bbox.y1,
+            (seq, r.bbox.x0, r.bbox.y0, r.bbox.x1, r.bbox.y1, r.id),
         )
-
-    from core.detection.pipeline import _compute_block_offsets
+    next_seq = len(doc.regions)
 
     created_regions: list[PIIRegion] = []
     flagged_ids: set[str] = set()
 
+    # One automaton over all accent-stripped lowercase terms, built once
+    # and reused for every page.
+    needle_norms = [accent_fold_with_map(t)[0] for t in terms]
+    matcher = AhoCorasick(needle_norms)
+
     for page in pages_to_scan:
         full_text = page.full_text
         if not full_text:
             continue
 
-        block_offsets = _compute_block_offsets(page.text_blocks, full_text)
-
-        # Build accent-stripped lowercase text + index map to originals.
-        # NFD decomposes accented chars (é→e+combining-accent), then we
-        # strip combining marks.  _n2o maps each position in the
-        # stripped string back to the corresponding original char index.
-        _nfd = unicodedata.normalize("NFD", full_text.lower())
-        _norm_chars: list[str] = []
-        _n2o: list[int] = []
-        _seen = 0
-        for ci in range(len(full_text)):
-            clen = len(unicodedata.normalize("NFD", full_text[ci]))
-            for _ in range(clen):
-                if _seen < len(_nfd) and unicodedata.category(_nfd[_seen]) != "Mn":
-                    _norm_chars.append(_nfd[_seen])
-                    _n2o.append(ci)
-                _seen += 1
-        _n2o.append(len(full_text))  # sentinel
-        full_norm = "".join(_norm_chars)
-
-        for needle in terms:
-            needle_norm = "".join(
-                ch for ch in unicodedata.normalize("NFD", needle.lower())
-                if unicodedata.category(ch) != "Mn"
-            )
-            needle_len = len(needle_norm)
-            if needle_len == 0:
-                continue
-
-            # Find all accent-agnostic, case-insensitive occurrences
-            search_start = 0
-            while True:
-                ni = full_norm.find(needle_norm, search_start)
-                if ni == -1:
+        page_index = page_text_index(page)
+        block_offsets = page_index.block_offsets
+        block_ends = page_index.ends
+        full_norm, n2o = page_index.text_view(accent_fold_with_map)
+
+        # Accent-agnostic, case-insensitive occurrences of every term, in
+        # term order then position (the order the regions are created in).
+        for ni, ti in matcher.find_all(full_norm):
+            needle_len = len(needle_norms[ti])
+            # Map normalized positions back to original text positions
+            idx = n2o[ni]
+            match_end = n2o[min(ni + needle_len, len(n2o) - 1)]
+
+            # Map char range → bounding box via text blocks
+            hit_blocks = []
+            for bi in range(bisect.bisect_right(block_ends, idx), len(block_offsets)):
+                cs, _ce, blk = block_offsets[bi]
+                if cs >= match_end:
                     break
-                search_start = ni + 1
-                # Map normalized positions back to original text positions
-                idx = _n2o[ni]
-                match_end = _n2o[min(ni + needle_len, len(_n2o) - 1)]
-
-                # Map char range → bounding box via text blocks
-                hit_blocks = []
-                for cs, ce, blk in block_offsets:
-                    if ce <= idx:
-                        continue
-                    if cs >= match_end:
-                        break
-                    hit_blocks.append(blk)
-
-                if not hit_blocks:
-                    continue
-
-                bx0 = min(b.bbox.x0 for b in hit_blocks)
-                by0 = min(b.bbox.y0 for b in hit_blocks)
-                bx1 = max(b.bbox.x1 for b in hit_blocks)
-                by1 = max(b.bbox.y1 for b in hit_blocks)
+                hit_blocks.append(blk)
 
-                # Clamp to page bounds
-                bx0 = max(0.0, min(bx0, page.width))
-                by0 = max(0.0, min(by0, page.height))
-                bx1 = max(0.0, min(bx1, page.width))
-                by1 = max(0.0, min(by1, page.height))
-
-                # Check if an existing region already covers this area
-                page_existing = existing_spans.get(page.page_number, [])
-                covered_region_id: str | None = None
-                for ex0, ey0, ex1, ey1, _etxt, eid in page_existing:
-                    ix0 = max(bx0, ex0)
-                    iy0 = max(by0, ey0)
-                    ix1 = min(bx1, ex1)
-                    iy1 = min(by1, ey1)
-                    if ix0 < ix1 and iy0 < iy1:
-                        inter_area = (ix1 - ix0) * (iy1 - iy0)
-                        new_area = max((bx1 - bx0) * (by1 - by0), 1e-6)
-                        if inter_area / new_area > _OVERLAP_COVERAGE_THRESHOLD:
-                            covered_region_id = eid
-                            break
+            if not hit_blocks:
+                continue
 
-                if covered_region_id:
-                    # Already covered — optionally flag the existing region
-                    if target_action and covered_region_id not in flagged_ids:
-                        for r in doc.regions:
-                            if r.id == covered_region_id:
-                                r.action = target_action
-                                flagged_ids.add(r.id)
-                                break
+            bx0 = min(b.bbox.x0 for b in hit_blocks)
+            by0 = min(b.bbox.y0 for b in hit_blocks)
+            bx1 = max(b.bbox.x1 for b in hit_blocks)
+            by1 = max(b.bbox.y1 for b in hit_blocks)
+
+            # Clamp to page bounds
+            bx0 = max(0.0, min(bx0, page.width))
+            by0 = max(0.0, min(by0, page.height))
+            bx1 = max(0.0, min(bx1, page.width))
+            by1 = max(0.0, min(by1, page.height))
+
+            # Check if an existing region already covers this area
+            covered_seq = next_seq
+            covered_region_id: str | None = None
+            new_area = max((bx1 - bx0) * (by1 - by0), 1e-6)
+            for seq, ex0, ey0, ex1, ey1, eid in existing_spans[page.page_number].overlapping(by0, by1):
+                if seq > covered_seq:
                     continue
+                ix0 = max(bx0, ex0)
+                iy0 = max(by0, ey0)
+                ix1 = min(bx1, ex1)
+                iy1 = min(by1, ey1)
+                if ix0 < ix1 and iy0 < iy1:
+                    inter_area = (ix1 - ix0) * (iy1 - iy0)
+                    if inter_area / new_area > _OVERLAP_COVERAGE_THRESHOLD:
+                        covered_seq, covered_region_id = seq, eid
+
+            if covered_region_id:
+                # Already covered — optionally flag the existing region
+                if target_action and covered_region_id not in flagged_ids:
+                    r = regions_by_id.get(covered_region_id)
+                    if r is not None:
+                        r.action = target_action
+                        flagged_ids.add(r.id)
+                continue
 
-                # Create a new region
-                matched_text = full_text[idx:match_end]
-                region = PIIRegion(
-                    page_number=page.page_number,
-                    bbox=BBox(x0=round(bx0, 2), y0=round(by0, 2),
-                              x1=round(bx1, 2), y1=round(by1, 2)),
-                    text=matched_text,
-                    pii_type=PIIType.CUSTOM,
-                    confidence=1.0,
-                    source=DetectionSource.MANUAL,
-                    action=target_action if target_action else RegionAction.PENDING,
-                    char_start=idx,
-                    char_end=match_end,
-                )
-                region.id = uuid.uuid4().hex[:12]
-                created_regions.append(region)
-                doc.regions.append(region)
-                existing_spans.setdefault(page.page_number, []).append(
-                    (bx0, by0, bx1, by1, needle_lower, region.id)
-                )
+            # Create a new region
+            matched_text = full_text[idx:match_end]
+            region = PIIRegion(
+                page_number=page.page_number,
+                bbox=BBox(x0=round(bx0, 2), y0=round(by0, 2),
+                          x1=round(bx1, 2), y1=round(by1, 2)),
+                text=matched_text,
+                pii_type=PIIType.CUSTOM,
+                confidence=1.0,
+                source=DetectionSource.MANUAL,
+                action=target_action if target_action else RegionAction.PENDING,
+                char_start=idx,
+                char_end=match_end,
+            )
+            region.id = uuid.uuid4().hex[:12]
+            created_regions.append(region)
+            doc.regions.append(region)
+            regions_by_id.setdefault(region.id, region)
+            existing_spans[page.page_number].add(
+                by0, by1, (next_seq, bx0, by0, bx1, by1, region.id)
+            )
+            next_seq += 1
 
     save_doc(doc)
 
@@ -667,10 +662,68 @@ def _normalize(text: str) -> str:
     return normalize_for_matching(text)
 
 
-def _fuzzy_ratio(a: str, b: str) -> float:
-    """Quick similarity ratio between two strings (0..1)."""
-    from difflib import SequenceMatcher
-    return SequenceMatcher(None, a, b).ratio()
+def _normalize_with_map(full_text: str) -> tuple[str, list[int]]:
+    """``_normalize(full_text)`` plus, for each of its positions, the
+    index of the originating character in *full_text*.
+
+    The chain is:
+      full_norm position  (ws-collapsed, lower, accent-stripped)
+          → tmp3 position  (same chars, NOT ws-collapsed; len == len(full_text))
+          → tmp  position  (raw NFKD; longer because combining marks are present)
+          → full_text position  (via nfkd_to_orig)
+
+    A position that falls off the end of the chain maps to
+    ``len(full_text)``.
+    """
+    full_norm = _normalize(full_text)
+    tmp = unicodedata.normalize("NFKD", full_text)
+    tmp3 = "".join(c for c in tmp if not unicodedata.combining(c)).lower()
+
+    # tmp2_to_nfkd[i] = NFKD position corresponding to tmp2/tmp3 position i.
+    # (_norm_chars holds tmp3 indices, which must not be fed directly into
+    # nfkd_to_orig: after the first accented char the two diverge.)
+    tmp2_to_nfkd: list[int] = []
+    for nfkd_i, c in enumerate(tmp):
+        if not unicodedata.combining(c):
+            tmp2_to_nfkd.append(nfkd_i)
+
+    # nfkd_to_orig[j] = position in full_text for NFKD position j
+    nfkd_to_orig: list[int] = []
+    for oi, orig_c in enumerate(full_text):
+        nfkd_to_orig.extend([oi] * len(unicodedata.normalize("NFKD", orig_c)))
+
+    # norm_chars[i] = position in tmp3 that corresponds to full_norm[i]
+    norm_chars: list[int] = []
+    in_space = False
+    stripped_leading = False
+    for ci, ch in enumerate(tmp3):
+        is_ws = ch in (" ", "\t", "\n", "\r")
+        if not stripped_leading and is_ws:
+            continue
+        if is_ws:
+            if not in_space:
+                norm_chars.append(ci)
+                in_space = True
+        else:
+            stripped_leading = True
+            norm_chars.append(ci)
+            in_space = False
+
+    n2o: list[int] = []
+    for tmp3_idx in norm_chars:
+        if tmp3_idx < len(tmp2_to_nfkd):
+            nfkd_idx = tmp2_to_nfkd[tmp3_idx]
+            if nfkd_idx < len(nfkd_to_orig):
+                n2o.append(nfkd_to_orig[nfkd_idx])
+                continue
+        n2o.append(len(full_text))
+    return full_norm, n2o
+
+
+def _normalized_char_counts(full_text: str) -> Counter:
+    """Character counts of ``_normalize(full_text)``, for skipping pages
+    that cannot contain a fuzzy highlight-all match."""
+    return Counter(_normalize(full_text))
 
 
 _FUZZY_THRESHOLD = 0.75  # 75% similarity for highlight-all matching
@@ -694,14 +747,27 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
     if not needle_norm:
         return {"created": 0, "new_regions": [], "all_ids": [source_region.id]}
 
-    # Gather existing region bboxes per page to avoid duplicates.
-    existing_spans: dict[int, list[tuple[float, float, float, float, str]]] = {}
-    for r in doc.regions:
+    from core.detection.fuzzy_match import FuzzyNeedle
+    from core.detection.page_index import page_text_index
+    from core.detection.region_index import RegionIndex
+
+    fuzzy_needle = FuzzyNeedle(needle_norm, _FUZZY_THRESHOLD)
+
+    # Existing region bboxes per page, indexed by y-band, to avoid
+    # duplicates.  Entries carry the normalised text.
+    existing_spans: dict[int, RegionIndex] = defaultdict(RegionIndex)
+    # Every live region per page (y-band), for superseded-partial cancels.
+    page_regions: dict[int, RegionIndex] = defaultdict(RegionIndex)
+    for seq, r in enumerate(doc.regions):
         if r.action == RegionAction.CANCEL:
             continue
-        existing_spans.setdefault(r.page_number, []).append(
-            (r.bbox.x0, r.bbox.y0, r.bbox.x1, r.bbox.y1, r.text.strip().lower())
+        existing_spans[r.page_number].add(
+            r.bbox.y0, r.bbox.y1,
+            (r.bbox.x0, r.bbox.y0, r.bbox.x1, r.bbox.y1, _normalize(r.text.strip().lower())),
         )
+        page_regions[r.page_number].add(r.bbox.y0, r.bbox.y1, (seq, r, _normalize(r.text)))
+    next_seq = len(doc.regions)
+    needle_lower_norm = _normalize(needle_lower)
 
     new_regions: list[PIIRegion] = []
     cancelled_ids: set[str] = set()
@@ -711,72 +777,17 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
         if not full_text:
             continue
 
-        from core.detection.pipeline import _compute_block_offsets
-        from core.detection.block_offsets import _char_offsets_to_line_bboxes, _char_offset_to_bbox
-        block_offsets = _compute_block_offsets(page.text_blocks, full_text)
+        page_index = page_text_index(page)
+        geometry = page_index.geometry
 
         # ---- Fuzzy sliding-window search for needle in full_text ----
         needle_len = len(needle_norm)
-        full_norm = _normalize(full_text)
-
-        # Build a mapping from normalized-string index → original char index.
-        #
-        # The chain is:
-        #   full_norm position  (ws-collapsed, lower, accent-stripped)
-        #       → tmp3 position  (same chars, NOT ws-collapsed; len == len(full_text))
-        #       → tmp  position  (raw NFKD; longer because combining marks are present)
-        #       → full_text position  (via nfkd_to_orig)
-        #
-        # Bug in previous code: _norm_chars[i] is a tmp3 index, but was fed
-        # directly into nfkd_to_orig (indexed by NFKD positions).  After the
-        # first accented char the two arrays diverge → wrong offsets → wrong
-        # bboxes for regions with accented multi-word names.  Fix: build
-        # tmp2_to_nfkd to bridge tmp3/tmp2 positions → NFKD positions.
-        import unicodedata, re as _re
-        tmp = unicodedata.normalize("NFKD", full_text)
-        tmp3 = "".join(c for c in tmp if not unicodedata.combining(c)).lower()
-
-        # tmp2_to_nfkd[i] = NFKD position corresponding to tmp2/tmp3 position i
-        _tmp2_to_nfkd: list[int] = []
-        _nfkd_i = 0
-        for _c in tmp:
-            if not unicodedata.combining(_c):
-                _tmp2_to_nfkd.append(_nfkd_i)
-            _nfkd_i += 1
-
-        # nfkd_to_orig[j] = position in full_text for NFKD position j
-        nfkd_to_orig: list[int] = []
-        _ni = 0
-        for _oi, _orig_c in enumerate(full_text):
-            for _ in unicodedata.normalize("NFKD", _orig_c):
-                nfkd_to_orig.append(_oi)
-                _ni += 1
-
-        # _norm_chars[i] = position in tmp3 that corresponds to full_norm[i]
-        _norm_chars: list[int] = []
-        in_space = False
-        stripped_leading = False
-        for ci, ch in enumerate(tmp3):
-            is_ws = ch in (" ", "\t", "\n", "\r")
-            if not stripped_leading and is_ws:
-                continue
-            if is_ws:
-                if not in_space:
-                    _norm_chars.append(ci)
-                    in_space = True
-            else:
-                stripped_leading = True
-                _norm_chars.append(ci)
-                in_space = False
+        full_norm, norm_to_orig = page_index.text_view(_normalize_with_map)
 
         def norm_idx_to_orig(ni_: int) -> int:
             """Map normalized-string index → original full_text index."""
-            if ni_ < len(_norm_chars):
-                tmp3_idx = _norm_chars[ni_]                    # position in tmp3 (== tmp2)
-                if tmp3_idx < len(_tmp2_to_nfkd):
-                    nfkd_idx = _tmp2_to_nfkd[tmp3_idx]        # position in NFKD (tmp)
-                    if nfkd_idx < len(nfkd_to_orig):
-                        return nfkd_to_orig[nfkd_idx]          # position in full_text
+            if ni_ < len(norm_to_orig):
+                return norm_to_orig[ni_]
             return len(full_text)
 
         # Try exact normalized match first (fast path)
@@ -796,48 +807,34 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
         # Also try fuzzy sliding window to catch OCR/encoding variations.
         # Only run when exact matching found nothing — apostrophe/quote variants
         # are now handled by normalize_for_matching so they hit the exact path.
-        if needle_len >= 2 and len(matches) == 0:
-            window = needle_len
-            # Pre-compute needle character frequency for fast pre-filter
-            from collections import Counter
-            needle_freq = Counter(needle_norm)
+        # Windows of length L, L±1, L±2 are tried in that order; a window
+        # is only compared when its character overlap with the needle can
+        # still reach the threshold (see core.detection.fuzzy_match), and a
+        # page whose whole text shares too few characters is skipped.
+        min_shared = needle_len * _CHAR_OVERLAP_MIN_RATIO
+        if (
+            needle_len >= 2 and len(matches) == 0
+            and fuzzy_needle.shared_chars(page_index.text_view(_normalized_char_counts)) >= min_shared
+        ):
+            sizes: list[int] = []
             for tol in (0, 1, 2):
-                wlen = window + tol
-                if wlen > len(full_norm):
+                if needle_len + tol > len(full_norm):
                     continue
-                for si in range(len(full_norm) - wlen + 1):
-                    chunk = full_norm[si : si + wlen]
-                    # Fast char-frequency pre-filter: skip if character overlap is too low
-                    chunk_freq = Counter(chunk)
-                    shared = sum((needle_freq & chunk_freq).values())
-                    if shared < needle_len * _CHAR_OVERLAP_MIN_RATIO:
-                        continue
-                    if _fuzzy_ratio(needle_norm, chunk) >= _FUZZY_THRESHOLD:
-                        orig_start = norm_idx_to_orig(si)
-                        orig_end = norm_idx_to_orig(si + wlen) if si + wlen < len(full_norm) else len(full_text)
-                        if any(abs(orig_start - ms) < max(needle_len // 2, 2) for ms, _ in matches):
-                            continue
-                        matches.append((orig_start, orig_end))
-                wlen = window - tol if tol > 0 else -1
-                if wlen >= 2 and wlen <= len(full_norm):
-                    for si in range(len(full_norm) - wlen + 1):
-                        chunk = full_norm[si : si + wlen]
-                        chunk_freq = Counter(chunk)
-                        shared = sum((needle_freq & chunk_freq).values())
-                        if shared < needle_len * _CHAR_OVERLAP_MIN_RATIO:
-                            continue
-                        if _fuzzy_ratio(needle_norm, chunk) >= _FUZZY_THRESHOLD:
-                            orig_start = norm_idx_to_orig(si)
-                            orig_end = norm_idx_to_orig(si + wlen) if si + wlen < len(full_norm) else len(full_text)
-                            if any(abs(orig_start - ms) < max(needle_len // 2, 2) for ms, _ in matches):
-                                continue
-                            matches.append((orig_start, orig_end))
+                sizes.append(needle_len + tol)
+                if tol > 0 and needle_len - tol >= 2:
+                    sizes.append(needle_len - tol)
+            for si, wlen in fuzzy_needle.windows(full_norm, sizes, min_shared):
+                orig_start = norm_idx_to_orig(si)
+                orig_end = norm_idx_to_orig(si + wlen) if si + wlen < len(full_norm) else len(full_text)
+                if any(abs(orig_start - ms) < max(needle_len // 2, 2) for ms, _ in matches):
+                    continue
+                matches.append((orig_start, orig_end))
 
         for idx, match_end in matches:
             # Use per-line bbox splitting — same approach as propagation.py
-            line_bboxes = _char_offsets_to_line_bboxes(idx, match_end, block_offsets)
+            line_bboxes = geometry.line_bboxes(idx, match_end)
             if not line_bboxes:
-                single = _char_offset_to_bbox(idx, match_end, block_offsets)
+                single = geometry.bbox(idx, match_end)
                 if single is None:
                     continue
                 line_bboxes = [single]
@@ -853,21 +850,21 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
                 bx1 = max(0.0, min(bx1, page.width))
                 by1 = max(0.0, min(by1, page.height))
 
-                page_existing = existing_spans.get(page.page_number, [])
+                page_existing = existing_spans[page.page_number]
                 already_covered = False
                 matched_text_norm = _normalize(matched_text)
-                for ex0, ey0, ex1, ey1, etxt in page_existing:
+                new_area = max((bx1 - bx0) * (by1 - by0), 1e-6)
+                for ex0, ey0, ex1, ey1, etxt_norm in page_existing.overlapping(by0, by1):
                     # Same normalised text + y-ranges overlap → same occurrence.
                     # We intentionally DON'T require x/area overlap here because
                     # add_manual_region snaps bboxes via word-centre logic while
                     # _char_offsets_to_line_bboxes uses a different line-level
                     # method; the two can have zero bbox intersection for the same
                     # text, but they will always share the same y-range.
-                    if _normalize(etxt) == matched_text_norm:
-                        if ey0 <= by1 and ey1 >= by0:   # any y-overlap
-                            already_covered = True
-                            break
-                        continue   # same text but different line → don't skip
+                    # (The index only yields entries that y-overlap.)
+                    if etxt_norm == matched_text_norm:
+                        already_covered = True
+                        break
                     # Different text: fall back to area-coverage threshold.
                     # BUT don't skip when the existing region's text is
                     # significantly shorter than the match — that means the
@@ -875,14 +872,12 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
                     # "Nautique Jacques-Cartier" inside the new match
                     # "Club Nautique Jacques-Cartier").  The new match
                     # represents a broader selection and must be created.
-                    etxt_norm = _normalize(etxt)
                     if len(etxt_norm) < len(matched_text_norm) * 0.85:
                         continue
                     ix0 = max(bx0, ex0); iy0 = max(by0, ey0)
                     ix1 = min(bx1, ex1); iy1 = min(by1, ey1)
                     if ix0 < ix1 and iy0 < iy1:
                         inter_area = (ix1 - ix0) * (iy1 - iy0)
-                        new_area = max((bx1 - bx0) * (by1 - by0), 1e-6)
                         if inter_area / new_area > _OVERLAP_COVERAGE_THRESHOLD:
                             already_covered = True
                             break
@@ -895,10 +890,11 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
                 # "Nautique Jacques-Cartier" cancelled when the new match is
                 # "Club Nautique Jacques-Cartier").  Adjacent regions are safe
                 # because they won't have a real bbox intersection.
-                for _er in list(doc.regions):
-                    if _er.action == RegionAction.CANCEL or _er.page_number != page.page_number:
+                for _seq, _er, _er_norm in sorted(
+                    page_regions[page.page_number].overlapping(by0, by1), key=lambda e: e[0],
+                ):
+                    if _er.action == RegionAction.CANCEL:
                         continue
-                    _er_norm = _normalize(_er.text)
                     if not _er_norm or _er_norm == matched_text_norm:
                         continue
                     if _er_norm not in matched_text_norm:
@@ -910,11 +906,10 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
                         cancelled_ids.add(_er.id)
                         # Remove from existing_spans so it no longer blocks
                         # future match iterations on this page
-                        existing_spans[page.page_number] = [
-                            _s for _s in existing_spans.get(page.page_number, [])
-                            if not (abs(_s[0] - _er.bbox.x0) < 1.0
-                                    and abs(_s[1] - _er.bbox.y0) < 1.0)
-                        ]
+                        _ey0 = _er.bbox.y0
+                        for _s in list(page_existing.starting_in(_ey0 - 1.0, _ey0 + 1.0)):
+                            if abs(_s[0] - _er.bbox.x0) < 1.0 and abs(_s[1] - _ey0) < 1.0:
+                                page_existing.remove(_s[1], _s[3], _s)
 
                 region = PIIRegion(
                     page_number=page.page_number,
@@ -930,9 +925,11 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
                 )
                 new_regions.append(region)
                 doc.regions.append(region)
-                existing_spans.setdefault(page.page_number, []).append(
-                    (bx0, by0, bx1, by1, needle_lower)
+                page_existing.add(by0, by1, (bx0, by0, bx1, by1, needle_lower_norm))
+                page_regions[page.page_number].add(
+                    region.bbox.y0, region.bbox.y1, (next_seq, region, _normalize(region.text)),
                 )
+                next_seq += 1
 
     # Collect all matching region IDs (existing + new) using fuzzy match.
     # We require the texts to be approximately EQUAL (not just substring matches)
@@ -952,7 +949,7 @@ def _highlight_all_impl(doc_id: str, req: HighlightAllRequest) -> dict[str, Any]
         # AND fuzzy-matches the needle (prevents false substring inclusions).
         if r.id == source_region.id or r.id in new_ids:
             all_ids.append(r.id)
-        elif _fuzzy_ratio(needle_norm, r_norm) >= _FUZZY_THRESHOLD:
+        elif fuzzy_needle.ratio_at_least(r_norm):
             all_ids.append(r.id)
 
     save_doc(doc)
@@ -8,10 +8,13 @@ import platform
 import subprocess
 from typing import Any, Optional
 
+import regex
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from core.config import config
+from core.detection.detection_config import CUSTOM_PATTERN_TIMEOUT_S
+from core.detection.regex_detector import check_pattern_complexity
 from api.deps import get_store
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,14 @@ class SettingsUpdate(BaseModel):
     llm_detection_enabled: Optional[bool] = None
     confidence_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
     detection_fuzziness: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    parallel_layers: Optional[bool] = None
+    cascade_enabled: Optional[bool] = None
+    cascade_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    prefilter_enabled: Optional[bool] = None
+    prefilter_threshold: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    fingerprint_reuse: Optional[bool] = None
+    paragraph_cache_enabled: Optional[bool] = None
+    gazetteer_enabled: Optional[bool] = None
     ocr_language: Optional[str] = None
     ocr_dpi: Optional[int] = Field(default=None, ge=72, le=1200)
     render_dpi: Optional[int] = Field(default=None, ge=72, le=1200)
@@ -41,6 +52,7 @@ class SettingsUpdate(BaseModel):
     llm_api_url: Optional[str] = None
     llm_api_key: Optional[str] = None
     llm_api_model: Optional[str] = None
+    llm_api_max_concurrency: Optional[int] = Field(default=None, ge=1, le=64)
 
 
 # ---------------------------------------------------------------------------
@@ -101,6 +113,21 @@ async def update_settings(body: SettingsUpdate) -> dict[str, Any]:
     return {"status": "ok", "applied": applied}
 
 
+@router.get("/settings/detection-cache")
+async def get_detection_cache_stats() -> dict[str, Any]:
+    """Size and hit-rate counters of the cross-document paragraph cache."""
+    from core.detection.paragraph_cache import paragraph_cache
+    return paragraph_cache.stats()
+
+
+@router.delete("/settings/detection-cache")
+async def clear_detection_cache() -> dict[str, str]:
+    """Drop every cached paragraph result."""
+    from core.detection.paragraph_cache import paragraph_cache
+    paragraph_cache.clear()
+    return {"status": "ok"}
+
+
 # ---------------------------------------------------------------------------
 # PII Label configuration
 # ---------------------------------------------------------------------------
@@ -260,9 +287,12 @@ async def save_custom_patterns(patterns: list[dict]) -> dict[str, Any]:
         
         if pattern_str:
             try:
-                re_mod.compile(pattern_str)
-            except re_mod.error as e:
+                regex.compile(pattern_str)
+            except regex.error as e:
                 raise HTTPException(400, f"Invalid regex in pattern '{clean['name']}': {e}")
+            reason = check_pattern_complexity(pattern_str)
+            if reason:
+                raise HTTPException(400, f"Pattern '{clean['name']}' is prone to catastrophic backtracking: {reason}")
         elif template:
             # Convert template to regex and validate
             try:
@@ -316,9 +346,12 @@ async def add_custom_pattern(body: CustomPatternCreate) -> dict[str, Any]:
     
     if body.pattern:
         try:
-            re_mod.compile(body.pattern)
-        except re_mod.error as e:
+            regex.compile(body.pattern)
+        except regex.error as e:
             raise HTTPException(400, f"Invalid regex: {e}")
+        reason = check_pattern_complexity(body.pattern)
+        if reason:
+            raise HTTPException(400, f"Pattern is prone to catastrophic backtracking: {reason}")
         new_pattern["pattern"] = body.pattern
     elif body.template:
         try:
@@ -374,16 +407,20 @@ async def test_pattern(body: PatternTestRequest) -> dict[str, Any]:
     
     Returns all matches found in the text.
     """
-    import re as re_mod
-    
     try:
-        flags = 0 if body.case_sensitive else re_mod.IGNORECASE
-        compiled = re_mod.compile(body.pattern, flags)
-    except re_mod.error as e:
+        flags = 0 if body.case_sensitive else regex.IGNORECASE
+        compiled = regex.compile(body.pattern, flags)
+    except regex.error as e:
         raise HTTPException(400, f"Invalid regex: {e}")
     
+    try:
+        found = list(compiled.finditer(body.test_text, timeout=CUSTOM_PATTERN_TIMEOUT_S))
+    except TimeoutError:
+        raise HTTPException(
+            400, f"Pattern timed out after {CUSTOM_PATTERN_TIMEOUT_S}s on the sample text",
+        )
     matches = []
-    for m in compiled.finditer(body.test_text):
+    for m in found:
         matches.append({
             "text": m.group(),
             "start": m.start(),
@@ -395,9 +432,21 @@ async def test_pattern(body: PatternTestRequest) -> dict[str, Any]:
         "pattern": body.pattern,
         "match_count": len(matches),
         "matches": matches,
+        "complexity_warning": check_pattern_complexity(body.pattern),
     }
 
 
+@router.get("/settings/patterns/stats")
+async def get_custom_pattern_stats() -> dict[str, dict]:
+    """Average / max runtime and timeout counts per enabled custom pattern.
+
+    Keyed by pattern id.  Counters cover the current process and reset
+    when a pattern is edited.
+    """
+    from core.detection.regex_detector import get_custom_pattern_stats as _stats
+    return _stats()
+
+
 # ---------------------------------------------------------------------------
 # System hardware info
 # ---------------------------------------------------------------------------
@@ -168,6 +168,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Shutdown cleanup
     logger.info("Shutting down promptShield sidecar...")
 
+    # Flush the cross-document detection cache
+    try:
+        from core.detection.paragraph_cache import paragraph_cache
+        paragraph_cache.save()
+    except Exception as e:
+        logger.warning(f"Failed to save detection cache: {e}")
+
     # Close the vault SQLite connection
     try:
         from core.vault.store import vault
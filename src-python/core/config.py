@@ -10,7 +10,7 @@ from pathlib import Path
 
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,10 @@ class AppConfig(BaseModel):
         default_factory=lambda: os.environ.get("DOC_ANON_LLM_API_KEY", ""),
     )
     llm_api_model: str = ""                            # e.g. gpt-4o-mini, claude-sonnet-4-20250514
+    # Requests the remote engine keeps in flight at once (across all pages
+    # and chunks).  Servers such as vLLM, llama.cpp server or Ollama batch
+    # concurrent requests; set to 1 for providers with strict rate limits.
+    llm_api_max_concurrency: int = Field(default=4, ge=1, le=64)
 
     # PII Detection thresholds
     regex_enabled: bool = True
@@ -69,6 +73,38 @@ class AppConfig(BaseModel):
         ),
     )
 
+    # Run the independent detection layers (regex, NER, GLiNER, LLM) of a
+    # page concurrently instead of one after another.  Lowers single-page
+    # latency at the cost of higher peak CPU / memory use.
+    parallel_layers: bool = False
+
+    # Cascade mode: run regex + spaCy first and only escalate pages whose
+    # uncertainty score (see core.detection.cascade) reaches the threshold
+    # to the expensive layers (BERT, GLiNER, LLM).
+    cascade_enabled: bool = False
+    cascade_threshold: float = Field(default=0.3, ge=0.0, le=1.0)
+
+    # Prefilter: skip the model layers (NER, GLiNER, LLM) on pages whose
+    # PII-likelihood score (see core.detection.prefilter) is below the
+    # threshold.  Regex always runs.
+    prefilter_enabled: bool = False
+    prefilter_threshold: float = Field(default=0.25, ge=0.0, le=1.0)
+
+    # Reuse detection results for repeated lines (headers, footers,
+    # disclaimers) and whole duplicate pages within one detection run
+    # instead of sending every copy through the model layers.
+    fingerprint_reuse: bool = False
+
+    # Persistent cross-document cache of NER / GLiNER results per paragraph
+    # (see core.detection.paragraph_cache) for documents built from the
+    # same templates.
+    paragraph_cache_enabled: bool = False
+
+    # Per-document gazetteer (see core.detection.gazetteer): names found
+    # with high confidence on earlier pages are matched directly on later
+    # pages, and lines they fully explain skip the model layers.
+    gazetteer_enabled: bool = False
+
     # Skip text whose rendered height >= this many PDF points.
     # Prevents redacting watermarks, headers, decorative text, etc.
     # 0 = disabled (redact everything regardless of size).
@@ -142,11 +178,14 @@ class AppConfig(BaseModel):
     _PERSISTABLE_KEYS: set[str] = {
         "regex_enabled", "custom_patterns_enabled", "ner_enabled", "llm_detection_enabled",
         "confidence_threshold", "detection_fuzziness", "max_font_size_pt",
+        "parallel_layers", "cascade_enabled", "cascade_threshold",
+        "prefilter_enabled", "prefilter_threshold", "fingerprint_reuse",
+        "paragraph_cache_enabled", "gazetteer_enabled",
         "ocr_language", "ocr_dpi",
         "render_dpi", "tesseract_cmd",
         "ner_backend", "ner_model_preference", "detection_language",
         "llm_model_path",
-        "llm_provider", "llm_api_url", "llm_api_model",
+        "llm_provider", "llm_api_url", "llm_api_model", "llm_api_max_concurrency",
         "llm_batch_size", "llm_flash_attn",
     }
 
@@ -181,5 +220,48 @@ class AppConfig(BaseModel):
             logger.warning(f"Failed to save settings: {exc}")
 
 
+class DetectionSettings(BaseModel):
+    """Immutable snapshot of the settings that drive one detection run.
+
+    Built once per request (from the global config plus any per-request
+    overrides) and passed explicitly through ``detect_pii_on_page`` and
+    the layer functions, so concurrent runs can use different thresholds
+    and layer toggles without touching the shared ``config`` object.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    regex_enabled: bool = True
+    custom_patterns_enabled: bool = True
+    ner_enabled: bool = True
+    llm_detection_enabled: bool = True
+    regex_types: Optional[tuple[str, ...]] = None
+    ner_types: Optional[tuple[str, ...]] = None
+    confidence_threshold: float = Field(default=0.55, ge=0.0, le=1.0)
+    detection_fuzziness: float = Field(default=0.5, ge=0.0, le=1.0)
+    max_font_size_pt: float = Field(default=28.0, ge=0.0)
+    ner_backend: str = "auto"
+    detection_language: str = "auto"
+    parallel_layers: bool = False
+    cascade_enabled: bool = False
+    cascade_threshold: float = Field(default=0.3, ge=0.0, le=1.0)
+    prefilter_enabled: bool = False
+    prefilter_threshold: float = Field(default=0.25, ge=0.0, le=1.0)
+    fingerprint_reuse: bool = False
+    paragraph_cache_enabled: bool = False
+    gazetteer_enabled: bool = False
+
+    @classmethod
+    def from_config(cls, cfg: AppConfig | None = None, **overrides: object) -> "DetectionSettings":
+        """Snapshot *cfg* (default: the global config), applying *overrides*."""
+        cfg = cfg if cfg is not None else config
+        values = {name: getattr(cfg, name) for name in cls.model_fields}
+        values.update(overrides)
+        for key in ("regex_types", "ner_types"):
+            if values[key] is not None:
+                values[key] = tuple(values[key])
+        return cls(**values)
+
+
 # Singleton — importable from anywhere
 config = AppConfig()
@@ -0,0 +1,107 @@
+"""Aho–Corasick multi-pattern matcher.
+
+Finds every occurrence of any of *n* patterns in one pass over the text,
+instead of one ``str.find`` / regex scan per pattern.  Used wherever a
+large, fixed term list is matched against many pages: user blacklists and
+the per-document gazetteer.
+
+The automaton is pure Python and immutable once built, so one instance
+can be shared across pages and threads.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+# Below this many patterns one C-level ``str.find`` loop per pattern beats
+# the pure-Python automaton walk, so :meth:`AhoCorasick.find_all` uses it.
+_FIND_LOOP_MAX_PATTERNS = 200
+
+
+class AhoCorasick:
+    """Compiled automaton over a fixed list of patterns.
+
+    Pattern ids are the positions in the list passed to the constructor.
+    Empty patterns never match.
+    """
+
+    __slots__ = ("_patterns", "_goto", "_fail", "_out", "_lengths")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        patterns = list(patterns)
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        lengths: list[int] = []
+        for pid, pattern in enumerate(patterns):
+            lengths.append(len(pattern))
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] += (pid,)
+
+        # Breadth-first failure links; each state's outputs include those
+        # of its failure state so the search loop never follows them.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(ch, 0)
+                if out[fail[child]]:
+                    out[child] += out[fail[child]]
+
+        self._patterns = patterns
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._lengths = lengths
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def pattern_length(self, pid: int) -> int:
+        return self._lengths[pid]
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, pattern_id)`` for every occurrence, overlaps included.
+
+        Matches are produced in order of their *end* position.
+        """
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        state = 0
+        for i, ch in enumerate(text):
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            if out[state]:
+                for pid in out[state]:
+                    yield i - lengths[pid] + 1, pid
+
+    def find_all(self, text: str) -> list[tuple[int, int]]:
+        """All ``(start, pattern_id)`` occurrences, sorted by pattern then start."""
+        if len(self._patterns) <= _FIND_LOOP_MAX_PATTERNS:
+            out: list[tuple[int, int]] = []
+            for pid, pattern in enumerate(self._patterns):
+                if not pattern:
+                    continue
+                i = text.find(pattern)
+                while i != -1:
+                    out.append((i, pid))
+                    i = text.find(pattern, i + 1)
+            return out
+        return sorted(self.iter_matches(text), key=lambda m: (m[1], m[0]))
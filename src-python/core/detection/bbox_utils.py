@@ -6,10 +6,12 @@ spatial index to reduce overlap checks from O(n²) to ~O(n) amortised.
 
 from __future__ import annotations
 
-from collections import defaultdict
-
 from models.schemas import BBox, PIIRegion
-from core.detection.detection_config import BBOX_GRID_CELL_SIZE
+from core.detection.detection_config import (
+    BBOX_GRID_CELL_SIZE,
+    BBOX_GRID_MAX_CELLS,
+    BBOX_GRID_MIN_CELL_SIZE,
+)
 
 
 def _bbox_overlap_area(a: BBox, b: BBox) -> float:
@@ -48,74 +50,130 @@ def _bbox_cells(bbox: BBox) -> set[tuple[int, int]]:
     return cells
 
 
+def _adaptive_cell_size(regions: list[PIIRegion]) -> tuple[float, float]:
+    """Grid cell (width, height) matched to the regions of one page.
+
+    A fixed cell is too coarse for a dense form (dozens of small fields
+    share one cell and are compared pairwise) and too fine for table rows
+    and addresses (one region spans many cells).  Cells the size of the
+    median region keep both the cells per region and the regions per cell
+    small.  ``BBOX_GRID_MIN_CELL_SIZE`` guards against degenerate boxes;
+    the few regions much larger than the median are handled outside the
+    grid (``BBOX_GRID_MAX_CELLS``).
+    """
+    n = len(regions)
+    widths = sorted(r.bbox.x1 - r.bbox.x0 for r in regions)
+    heights = sorted(r.bbox.y1 - r.bbox.y0 for r in regions)
+    return (
+        max(widths[n // 2], BBOX_GRID_MIN_CELL_SIZE),
+        max(heights[n // 2], BBOX_GRID_MIN_CELL_SIZE),
+    )
+
+
 def _resolve_bbox_overlaps(regions: list[PIIRegion]) -> list[PIIRegion]:
     """Ensure no two highlight rectangles overlap on the same page.
 
-    Uses a grid-based spatial index so each region is only compared
-    against nearby regions, reducing average complexity from O(n²) to
-    ~O(n × k) where k is the average number of neighbours in the same
-    grid cell (typically small).
+    Uses a grid-based spatial index (cells sized by
+    :func:`_adaptive_cell_size`) so each region is only compared against
+    nearby regions, reducing average complexity from O(n²) to ~O(n × k)
+    where k is the average number of neighbours in the same grid cell.
 
     Strategy:
     1. Sort regions by confidence descending (process higher-conf first).
     2. For each region, check overlap only against accepted regions in
-       the same grid cells; shrink/clip lower-confidence region.
+       the same grid cells, in acceptance order; shrink/clip the
+       lower-confidence region.
     3. If clipping would reduce a region to near-zero area, drop it.
+
+    A region spanning more than ``BBOX_GRID_MAX_CELLS`` cells is not put
+    in the grid; it is compared against every keeper, and every later
+    region is compared against it.
+
+    Clipping runs on plain floats; a new ``BBox`` and region copy are only
+    made for regions that were actually clipped.
     """
     if len(regions) <= 1:
         return regions
 
     result = sorted(regions, key=lambda r: -r.confidence)
+    cell_w, cell_h = _adaptive_cell_size(result)
     final: list[PIIRegion] = []
+    # Accepted (possibly clipped) coordinates, parallel to `final`
+    kx0: list[float] = []
+    ky0: list[float] = []
+    kx1: list[float] = []
+    ky1: list[float] = []
     # Grid: cell → list of indices into `final`
-    grid: dict[tuple[int, int], list[int]] = defaultdict(list)
-
-    for region in result:
-        bbox = BBox(
-            x0=region.bbox.x0,
-            y0=region.bbox.y0,
-            x1=region.bbox.x1,
-            y1=region.bbox.y1,
-        )
-
-        # Collect candidate keepers from overlapping grid cells
-        cells = _bbox_cells(bbox)
-        seen_keepers: set[int] = set()
-        for cell in cells:
-            for ki in grid.get(cell, ()):
-                seen_keepers.add(ki)
-
-        for ki in seen_keepers:
-            keeper = final[ki]
-            if _bbox_overlap_area(bbox, keeper.bbox) <= 0:
+    grid: dict[tuple[int, int], list[int]] = {}
+    # Keepers spanning too many cells to register in the grid
+    large: list[int] = []
+    # seen[k] == i once keeper k has been collected for region i
+    seen = [-1] * len(result)
+
+    for i, region in enumerate(result):
+        b = region.bbox
+        x0, y0, x1, y1 = b.x0, b.y0, b.x1, b.y1
+        r0, r1 = int(y0 // cell_h), int(y1 // cell_h)
+        c0, c1 = int(x0 // cell_w), int(x1 // cell_w)
+
+        # Collect candidate keepers from the cells of the unclipped bbox
+        if (r1 - r0 + 1) * (c1 - c0 + 1) > BBOX_GRID_MAX_CELLS:
+            near = range(len(final))
+        else:
+            near = list(large)
+            for r in range(r0, r1 + 1):
+                for c in range(c0, c1 + 1):
+                    for ki in grid.get((r, c), ()):
+                        if seen[ki] != i:
+                            seen[ki] = i
+                            near.append(ki)
+            near.sort()
+
+        clipped = False
+        for ki in near:
+            ax0, ay0, ax1, ay1 = kx0[ki], ky0[ki], kx1[ki], ky1[ki]
+            overlap_x = min(x1, ax1) - max(x0, ax0)
+            overlap_y = min(y1, ay1) - max(y0, ay0)
+            if overlap_x <= 0 or overlap_y <= 0:
                 continue
 
-            overlap_x = min(bbox.x1, keeper.bbox.x1) - max(bbox.x0, keeper.bbox.x0)
-            overlap_y = min(bbox.y1, keeper.bbox.y1) - max(bbox.y0, keeper.bbox.y0)
-
-            cx = (bbox.x0 + bbox.x1) / 2
-            cy = (bbox.y0 + bbox.y1) / 2
-            kcx = (keeper.bbox.x0 + keeper.bbox.x1) / 2
-            kcy = (keeper.bbox.y0 + keeper.bbox.y1) / 2
-
             if overlap_y <= overlap_x:
-                if cy < kcy:
-                    bbox = BBox(x0=bbox.x0, y0=bbox.y0, x1=bbox.x1, y1=keeper.bbox.y0)
+                if (y0 + y1) / 2 < (ay0 + ay1) / 2:
+                    y1 = ay0
                 else:
-                    bbox = BBox(x0=bbox.x0, y0=keeper.bbox.y1, x1=bbox.x1, y1=bbox.y1)
+                    y0 = ay1
             else:
-                if cx < kcx:
-                    bbox = BBox(x0=bbox.x0, y0=bbox.y0, x1=keeper.bbox.x0, y1=bbox.y1)
+                if (x0 + x1) / 2 < (ax0 + ax1) / 2:
+                    x1 = ax0
                 else:
-                    bbox = BBox(x0=keeper.bbox.x1, y0=bbox.y0, x1=bbox.x1, y1=bbox.y1)
+                    x0 = ax1
+            clipped = True
 
-        if bbox.width < 2 or bbox.height < 2:
+        if x1 - x0 < 2 or y1 - y0 < 2:
             continue
 
         idx = len(final)
-        final.append(region.model_copy(update={"bbox": bbox}))
+        if clipped:
+            region = region.model_copy(
+                update={"bbox": BBox(x0=x0, y0=y0, x1=x1, y1=y1)},
+            )
+        final.append(region)
+        kx0.append(x0)
+        ky0.append(y0)
+        kx1.append(x1)
+        ky1.append(y1)
         # Register this region in all its grid cells
-        for cell in _bbox_cells(bbox):
-            grid[cell].append(idx)
+        r0, r1 = int(y0 // cell_h), int(y1 // cell_h)
+        c0, c1 = int(x0 // cell_w), int(x1 // cell_w)
+        if (r1 - r0 + 1) * (c1 - c0 + 1) > BBOX_GRID_MAX_CELLS:
+            large.append(idx)
+            continue
+        for r in range(r0, r1 + 1):
+            for c in range(c0, c1 + 1):
+                cell = grid.get((r, c))
+                if cell is None:
+                    grid[(r, c)] = [idx]
+                else:
+                    cell.append(idx)
 
     return final
@@ -491,17 +491,22 @@ _CHUNK_OVERLAP = 200       # overlap in characters
 # Loading
 # ---------------------------------------------------------------------------
 
-def _load_pipeline(model_id: str | None = None) -> object:
+def _load_pipeline(model_id: str | None = None, ner_backend: str | None = None) -> object:
     """Lazy-load a Hugging Face token-classification pipeline.
 
+    Without an explicit *model_id* the model named by *ner_backend* is
+    used; ``None`` reads it from the global config.
+
     Thread-safe via double-checked locking.
     """
     global _pipeline, _active_model_id, _label_map
 
     if model_id is None or model_id == "auto":
-        from core.config import config
-        if config.ner_backend not in ("spacy", "auto"):
-            model_id = config.ner_backend
+        if ner_backend is None:
+            from core.config import config
+            ner_backend = config.ner_backend
+        if ner_backend not in ("spacy", "auto"):
+            model_id = ner_backend
         else:
             # Default fallback — auto mode should resolve before calling here
             model_id = "Isotonic/distilbert_finetuned_ai4privacy_v2"
@@ -652,14 +657,19 @@ def _deduplicate_matches(matches: list[NERMatch], source_text: str = "") -> list
     return merged
 
 
-def detect_bert_ner(text: str, model_id: str | None = None) -> list[NERMatch]:
+def detect_bert_ner(
+    text: str,
+    model_id: str | None = None,
+    ner_backend: str | None = None,
+) -> list[NERMatch]:
     """
     Run Hugging Face BERT NER on *text* and return PII matches.
 
     Long texts are split into overlapping chunks to stay within the
-    model's context window.
+    model's context window.  *ner_backend* (a ``DetectionSettings``
+    value) picks the model when *model_id* is not given.
     """
-    pipe = _load_pipeline(model_id)
+    pipe = _load_pipeline(model_id, ner_backend)
 
     if len(text) <= _CHUNK_SIZE:
         # Single chunk — still run dedup/ADDRESS-merge pass
@@ -32,14 +32,15 @@ _GAP_OUTLIER_FACTOR: float = 3.0
 _MAX_WORD_GAP_WS: int = 3
 
 
-def _effective_gap_threshold(line_height: float) -> float:
+def _effective_gap_threshold(line_height: float, fuzziness: float | None = None) -> float:
     """Compute the spatial gap threshold in PDF pts.
 
     Scales linearly with ``detection_fuzziness`` (0 → 1) between
     ``_MIN_GAP_LINE_RATIO`` and ``_MAX_GAP_LINE_RATIO`` of *line_height*,
-    clamped to ``_ABSOLUTE_MAX_GAP_PX``.
+    clamped to ``_ABSOLUTE_MAX_GAP_PX``.  *fuzziness* defaults to
+    ``config.detection_fuzziness``.
     """
-    f = config.detection_fuzziness
+    f = config.detection_fuzziness if fuzziness is None else fuzziness
     ratio = _MIN_GAP_LINE_RATIO + (_MAX_GAP_LINE_RATIO - _MIN_GAP_LINE_RATIO) * f
     return min(line_height * ratio, _ABSOLUTE_MAX_GAP_PX)
 
@@ -70,6 +71,7 @@ def _blocks_overlapping_bbox(
 def _split_blocks_at_gaps(
     triples: list[tuple[int, int, TextBlock]],
     full_text: str,
+    fuzziness: float | None = None,
 ) -> list[list[tuple[int, int, TextBlock]]]:
     """Split a sequence of block-offset triples at large gaps.
 
@@ -128,7 +130,7 @@ def _split_blocks_at_gaps(
         same_line = abs(curr_yc - prev_yc) < tolerance
 
         gap_px = (curr_blk.bbox.x0 - prev_blk.bbox.x1) if same_line else 0.0
-        gap_threshold = _effective_gap_threshold(line_h)
+        gap_threshold = _effective_gap_threshold(line_h, fuzziness)
 
         between = full_text[prev_ce:curr_cs] if prev_ce <= curr_cs else ""
         ws_count = sum(1 for ch in between if ch in " \t\n\r")
@@ -193,13 +195,17 @@ def _compute_block_offsets_legacy(
 
 def _compute_block_offsets_clustered(
     text_blocks: list[TextBlock],
+    lines: list[list[TextBlock]] | None = None,
 ) -> list[tuple[int, int, TextBlock]]:
     """Offset computation using line-clustering (matches the improved
     ``_build_full_text`` used for newly ingested documents).
+
+    *lines* is ``_cluster_into_lines(text_blocks)`` when already known.
     """
-    from core.ingestion.loader import _cluster_into_lines
+    if lines is None:
+        from core.ingestion.loader import _cluster_into_lines
 
-    lines = _cluster_into_lines(text_blocks)
+        lines = _cluster_into_lines(text_blocks)
     offsets: list[tuple[int, int, TextBlock]] = []
     pos = 0
     prev_y: float | None = None
@@ -255,18 +261,23 @@ def _verify_offsets(
 def _compute_block_offsets(
     text_blocks: list[TextBlock],
     full_text: str,
+    lines: list[list[TextBlock]] | None = None,
 ) -> list[tuple[int, int, TextBlock]]:
     """Build a deterministic char-offset → TextBlock mapping.
 
     Tries the current line-clustering algorithm first.  Falls back to
-    legacy computation if offsets don't align.
+    legacy computation if offsets don't align.  *lines* optionally
+    supplies the line clustering of *text_blocks*.
+
+    Callers holding a ``PageData`` should prefer the cached
+    ``page_text_index(page).block_offsets`` (core.detection.page_index).
 
     Returns a list of ``(char_start, char_end, TextBlock)`` tuples.
     """
     if not text_blocks or not full_text:
         return []
 
-    offsets = _compute_block_offsets_clustered(text_blocks)
+    offsets = _compute_block_offsets_clustered(text_blocks, lines)
     if _verify_offsets(offsets, full_text):
         logger.debug("Block offsets: clustered strategy succeeded (%d blocks)", len(offsets))
         return offsets
@@ -294,17 +305,19 @@ def _char_offset_to_bbox(
     char_start: int,
     char_end: int,
     block_offsets: list[tuple[int, int, TextBlock]],
+    ends: list[int] | None = None,
 ) -> Optional[BBox]:
     """Map character offsets in the full page text to a bounding box.
 
     Uses binary search (bisect) on block end positions for O(log B) lookup.
+    *ends* is ``[bo[1] for bo in block_offsets]`` when the caller has it
+    (e.g. ``PageTextIndex.ends``); otherwise it is rebuilt here.
     """
     if not block_offsets:
         return None
 
-    # Build end-position list for bisect (lazy, but fast for repeated calls
-    # on the same block_offsets since Python caches list comprehensions).
-    ends = [bo[1] for bo in block_offsets]
+    if ends is None:
+        ends = [bo[1] for bo in block_offsets]
 
     overlapping: list[TextBlock] = []
     # Find first block whose end > char_start
@@ -338,15 +351,18 @@ def _char_offsets_to_line_bboxes(
     char_start: int,
     char_end: int,
     block_offsets: list[tuple[int, int, TextBlock]],
+    ends: list[int] | None = None,
 ) -> list[BBox]:
     """Map character offsets to one bounding box **per visual line**.
 
-    Uses binary search for O(log B) initial lookup.
+    Uses binary search for O(log B) initial lookup; *ends* as for
+    :func:`_char_offset_to_bbox`.
     """
     if not block_offsets:
         return []
 
-    ends = [bo[1] for bo in block_offsets]
+    if ends is None:
+        ends = [bo[1] for bo in block_offsets]
 
     overlapping: list[TextBlock] = []
     lo = bisect.bisect_right(ends, char_start)
@@ -410,3 +426,160 @@ def _char_offsets_to_line_bboxes(
             bboxes.append(BBox(x0=x0, y0=y0, x1=x1, y1=y1))
 
     return bboxes
+
+
+class PageGeometry:
+    """Reusable lookup arrays for mapping char ranges of one page to bboxes.
+
+    Built once from a page's block offsets, it holds the sorted start /
+    end arrays and each block's coordinates, centre and height as plain
+    floats.  Hits that lie on one visual line skip line clustering
+    altogether; the line grouping and per-line bbox unions of each
+    distinct set of hit blocks are computed once and remembered, so
+    mapping many regions — or the same range again — skips the work.
+
+    :meth:`line_bboxes` returns exactly what
+    :func:`_char_offsets_to_line_bboxes` returns for the same offsets,
+    and :meth:`bbox` what :func:`_char_offset_to_bbox` returns.
+    """
+
+    __slots__ = (
+        "block_offsets", "_starts", "_ends", "_x0", "_y0", "_x1", "_y1", "_yc", "_h",
+        "_line_boxes",
+    )
+
+    def __init__(
+        self,
+        block_offsets: list[tuple[int, int, TextBlock]],
+        ends: list[int] | None = None,
+    ) -> None:
+        self.block_offsets = block_offsets
+        self._starts = [bo[0] for bo in block_offsets]
+        self._ends = ends if ends is not None else [bo[1] for bo in block_offsets]
+        boxes = [bo[2].bbox for bo in block_offsets]
+        self._x0 = [b.x0 for b in boxes]
+        self._y0 = [b.y0 for b in boxes]
+        self._x1 = [b.x1 for b in boxes]
+        self._y1 = [b.y1 for b in boxes]
+        self._yc = [(b.y0 + b.y1) / 2 for b in boxes]
+        self._h = [b.y1 - b.y0 for b in boxes]
+        self._line_boxes: dict[tuple[int, ...], list[tuple[float, float, float, float]]] = {}
+
+    def _hit_blocks(self, char_start: int, char_end: int) -> tuple[int, ...]:
+        """Indices of the blocks overlapping ``[char_start, char_end)``, or
+        of the closest block when none does."""
+        starts, ends = self._starts, self._ends
+        n = len(ends)
+        lo = bisect.bisect_right(ends, char_start)
+        if lo > 0 and ends[lo - 1] > char_start:
+            lo -= 1
+        hits: list[int] = []
+        for i in range(max(0, lo - 1), n):
+            if starts[i] >= char_end:
+                break
+            if ends[i] > char_start:
+                hits.append(i)
+        if not hits:
+            hits.append(min(
+                range(n),
+                key=lambda i: min(abs(starts[i] - char_start), abs(ends[i] - char_end)),
+            ))
+        return tuple(hits)
+
+    def _group_boxes(self, hits: tuple[int, ...]) -> list[tuple[float, float, float, float]]:
+        """Per-line (and per-column) bbox unions of *hits* — the steps of
+        ``_char_offsets_to_line_bboxes`` after the block lookup."""
+        x0, y0, x1, y1, yc, h = self._x0, self._y0, self._x1, self._y1, self._yc, self._h
+        if len(hits) == 1:
+            i = hits[0]
+            return [(x0[i], y0[i], x1[i], y1[i])]
+
+        centres = [yc[i] for i in hits]
+        if (max(centres) - min(centres) <= max(h[i] for i in hits)
+                and len({x0[i] for i in hits}) == len(hits)):
+            # Single visual line: the centres are close enough that the
+            # clustered lines (if more than one) are merged back, and
+            # with distinct x0 the left-to-right order is unambiguous.
+            lines = [sorted(hits, key=x0.__getitem__)]
+        else:
+            lines = self._cluster(hits)
+
+        all_overlapping = [i for line in lines for i in line]
+        avg_h = sum(h[i] for i in all_overlapping) / len(all_overlapping)
+        col_gap_threshold = avg_h * 5
+
+        boxes: list[tuple[float, float, float, float]] = []
+        for line in lines:
+            groups: list[list[int]] = [[line[0]]]
+            for i in line[1:]:
+                if x0[i] - x1[groups[-1][-1]] > col_gap_threshold:
+                    groups.append([i])
+                else:
+                    groups[-1].append(i)
+            for grp in groups:
+                boxes.append((
+                    min(x0[i] for i in grp), min(y0[i] for i in grp),
+                    max(x1[i] for i in grp), max(y1[i] for i in grp),
+                ))
+        return boxes
+
+    def _cluster(self, hits: tuple[int, ...]) -> list[list[int]]:
+        """``_cluster_into_lines`` on the hit blocks, then the merge of
+        lines whose centres lie within one block height."""
+        x0, yc, h = self._x0, self._yc, self._h
+        lines: list[list[int]] = []
+        cur_line: list[int] = []
+        line_yc = 0.0
+        line_h = 0.0
+        for i in sorted(hits, key=yc.__getitem__):
+            bh = h[i]
+            byc = yc[i]
+            if not cur_line:
+                cur_line.append(i)
+                line_yc = byc
+                line_h = bh
+            elif abs(byc - line_yc) <= max(line_h, bh) * 0.5:
+                cur_line.append(i)
+                line_h = max(line_h, bh)
+                n = len(cur_line)
+                line_yc = (line_yc * (n - 1) + byc) / n
+            else:
+                lines.append(sorted(cur_line, key=x0.__getitem__))
+                cur_line = [i]
+                line_yc = byc
+                line_h = bh
+        if cur_line:
+            lines.append(sorted(cur_line, key=x0.__getitem__))
+
+        if len(lines) > 1:
+            all_blocks = [i for line in lines for i in line]
+            y_centres = [yc[i] for i in all_blocks]
+            if max(y_centres) - min(y_centres) <= max(h[i] for i in all_blocks):
+                lines = [sorted(all_blocks, key=x0.__getitem__)]
+        return lines
+
+    def line_bboxes(self, char_start: int, char_end: int) -> list[BBox]:
+        """One bbox per visual line (and column) covered by the range."""
+        if not self.block_offsets:
+            return []
+        hits = self._hit_blocks(char_start, char_end)
+        boxes = self._line_boxes.get(hits)
+        if boxes is None:
+            boxes = self._line_boxes[hits] = self._group_boxes(hits)
+        return [BBox(x0=a, y0=b, x1=c, y1=d) for a, b, c, d in boxes]
+
+    def line_bboxes_many(self, spans: list[tuple[int, int]]) -> list[list[BBox]]:
+        """:meth:`line_bboxes` for every ``(char_start, char_end)`` in *spans*."""
+        return [self.line_bboxes(s, e) for s, e in spans]
+
+    def bbox(self, char_start: int, char_end: int) -> Optional[BBox]:
+        """Union bbox of the blocks covered by the range."""
+        if not self.block_offsets:
+            return None
+        hits = self._hit_blocks(char_start, char_end)
+        return BBox(
+            x0=min(self._x0[i] for i in hits),
+            y0=min(self._y0[i] for i in hits),
+            x1=max(self._x1[i] for i in hits),
+            y1=max(self._y1[i] for i in hits),
+        )
@@ -0,0 +1,152 @@
+"""Confidence-driven detection cascade.
+
+Scores how *uncertain* a page still is after the cheap layers (regex and
+spaCy / heuristic NER) have run.  ``detect_pii_on_page`` only escalates
+pages whose score reaches ``config.cascade_threshold`` to the expensive
+layers (BERT, GLiNER, LLM); everything else is settled by the cheap
+results alone.
+
+Three signals feed the score, each normalised to ``[0, 1]``:
+
+- **low_confidence** — share of cheap candidates below
+  ``CASCADE_LOW_CONFIDENCE``.
+- **unresolved_caps** — multi-word Title-Case spans that no cheap layer
+  matched (likely names / organisations the small models missed).
+- **unresolved_labels** — label-like context ("Name:", "Client:", …)
+  whose value has no match.
+
+The page score is the maximum of the three so that a single strong signal
+is enough to escalate.  :class:`CascadeStats` tallies the decisions of
+all pages in one run into a document-level skip ratio.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Iterator, NamedTuple, Sequence
+
+from core.detection import detection_config as det_cfg
+
+# Multi-word Title-Case run, e.g. "Jean-Luc Picard", "Acme Holdings Group".
+_CAP_SPAN_RE = re.compile(
+    r"\b[A-ZÀ-ÖØ-Þ][a-zß-öø-ÿ'’\-]+(?:[ \t]+[A-ZÀ-ÖØ-Þ][a-zß-öø-ÿ'’\-]+)+"
+)
+
+# Capitalised function words that start sentences or headings and would
+# otherwise make "The Agreement" look like an unresolved name.
+_LEADING_FUNCTION_WORDS: frozenset[str] = frozenset({
+    "The", "A", "An", "This", "That", "These", "Those", "In", "On", "At",
+    "For", "By", "Of", "To", "From", "With", "And", "Or", "If", "As",
+    "Le", "La", "Les", "Un", "Une", "Des", "Der", "Die", "Das", "Ein",
+    "El", "Los", "Las", "Il", "Lo", "Gli", "De", "Het", "Een", "O", "Os",
+})
+
+# "<label>:" followed by a value on the same line.
+_LABEL_RE = re.compile(
+    r"\b(?:name|full name|client|customer|patient|employee|contact|attn|"
+    r"attention|signed|signature|beneficiary|account holder|holder|"
+    r"applicant|tenant|landlord|insured|policyholder|recipient|sender|"
+    r"nom|prénom|titulaire|destinataire|vorname|nachname|empfänger|"
+    r"nombre|apellido|nome|cognome|naam)\s*:[ \t]*(\S[^\n]{0,60})",
+    re.IGNORECASE,
+)
+
+
+class CascadeScore(NamedTuple):
+    """Uncertainty breakdown for one page (all values in ``[0, 1]``)."""
+    score: float
+    low_confidence: float
+    unresolved_caps: float
+    unresolved_labels: float
+
+
+class CascadeStats:
+    """Cascade decisions across the pages of one detection run.
+
+    Shared by the pages of a document (like ``FingerprintCache``), so it
+    is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.pages_scored = 0
+        self.pages_skipped = 0
+
+    def record(self, skipped: bool) -> None:
+        """Count one scored page; *skipped* when the cheap layers settled it."""
+        with self._lock:
+            self.pages_scored += 1
+            if skipped:
+                self.pages_skipped += 1
+
+    def stats(self) -> dict[str, float]:
+        """Counters for diagnostics, with ``skip_pct`` the share of scored
+        pages that skipped the expensive layers."""
+        with self._lock:
+            scored, skipped = self.pages_scored, self.pages_skipped
+        return {
+            "pages_scored": scored,
+            "pages_skipped": skipped,
+            "skip_pct": round(skipped * 100 / scored, 1) if scored else 0.0,
+        }
+
+
+def _covered(start: int, end: int, spans: Sequence[tuple[int, int]]) -> bool:
+    """True when ``[start, end)`` overlaps any span in *spans*."""
+    for s, e in spans:
+        if s < end and e > start:
+            return True
+    return False
+
+
+def iter_cap_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Yield multi-word Title-Case spans, minus leading function words."""
+    for cm in _CAP_SPAN_RE.finditer(text):
+        span = cm.group()
+        words = span.split()
+        skip = 0
+        while skip < len(words) and words[skip] in _LEADING_FUNCTION_WORDS:
+            skip += 1
+        if len(words) - skip < 2:
+            continue
+        yield cm.start() + (span.index(words[skip]) if skip else 0), cm.end()
+
+
+def score_page_uncertainty(text: str, matches: Sequence) -> CascadeScore:
+    """Score how much *text* still needs the expensive layers.
+
+    Args:
+        text: The page text the matches refer to.
+        matches: Cheap-layer matches (anything with ``start``, ``end`` and
+            ``confidence`` attributes), in *text* coordinates.
+    """
+    spans = [(m.start, m.end) for m in matches]
+
+    # 1. Low-confidence candidates
+    if matches:
+        low = sum(1 for m in matches if m.confidence < det_cfg.CASCADE_LOW_CONFIDENCE)
+        low_confidence = low / len(matches)
+    else:
+        low_confidence = 0.0
+
+    # 2. Title-Case spans nobody claimed
+    unresolved_caps = 0
+    for start, end in iter_cap_spans(text):
+        if not _covered(start, end, spans):
+            unresolved_caps += 1
+
+    # 3. Labelled values with no match
+    unresolved_labels = 0
+    for lm in _LABEL_RE.finditer(text):
+        if not _covered(lm.start(1), lm.end(1), spans):
+            unresolved_labels += 1
+
+    caps_score = min(1.0, unresolved_caps / det_cfg.CASCADE_CAPS_SATURATION)
+    label_score = min(1.0, unresolved_labels / det_cfg.CASCADE_LABELS_SATURATION)
+    return CascadeScore(
+        score=max(low_confidence, caps_score, label_score),
+        low_confidence=low_confidence,
+        unresolved_caps=caps_score,
+        unresolved_labels=label_score,
+    )
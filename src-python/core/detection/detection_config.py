@@ -14,6 +14,8 @@ Tuning Guide:
 
 from __future__ import annotations
 
+import os
+
 # =============================================================================
 # CONFIDENCE BOOSTS
 # =============================================================================
@@ -200,6 +202,16 @@ REGEX_CONTEXT_WINDOW: int = 100
 BBOX_GRID_CELL_SIZE: float = 50.0
 """Grid cell size in PDF points (~0.7 inch) for spatial indexing."""
 
+BBOX_GRID_MIN_CELL_SIZE: float = 4.0
+"""Smallest cell side, in PDF points, of the per-page overlap grid in
+``_resolve_bbox_overlaps``; cells otherwise follow the median region size."""
+
+BBOX_GRID_MAX_CELLS: int = 64
+"""Regions spanning more grid cells than this (a page-wide box on a page
+of tiny fields) are kept out of the grid and checked against every other
+region instead, so one large box cannot cost tens of thousands of cell
+visits."""
+
 BLOCK_ABSOLUTE_MAX_GAP_PX: float = 20.0
 """Maximum absolute gap in pixels between blocks to consider grouping."""
 
@@ -241,3 +253,129 @@ FP_MIN_PERSON_WORD_LENGTH: int = 3
 
 FP_MIN_ORG_WORD_LENGTH: int = 3
 """Minimum word length for single-word ORG entities."""
+
+# =============================================================================
+# PIPELINE EXECUTION
+# =============================================================================
+
+DETECTION_MAX_WORKERS: int = min(4, os.cpu_count() or 2)
+"""Worker threads in the process-wide detection scheduler (scheduler.py).
+Bounds concurrent page detections across *all* documents; the C-extension
+work in spaCy / PyTorch releases the GIL, so a few threads give real
+parallelism without oversubscribing the CPU or the model locks."""
+
+DETECTION_WAVE_PAGES: int = 8
+"""Pages of one document detected together before their results are
+shared with later pages (fingerprint reuse, gazetteer).  A page only
+reuses results from earlier waves, which keeps output independent of the
+order worker threads finish in; smaller waves share sooner but leave
+workers idle at each wave boundary."""
+
+LAYER_EXECUTOR_WORKERS: int = 4
+"""Worker threads in the shared pool used when ``config.parallel_layers`` is on.
+One slot per model-backed layer (NER, GLiNER, LLM) plus headroom for a second
+page; regex always runs in the calling thread."""
+
+LLM_CHUNK_EXECUTOR_WORKERS: int = 64
+"""Threads in the pool shared by every ``detect_llm`` call that sends a
+page's chunks concurrently.  Matches the upper bound of
+``config.llm_api_max_concurrency``; the engine's request semaphore, not
+this pool, decides how many requests are in flight.  Threads start on
+demand."""
+
+# =============================================================================
+# DETECTION CASCADE
+# =============================================================================
+# Used by cascade.py when ``config.cascade_enabled`` is on.
+
+CASCADE_LOW_CONFIDENCE: float = 0.70
+"""Cheap-layer candidates below this confidence count as unsettled."""
+
+CASCADE_CAPS_SATURATION: int = 3
+"""Number of unmatched multi-word Title-Case spans that saturates the caps signal.
+Three unexplained capitalised phrases on one page is a strong hint that the
+small models missed names or organisations."""
+
+CASCADE_LABELS_SATURATION: int = 1
+"""Number of unmatched labelled values ("Name: …") that saturates the label signal.
+A single labelled field with no detection is enough to escalate."""
+
+# =============================================================================
+# PII-LIKELIHOOD PREFILTER
+# =============================================================================
+# Used by prefilter.py when ``config.prefilter_enabled`` is on.
+
+PREFILTER_CAPS_SATURATION: int = 2
+"""Mid-sentence capitalised tokens that saturate the capitalisation signal.
+With the default threshold a single such token already keeps the page."""
+
+PREFILTER_PROSE_ALPHA_RATIO: float = 0.25
+"""Letter share (of non-space chars) below which a page is treated as
+non-prose and the capitalisation signal is scaled down proportionally."""
+
+PREFILTER_MIN_ID_DIGITS: int = 5
+"""Digit runs with at least this many digits count as ID-like numbers.
+Short runs (page numbers, list indices) are ignored."""
+
+# =============================================================================
+# REPEATED-CONTENT FINGERPRINTS
+# =============================================================================
+# Used by fingerprint.py when ``config.fingerprint_reuse`` is on.
+
+FINGERPRINT_MIN_LINE_CHARS: int = 16
+"""Minimum normalised length for a line to be fingerprinted and reused.
+Short lines ("Name:", "Page 3", a lone surname) depend too much on their
+surroundings for a result from another page to be trusted."""
+
+# =============================================================================
+# PARAGRAPH CACHE
+# =============================================================================
+# Used by paragraph_cache.py when ``config.paragraph_cache_enabled`` is on.
+
+PARAGRAPH_CACHE_MIN_CHARS: int = 80
+"""Minimum normalised length for a paragraph to be cached across documents.
+Template boilerplate is long; short lines are left to the per-run
+fingerprints, which never outlive one document."""
+
+PARAGRAPH_CACHE_MAX_ENTRIES: int = 20_000
+"""Paragraphs kept in the persistent cache before least-recently-used
+entries are evicted.  Entries hold only spans, so this stays a few MB on disk."""
+
+# =============================================================================
+# DOCUMENT GAZETTEER
+# =============================================================================
+# Used by gazetteer.py when ``config.gazetteer_enabled`` is on.
+
+GAZETTEER_MIN_CONFIDENCE: float = 0.85
+"""Model-layer matches at or above this confidence seed the per-document
+gazetteer.  Kept high so one doubtful detection is not copied onto every
+later page without a model ever looking at it again."""
+
+GAZETTEER_MIN_CHARS: int = 4
+"""Shortest (normalised) term the gazetteer accepts; shorter names match
+too much unrelated text."""
+
+# =============================================================================
+# CUSTOM REGEX GUARDS
+# =============================================================================
+# Used by regex_detector.py for user-defined patterns.
+
+CUSTOM_PATTERN_TIMEOUT_S: float = 0.25
+"""Longest one custom pattern may run over one page before the scan is
+abandoned.  Built-in patterns finish in well under a millisecond per page."""
+
+CUSTOM_PATTERN_MAX_TIMEOUTS: int = 3
+"""Consecutive timeouts after which a custom pattern is skipped until the
+patterns are saved again, so one runaway pattern costs a document at most
+a few timeouts instead of one per page."""
+
+# =============================================================================
+# NOISE-FILTER VERDICT CACHE
+# =============================================================================
+# Used by noise_filters.py for the pipeline-level ORG / LOCATION / PERSON /
+# ADDRESS noise checks.
+
+NOISE_VERDICT_CACHE_MAX_ENTRIES: int = 50_000
+"""Verdicts kept per process before least-recently-used entries are
+evicted.  One entry is a short string and a bool, so the cache stays a few
+MB while covering every distinct name in a large batch of documents."""
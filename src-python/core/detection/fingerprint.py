@@ -0,0 +1,286 @@
+"""Fingerprints for repeated lines and duplicate pages within one detection run.
+
+Long filings repeat the same header and footer lines, disclaimers and
+sometimes whole pages (cover sheets, signature blocks) many times.  A
+``FingerprintCache`` lives for one detection run over one document and
+remembers, per normalised-text hash:
+
+- **pages** — every layer's matches for a page, so an identical later
+  page skips all layers and only goes through merge (which computes the
+  bboxes from the new page's own text blocks);
+- **lines** — the model-layer matches that fell inside a line, so later
+  copies of that line are masked out of the model input and their
+  matches are added back with remapped offsets.
+
+Normalisation only collapses whitespace; case and punctuation are kept
+since both matter to NER.  Matches are stored in normalised coordinates
+and remapped onto the target text, so copies that differ only in spacing
+still hit.  Results are reused only within one run, i.e. one settings
+snapshot.
+
+Pages run concurrently, so, as for the gazetteer, entries remember the
+page that stored them: a page only reuses entries from earlier waves of
+``DETECTION_WAVE_PAGES`` pages, and where several pages stored the same
+text the lowest page wins.  Which copy seeds the cache therefore does not
+depend on which worker finished first.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import threading
+from typing import Any, Iterable, NamedTuple
+
+from core.detection.detection_config import (
+    DETECTION_WAVE_PAGES,
+    FINGERPRINT_MIN_LINE_CHARS,
+)
+
+# (start, end, pii_type, confidence, match class) in normalised coordinates
+_StoredMatch = tuple[int, int, Any, float, type]
+
+
+class Line(NamedTuple):
+    """A fingerprintable line of ``full_text``."""
+    start: int
+    end: int
+    key: bytes
+    positions: list[int]
+
+
+def normalize_with_positions(text: str) -> tuple[str, list[int]]:
+    """Collapse whitespace runs to one space and strip the ends.
+
+    Returns the normalised string and, for every character of it, its
+    index in *text*.
+    """
+    out: list[str] = []
+    positions: list[int] = []
+    pending_space = -1
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            if out and pending_space < 0:
+                pending_space = i
+            continue
+        if pending_space >= 0:
+            out.append(" ")
+            positions.append(pending_space)
+            pending_space = -1
+        out.append(ch)
+        positions.append(i)
+    return "".join(out), positions
+
+
+def _digest(normalized: str) -> bytes:
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+def iter_lines(text: str, min_chars: int = FINGERPRINT_MIN_LINE_CHARS) -> Iterable[Line]:
+    """Yield the lines of *text* with at least *min_chars* normalised chars."""
+    start = 0
+    n = len(text)
+    while start <= n:
+        end = text.find("\n", start)
+        if end < 0:
+            end = n
+        norm, positions = normalize_with_positions(text[start:end])
+        if len(norm) >= min_chars:
+            yield Line(start, end, _digest(norm), positions)
+        start = end + 1
+
+
+def mask_lines(det_text: str, dt_to_ft: list[int], lines: Iterable[Line]) -> str:
+    """Blank out the characters of *lines* in the detection text.
+
+    *lines* are in ``full_text`` coordinates; ``dt_to_ft`` maps detection
+    text positions to them.  Masked characters become spaces so every
+    offset stays valid.
+    """
+    spans = sorted((line.start, line.end) for line in lines)
+    if not spans:
+        return det_text
+    starts = [s for s, _e in spans]
+    chars = list(det_text)
+    for i, v in enumerate(dt_to_ft):
+        if v < 0:
+            continue
+        j = bisect.bisect_right(starts, v) - 1
+        if j >= 0 and v < spans[j][1] and not chars[i].isspace():
+            chars[i] = " "
+    return "".join(chars)
+
+
+def _to_stored(matches: Iterable, offset: int, positions: list[int]) -> list[_StoredMatch]:
+    """Convert matches relative to a segment starting at *offset*."""
+    stored: list[_StoredMatch] = []
+    for m in matches:
+        ns = bisect.bisect_left(positions, m.start - offset)
+        ne = bisect.bisect_left(positions, m.end - offset)
+        if ne > ns:
+            stored.append((ns, ne, m.pii_type, m.confidence, type(m)))
+    return stored
+
+
+def _from_stored(
+    stored: list[_StoredMatch], offset: int, positions: list[int], text: str,
+) -> list:
+    """Rebuild matches onto a segment of *text* starting at *offset*."""
+    out = []
+    for ns, ne, pii_type, confidence, cls in stored:
+        start = offset + positions[ns]
+        end = offset + positions[ne - 1] + 1
+        out.append(cls(start, end, text[start:end].replace("\n", " "), pii_type, confidence))
+    return out
+
+
+def self_contained_lines(
+    text: str,
+    layer_matches: dict[str, list],
+    min_chars: int = FINGERPRINT_MIN_LINE_CHARS,
+    skip: Iterable[int] = (),
+) -> list[tuple[Line, dict[str, list[_StoredMatch]]]]:
+    """Split *layer_matches* into per-line entries for caching.
+
+    Lines crossed by a match (an entity spanning two lines) are left out —
+    a copy of one of them on its own would lose that entity — as are lines
+    starting at an offset in *skip* (lines the models did not see).
+    """
+    skip = set(skip)
+    all_spans = sorted(
+        (m.start, m.end) for ms in layer_matches.values() for m in ms
+    )
+    starts = [s for s, _e in all_spans]
+    out: list[tuple[Line, dict[str, list[_StoredMatch]]]] = []
+    for line in iter_lines(text, min_chars):
+        if line.start in skip:
+            continue
+        hi = bisect.bisect_left(starts, line.end)
+        if any(
+            e > line.start and (s < line.start or e > line.end)
+            for s, e in all_spans[:hi]
+        ):
+            continue
+        entry: dict[str, list[_StoredMatch]] = {}
+        for name, ms in layer_matches.items():
+            inside = [m for m in ms if m.start >= line.start and m.end <= line.end]
+            entry[name] = _to_stored(inside, line.start, line.positions)
+        out.append((line, entry))
+    return out
+
+
+class FingerprintCache:
+    """Per-run store of detection results keyed by normalised-text hashes.
+
+    Thread-safe: pages of one run are detected concurrently.  Lookups for
+    a page only see entries stored by pages before :meth:`visible_before`
+    it; without a page every entry is visible.
+    """
+
+    def __init__(self, wave: int = DETECTION_WAVE_PAGES) -> None:
+        if wave < 1:
+            raise ValueError("wave must be >= 1")
+        self.wave = wave
+        self._lock = threading.Lock()
+        # hash → (storing page, {layer: matches})
+        self._pages: dict[bytes, tuple[int, dict[str, list[_StoredMatch]]]] = {}
+        self._lines: dict[bytes, tuple[int, dict[str, list[_StoredMatch]]]] = {}
+        self.page_hits = 0
+        self.line_hits = 0
+
+    def visible_before(self, page: int) -> int:
+        """First page of *page*'s wave; only entries from pages before it are reused."""
+        return page - page % self.wave
+
+    @staticmethod
+    def _store(
+        table: dict[bytes, tuple[int, dict[str, list[_StoredMatch]]]],
+        key: bytes,
+        page: int,
+        entry: dict[str, list[_StoredMatch]],
+    ) -> None:
+        known = table.get(key)
+        if known is None or page < known[0]:
+            table[key] = (page, entry)
+
+    def _visible(
+        self,
+        found: tuple[int, dict[str, list[_StoredMatch]]] | None,
+        page: int | None,
+    ) -> dict[str, list[_StoredMatch]] | None:
+        if found is None or (page is not None and found[0] >= self.visible_before(page)):
+            return None
+        return found[1]
+
+    # -- whole pages ---------------------------------------------------
+
+    def lookup_page(self, text: str, page: int | None = None) -> dict[str, list] | None:
+        """Return ``{layer: matches}`` remapped onto *text*, or None."""
+        norm, positions = normalize_with_positions(text)
+        with self._lock:
+            entry = self._visible(self._pages.get(_digest(norm)), page)
+            if entry is None:
+                return None
+            self.page_hits += 1
+        return {name: _from_stored(s, 0, positions, text) for name, s in entry.items()}
+
+    def store_page(self, text: str, layer_matches: dict[str, list], page: int = 0) -> None:
+        """Remember every layer's matches for *text*, detected as *page*."""
+        norm, positions = normalize_with_positions(text)
+        entry = {name: _to_stored(ms, 0, positions) for name, ms in layer_matches.items()}
+        with self._lock:
+            self._store(self._pages, _digest(norm), page, entry)
+
+    # -- lines -----------------------------------------------------------
+
+    def lookup_lines(
+        self, text: str, page: int | None = None,
+    ) -> tuple[list[Line], dict[str, list]]:
+        """Find the lines of *text* seen on an earlier page.
+
+        Returns the reused lines and their model-layer matches remapped
+        onto *text*, grouped by layer.
+        """
+        lines = list(iter_lines(text))
+        reused: list[Line] = []
+        matches: dict[str, list] = {}
+        with self._lock:
+            entries = [(line, self._visible(self._lines.get(line.key), page)) for line in lines]
+            for line, entry in entries:
+                if entry is not None:
+                    self.line_hits += 1
+        for line, entry in entries:
+            if entry is None:
+                continue
+            reused.append(line)
+            for name, stored in entry.items():
+                matches.setdefault(name, []).extend(
+                    _from_stored(stored, line.start, line.positions, text)
+                )
+        return reused, matches
+
+    def store_lines(
+        self,
+        text: str,
+        layer_matches: dict[str, list],
+        skip: Iterable[int] = (),
+        page: int = 0,
+    ) -> None:
+        """Remember the model-layer matches of each self-contained line of *page*."""
+        new = {
+            line.key: entry
+            for line, entry in self_contained_lines(text, layer_matches, skip=skip)
+        }
+        with self._lock:
+            for key, entry in new.items():
+                self._store(self._lines, key, page, entry)
+
+    def stats(self) -> dict[str, int]:
+        """Counters for diagnostics."""
+        with self._lock:
+            return {
+                "pages": len(self._pages),
+                "lines": len(self._lines),
+                "page_hits": self.page_hits,
+                "line_hits": self.line_hits,
+            }
@@ -0,0 +1,173 @@
+"""Fast exact-parity helpers for ``SequenceMatcher`` ratio thresholds.
+
+Highlight-all and the LLM span alignment (``llm_detector._fuzzy_find``)
+compare one needle against thousands of windows of page text and keep
+those with ``SequenceMatcher(None, needle, window).ratio() >= threshold``
+(or the best of them).  The
+ratio is ``2 * M / (len(needle) + len(window))`` where ``M`` — the number
+of characters in matching blocks — can never exceed either
+
+- the multiset character overlap of the two strings (what
+  ``SequenceMatcher.quick_ratio`` uses), or
+- their longest common subsequence.
+
+:class:`FuzzyNeedle` rejects a candidate as soon as one of these upper
+bounds falls below the threshold and only runs ``SequenceMatcher`` on the
+rest, so the accepted set is identical to the plain comparison.  The
+character overlap is maintained incrementally while sliding a window,
+and the LCS length uses the bit-parallel algorithm of Allison & Dix
+(one big-int step per character).
+
+A q-gram (e.g. trigram) count filter is not used: at the thresholds in
+use here (0.75) the q-gram lemma gives no positive lower bound on shared
+q-grams, so it could not prune without losing matches.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Iterable, Iterator
+
+
+def lcs_length(a: str, b: str) -> int:
+    """Length of the longest common subsequence of *a* and *b*."""
+    return _lcs_with_masks(_char_masks(a), len(a), b)
+
+
+def _char_masks(a: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _lcs_with_masks(masks: dict[str, int], m: int, b: str) -> int:
+    full = (1 << m) - 1
+    v = full
+    get = masks.get
+    for ch in b:
+        u = v & get(ch, 0)
+        if u:
+            v = ((v + u) | (v - u)) & full
+    return m - v.bit_count()
+
+
+class FuzzyNeedle:
+    """A needle compared against many candidates at one ratio threshold.
+
+    ``needle.ratio_at_least(s)`` is exactly
+    ``SequenceMatcher(None, needle, s).ratio() >= threshold``.
+    """
+
+    __slots__ = ("text", "threshold", "_len", "_counts", "_masks")
+
+    def __init__(self, text: str, threshold: float) -> None:
+        self.text = text
+        self.threshold = threshold
+        self._len = len(text)
+        self._counts = Counter(text)
+        self._masks = _char_masks(text)
+
+    def shared_chars(self, counts: Counter) -> int:
+        """Multiset overlap between the needle and a text with *counts*."""
+        return sum(min(n, counts[ch]) for ch, n in self._counts.items())
+
+    def ratio_at_least(self, candidate: str) -> bool:
+        total = self._len + len(candidate)
+        if not total:
+            return 1.0 >= self.threshold
+        # Cheapest bound first: M <= min(len) (real_quick_ratio).
+        if 2.0 * min(self._len, len(candidate)) / total < self.threshold:
+            return False
+        return self._passes(candidate, total)
+
+    def ratio_upper_bound(self, candidate: str) -> float:
+        """An upper bound on ``SequenceMatcher(None, needle, candidate).ratio()``
+        (computed the same way, so ``bound <= r`` implies ``ratio <= r``)."""
+        total = self._len + len(candidate)
+        if not total:
+            return 1.0
+        return 2.0 * _lcs_with_masks(self._masks, self._len, candidate) / total
+
+    def _passes(self, candidate: str, total: int) -> bool:
+        if 2.0 * _lcs_with_masks(self._masks, self._len, candidate) / total < self.threshold:
+            return False
+        return SequenceMatcher(None, self.text, candidate).ratio() >= self.threshold
+
+    def windows(
+        self,
+        text: str,
+        sizes: Iterable[int],
+        min_shared: float = 0.0,
+    ) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, size)`` of every window of *text* whose ratio
+        reaches the threshold, for each size in *sizes* in turn and by
+        increasing start.
+
+        Windows sharing fewer than *min_shared* characters (multiset
+        overlap) with the needle are skipped as well, matching callers
+        that pre-filter on character frequency.
+        """
+        for start, size in self.candidates(text, sizes, min_shared):
+            if SequenceMatcher(None, self.text, text[start:start + size]).ratio() >= self.threshold:
+                yield start, size
+
+    def candidates(
+        self,
+        text: str,
+        sizes: Iterable[int],
+        min_shared: float = 0.0,
+        step: int = 1,
+    ) -> Iterator[tuple[int, int]]:
+        """Like :meth:`windows`, but yields every window whose ratio *may*
+        reach the threshold (both bounds pass) without computing it.
+        Only starts that are multiples of *step* are considered.
+        """
+        need = self._counts
+        masks, m = self._masks, self._len
+        threshold = self.threshold
+        n = len(text)
+        for size in sizes:
+            if size <= 0 or size > n:
+                continue
+            total = m + size
+            # Smallest overlap that can still reach the threshold.
+            floor = 0
+            while floor <= size and 2.0 * floor / total < threshold:
+                floor += 1
+            floor = max(floor, math.ceil(min_shared))
+            if floor > size:
+                continue
+            have = dict.fromkeys(need, 0)
+            shared = 0
+            for ch in text[:size]:
+                if ch in have:
+                    have[ch] += 1
+                    if have[ch] <= need[ch]:
+                        shared += 1
+            start = 0
+            last = n - size
+            while True:
+                if (
+                    shared >= floor
+                    and start % step == 0
+                    and 2.0 * _lcs_with_masks(masks, m, text[start:start + size]) / total >= threshold
+                ):
+                    yield start, size
+                if start == last:
+                    break
+                out_ch = text[start]
+                in_ch = text[start + size]
+                start += 1
+                if out_ch == in_ch:
+                    continue
+                if out_ch in have:
+                    if have[out_ch] <= need[out_ch]:
+                        shared -= 1
+                    have[out_ch] -= 1
+                if in_ch in have:
+                    have[in_ch] += 1
+                    if have[in_ch] <= need[in_ch]:
+                        shared += 1
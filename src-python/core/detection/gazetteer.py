@@ -0,0 +1,224 @@
+"""Per-document running gazetteer of names seen on earlier pages.
+
+In a long document the same people and organisations come up on page
+after page.  ``propagate_regions_across_pages`` only links them once every
+page has been through every model.  A ``DocumentGazetteer`` lives for one
+detection run over one document instead:
+
+- **seeding** — after each page, high-confidence PERSON / ORG / LOCATION
+  matches from the model layers (confidence ≥ ``GAZETTEER_MIN_CONFIDENCE``)
+  are added as terms;
+- **matching** — before the model layers run on a later page, the terms are
+  compiled into one Aho–Corasick automaton and matched, whole words only
+  and leftmost-longest, against the whitespace-normalised page;
+- **skipping** — a line whose name candidates (multi-word Title-Case spans,
+  mid-sentence capitalised words, labelled values) all lie inside
+  gazetteer hits is blanked out of the model input; the gazetteer hits are
+  reported for it instead.  Lines with any unknown candidate still go
+  through the models.
+
+Pages run concurrently, so what a page sees must not depend on which
+other pages happen to have finished.  Pages are grouped into waves of
+``DETECTION_WAVE_PAGES`` in document order; a page only matches names
+seeded by pages of earlier waves, and the caller finishes each wave
+before starting the next.
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from typing import Iterable, Sequence
+
+from core.detection.aho_corasick import AhoCorasick
+from core.detection.cascade import _LABEL_RE, iter_cap_spans
+from core.detection.detection_config import (
+    DETECTION_WAVE_PAGES,
+    GAZETTEER_MIN_CHARS,
+    GAZETTEER_MIN_CONFIDENCE,
+)
+from core.detection.fingerprint import Line, iter_lines, normalize_with_positions
+from core.detection.ner_types import NERMatch
+from core.detection.prefilter import _BOILERPLATE_CAPS, _TOKEN_RE, _is_sentence_initial
+from models.schemas import PIIType
+
+# Entity types the model layers find and the gazetteer can stand in for.
+_GAZETTEER_TYPES: frozenset[PIIType] = frozenset({
+    PIIType.PERSON, PIIType.ORG, PIIType.LOCATION,
+})
+
+_WORD_CHAR_RE = re.compile(r"\w")
+
+
+def _normalize_term(text: str) -> str:
+    return " ".join(text.split())
+
+
+def name_candidates(text: str) -> list[tuple[int, int]]:
+    """Spans of *text* a model layer could plausibly report as a name."""
+    spans = list(iter_cap_spans(text))
+    spans.extend((m.start(1), m.end(1)) for m in _LABEL_RE.finditer(text))
+    for m in _TOKEN_RE.finditer(text):
+        tok = m.group()
+        if len(tok) < 2 or not tok[0].isupper() or tok.lower() in _BOILERPLATE_CAPS:
+            continue
+        if not _is_sentence_initial(text, m.start()):
+            spans.append((m.start(), m.end()))
+    return spans
+
+
+class DocumentGazetteer:
+    """Thread-safe set of known names with lazily compiled matchers.
+
+    Terms remember the pages that seeded them; :meth:`find` for a page
+    only uses terms seeded by earlier waves, so its result is the same
+    whatever order the pages of a wave finish in.
+    """
+
+    def __init__(self, wave: int = DETECTION_WAVE_PAGES) -> None:
+        if wave < 1:
+            raise ValueError("wave must be >= 1")
+        self.wave = wave
+        self._lock = threading.Lock()
+        # normalised term → page → (pii_type, confidence)
+        self._terms: dict[str, dict[int, tuple[PIIType, float]]] = {}
+        # first page not visible (None: all pages) → compiled matcher
+        self._matchers: dict[
+            int | None,
+            tuple[AhoCorasick | None, list[str], dict[str, tuple[PIIType, float]]],
+        ] = {}
+        self.lines_skipped = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._terms)
+
+    def visible_before(self, page: int) -> int:
+        """First page of *page*'s wave; only pages before it are matched."""
+        return page - page % self.wave
+
+    def add(self, matches: Iterable, page: int = 0) -> int:
+        """Seed the gazetteer from the matches of *page*; return the number of new terms."""
+        added = 0
+        with self._lock:
+            for m in matches:
+                if m.pii_type not in _GAZETTEER_TYPES or m.confidence < GAZETTEER_MIN_CONFIDENCE:
+                    continue
+                term = _normalize_term(m.text)
+                if len(term) < GAZETTEER_MIN_CHARS:
+                    continue
+                seen = self._terms.get(term)
+                if seen is None:
+                    seen = self._terms[term] = {}
+                    added += 1
+                known = seen.get(page)
+                if known is None or m.confidence > known[1]:
+                    seen[page] = (m.pii_type, m.confidence)
+                    for limit in list(self._matchers):
+                        if limit is None or limit > page:
+                            del self._matchers[limit]
+        return added
+
+    def _matcher(
+        self, limit: int | None,
+    ) -> tuple[AhoCorasick | None, list[str], dict[str, tuple[PIIType, float]]]:
+        with self._lock:
+            matcher = self._matchers.get(limit)
+            if matcher is None:
+                # Most confident sighting wins; ties go to the earliest page.
+                terms = {
+                    term: max(
+                        ((p, v) for p, v in seen.items() if limit is None or p < limit),
+                        key=lambda pv: (pv[1][1], -pv[0]),
+                    )[1]
+                    for term, seen in self._terms.items()
+                    if limit is None or min(seen) < limit
+                }
+                term_list = list(terms)
+                automaton = AhoCorasick(term_list) if term_list else None
+                matcher = self._matchers[limit] = (automaton, term_list, terms)
+            return matcher
+
+    def find(self, text: str, page: int | None = None) -> list[NERMatch]:
+        """Every occurrence of a known term in *text*.
+
+        With *page*, only terms seeded before :meth:`visible_before` that
+        page count.  Whole-word matches only; where terms overlap, the
+        leftmost and then the longest wins.  Runs of whitespace (including
+        line breaks) inside a term match any whitespace in *text*.
+        """
+        limit = None if page is None else self.visible_before(page)
+        automaton, term_list, terms = self._matcher(limit)
+        if automaton is None:
+            return []
+        norm, positions = normalize_with_positions(text)
+        n = len(norm)
+        # start → (end, term) of the longest whole-word match there
+        longest: dict[int, tuple[int, str]] = {}
+        for start, pid in automaton.iter_matches(norm):
+            term = term_list[pid]
+            end = start + len(term)
+            if start and _WORD_CHAR_RE.match(norm[start - 1]):
+                continue
+            if end < n and _WORD_CHAR_RE.match(norm[end]):
+                continue
+            if end > longest.get(start, (-1, ""))[0]:
+                longest[start] = (end, term)
+        out: list[NERMatch] = []
+        last_end = 0
+        for start in sorted(longest):
+            if start < last_end:
+                continue
+            end, term = longest[start]
+            last_end = end
+            o_start, o_end = positions[start], positions[end - 1] + 1
+            pii_type, confidence = terms[term]
+            out.append(NERMatch(o_start, o_end, text[o_start:o_end].replace("\n", " "), pii_type, confidence))
+        return out
+
+    def covered_lines(
+        self,
+        text: str,
+        hits: Sequence[NERMatch],
+        skip: Iterable[int] = (),
+    ) -> tuple[list[Line], list[NERMatch]]:
+        """Lines of *text* fully explained by gazetteer *hits*.
+
+        Returns the lines the model layers can skip and the hits inside
+        them.  Lines starting at an offset in *skip* are ignored.
+        """
+        if not hits:
+            return [], []
+        skip = set(skip)
+        hits = sorted(hits, key=lambda h: h.start)
+        hit_starts = [h.start for h in hits]
+        candidates = sorted(name_candidates(text))
+        cand_starts = [s for s, _e in candidates]
+        covered: list[Line] = []
+        covered_hits: list[NERMatch] = []
+        for line in iter_lines(text, 1):
+            if line.start in skip:
+                continue
+            lo = bisect.bisect_left(hit_starts, line.start)
+            hi = bisect.bisect_left(hit_starts, line.end)
+            line_hits = [h for h in hits[lo:hi] if h.end <= line.end]
+            if not line_hits:
+                continue
+            lo = bisect.bisect_left(cand_starts, line.start)
+            hi = bisect.bisect_left(cand_starts, line.end)
+            if all(
+                any(h.start <= s and h.end >= e for h in line_hits)
+                for s, e in candidates[lo:hi]
+            ):
+                covered.append(line)
+                covered_hits.extend(line_hits)
+        if covered:
+            with self._lock:
+                self.lines_skipped += len(covered)
+        return covered, covered_hits
+
+    def stats(self) -> dict[str, int]:
+        """Counters for diagnostics."""
+        with self._lock:
+            return {"terms": len(self._terms), "lines_skipped": self.lines_skipped}
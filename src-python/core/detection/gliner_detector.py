@@ -106,6 +106,11 @@ def _load_model() -> object:
             raise
 
 
+def get_model_name() -> str:
+    """Return the id of the GLiNER model :func:`detect_gliner` uses."""
+    return _MODEL_NAME
+
+
 def is_gliner_available() -> bool:
     """Return True if the GLiNER package is importable.
 
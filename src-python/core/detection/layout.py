@@ -28,14 +28,22 @@ text) are ignored.
 One-line columns are a natural degenerate case and require no special
 handling — a column with a single line is processed identically to one with
 many lines.
+
+Both results depend only on the page geometry, so :func:`page_layout`
+keeps them on the ``PageData`` keyed by :func:`layout_fingerprint` (the
+staleness rule shared with the page text index, see ``PageData``);
+redetecting an unchanged page reuses them.
 """
 
 from __future__ import annotations
 
+import bisect
+import hashlib
 import logging
 import math
+from array import array
 from dataclasses import dataclass, field
-from typing import NamedTuple
+from typing import NamedTuple, Sequence
 
 from models.schemas import PageData, TextBlock
 
@@ -92,10 +100,52 @@ class OffsetMap(NamedTuple):
     ``detection_text[i]``, or ``-1`` for separator characters inserted by
     the layout assembler (spaces or newlines that do not exist in
     ``full_text``).
+
+    The mapped characters come in runs (one per word block) that are
+    contiguous in both texts: ``run_dt[k]``/``run_ft[k]`` are the run's
+    first detection-text / full-text positions and ``run_end[k]`` its
+    detection-text end.  :meth:`translate_matches` bisects these when a
+    match edge falls on a separator instead of walking ``dt_to_ft``
+    character by character.  All arrays are ``array('i')``.
     """
 
     detection_text: str
-    dt_to_ft: list[int]
+    dt_to_ft: array
+    run_dt: array
+    run_end: array
+    run_ft: array
+
+    def translate_matches(self, matches, full_text: str) -> list:
+        """Translate a batch of detection-text matches to ``full_text``.
+
+        Same result as calling :func:`translate_match` on each match and
+        dropping the ``None`` results, in input order.
+        """
+        dt_to_ft = self.dt_to_ft
+        run_dt, run_end, run_ft = self.run_dt, self.run_end, self.run_ft
+        n_runs = len(run_dt)
+        n = len(dt_to_ft)
+        out = []
+        for m in matches:
+            ds = m.start if m.start > 0 else 0
+            de = m.end if m.end < n else n
+            if ds >= de:
+                continue
+            ft_start = dt_to_ft[ds]
+            if ft_start < 0:
+                # First run ending after ds holds the first mapped position.
+                k = bisect.bisect_right(run_end, ds)
+                if k == n_runs or run_dt[k] >= de:
+                    continue
+                ft_start = run_ft[k]
+            ft_end = dt_to_ft[de - 1] + 1
+            if ft_end == 0:
+                # Last run starting before de holds the last mapped position.
+                j = bisect.bisect_left(run_dt, de) - 1
+                ft_end = run_ft[j] + run_end[j] - run_dt[j]
+            ft_text = full_text[ft_start:ft_end].replace("\n", " ")
+            out.append(m._replace(start=ft_start, end=ft_end, text=ft_text))
+        return out
 
 
 # ---------------------------------------------------------------------------
@@ -277,6 +327,7 @@ def detect_column_bands(
 def build_detection_text(
     page_data: PageData,
     block_offsets: list[tuple[int, int, "TextBlock"]],
+    bands: list[ColumnBand] | None = None,
 ) -> OffsetMap:
     """Build a detection text that joins cross-line content within columns.
 
@@ -291,9 +342,10 @@ def build_detection_text(
 
     ``block_offsets`` is the output of
     ``_compute_block_offsets(page_data.text_blocks, page_data.full_text)``.
+    ``bands`` are the page's column bands if already computed.
 
     Returns an :class:`OffsetMap` with ``detection_text`` and a parallel
-    ``dt_to_ft`` list mapping each character position in ``detection_text``
+    ``dt_to_ft`` array mapping each character position in ``detection_text``
     to the corresponding position in ``page_data.full_text``, or ``-1`` for
     inserted separator characters.
     """
@@ -304,41 +356,34 @@ def build_detection_text(
     page_width = page_data.width
 
     if not text_blocks or not full_text:
-        return OffsetMap(full_text, list(range(len(full_text))))
+        n = len(full_text)
+        runs = array("i", [0] if n else [])
+        return OffsetMap(
+            full_text, array("i", range(n)),
+            runs, array("i", [n] if n else []), runs,
+        )
 
-    # Build block → (ft_start, ft_end) lookup keyed by object id.
+    # Build block → ft_start lookup keyed by object id.
     # Object ids are stable within a single call stack.
-    block_ft: dict[int, tuple[int, int]] = {
-        id(blk): (fs, fe) for fs, fe, blk in block_offsets
-    }
+    block_ft: dict[int, int] = {id(blk): fs for fs, _fe, blk in block_offsets}
 
     avg_h = _avg_word_height(text_blocks)
-    bands = detect_column_bands(text_blocks, page_width)
-
-    dt_chars: list[str] = []
-    dt_to_ft: list[int] = []
-
-    def _append_block(block: TextBlock) -> None:
-        """Append word characters tracking their full_text positions."""
-        bid = id(block)
-        if bid in block_ft:
-            ft_start, _ = block_ft[bid]
-            for ci, ch in enumerate(block.text):
-                dt_chars.append(ch)
-                dt_to_ft.append(ft_start + ci)
-        else:
-            # Block not found in offsets (shouldn't happen) — use sentinel
-            for ch in block.text:
-                dt_chars.append(ch)
-                dt_to_ft.append(-1)
-
-    def _sep(ch: str) -> None:
-        dt_chars.append(ch)
-        dt_to_ft.append(-1)
+    if bands is None:
+        bands = detect_column_bands(text_blocks, page_width)
+
+    # The text is assembled one visual line at a time; each mapped word is
+    # recorded as a run and dt_to_ft is filled from the runs at the end.
+    # Blocks missing from the offsets (shouldn't happen) stay unmapped.
+    parts: list[str] = []
+    run_dt: list[int] = []
+    run_end: list[int] = []
+    run_ft: list[int] = []
+    pos = 0
 
     for band_idx, band in enumerate(bands):
         if band_idx > 0:
-            _sep("\n")  # column boundary
+            parts.append("\n")  # column boundary
+            pos += 1
 
         if not band.blocks:
             continue
@@ -353,19 +398,84 @@ def build_detection_text(
             if prev_line_bottom is not None:
                 y_gap = line_top - prev_line_bottom
                 if y_gap > avg_h * _COL_LINE_JOIN_RATIO:
-                    _sep("\n")   # paragraph break — preserve sentence boundary
+                    parts.append("\n")   # paragraph break — preserve sentence boundary
                 else:
-                    _sep(" ")   # ← KEY: enables cross-line NER recognition
-
-            for word_idx, block in enumerate(line_blocks):
-                if word_idx > 0:
-                    _sep(" ")
-                _append_block(block)
+                    parts.append(" ")    # ← KEY: enables cross-line NER recognition
+                pos += 1
+
+            words = [b.text for b in line_blocks]
+            for block, word in zip(line_blocks, words):
+                ft_start = block_ft.get(id(block))
+                if ft_start is not None and word:
+                    run_dt.append(pos)
+                    run_end.append(pos + len(word))
+                    run_ft.append(ft_start)
+                pos += len(word) + 1
+            pos -= 1
+            parts.append(" ".join(words))
 
             prev_line_bottom = line_bottom
 
-    detection_text = "".join(dt_chars)
-    return OffsetMap(detection_text=detection_text, dt_to_ft=dt_to_ft)
+    detection_text = "".join(parts)
+    dt_to_ft = [-1] * len(detection_text)
+    for d, e, f in zip(run_dt, run_end, run_ft):
+        dt_to_ft[d:e] = range(f, f + e - d)
+    return OffsetMap(
+        detection_text, array("i", dt_to_ft),
+        array("i", run_dt), array("i", run_end), array("i", run_ft),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Per-page layout cache
+# ---------------------------------------------------------------------------
+
+
+class PageLayout(NamedTuple):
+    """Column bands and detection text of one page, as cached by
+    :func:`page_layout`."""
+
+    fingerprint: bytes
+    bands: list[ColumnBand]
+    offset_map: OffsetMap
+
+
+def layout_fingerprint(page_data: PageData) -> bytes:
+    """Digest of everything the layout and the page text index are
+    computed from: page width, ``full_text``, and the text and bbox of
+    every block in order."""
+    blocks = page_data.text_blocks
+    coords = array("d", [page_data.width])
+    for b in blocks:
+        bb = b.bbox
+        coords.extend((bb.x0, bb.y0, bb.x1, bb.y1))
+    h = hashlib.blake2b(coords.tobytes(), digest_size=16)
+    h.update("\x00".join([b.text for b in blocks]).encode("utf-8", "surrogatepass"))
+    h.update(b"\x01")
+    h.update(page_data.full_text.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def page_layout(
+    page_data: PageData,
+    block_offsets: list[tuple[int, int, "TextBlock"]],
+) -> PageLayout:
+    """The page's :class:`PageLayout`, reused while its geometry is unchanged.
+
+    The result is kept on ``page_data`` (a private attribute, never
+    serialised).  It survives ``model_copy`` and text-index rebuilds as
+    long as the fingerprint matches, and is recomputed after any change to
+    the blocks, including in-place bbox edits.
+    """
+    fingerprint = layout_fingerprint(page_data)
+    cached = page_data._layout
+    if cached is not None and cached.fingerprint == fingerprint:
+        return cached
+    bands = detect_column_bands(page_data.text_blocks, page_data.width)
+    offset_map = build_detection_text(page_data, block_offsets, bands)
+    layout = PageLayout(fingerprint, bands, offset_map)
+    page_data._layout = layout
+    return layout
 
 
 # ---------------------------------------------------------------------------
@@ -373,7 +483,7 @@ def build_detection_text(
 # ---------------------------------------------------------------------------
 
 
-def translate_match(match, dt_to_ft: list[int], full_text: str):
+def translate_match(match, dt_to_ft: Sequence[int], full_text: str):
     """Translate a detector match from detection_text → full_text coordinates.
 
     Works on any NamedTuple with ``start``, ``end``, ``text`` fields
@@ -387,6 +497,8 @@ def translate_match(match, dt_to_ft: list[int], full_text: str):
 
     Returns the translated match, or *None* if the matched span maps
     entirely to inserted separator characters (very unlikely in practice).
+    For many matches against one page use
+    :meth:`OffsetMap.translate_matches`.
     """
     ds, de = match.start, match.end
     n = len(dt_to_ft)
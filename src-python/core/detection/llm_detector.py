@@ -14,9 +14,13 @@ from __future__ import annotations
 import json
 import logging
 import re as _re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from typing import NamedTuple
 
+from core.detection.detection_config import LLM_CHUNK_EXECUTOR_WORKERS
+from core.detection.fuzzy_match import FuzzyNeedle
 from models.schemas import PIIType
 
 logger = logging.getLogger(__name__)
@@ -68,6 +72,27 @@ JSON:"""
 _CHUNK_SIZE = 1000             # Characters per chunk sent to LLM
 _CHUNK_OVERLAP = 100           # Overlap between consecutive chunks
 
+# Shared pool for sending one page's chunks concurrently (see ``detect_llm``).
+_CHUNK_EXECUTOR: ThreadPoolExecutor | None = None
+_CHUNK_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_chunk_executor() -> ThreadPoolExecutor:
+    """Return the executor shared by every concurrent ``detect_llm`` call.
+
+    Created lazily, so a local-only setup never starts it.  Chunk tasks
+    never submit further work, so pages waiting on it cannot deadlock it.
+    """
+    global _CHUNK_EXECUTOR
+    if _CHUNK_EXECUTOR is None:
+        with _CHUNK_EXECUTOR_LOCK:
+            if _CHUNK_EXECUTOR is None:
+                _CHUNK_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=LLM_CHUNK_EXECUTOR_WORKERS,
+                    thread_name_prefix="llm-chunk",
+                )
+    return _CHUNK_EXECUTOR
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -101,31 +126,38 @@ def detect_llm(text: str, llm_engine) -> list[LLMMatch]:
         logger.warning("LLM engine not available — skipping LLM detection")
         return []
 
-    all_matches: list[LLMMatch] = []
-
     # Short text — single pass
     if len(text) <= _CHUNK_SIZE:
         return _detect_chunk(text, 0, llm_engine)
 
     # Sliding-window for long text
+    chunks: list[tuple[int, str]] = []
     offset = 0
-    chunk_idx = 0
     while offset < len(text):
         end = min(offset + _CHUNK_SIZE, len(text))
-        chunk = text[offset:end]
+        chunks.append((offset, text[offset:end]))
+        offset += _CHUNK_SIZE - _CHUNK_OVERLAP
+        if end == len(text):
+            break
+
+    # Engines that accept concurrent calls (the remote API) get all the
+    # page's chunks at once and bound the requests in flight themselves;
+    # the local engine serialises anyway.
+    if getattr(llm_engine, "max_concurrency", 1) > 1:
+        results = list(_get_chunk_executor().map(
+            lambda c: _detect_chunk(c[1], c[0], llm_engine), chunks,
+        ))
+    else:
+        results = [_detect_chunk(chunk, off, llm_engine) for off, chunk in chunks]
 
-        chunk_matches = _detect_chunk(chunk, offset, llm_engine)
+    all_matches: list[LLMMatch] = []
+    for chunk_idx, ((off, chunk), chunk_matches) in enumerate(zip(chunks, results), 1):
         all_matches.extend(chunk_matches)
-        chunk_idx += 1
         logger.debug(
-            f"LLM chunk {chunk_idx}: offset={offset} len={len(chunk)} "
+            f"LLM chunk {chunk_idx}: offset={off} len={len(chunk)} "
             f"found={len(chunk_matches)}"
         )
 
-        offset += _CHUNK_SIZE - _CHUNK_OVERLAP
-        if end == len(text):
-            break
-
     # Deduplicate matches from overlapping regions
     return _deduplicate(all_matches)
 
@@ -195,7 +227,19 @@ def _fuzzy_find(needle: str, haystack: str, threshold: float = 0.75) -> int | No
     # Step size — check every character for short needles, skip for long
     step = max(1, n // 6)
 
-    for i in range(0, len(haystack) - n + 1, step):
+    # Only windows whose ratio can reach the refine cut-off (see
+    # core.detection.fuzzy_match) are compared; when the best window is
+    # below it the result is None either way.  lower() may change the
+    # length of some characters, in which case windows of the lowered
+    # text no longer line up and every window is compared.
+    fuzzy = FuzzyNeedle(lower_needle, threshold * 0.9)
+    aligned = len(lower_hay) == len(haystack)
+    if aligned:
+        starts = (i for i, _n in fuzzy.candidates(lower_hay, (n,), step=step))
+    else:
+        starts = range(0, len(haystack) - n + 1, step)
+
+    for i in starts:
         window = haystack[i : i + n]
         ratio = SequenceMatcher(None, lower_needle, window.lower()).ratio()
         if ratio > best_ratio:
@@ -208,6 +252,8 @@ def _fuzzy_find(needle: str, haystack: str, threshold: float = 0.75) -> int | No
         hi = min(len(haystack) - n + 1, best_idx + step + 1)
         for i in range(lo, hi):
             window = haystack[i : i + n]
+            if aligned and fuzzy.ratio_upper_bound(lower_hay[i : i + n]) <= best_ratio:
+                continue
             ratio = SequenceMatcher(None, lower_needle, window.lower()).ratio()
             if ratio > best_ratio:
                 best_ratio = ratio
@@ -5,19 +5,16 @@ resolution, noise filtering, and shape enforcement.
 
 from __future__ import annotations
 
+import bisect
+import dataclasses
 import logging
 import re
 import uuid
 
-from core.config import config
+from core.config import DetectionSettings, config
 from core.detection import detection_config as det_cfg
 from core.detection.bbox_utils import _resolve_bbox_overlaps
-from core.detection.block_offsets import (
-    _clamp_bbox,
-    _compute_block_offsets,
-    _char_offset_to_bbox,
-    _char_offsets_to_line_bboxes,
-)
+from core.detection.block_offsets import _clamp_bbox
 from core.detection.noise_filters import (
     _is_org_pipeline_noise,
     _is_loc_pipeline_noise,
@@ -27,6 +24,7 @@ from core.detection.noise_filters import (
     _STRUCTURED_MIN_DIGITS,
     has_legal_suffix,
 )
+from core.detection.page_index import page_text_index
 from core.detection.region_shapes import (
     _enforce_region_shapes,
     _max_lines_for_type,
@@ -55,6 +53,25 @@ _MAX_Y_GAP_FACTOR = det_cfg.MAX_Y_GAP_FACTOR
 _MIN_Y_GAP_ABS = det_cfg.MIN_Y_GAP_ABS
 
 
+@dataclasses.dataclass(slots=True)
+class _Candidate:
+    """One detection on its way through ``_merge_detections``.
+
+    Slotted so a dense page does not pay for a per-candidate ``__dict__``
+    through the boost, merge, filter and split passes; converted to
+    ``PIIRegion`` only once bboxes are assigned.
+    """
+
+    start: int
+    end: int
+    text: str
+    pii_type: PIIType
+    confidence: float
+    source: DetectionSource
+    priority: int
+    has_visual_boost: bool = False
+
+
 def _reconstruct_text_from_blocks(blocks: list[TextBlock]) -> str:
     """Join block texts respecting visual line structure.
 
@@ -144,15 +161,90 @@ def _split_bboxes_by_proximity(
     return final_groups
 
 
+def _cross_layer_counts(candidates: list[_Candidate]) -> list[int]:
+    """Number of distinct layers agreeing with each candidate.
+
+    A candidate counts its own source plus the source of every candidate
+    after it in start order (stable sort) whose span overlaps it by at
+    least half of the shorter of the two spans — the same rule the
+    original forward walk applied.
+
+    That walk was quadratic when long spans (LLM / GLiNER addresses and
+    organisations) covered most of a dense page.  Here each source keeps
+    its candidates in start order, and for a candidate ``c`` only the
+    window of that source starting inside ``c`` matters.  With integer
+    offsets a window member ``o`` qualifies iff
+
+    - ``2 * (c.end - o.start) >= len(c)`` (it starts in the first half of
+      ``c``) — checked on the window's first member, or
+    - ``o.start + o.end <= 2 * c.end`` (its midpoint lies inside ``c``,
+      which includes every ``o`` contained in ``c``) — checked with a
+      range-minimum over ``start + end``.
+
+    Each query is two bisections and one sparse-table lookup, so the
+    whole pass is O(n log n) whatever the span lengths.
+    """
+    n = len(candidates)
+    order = sorted(range(n), key=lambda k: candidates[k].start)
+    rank = [0] * n
+    for r, k in enumerate(order):
+        rank[k] = r
+
+    # source → (ranks, starts, sparse table of start+end), in start order.
+    # Empty spans never overlap anything and are left out.
+    by_source: dict[object, tuple[list[int], list[int], list[list[int]]]] = {}
+    for k in order:
+        c = candidates[k]
+        if c.end <= c.start:
+            continue
+        ranks, starts, table = by_source.setdefault(c.source, ([], [], [[]]))
+        ranks.append(rank[k])
+        starts.append(c.start)
+        table[0].append(c.start + c.end)
+    for _ranks, _starts, table in by_source.values():
+        row, width = table[0], 1
+        while 2 * width <= len(row):
+            row = [min(row[i], row[i + width]) for i in range(len(row) - width)]
+            table.append(row)
+            width *= 2
+
+    counts: list[int] = []
+    for k, c in enumerate(candidates):
+        c_start, c_end = c.start, c.end
+        c_len = c_end - c_start
+        sources = {c.source}
+        if c_len > 0:
+            for source, (ranks, starts, table) in by_source.items():
+                if source in sources:
+                    continue
+                lo = bisect.bisect_right(ranks, rank[k])
+                hi = bisect.bisect_left(starts, c_end, lo)
+                if lo >= hi:
+                    continue
+                if 2 * (c_end - starts[lo]) >= c_len:
+                    sources.add(source)
+                    continue
+                level = (hi - lo).bit_length() - 1
+                row = table[level]
+                if min(row[lo], row[hi - (1 << level)]) <= 2 * c_end:
+                    sources.add(source)
+        counts.append(len(sources))
+    return counts
+
+
 def _merge_detections(
     regex_matches: list[RegexMatch],
     ner_matches: list[NERMatch],
     llm_matches: list[LLMMatch],
     page_data: PageData,
     gliner_matches: list[GLiNERMatch] | None = None,
+    settings: DetectionSettings | None = None,
 ) -> list[PIIRegion]:
     """Merge detection results from all layers into unified PIIRegion list.
 
+    *settings* supplies the confidence threshold, font-size cap and gap
+    fuzziness; ``None`` reads them from the global config.
+
     Strategy:
     1. Convert all matches to a common format with char offsets.
     2. Cross-layer confidence boost when 2+ layers flag the same span.
@@ -168,7 +260,7 @@ def _merge_detections(
     semi_structured_types = {PIIType.ORG, PIIType.ADDRESS}
 
     # ── Convert to common intermediate format ────────────────────────
-    candidates: list[dict] = []
+    candidates: list[_Candidate] = []
 
     for m in regex_matches:
         if m.pii_type in structured_types:
@@ -177,12 +269,11 @@ def _merge_detections(
             prio = 2
         else:
             prio = 1
-        candidates.append({
-            "start": m.start, "end": m.end, "text": m.text,
-            "pii_type": m.pii_type, "confidence": m.confidence,
-            "source": DetectionSource.REGEX,
-            "priority": prio,
-        })
+        candidates.append(_Candidate(
+            m.start, m.end, m.text, m.pii_type, m.confidence,
+            source=DetectionSource.REGEX,
+            priority=prio,
+        ))
 
     for m in ner_matches:
         if m.pii_type in (PIIType.PHONE, PIIType.SSN, PIIType.DRIVER_LICENSE):
@@ -206,12 +297,11 @@ def _merge_detections(
             if "-" in m.text or "(" in m.text or ")" in m.text:
                 logger.debug("Skipping NER PASSPORT with phone formatting: %r", m.text)
                 continue
-        candidates.append({
-            "start": m.start, "end": m.end, "text": m.text,
-            "pii_type": m.pii_type, "confidence": m.confidence,
-            "source": DetectionSource.NER,
-            "priority": 2,
-        })
+        candidates.append(_Candidate(
+            m.start, m.end, m.text, m.pii_type, m.confidence,
+            source=DetectionSource.NER,
+            priority=2,
+        ))
 
     for m in (gliner_matches or []):
         if m.pii_type in (PIIType.PHONE, PIIType.SSN, PIIType.DRIVER_LICENSE):
@@ -228,55 +318,28 @@ def _merge_detections(
                 continue
             if m.pii_type == PIIType.DRIVER_LICENSE and digits < 6:
                 continue
-        candidates.append({
-            "start": m.start, "end": m.end, "text": m.text,
-            "pii_type": m.pii_type, "confidence": m.confidence,
-            "source": DetectionSource.GLINER,
-            "priority": 2,
-        })
+        candidates.append(_Candidate(
+            m.start, m.end, m.text, m.pii_type, m.confidence,
+            source=DetectionSource.GLINER,
+            priority=2,
+        ))
 
     for m in llm_matches:
-        candidates.append({
-            "start": m.start, "end": m.end, "text": m.text,
-            "pii_type": m.pii_type, "confidence": m.confidence,
-            "source": DetectionSource.LLM,
-            "priority": 1 if m.pii_type in structured_types else 3,
-        })
+        candidates.append(_Candidate(
+            m.start, m.end, m.text, m.pii_type, m.confidence,
+            source=DetectionSource.LLM,
+            priority=1 if m.pii_type in structured_types else 3,
+        ))
 
     # ── Cross-layer confidence boost (see detection_config.py) ────────
     _BOOST_2_LAYERS = det_cfg.BOOST_2_LAYERS
     _BOOST_3_LAYERS = det_cfg.BOOST_3_LAYERS
 
-    idx_sorted = sorted(range(len(candidates)), key=lambda k: candidates[k]["start"])
-
-    for ii in range(len(idx_sorted)):
-        i = idx_sorted[ii]
-        c = candidates[i]
-        overlapping_sources: set[str] = {c["source"]}
-        c_end = c["end"]
-
-        for jj in range(ii + 1, len(idx_sorted)):
-            j = idx_sorted[jj]
-            other = candidates[j]
-            if other["start"] >= c_end:
-                break
-            overlap_start = max(c["start"], other["start"])
-            overlap_end = min(c_end, other["end"])
-            if overlap_end <= overlap_start:
-                continue
-            overlap_len = overlap_end - overlap_start
-            c_len = c_end - c["start"]
-            o_len = other["end"] - other["start"]
-            if c_len > 0 and o_len > 0:
-                ratio = overlap_len / min(c_len, o_len)
-                if ratio >= 0.5:
-                    overlapping_sources.add(other["source"])
-
-        n_layers = len(overlapping_sources)
+    for c, n_layers in zip(candidates, _cross_layer_counts(candidates)):
         if n_layers >= 3:
-            c["confidence"] = min(1.0, c["confidence"] + _BOOST_3_LAYERS)
+            c.confidence = min(1.0, c.confidence + _BOOST_3_LAYERS)
         elif n_layers == 2:
-            c["confidence"] = min(1.0, c["confidence"] + _BOOST_2_LAYERS)
+            c.confidence = min(1.0, c.confidence + _BOOST_2_LAYERS)
 
     # ── Visual-grouping confidence boost (ORG only) ──────────────────
     # Three heuristics that increase ORG confidence for multi-word
@@ -288,9 +351,8 @@ def _merge_detections(
     _BOOST_VISUAL = det_cfg.BOOST_VISUAL
 
     # Pre-compute block offsets once for bold/italic + centring checks
-    _vg_block_offsets = _compute_block_offsets(
-        page_data.text_blocks, page_data.full_text,
-    )
+    _page_index = page_text_index(page_data)
+    _vg_block_offsets = _page_index.block_offsets
 
     # Build a set of character ranges enclosed in quotation marks
     _QUOTE_PAIRS = [('"', '"'), ("'", "'"), ('\u201c', '\u201d'),
@@ -321,19 +383,19 @@ def _merge_detections(
     page_width = page_data.width
 
     for c in candidates:
-        if c["pii_type"] != PIIType.ORG:
+        if c.pii_type != PIIType.ORG:
             continue
         already_boosted = False
 
         # 1. Quoted-text boost
         for qs, qe in _quoted_ranges:
-            if c["start"] >= qs and c["end"] <= qe:
-                c["confidence"] = min(1.0, c["confidence"] + _BOOST_VISUAL)
-                c["has_visual_boost"] = True
+            if c.start >= qs and c.end <= qe:
+                c.confidence = min(1.0, c.confidence + _BOOST_VISUAL)
+                c.has_visual_boost = True
                 already_boosted = True
                 logger.debug(
                     "Page %d: ORG visual boost (quoted): %r +%.2f",
-                    page_data.page_number, c["text"], _BOOST_VISUAL,
+                    page_data.page_number, c.text, _BOOST_VISUAL,
                 )
                 break
 
@@ -342,18 +404,18 @@ def _merge_detections(
             styled_count = 0
             total_count = 0
             for blk_start, blk_end, blk in _vg_block_offsets:
-                if blk_end <= c["start"] or blk_start >= c["end"]:
+                if blk_end <= c.start or blk_start >= c.end:
                     continue
                 total_count += 1
                 if blk.is_bold or blk.is_italic:
                     styled_count += 1
             if total_count >= 1 and styled_count > total_count / 2:
-                c["confidence"] = min(1.0, c["confidence"] + _BOOST_VISUAL)
-                c["has_visual_boost"] = True
+                c.confidence = min(1.0, c.confidence + _BOOST_VISUAL)
+                c.has_visual_boost = True
                 already_boosted = True
                 logger.debug(
                     "Page %d: ORG visual boost (bold/italic): %r +%.2f",
-                    page_data.page_number, c["text"], _BOOST_VISUAL,
+                    page_data.page_number, c.text, _BOOST_VISUAL,
                 )
 
         # 3. Horizontally-centred boost — the *entire line* containing
@@ -364,7 +426,7 @@ def _merge_detections(
         if not already_boosted and _vg_block_offsets and page_width > 0:
             span_blocks = [
                 (bs, be, b) for bs, be, b in _vg_block_offsets
-                if be > c["start"] and bs < c["end"]
+                if be > c.start and bs < c.end
             ]
             if span_blocks:
                 # Determine the y-range of the ORG's blocks
@@ -384,12 +446,12 @@ def _merge_detections(
                 right_margin = (page_width - right_edge) / page_width
                 _MIN_MARGIN = det_cfg.CENTERED_MIN_MARGIN
                 if left_margin >= _MIN_MARGIN and right_margin >= _MIN_MARGIN:
-                    c["confidence"] = min(1.0, c["confidence"] + _BOOST_VISUAL)
-                    c["has_visual_boost"] = True
+                    c.confidence = min(1.0, c.confidence + _BOOST_VISUAL)
+                    c.has_visual_boost = True
                     logger.debug(
                         "Page %d: ORG visual boost (centred): %r +%.2f "
                         "(L=%.0f%% R=%.0f%%)",
-                        page_data.page_number, c["text"], _BOOST_VISUAL,
+                        page_data.page_number, c.text, _BOOST_VISUAL,
                         left_margin * 100, right_margin * 100,
                     )
 
@@ -397,8 +459,8 @@ def _merge_detections(
         #    a capital letter indicate proper nouns (e.g., "Filets Sports
         #    Gaspésiens"). Only apply when there's NO legal suffix, since
         #    legal suffixes already provide strong detection signals.
-        if not already_boosted and not has_legal_suffix(c["text"]):
-            words = c["text"].split()
+        if not already_boosted and not has_legal_suffix(c.text):
+            words = c.text.split()
             if len(words) >= 2:
                 # Check if all words start with uppercase (ignoring articles/prepositions)
                 _SKIP_WORDS = {"de", "du", "des", "la", "le", "les", "l'", "d'",
@@ -408,11 +470,11 @@ def _merge_detections(
                 if len(title_words) >= 2 and all(
                     w[0].isupper() for w in title_words if len(w) > 0
                 ):
-                    c["confidence"] = min(1.0, c["confidence"] + _BOOST_VISUAL)
-                    c["has_visual_boost"] = True
+                    c.confidence = min(1.0, c.confidence + _BOOST_VISUAL)
+                    c.has_visual_boost = True
                     logger.debug(
                         "Page %d: ORG visual boost (title-case): %r +%.2f",
-                        page_data.page_number, c["text"], _BOOST_VISUAL,
+                        page_data.page_number, c.text, _BOOST_VISUAL,
                     )
 
     # ── Extend PERSON / ORG to cover full quoted text ─────────────────
@@ -420,7 +482,7 @@ def _merge_detections(
     # extend it to cover the entire quoted expression (e.g., « Dixie Lee »
     # should be detected as one "Dixie Lee" even if NER only found "Dixie").
     for c in candidates:
-        if c["pii_type"] not in (PIIType.PERSON, PIIType.ORG):
+        if c.pii_type not in (PIIType.PERSON, PIIType.ORG):
             continue
         for qs, qe in _quoted_ranges:
             # qs is index of opening quote, qe is index after closing quote
@@ -428,31 +490,31 @@ def _merge_detections(
             inner_start = qs + 1
             inner_end = qe - 1
             # Check if candidate overlaps with the quoted range
-            if c["start"] < inner_end and c["end"] > inner_start:
+            if c.start < inner_end and c.end > inner_start:
                 # Candidate overlaps with quoted text — extend to full inner
-                old_text = c["text"]
-                c["start"] = inner_start
-                c["end"] = inner_end
-                c["text"] = _ft[inner_start:inner_end].strip()
+                old_text = c.text
+                c.start = inner_start
+                c.end = inner_end
+                c.text = _ft[inner_start:inner_end].strip()
                 # Adjust start/end to match stripped text
-                while c["start"] < inner_end and _ft[c["start"]] in " \t\n":
-                    c["start"] += 1
-                while c["end"] > c["start"] and _ft[c["end"] - 1] in " \t\n":
-                    c["end"] -= 1
-                c["text"] = _ft[c["start"]:c["end"]]
-                if c["text"] != old_text:
+                while c.start < inner_end and _ft[c.start] in " \t\n":
+                    c.start += 1
+                while c.end > c.start and _ft[c.end - 1] in " \t\n":
+                    c.end -= 1
+                c.text = _ft[c.start:c.end]
+                if c.text != old_text:
                     logger.debug(
                         "Page %d: %s extended to quoted text: %r -> %r",
-                        page_data.page_number, c["pii_type"].value, old_text, c["text"],
+                        page_data.page_number, c.pii_type.value, old_text, c.text,
                     )
                 break  # Only extend once per candidate
 
     # ── Sort and merge overlapping regions ────────────────────────────
-    candidates.sort(key=lambda x: (x["start"], -x["priority"]))
+    candidates.sort(key=lambda x: (x.start, -x.priority))
 
     _MAX_PERSON_WORDS = 4  # same as _MAX_WORDS_BY_TYPE["PERSON"]
 
-    merged: list[dict] = []
+    merged: list[_Candidate] = []
     for cand in candidates:
         if not merged:
             merged.append(cand)
@@ -465,69 +527,69 @@ def _merge_detections(
         # (e.g. "Dagmar" + "Vymetalova") are parts of the same full name.
         # Merge them so the whole name surfaces as a single region.
         if (
-            cand["pii_type"] == PIIType.PERSON
-            and last["pii_type"] == PIIType.PERSON
-            and cand["start"] == last["end"] + 1
-            and page_data.full_text[last["end"]:cand["start"]] == " "
-            and len(page_data.full_text[last["start"]:cand["end"]].split()) <= _MAX_PERSON_WORDS
+            cand.pii_type == PIIType.PERSON
+            and last.pii_type == PIIType.PERSON
+            and cand.start == last.end + 1
+            and page_data.full_text[last.end:cand.start] == " "
+            and len(page_data.full_text[last.start:cand.end].split()) <= _MAX_PERSON_WORDS
         ):
-            last["end"] = cand["end"]
-            last["text"] = page_data.full_text[last["start"]:last["end"]]
-            last["confidence"] = max(last["confidence"], cand["confidence"])
+            last.end = cand.end
+            last.text = page_data.full_text[last.start:last.end]
+            last.confidence = max(last.confidence, cand.confidence)
             continue
 
-        if cand["start"] < last["end"]:
-            same_type = cand["pii_type"] == last["pii_type"]
-            prev_start = last["start"]
-            prev_end = last["end"]  # save before potential replacement
+        if cand.start < last.end:
+            same_type = cand.pii_type == last.pii_type
+            prev_start = last.start
+            prev_end = last.end  # save before potential replacement
 
-            if cand["priority"] > last["priority"]:
+            if cand.priority > last.priority:
                 merged[-1] = cand
-            elif cand["priority"] == last["priority"] and cand["confidence"] > last["confidence"]:
+            elif cand.priority == last.priority and cand.confidence > last.confidence:
                 merged[-1] = cand
 
             # For same-type overlaps, always take the UNION of spans so that
             # a shorter high-confidence candidate cannot silently drop a
             # legal suffix (e.g. "INC.") that a longer lower-confidence one
             # already captured.
-            if same_type and prev_start < merged[-1]["start"]:
-                merged[-1]["start"] = prev_start
-            if same_type and prev_end > merged[-1]["end"]:
-                merged[-1]["end"] = prev_end
+            if same_type and prev_start < merged[-1].start:
+                merged[-1].start = prev_start
+            if same_type and prev_end > merged[-1].end:
+                merged[-1].end = prev_end
             # Also extend if the *incoming* candidate itself is longer.
-            if same_type and cand["end"] > merged[-1]["end"]:
-                merged[-1]["end"] = cand["end"]
+            if same_type and cand.end > merged[-1].end:
+                merged[-1].end = cand.end
 
             # L11: Max-span guard — prevent snowball merging from creating
             # unreasonably long regions.  Cap merged span at 500 chars.
             _MAX_MERGE_CHARS = 500
-            span_len = merged[-1]["end"] - merged[-1]["start"]
+            span_len = merged[-1].end - merged[-1].start
             if span_len > _MAX_MERGE_CHARS:
-                merged[-1]["end"] = merged[-1]["start"] + _MAX_MERGE_CHARS
+                merged[-1].end = merged[-1].start + _MAX_MERGE_CHARS
 
             # Recompute text from the (possibly extended) span
-            merged[-1]["text"] = page_data.full_text[
-                merged[-1]["start"]:merged[-1]["end"]
+            merged[-1].text = page_data.full_text[
+                merged[-1].start:merged[-1].end
             ]
         else:
             merged.append(cand)
 
     # ── Apply pipeline-level noise filters (single combined pass) ────
     for item in merged:
-        if item["pii_type"] == PIIType.ORG:
+        if item.pii_type == PIIType.ORG:
             logger.debug(
                 "Page %d: ORG candidate: text=%r source=%s conf=%.2f noise=%s",
-                page_data.page_number, item["text"], item["source"],
-                item["confidence"], _is_org_pipeline_noise(item["text"]),
+                page_data.page_number, item.text, item.source,
+                item.confidence, _is_org_pipeline_noise(item.text),
             )
 
     # Pre-compile ISO date pattern for PHONE false-positive rejection.
     _ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 
-    def _is_candidate_noise(item: dict) -> bool:
+    def _is_candidate_noise(item: _Candidate) -> bool:
         """Combined noise + structured filter (M2: single pass)."""
-        ptype = item["pii_type"]
-        txt = item["text"]
+        ptype = item.pii_type
+        txt = item.text
         stripped = txt.strip()
 
         # ── Structural minimum-content gates ──────────────────────────
@@ -572,7 +634,7 @@ def _merge_detections(
         # centered, quoted) since those are strong signals of intentional
         # emphasis by the document author.
         if ptype == PIIType.ORG:
-            if item.get("has_visual_boost"):
+            if item.has_visual_boost:
                 logger.debug(
                     "Page %d: ORG skipping noise filter (visual boost): %r",
                     page_data.page_number, txt,
@@ -588,8 +650,8 @@ def _merge_detections(
         # Context-aware PERSON filter: page-header pattern
         if (
             ptype == PIIType.PERSON
-            and item.get("source") in ("NER", "GLINER", "BERT")
-            and item.get("start", 99) <= 5
+            and item.source in ("NER", "GLINER", "BERT")
+            and item.start <= 5
             and len(txt.split()) >= 2
         ):
             return True
@@ -621,9 +683,8 @@ def _merge_detections(
         )
 
     # ── Pre-compute block offsets (used by ADDRESS merge + bbox mapping) ──
-    block_offsets = _compute_block_offsets(
-        page_data.text_blocks, page_data.full_text,
-    )
+    block_offsets = _page_index.block_offsets
+    geometry = _page_index.geometry
 
     # ── Spatial coherence filter ─────────────────────────────────────
     # A regex may match text that is *textually* adjacent in full_text
@@ -638,7 +699,7 @@ def _merge_detections(
             cand_blocks = [
                 (bs, be, blk)
                 for bs, be, blk in block_offsets
-                if be > item["start"] and bs < item["end"]
+                if be > item.start and bs < item.end
             ]
             if len(cand_blocks) < 2:
                 continue
@@ -672,8 +733,8 @@ def _merge_detections(
             # ADDRESS / LOCATION candidates legitimately span 2-3 lines
             # (street + city/postal) with potentially generous spacing,
             # so we use a looser factor for those.
-            _is_addr = item["pii_type"] in {PIIType.ADDRESS, PIIType.LOCATION}
-            _is_person = item["pii_type"] == PIIType.PERSON
+            _is_addr = item.pii_type in {PIIType.ADDRESS, PIIType.LOCATION}
+            _is_person = item.pii_type == PIIType.PERSON
             # ADDRESS/LOCATION: loose (3.0×), PERSON: moderate (2.0×),
             # everything else: tight (1.5×)
             if _is_addr:
@@ -697,9 +758,9 @@ def _merge_detections(
                 new_end = max(t[1] for t in kept)
                 new_text = page_data.full_text[new_start:new_end]
                 if new_text.strip():
-                    item["start"] = new_start
-                    item["end"] = new_end
-                    item["text"] = new_text
+                    item.start = new_start
+                    item.end = new_end
+                    item.text = new_text
                     _spatial_trimmed += 1
         if _spatial_trimmed:
             logger.info(
@@ -716,33 +777,33 @@ def _merge_detections(
     # Split at newlines, keeping each line that looks like an entity
     # (starts with an uppercase letter and is at least 2 chars long).
     _NL_TRIM_TYPES = {PIIType.ORG, PIIType.PERSON}
-    _nl_split_replacements: list[tuple[int, list[dict]]] = []
+    _nl_split_replacements: list[tuple[int, list[_Candidate]]] = []
     for idx, item in enumerate(merged):
-        if item["pii_type"] not in _NL_TRIM_TYPES:
+        if item.pii_type not in _NL_TRIM_TYPES:
             continue
-        txt = item["text"]
+        txt = item.text
         if "\n" not in txt:
             continue
         # ORG with a legal suffix is a validated company name that
         # legitimately spans multiple lines — don't split it; the
         # linked-group logic downstream will create per-line siblings.
-        if item["pii_type"] == PIIType.ORG and has_legal_suffix(txt):
+        if item.pii_type == PIIType.ORG and has_legal_suffix(txt):
             continue
         # Split into per-line segments
-        segments: list[dict] = []
+        segments: list[_Candidate] = []
         offset = 0
         for line in txt.split("\n"):
             stripped = line.strip()
-            line_start = item["start"] + offset
+            line_start = item.start + offset
             line_end = line_start + len(line)
             # Keep lines that look like entity names:
             # - at least 2 chars after stripping
             # - starts with uppercase letter (not parenthesis, digit, etc.)
             if len(stripped) >= 2 and stripped[0].isupper():
-                seg = dict(item)  # shallow copy
-                seg["text"] = stripped
-                seg["start"] = line_start + (len(line) - len(line.lstrip()))
-                seg["end"] = seg["start"] + len(stripped)
+                seg = dataclasses.replace(item)
+                seg.text = stripped
+                seg.start = line_start + (len(line) - len(line.lstrip()))
+                seg.end = seg.start + len(stripped)
                 segments.append(seg)
             offset += len(line) + 1  # +1 for the \n
         if segments:
@@ -750,7 +811,7 @@ def _merge_detections(
 
     if _nl_split_replacements:
         # Rebuild merged list with split segments replacing originals
-        new_merged: list[dict] = []
+        new_merged: list[_Candidate] = []
         replaced_indices = {idx for idx, _ in _nl_split_replacements}
         replace_map = {idx: segs for idx, segs in _nl_split_replacements}
         for idx, item in enumerate(merged):
@@ -767,14 +828,14 @@ def _merge_detections(
         )
 
     # ── Merge adjacent ADDRESS fragments ──────────────────────────────
-    _addr_merged: list[dict] = []
+    _addr_merged: list[_Candidate] = []
     for item in merged:
         if _addr_merged:
             prev = _addr_merged[-1]
-            prev_is_addr = prev["pii_type"] == PIIType.ADDRESS
-            prev_is_loc = prev["pii_type"] == PIIType.LOCATION
-            cur_is_addr = item["pii_type"] == PIIType.ADDRESS
-            cur_is_loc = item["pii_type"] == PIIType.LOCATION
+            prev_is_addr = prev.pii_type == PIIType.ADDRESS
+            prev_is_loc = prev.pii_type == PIIType.LOCATION
+            cur_is_addr = item.pii_type == PIIType.ADDRESS
+            cur_is_loc = item.pii_type == PIIType.LOCATION
 
             can_merge = False
             if prev_is_addr and (cur_is_addr or cur_is_loc):
@@ -783,20 +844,16 @@ def _merge_detections(
                 can_merge = True
 
             if can_merge:
-                gap = item["start"] - prev["end"]
+                gap = item.start - prev.end
                 if 0 <= gap <= 60:
-                    combined_text = page_data.full_text[prev["start"]:item["end"]]
+                    combined_text = page_data.full_text[prev.start:item.end]
                     newline_count = combined_text.count("\n")
                     if newline_count <= 3:
                         # ── spatial proximity guard ──
                         # Compute bboxes for both fragments; skip merge
                         # if they're too far apart vertically.
-                        prev_bbs = _char_offsets_to_line_bboxes(
-                            prev["start"], prev["end"], block_offsets,
-                        ) if block_offsets else []
-                        cur_bbs = _char_offsets_to_line_bboxes(
-                            item["start"], item["end"], block_offsets,
-                        ) if block_offsets else []
+                        prev_bbs = geometry.line_bboxes(prev.start, prev.end)
+                        cur_bbs = geometry.line_bboxes(item.start, item.end)
                         if prev_bbs and cur_bbs:
                             prev_y1_max = max(b.y1 for b in prev_bbs)
                             cur_y0_min = min(b.y0 for b in cur_bbs)
@@ -818,7 +875,7 @@ def _merge_detections(
                             merged_y1 = max(b.y1 for b in all_bbs)
                             spatial_blocks = [
                                 blk for bs, be, blk in block_offsets
-                                if (be > prev["start"] and bs < item["end"]
+                                if (be > prev.start and bs < item.end
                                     and blk.bbox.x1 >= merged_x0
                                     and blk.bbox.x0 <= merged_x1
                                     and blk.bbox.y1 >= merged_y0
@@ -829,10 +886,10 @@ def _merge_detections(
                                     spatial_blocks,
                                 )
 
-                        prev["end"] = item["end"]
-                        prev["text"] = combined_text
-                        prev["pii_type"] = PIIType.ADDRESS
-                        prev["confidence"] = max(prev["confidence"], item["confidence"])
+                        prev.end = item.end
+                        prev.text = combined_text
+                        prev.pii_type = PIIType.ADDRESS
+                        prev.confidence = max(prev.confidence, item.confidence)
                         continue
         _addr_merged.append(item)
     if len(_addr_merged) < len(merged):
@@ -844,30 +901,29 @@ def _merge_detections(
 
     # ── Strip phone/fax labels from ADDRESS text ─────────────────────
     for item in merged:
-        if item["pii_type"] == PIIType.ADDRESS:
-            cleaned = _strip_phone_labels_from_address(item["text"])
-            if cleaned != item["text"]:
+        if item.pii_type == PIIType.ADDRESS:
+            cleaned = _strip_phone_labels_from_address(item.text)
+            if cleaned != item.text:
                 # Adjust end offset to reflect the trimmed text
-                item["text"] = cleaned
-                item["end"] = item["start"] + len(cleaned)
+                item.text = cleaned
+                item.end = item.start + len(cleaned)
 
     # ── Convert to PIIRegion with per-line bboxes ─────────────────────
 
-    _max_pt = config.max_font_size_pt
+    _settings = settings if settings is not None else config
+    _max_pt = _settings.max_font_size_pt
 
     regions: list[PIIRegion] = []
     _large_font_skipped = 0
-    for item in merged:
-        if item["confidence"] < config.confidence_threshold:
-            continue
-        if item["pii_type"] == PIIType.CUSTOM:
-            continue
-
-        line_bboxes = _char_offsets_to_line_bboxes(
-            item["start"], item["end"], block_offsets,
-        )
+    emitted = [
+        item for item in merged
+        if item.confidence >= _settings.confidence_threshold
+        and item.pii_type != PIIType.CUSTOM
+    ]
+    emitted_line_bboxes = geometry.line_bboxes_many([(item.start, item.end) for item in emitted])
+    for item, line_bboxes in zip(emitted, emitted_line_bboxes):
         if not line_bboxes:
-            bbox = _char_offset_to_bbox(item["start"], item["end"], block_offsets)
+            bbox = geometry.bbox(item.start, item.end)
             if bbox is None:
                 continue
             line_bboxes = [bbox]
@@ -881,21 +937,21 @@ def _merge_detections(
         # ADDRESS street-number heuristic
         if (
             len(line_bboxes) > 1
-            and item["pii_type"] in (PIIType.ADDRESS, "ADDRESS")
+            and item.pii_type in (PIIType.ADDRESS, "ADDRESS")
         ):
-            match_text = page_data.full_text[item["start"]:item["end"]]
+            match_text = page_data.full_text[item.start:item.end]
             first_line = match_text.split("\n")[0].strip()
             if first_line and not re.search(r"[A-Za-zÀ-ÿ]", first_line):
                 continue
 
-        max_lines = _max_lines_for_type(item["pii_type"])
+        max_lines = _max_lines_for_type(item.pii_type)
 
         # ── Build per-line char ranges ────────────────────────────────
-        match_text = page_data.full_text[item["start"]:item["end"]]
+        match_text = page_data.full_text[item.start:item.end]
         line_parts = match_text.split("\n")
         if len(line_parts) == len(line_bboxes):
             all_char_ranges: list[tuple[int, int]] = []
-            pos = item["start"]
+            pos = item.start
             for part in line_parts:
                 all_char_ranges.append((pos, pos + len(part)))
                 pos += len(part) + 1
@@ -909,19 +965,19 @@ def _merge_detections(
                 ov_starts: list[int] = []
                 ov_ends: list[int] = []
                 for bs, be, blk in block_offsets:
-                    if be <= item["start"] or bs >= item["end"]:
+                    if be <= item.start or bs >= item.end:
                         continue
                     bb = blk.bbox
                     # Check spatial overlap with this line bbox
                     if (bb.x1 < lb.x0 or bb.x0 > lb.x1
                             or bb.y1 < lb.y0 or bb.y0 > lb.y1):
                         continue
-                    ov_starts.append(max(bs, item["start"]))
-                    ov_ends.append(min(be, item["end"]))
+                    ov_starts.append(max(bs, item.start))
+                    ov_ends.append(min(be, item.end))
                 if ov_starts:
                     all_char_ranges.append((min(ov_starts), max(ov_ends)))
                 else:
-                    all_char_ranges.append((item["start"], item["end"]))
+                    all_char_ranges.append((item.start, item.end))
 
         # ── Split bboxes into spatially contiguous clusters ───────────
         spatial_groups = _split_bboxes_by_proximity(line_bboxes)
@@ -943,7 +999,7 @@ def _merge_detections(
                 sg_y1 = max(b.y1 for b in sg_bboxes)
                 sg_blocks = [
                     blk for bs, be, blk in block_offsets
-                    if (be > item["start"] and bs < item["end"]
+                    if (be > item.start and bs < item.end
                         and blk.bbox.x1 >= sg_x0 and blk.bbox.x0 <= sg_x1
                         and blk.bbox.y1 >= sg_y0 and blk.bbox.y0 <= sg_y1)
                 ]
@@ -954,7 +1010,7 @@ def _merge_detections(
             elif len(spatial_groups) > 1:
                 group_text = page_data.full_text[group_cs:group_ce]
             else:
-                group_text = item["text"]
+                group_text = item.text
 
             if len(sg_bboxes) == 1:
                 cs, ce = sg_ranges[0]
@@ -963,9 +1019,9 @@ def _merge_detections(
                     page_number=page_data.page_number,
                     bbox=sg_bboxes[0],
                     text=group_text,
-                    pii_type=item["pii_type"],
-                    confidence=item["confidence"],
-                    source=item["source"],
+                    pii_type=item.pii_type,
+                    confidence=item.confidence,
+                    source=item.source,
                     char_start=cs,
                     char_end=ce,
                 ))
@@ -978,9 +1034,9 @@ def _merge_detections(
                         page_number=page_data.page_number,
                         bbox=lb,
                         text=group_text,
-                        pii_type=item["pii_type"],
-                        confidence=item["confidence"],
-                        source=item["source"],
+                        pii_type=item.pii_type,
+                        confidence=item.confidence,
+                        source=item.source,
                         char_start=cs,
                         char_end=ce,
                         linked_group=group_id,
@@ -997,9 +1053,9 @@ def _merge_detections(
                             page_number=page_data.page_number,
                             bbox=lb,
                             text=group_text,
-                            pii_type=item["pii_type"],
-                            confidence=item["confidence"],
-                            source=item["source"],
+                            pii_type=item.pii_type,
+                            confidence=item.confidence,
+                            source=item.source,
                             char_start=cs,
                             char_end=ce,
                             linked_group=group_id,
@@ -1037,7 +1093,7 @@ def _merge_detections(
         regions = kept
 
     # Enforce region shape constraints
-    regions = _enforce_region_shapes(regions, page_data, block_offsets)
+    regions = _enforce_region_shapes(regions, page_data, block_offsets, settings=settings)
 
     # Resolve remaining bbox overlaps
     regions = _resolve_bbox_overlaps(regions)
@@ -1054,9 +1110,9 @@ def _merge_detections(
     # quotes) still passes through _is_region_noise because its visual
     # evidence is too weak to override the heuristic noise filter.
     _boosted_char_starts: frozenset[int] = frozenset(
-        item["start"] for item in merged
-        if item.get("has_visual_boost")
-        and len(item.get("text", "").split()) >= 2
+        item.start for item in merged
+        if item.has_visual_boost
+        and len(item.text.split()) >= 2
     )
 
     def _is_region_noise(r: PIIRegion) -> bool:
@@ -15,7 +15,7 @@ import logging
 import re
 import threading
 from dataclasses import dataclass, field
-from typing import Callable, NamedTuple
+from typing import Callable, NamedTuple, Sequence
 
 from models.schemas import PIIType
 
@@ -401,7 +401,11 @@ def _process_chunk_generic(
     nlp, text: str, global_offset: int, cfg: _LangNERConfig,
 ) -> list[NERMatch]:
     """Run NER on a single text chunk — shared logic for all languages."""
-    doc = nlp(text)
+    return _doc_matches(nlp(text), global_offset, cfg)
+
+
+def _doc_matches(doc, global_offset: int, cfg: _LangNERConfig) -> list[NERMatch]:
+    """Turn the entities of a processed spaCy *doc* into filtered matches."""
     matches: list[NERMatch] = []
 
     for ent in doc.ents:
@@ -575,6 +579,30 @@ def detect_ner(text: str) -> list[NERMatch]:
     return _deduplicate_matches(all_matches)
 
 
+def detect_ner_batch(texts: Sequence[str]) -> list[list[NERMatch]]:
+    """Run :func:`detect_ner` over many texts with one ``nlp.pipe`` call.
+
+    Returns one match list per input text, identical to calling
+    ``detect_ner`` on each.  Every text keeps its own language gate and
+    offsets; only the model invocation is shared, which is what makes
+    re-validating dozens of short snippets cheap.
+    """
+    results: list[list[NERMatch]] = [[] for _ in texts]
+    short: list[int] = []
+    for i, text in enumerate(texts):
+        if not _is_english_text(text):
+            continue
+        if len(text) <= _CHUNK_SIZE:
+            short.append(i)
+        else:
+            results[i] = detect_ner(text)
+    if short:
+        nlp = _load_model()
+        for i, doc in zip(short, nlp.pipe([texts[i] for i in short])):
+            results[i] = _doc_matches(doc, 0, _EN_CONFIG)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # French spaCy NER entity label map
 # ---------------------------------------------------------------------------
@@ -1678,6 +1706,19 @@ def get_active_model_name() -> str:
     return _active_model_name
 
 
+def get_active_model_names() -> dict[str, str]:
+    """Loaded spaCy model names by language code (``""`` when not loaded)."""
+    return {
+        "en": _active_model_name,
+        "fr": _active_fr_model_name,
+        "it": _active_it_model_name,
+        "de": _active_de_model_name,
+        "es": _active_es_model_name,
+        "nl": _active_nl_model_name,
+        "pt": _active_pt_model_name,
+    }
+
+
 def is_ner_available() -> bool:
     """Check if NER is available without raising."""
     try:
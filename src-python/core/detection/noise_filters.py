@@ -16,8 +16,11 @@ filtered.
 
 from __future__ import annotations
 
+import functools as _functools
 import re as _re
+import threading as _threading
 import unicodedata as _unicodedata
+from collections import OrderedDict as _OrderedDict
 
 import Stemmer as _Stemmer  # PyStemmer — Snowball stemmers
 
@@ -185,6 +188,82 @@ def _get_german_words() -> frozenset[str]:
     return _german_words
 
 
+# ── Verdict cache ────────────────────────────────────────────────────────
+# The pipeline noise checks below depend only on the stripped text and the
+# PII type: they consult all seven dictionaries regardless of the document
+# language, and their word lists are fixed for the life of the process.
+# Repeated surnames, organisations and addresses are therefore answered from
+# a bounded LRU instead of re-running the dictionary and stemming lookups.
+
+# Bump when a rule change must not be answered from verdicts computed by
+# the previous rules (e.g. after reloading the dictionaries in-process).
+NOISE_FILTER_VERSION = 1
+
+
+class NoiseVerdictCache:
+    """Bounded LRU of noise-filter verdicts, shared by all threads."""
+
+    def __init__(self, max_entries: int = det_cfg.NOISE_VERDICT_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._lock = _threading.Lock()
+        self._entries: _OrderedDict[tuple[str, PIIType, int], bool] = _OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, PIIType, int]) -> bool | None:
+        with self._lock:
+            verdict = self._entries.get(key)
+            if verdict is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return verdict
+
+    def put(self, key: tuple[str, PIIType, int], verdict: bool) -> None:
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> tuple[int, int]:
+        """``(hits, misses)`` since the cache was created or cleared."""
+        with self._lock:
+            return self.hits, self.misses
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+noise_verdict_cache = NoiseVerdictCache()
+
+
+def _cached_verdict(pii_type: PIIType):
+    """Memoize a ``(text) -> bool`` noise check in ``noise_verdict_cache``.
+
+    The wrapped function stays reachable as ``__wrapped__`` for callers
+    that need to bypass the cache.
+    """
+    def decorator(fn):
+        @_functools.wraps(fn)
+        def wrapper(text: str) -> bool:
+            key = (text.strip(), pii_type, NOISE_FILTER_VERSION)
+            verdict = noise_verdict_cache.get(key)
+            if verdict is None:
+                verdict = fn(text)
+                noise_verdict_cache.put(key, verdict)
+            return verdict
+        return wrapper
+    return decorator
+
+
 # ── ORG noise (dictionary-based) ─────────────────────────────────────────
 # No hand-curated word list — uses _common_words from language dictionaries.
 # A candidate is noise if all its words are ordinary dictionary words and
@@ -203,6 +282,7 @@ _ARTICLE_PREFIX_RE = _re.compile(
 )
 
 
+@_cached_verdict(PIIType.ORG)
 def _is_org_pipeline_noise(text: str) -> bool:
     """Return True if *text* looks like a noisy ORG false-positive.
 
@@ -963,6 +1043,7 @@ _LOC_PIPELINE_NOISE: frozenset[str] = _COMMON_DOMAIN_NOISE | _LOC_ONLY_NOISE
 _PERSON_PIPELINE_NOISE: frozenset[str] = _COMMON_DOMAIN_NOISE | _PERSON_ONLY_NOISE
 
 
+@_cached_verdict(PIIType.LOCATION)
 def _is_loc_pipeline_noise(text: str) -> bool:
     """Return True if *text* looks like a noisy LOCATION false-positive.
 
@@ -1267,6 +1348,7 @@ def _is_single_word_dict_noise(word: str) -> bool:
     return False
 
 
+@_cached_verdict(PIIType.PERSON)
 def _is_person_pipeline_noise(text: str) -> bool:
     """Return True if *text* looks like a noisy PERSON false-positive."""
     clean = text.strip()
@@ -1469,6 +1551,7 @@ _MORTGAGE_TERM_RE = _re.compile(
 )
 
 
+@_cached_verdict(PIIType.ADDRESS)
 def _is_address_number_only(text: str) -> bool:
     """Return True if an ADDRESS region is structurally invalid.
 
@@ -0,0 +1,85 @@
+"""Per-page derived text index, cached on the page.
+
+Detection, propagation, redetect, blacklist and highlight-all all need
+the same facts about a page: its visual lines, the char-offset →
+TextBlock mapping, the sorted block end offsets for bisect lookups, and
+one or more normalised copies of ``full_text`` with a map back to it.
+``page_text_index(page)`` builds them once and keeps them on the
+``PageData`` (a private attribute, never serialised) and rebuilds them
+when the page goes stale, by the rule documented on ``PageData``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from core.detection.block_offsets import PageGeometry, _compute_block_offsets
+from core.detection.layout import layout_fingerprint
+from models.schemas import PageData, TextBlock
+
+
+class PageTextIndex:
+    """Derived lookup structures for one page's text.
+
+    Attributes:
+        fingerprint: ``layout_fingerprint`` of the page it was built from.
+        lines: ``_cluster_into_lines(text_blocks)`` — visual lines, each
+            sorted left-to-right.
+        block_offsets: ``(char_start, char_end, TextBlock)`` triples, as
+            returned by ``_compute_block_offsets``.
+        ends: ``char_end`` of every triple, for ``bisect``.
+        geometry: :class:`PageGeometry` for char-range → bbox mapping,
+            built on first use.
+    """
+
+    __slots__ = (
+        "fingerprint", "full_text", "lines", "block_offsets", "ends",
+        "_geometry", "_views",
+    )
+
+    def __init__(self, page: PageData) -> None:
+        from core.ingestion.loader import _cluster_into_lines
+
+        text_blocks = page.text_blocks
+        full_text = page.full_text
+        self.fingerprint = layout_fingerprint(page)
+        self.full_text = full_text
+        self.lines: list[list[TextBlock]] = _cluster_into_lines(text_blocks)
+        self.block_offsets: list[tuple[int, int, TextBlock]] = _compute_block_offsets(
+            text_blocks, full_text, lines=self.lines,
+        )
+        self.ends: list[int] = [bo[1] for bo in self.block_offsets]
+        self._geometry: PageGeometry | None = None
+        self._views: dict[Callable[[str], Any], Any] = {}
+
+    @property
+    def geometry(self) -> PageGeometry:
+        if self._geometry is None:
+            self._geometry = PageGeometry(self.block_offsets, self.ends)
+        return self._geometry
+
+    def is_current(self, page: PageData) -> bool:
+        """True while *page* still has the fingerprint this was built from."""
+        return layout_fingerprint(page) == self.fingerprint
+
+    def text_view(self, build: Callable[[str], Any]) -> Any:
+        """``build(full_text)``, computed once per index.
+
+        *build* is a module-level normaliser such as
+        ``accent_fold_with_map`` returning the normalised text and its
+        offset map; the function object itself is the cache key.
+        """
+        try:
+            return self._views[build]
+        except KeyError:
+            view = self._views[build] = build(self.full_text)
+            return view
+
+
+def page_text_index(page: PageData) -> PageTextIndex:
+    """The cached :class:`PageTextIndex` of *page*, rebuilt if stale."""
+    index = page._text_index
+    if index is None or not index.is_current(page):
+        index = PageTextIndex(page)
+        page._text_index = index
+    return index
@@ -0,0 +1,330 @@
+"""Persistent cross-document cache of model-layer results per paragraph.
+
+Documents generated from the same template (engagement letters, payslips,
+bank statements) share large, byte-identical paragraphs.  When
+``config.paragraph_cache_enabled`` is on, ``detect_pii_on_page`` looks up
+every paragraph of ``full_text`` (a ``\\n``-separated segment of at least
+``PARAGRAPH_CACHE_MIN_CHARS`` normalised characters) in this cache and
+blanks the hits out of the NER / BERT / GLiNER input, adding the cached
+spans back instead.  Regex and the LLM always see the full text.
+
+Keys are the normalised-paragraph hash combined with a fingerprint of the
+settings, detection language and model ids that shape the NER / GLiNER
+output, so changing the NER backend, the language or an installed model
+never serves stale spans.  Spans are stored relative to the
+paragraph.  The cache is an LRU bounded to ``PARAGRAPH_CACHE_MAX_ENTRIES``
+and is persisted as JSON in the data directory.
+
+Paragraphs carry PII, so the file never holds a plain hash of their
+text: paragraph digests are re-hashed with a random per-install key
+(``detection_cache.key``, created with owner-only permissions next to
+the cache file).  Without the key the file cannot be used to check
+whether a known paragraph was processed.  Clearing the cache rotates
+the key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import secrets
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+
+from core.detection.detection_config import (
+    PARAGRAPH_CACHE_MAX_ENTRIES,
+    PARAGRAPH_CACHE_MIN_CHARS,
+)
+from core.detection.fingerprint import (
+    Line,
+    _StoredMatch,
+    _from_stored,
+    iter_lines,
+    self_contained_lines,
+)
+from core.detection.gliner_detector import GLiNERMatch
+from core.detection.ner_types import NERMatch
+from models.schemas import PIIType
+
+logger = logging.getLogger(__name__)
+
+# Bump when detector output changes in a way that invalidates stored spans.
+_CACHE_VERSION = 2
+
+_KEY_BYTES = 32
+
+# Layer family → match class used when loading spans back from disk.
+_FAMILY_CLASSES: dict[str, type] = {"ner": NERMatch, "gliner": GLiNERMatch}
+
+
+def settings_fingerprint(
+    settings: object,
+    language: str | None = None,
+    models: Iterable[str] = (),
+) -> str:
+    """Hash the settings and models that shape NER / GLiNER output.
+
+    *language* is the page's detection language and *models* the ids of
+    the models that would run on it (BERT, spaCy per language, GLiNER),
+    so switching either never serves spans produced by another.
+    ``ner_types`` and the confidence threshold are applied after the
+    layers run and so are deliberately left out.
+    """
+    parts = (
+        _CACHE_VERSION,
+        getattr(settings, "ner_enabled", None),
+        getattr(settings, "ner_backend", None),
+        language,
+        tuple(models),
+    )
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Atomically write *data* to *path*, readable by the owner only."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates the file with mode 0o600.
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp", prefix="detection_cache_")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _new_key(path: Path) -> bytes:
+    """Generate a fresh cache key and store it at *path*."""
+    key = secrets.token_bytes(_KEY_BYTES)
+    try:
+        _write_private(path, key)
+    except OSError as exc:
+        logger.warning(f"Could not store detection cache key ({exc}) — entries won't survive a restart")
+    return key
+
+
+def _load_key(path: Path) -> bytes:
+    """Read the per-install cache key at *path*, creating it on first use."""
+    try:
+        key = path.read_bytes()
+    except FileNotFoundError:
+        return _new_key(path)
+    except OSError as exc:
+        logger.warning(f"Unreadable detection cache key {path}: {exc}")
+        return secrets.token_bytes(_KEY_BYTES)
+    if len(key) != _KEY_BYTES:
+        logger.warning(f"Replacing malformed detection cache key {path}")
+        return _new_key(path)
+    return key
+
+
+class ParagraphCache:
+    """Bounded LRU of paragraph results, persisted to a JSON file.
+
+    Thread-safe.  The file and its key are read lazily on first use and
+    the file is written by :meth:`save` (after each detection run and at
+    shutdown) only when something changed.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        max_entries: int = PARAGRAPH_CACHE_MAX_ENTRIES,
+        key_path: Path | None = None,
+    ) -> None:
+        self._path = path
+        self._key_path = key_path
+        self._secret: bytes | None = None
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, dict[str, list[_StoredMatch]]] = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            from core.config import config
+            self._path = config.data_dir / "detection_cache.json"
+        return self._path
+
+    @property
+    def key_path(self) -> Path:
+        if self._key_path is None:
+            self._key_path = self.path.with_suffix(".key")
+        return self._key_path
+
+    def _key(self, fingerprint: str, line: Line) -> str:
+        """Entry key: the paragraph digest hashed with the install key
+        (caller holds the lock, cache loaded)."""
+        digest = hashlib.blake2b(line.key, key=self._secret, digest_size=16).hexdigest()
+        return f"{fingerprint}:{digest}"
+
+    def _key_id(self) -> str:
+        """Identifies the install key the entries were hashed with."""
+        return hashlib.blake2b(b"detection-cache", key=self._secret, digest_size=8).hexdigest()
+
+    def lookup(
+        self,
+        text: str,
+        fingerprint: str,
+        skip: Iterable[int] = (),
+    ) -> tuple[list[Line], dict[str, list]]:
+        """Find cached paragraphs of *text*.
+
+        Paragraphs starting at an offset in *skip* (already handled by
+        another cache) are ignored.  Returns the hit paragraphs and their
+        cached spans remapped onto *text*, grouped by layer family.
+        """
+        skip = set(skip)
+        paragraphs = [
+            p for p in iter_lines(text, PARAGRAPH_CACHE_MIN_CHARS) if p.start not in skip
+        ]
+        if not paragraphs:
+            return [], {}
+        hits: list[tuple[Line, dict[str, list[_StoredMatch]]]] = []
+        with self._lock:
+            self._ensure_loaded()
+            for p in paragraphs:
+                key = self._key(fingerprint, p)
+                entry = self._entries.get(key)
+                if entry is None:
+                    self.misses += 1
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                hits.append((p, entry))
+        matches: dict[str, list] = {}
+        for p, entry in hits:
+            for family, stored in entry.items():
+                matches.setdefault(family, []).extend(
+                    _from_stored(stored, p.start, p.positions, text)
+                )
+        return [p for p, _entry in hits], matches
+
+    def store(
+        self,
+        text: str,
+        fingerprint: str,
+        layer_matches: dict[str, list],
+        skip: Iterable[int] = (),
+    ) -> None:
+        """Remember the per-paragraph spans of *layer_matches* (family → matches).
+
+        Paragraphs starting at an offset in *skip* are not stored.
+        """
+        new = list(self_contained_lines(
+            text, layer_matches, PARAGRAPH_CACHE_MIN_CHARS, skip=skip,
+        ))
+        if not new:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            for p, entry in new:
+                key = self._key(fingerprint, p)
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    continue
+                self._entries[key] = entry
+                self._dirty = True
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (memory and disk), rotate the key and reset
+        the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._secret = _new_key(self.key_path)
+            self._loaded = True
+            self._dirty = True
+            self.hits = self.misses = self.evictions = 0
+        self.save()
+
+    def stats(self) -> dict[str, float]:
+        """Size and hit-rate counters for diagnostics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self._max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        """Read the key and the cache file once (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        self._secret = _load_key(self.key_path)
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable detection cache {self.path}: {exc}")
+            return
+        if data.get("version") != _CACHE_VERSION or data.get("key_id") != self._key_id():
+            # Older format or another key: rewrite the file on next save.
+            self._dirty = True
+            return
+        for key, entry in data.get("entries", []):
+            try:
+                self._entries[key] = {
+                    family: [
+                        (s, e, PIIType(t), float(c), _FAMILY_CLASSES[family])
+                        for s, e, t, c in spans
+                    ]
+                    for family, spans in entry.items()
+                }
+            except (KeyError, ValueError, TypeError):
+                continue
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the cache to disk (atomic write via tmp + rename) if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = [
+                [key, {
+                    family: [
+                        [s, e, t.value if hasattr(t, "value") else str(t), c]
+                        for s, e, t, c, _cls in spans
+                    ]
+                    for family, spans in entry.items()
+                }]
+                for key, entry in self._entries.items()
+            ]
+            key_id = self._key_id()
+            self._dirty = False
+        payload = {"version": _CACHE_VERSION, "key_id": key_id, "entries": entries}
+        try:
+            _write_private(self.path, json.dumps(payload).encode("utf-8"))
+        except Exception as exc:
+            logger.warning(f"Failed to save detection cache: {exc}")
+
+
+# Singleton — shared by every detection run in the process
+paragraph_cache = ParagraphCache()
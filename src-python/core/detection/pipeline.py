@@ -16,20 +16,28 @@ from __future__ import annotations
 
 import bisect
 import logging
+import threading
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
-from core.config import config
+from core.config import DetectionSettings
 from core.detection.regex_detector import RegexMatch, detect_regex
 from core.detection.ner_detector import (
     NERMatch,
     NER_LANGUAGE_REGISTRY,
     detect_ner,
+    get_active_model_names,
     is_ner_available,
     detect_names_heuristic,
     _is_english_text,
 )
-from core.detection.gliner_detector import GLiNERMatch, detect_gliner, is_gliner_available
+from core.detection.gliner_detector import (
+    GLiNERMatch,
+    detect_gliner,
+    get_model_name as get_gliner_model_name,
+    is_gliner_available,
+)
 from core.detection.bert_detector import (
     NERMatch as BERTNERMatch,
     detect_bert_ner,
@@ -37,6 +45,13 @@ from core.detection.bert_detector import (
 )
 from core.detection.language import resolve_auto_model, detect_language, SUPPORTED_LANGUAGES
 from core.detection.llm_detector import LLMMatch, detect_llm
+from core.detection.detection_config import LAYER_EXECUTOR_WORKERS
+from core.detection.cascade import CascadeStats, score_page_uncertainty
+from core.detection.prefilter import score_pii_likelihood
+from core.detection.fingerprint import FingerprintCache, mask_lines
+from core.detection.paragraph_cache import paragraph_cache, settings_fingerprint
+from core.detection.gazetteer import DocumentGazetteer
+from core.detection.page_index import page_text_index
 from models.schemas import (
     BBox,
     DetectionSource,
@@ -48,10 +63,7 @@ from models.schemas import (
 
 # Sub-module imports for local use
 from core.detection.cross_line import _detect_cross_line_orgs
-from core.detection.layout import (
-    build_detection_text as _build_detection_text,
-    translate_match as _translate_match,
-)
+from core.detection.layout import page_layout
 from core.detection.merge import (                # noqa: F401
     _merge_detections,
     _split_bboxes_by_proximity,
@@ -60,6 +72,10 @@ from core.detection.propagation import propagate_regions_across_pages
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for concurrent layer execution (see ``_run_layers``).
+_LAYER_EXECUTOR: ThreadPoolExecutor | None = None
+_LAYER_EXECUTOR_LOCK = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Sorted-interval overlap index (replaces O(n²) linear scans)
@@ -130,6 +146,7 @@ from core.detection.noise_filters import (       # noqa: F401
     _STRUCTURED_MIN_DIGITS,
     LEGAL_SUFFIX_RE,
     has_legal_suffix,
+    noise_verdict_cache,
 )
 from core.detection.region_shapes import (       # noqa: F401
     _MAX_WORDS_DEFAULT,
@@ -145,12 +162,88 @@ from core.detection.region_shapes import (       # noqa: F401
 # ---------------------------------------------------------------------------
 
 
+def _get_layer_executor() -> ThreadPoolExecutor:
+    """Return the shared executor used for concurrent layer execution.
+
+    Created lazily so that processes which never enable
+    ``parallel_layers`` don't pay for idle threads.  The pool is kept
+    separate from the per-document page pools in the API layer so that a
+    page worker waiting on its layers can never deadlock the pool it runs on.
+    """
+    global _LAYER_EXECUTOR
+    if _LAYER_EXECUTOR is None:
+        with _LAYER_EXECUTOR_LOCK:
+            if _LAYER_EXECUTOR is None:
+                _LAYER_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=LAYER_EXECUTOR_WORKERS,
+                    thread_name_prefix="pii-layer",
+                )
+    return _LAYER_EXECUTOR
+
+
+def _run_layers(
+    jobs: list[tuple[str, Callable[[], Any]]],
+    parallel: bool,
+) -> dict[str, Any]:
+    """Run independent detection layers and return ``{name: result}``.
+
+    When *parallel* is False the jobs run one after another in the calling
+    thread (the historical behaviour).  Otherwise the first job — regex,
+    which is pure Python and gains nothing from a worker thread — runs
+    inline while the remaining model-backed layers (torch, llama-cpp,
+    HTTP) are submitted to the shared layer executor, where they release
+    the GIL for most of their runtime.  Exceptions propagate exactly as in
+    the sequential path.
+    """
+    if not parallel or len(jobs) < 2:
+        return {name: fn() for name, fn in jobs}
+
+    executor = _get_layer_executor()
+    futures = [(name, executor.submit(fn)) for name, fn in jobs[1:]]
+    first_name, first_fn = jobs[0]
+    results: dict[str, Any] = {first_name: first_fn()}
+    for name, fut in futures:
+        results[name] = fut.result()
+    return results
+
+
+def _ner_model_ids(text: str, settings: DetectionSettings) -> list[str]:
+    """Ids of the models whose output the paragraph cache stores for *text*.
+
+    Mirrors the model choice of the NER / BERT / GLiNER layers; probing
+    the spaCy models loads them, as the NER layer would anyway.
+    """
+    ids: list[str] = []
+    if settings.ner_backend != "spacy" and is_bert_ner_available():
+        if settings.ner_backend == "auto":
+            ids.append("bert:" + resolve_auto_model(text)[0])
+        else:
+            ids.append("bert:" + settings.ner_backend)
+    if is_ner_available():
+        spacy_models = get_active_model_names()
+        ids.append("spacy:" + spacy_models["en"])
+        if not _is_english_text(text):
+            for entry in NER_LANGUAGE_REGISTRY:
+                if entry.is_text(text) and entry.is_available():
+                    ids.append("spacy:" + spacy_models.get(entry.lang_code, ""))
+    if is_gliner_available():
+        ids.append("gliner:" + get_gliner_model_name())
+    return ids
+
+
 def detect_pii_on_page(
     page_data: PageData,
     llm_engine: Optional[object] = None,
     *,
     predetected_language: str | None = None,
     progress_callback: Optional[object] = None,
+    parallel_layers: bool | None = None,
+    cascade: bool | None = None,
+    settings: DetectionSettings | None = None,
+    fingerprints: FingerprintCache | None = None,
+    gazetteer: DocumentGazetteer | None = None,
+    page_index: int | None = None,
+    cascade_stats: CascadeStats | None = None,
 ) -> list[PIIRegion]:
     """Run the full hybrid PII detection pipeline on a single page.
 
@@ -161,6 +254,39 @@ def detect_pii_on_page(
             and use this language code instead (performance optimisation).
         progress_callback: Optional callable(step: str) invoked at the
             start of each pipeline step ("regex", "ner", "gliner", "llm", "merge").
+        parallel_layers: Run the independent detection layers concurrently
+            and join them before merge.  ``None`` uses
+            ``settings.parallel_layers``.
+        cascade: Run BERT / GLiNER / LLM only when the regex + spaCy
+            results leave the page uncertain (see
+            :mod:`core.detection.cascade`).  ``None`` uses
+            ``settings.cascade_enabled``.  The page's uncertainty score and
+            skip ratio are reported as ``cascade_score_pct`` /
+            ``cascade_skip_pct`` in the timings log.  When
+            ``settings.prefilter_enabled`` is set, pages scoring below
+            ``prefilter_threshold`` (see :mod:`core.detection.prefilter`)
+            run regex only.
+        settings: Detection settings for this run.  ``None`` snapshots the
+            global config when the page starts; pass an explicit snapshot
+            to run with per-request overrides without mutating ``config``.
+        fingerprints: Results of earlier pages in the same run (see
+            :mod:`core.detection.fingerprint`).  A page identical to an
+            earlier one reuses its layer results; lines seen before are
+            masked out of the model layers and their earlier matches
+            reused.  The reused share is logged as ``fingerprint_reuse_pct``.
+            With ``settings.paragraph_cache_enabled`` long paragraphs are
+            also looked up in the persistent cross-document
+            :mod:`core.detection.paragraph_cache` (``paragraph_cache_pct``).
+        gazetteer: Names found on earlier pages of the same document (see
+            :mod:`core.detection.gazetteer`).  Lines whose name candidates
+            are all known skip the model layers (``gazetteer_skip_pct``);
+            this page's confident model matches are added to it.
+        page_index: Index of this page in the document.  *fingerprints*
+            and *gazetteer* only serve it results from pages of earlier
+            waves (``DETECTION_WAVE_PAGES``), so the output does not depend
+            on which pages finished first.  ``None`` uses everything known.
+        cascade_stats: Document-level tally of cascade decisions; the
+            page is recorded in it whenever the cascade scores it.
 
     Returns:
         List of PIIRegion instances ready for UI display.
@@ -171,6 +297,8 @@ def detect_pii_on_page(
                 progress_callback(step)
             except Exception:
                 pass
+    if settings is None:
+        settings = DetectionSettings.from_config()
     text = page_data.full_text
     stripped = text.strip()
     if not stripped:
@@ -184,53 +312,109 @@ def detect_pii_on_page(
         )
         return []
 
+    if parallel_layers is None:
+        parallel_layers = settings.parallel_layers
+
     # Build detection text: joins adjacent lines within each column with a
     # space instead of \n so NER / GLiNER recognises entity names that span
     # two visual lines.  The dt_to_ft map translates matches back to
-    # full_text coordinates for all downstream code.
-    _block_offsets_early = _compute_block_offsets(page_data.text_blocks, text)
-    _om = _build_detection_text(page_data, _block_offsets_early)
+    # full_text coordinates for all downstream code.  Both are reused from
+    # an earlier detection of this page while its geometry is unchanged.
+    _block_offsets_early = page_text_index(page_data).block_offsets
+    _om = page_layout(page_data, _block_offsets_early).offset_map
     det_text = _om.detection_text
     _dt_to_ft = _om.dt_to_ft
 
     def _xlate(matches):
         """Translate detection_text match positions → full_text coordinates."""
-        out = []
-        for m in matches:
-            tm = _translate_match(m, _dt_to_ft, text)
-            if tm is not None:
-                out.append(tm)
-        return out
+        return _om.translate_matches(matches, text)
 
     page_t0 = time.perf_counter()
     timings: dict[str, float] = {}
 
     # ── Resolve detection language once for this page ──
-    if config.detection_language and config.detection_language != "auto":
-        page_lang: str | None = config.detection_language
+    if settings.detection_language and settings.detection_language != "auto":
+        page_lang: str | None = settings.detection_language
     elif predetected_language is not None:
         page_lang = predetected_language
     else:
         page_lang = detect_language(text)
 
+    # ── Repeated content: reuse results from earlier pages of this run ──
+    # The model layers read ``model_text``, which has previously seen lines
+    # blanked out; their earlier matches are added back per layer family
+    # ("ner" covers both spaCy and BERT).
+    model_text = det_text
+    cached_page: dict[str, list] | None = None
+    reused_lines: list = []
+    reused_matches: dict[str, list] = {}
+    if fingerprints is not None:
+        cached_page = fingerprints.lookup_page(text, page_index)
+        if cached_page is not None:
+            timings["fingerprint_reuse_pct"] = 100.0
+        else:
+            reused_lines, reused_matches = fingerprints.lookup_lines(text, page_index)
+            if reused_lines:
+                model_text = mask_lines(det_text, _dt_to_ft, reused_lines)
+                reused_chars = sum(len(line.positions) for line in reused_lines)
+                timings["fingerprint_reuse_pct"] = min(100.0, reused_chars * 100 / len(stripped))
+
+    # ── Template paragraphs seen in earlier documents ──
+    # NER / BERT / GLiNER read ``ner_text``, which additionally has cached
+    # paragraphs blanked out; the LLM still reads ``model_text``.
+    ner_text = model_text
+    paragraph_fp: str | None = None
+    hit_paragraphs: list = []
+    if settings.paragraph_cache_enabled and settings.ner_enabled and cached_page is None:
+        paragraph_fp = settings_fingerprint(settings, page_lang, _ner_model_ids(text, settings))
+        hit_paragraphs, paragraph_matches = paragraph_cache.lookup(
+            text, paragraph_fp, skip=[line.start for line in reused_lines],
+        )
+        if hit_paragraphs:
+            ner_text = mask_lines(model_text, _dt_to_ft, hit_paragraphs)
+            for family, matches in paragraph_matches.items():
+                reused_matches.setdefault(family, []).extend(matches)
+            hit_chars = sum(len(p.positions) for p in hit_paragraphs)
+            timings["paragraph_cache_pct"] = min(100.0, hit_chars * 100 / len(stripped))
+
+    # ── Names already confirmed on earlier pages of this document ──
+    gazetteer_lines: list = []
+    if gazetteer is not None and cached_page is None:
+        gazetteer_lines, gazetteer_hits = gazetteer.covered_lines(
+            text, gazetteer.find(text, page_index),
+            skip=[line.start for line in reused_lines + hit_paragraphs],
+        )
+        if gazetteer_lines:
+            model_text = mask_lines(model_text, _dt_to_ft, gazetteer_lines)
+            ner_text = mask_lines(ner_text, _dt_to_ft, gazetteer_lines)
+            reused_matches.setdefault("ner", []).extend(gazetteer_hits)
+            skipped_chars = sum(len(line.positions) for line in gazetteer_lines)
+            timings["gazetteer_skip_pct"] = min(100.0, skipped_chars * 100 / len(stripped))
+    model_text_blank = not model_text.strip()
+    ner_text_blank = not ner_text.strip()
+
+    # Each layer only reads det_text / the offset map and records its own
+    # timings, so the layers can run in any order (or concurrently).
+
     # Layer 1: Regex
-    regex_matches: list[RegexMatch] = []
-    if config.regex_enabled:
+    def _regex_layer() -> tuple[list[RegexMatch], dict[str, float]]:
+        layer_timings: dict[str, float] = {}
         _report("regex")
         t0 = time.perf_counter()
         effective_regex_types = None
-        if config.regex_types is not None:
-            effective_regex_types = list(set(config.regex_types))
-            if config.ner_types is not None:
+        if settings.regex_types is not None:
+            effective_regex_types = list(set(settings.regex_types))
+            if settings.ner_types is not None:
                 effective_regex_types = list(
-                    set(effective_regex_types) | set(config.ner_types)
+                    set(effective_regex_types) | set(settings.ner_types)
                 )
             else:
                 effective_regex_types = None
         regex_matches = detect_regex(det_text, allowed_types=effective_regex_types,
-                                      detection_language=page_lang)
+                                     detection_language=page_lang,
+                                     custom_patterns_enabled=settings.custom_patterns_enabled)
         regex_matches = _xlate(regex_matches)
-        timings["regex"] = (time.perf_counter() - t0) * 1000
+        layer_timings["regex"] = (time.perf_counter() - t0) * 1000
         logger.info(
             "Page %d: Regex found %d matches",
             page_data.page_number, len(regex_matches),
@@ -252,113 +436,298 @@ def detect_pii_on_page(
                     "Page %d: Cross-line ORG scan added %d match(es)",
                     page_data.page_number, added,
                 )
-        timings["cross_line_org"] = (time.perf_counter() - t0) * 1000
+        layer_timings["cross_line_org"] = (time.perf_counter() - t0) * 1000
+        return regex_matches, layer_timings
 
     # Layer 2: NER (spaCy / BERT / auto)
-    ner_matches: list[NERMatch] = []
-    if config.ner_enabled:
-        _report("ner")
-        t0 = time.perf_counter()
-
-        if config.ner_backend == "auto" and is_bert_ner_available():
+    def _ner_model(use_bert: bool) -> list[NERMatch]:
+        """The page's main NER model: spaCy, or BERT when *use_bert*."""
+        if not use_bert:
+            # Cascade first stage — BERT is deferred to escalation.
+            if is_ner_available():
+                ner_matches = _xlate(detect_ner(ner_text))
+                logger.info(
+                    "Page %d: spaCy NER found %d matches",
+                    page_data.page_number, len(ner_matches),
+                )
+                return ner_matches
+        elif settings.ner_backend == "auto" and is_bert_ner_available():
             auto_model, detected_lang = resolve_auto_model(text)
-            bert_results = detect_bert_ner(det_text, model_id=auto_model)
+            bert_results = detect_bert_ner(ner_text, model_id=auto_model)
             ner_matches = _xlate([NERMatch(*m) for m in bert_results])
             logger.info(
                 "Page %d: Auto NER — lang=%s, model=%s, found %d matches",
                 page_data.page_number, detected_lang, auto_model, len(ner_matches),
             )
-        elif config.ner_backend not in ("spacy", "auto") and is_bert_ner_available():
-            bert_results = detect_bert_ner(det_text)
+            return ner_matches
+        elif settings.ner_backend not in ("spacy", "auto") and is_bert_ner_available():
+            bert_results = detect_bert_ner(ner_text, ner_backend=settings.ner_backend)
             ner_matches = _xlate([NERMatch(*m) for m in bert_results])
             logger.info(
                 "Page %d: BERT NER (%s) found %d matches",
-                page_data.page_number, config.ner_backend, len(ner_matches),
+                page_data.page_number, settings.ner_backend, len(ner_matches),
             )
+            return ner_matches
         elif is_ner_available():
-            ner_matches = _xlate(detect_ner(det_text))
+            ner_matches = _xlate(detect_ner(ner_text))
             logger.info(
                 "Page %d: spaCy NER found %d matches",
                 page_data.page_number, len(ner_matches),
             )
-        timings["ner"] = (time.perf_counter() - t0) * 1000
+            return ner_matches
+        return []
 
-        # Heuristic name supplement
-        t0 = time.perf_counter()
-        heuristic_matches = _xlate(detect_names_heuristic(det_text))
-        if heuristic_matches:
-            ner_span_idx = SpanIndex([(m.start, m.end) for m in ner_matches])
-            for hm in heuristic_matches:
-                if not ner_span_idx.overlaps(hm.start, hm.end):
-                    ner_matches.append(hm)
-                    ner_span_idx.add(hm.start, hm.end)
-            logger.info(
-                "Page %d: Heuristic added %d name candidates",
-                page_data.page_number, len(heuristic_matches),
-            )
-        timings["heuristic"] = (time.perf_counter() - t0) * 1000
+    # Heuristic and multilingual matches do not depend on the main model,
+    # so an escalated BERT pass reuses the ones the first stage found.
+    ner_supplements: list[tuple[str, list[NERMatch]]] | None = None
 
-        # Multilingual NER (all non-English languages)
+    def _ner_supplement_matches(layer_timings: dict[str, float]) -> list[tuple[str, list[NERMatch]]]:
+        """``(label, matches)`` of the heuristic and every multilingual model."""
+        t0 = time.perf_counter()
+        found = [("Heuristic", _xlate(detect_names_heuristic(ner_text)))]
+        layer_timings["heuristic"] = (time.perf_counter() - t0) * 1000
         if not _is_english_text(text):
-            ml_span_idx = SpanIndex([(m.start, m.end) for m in ner_matches])
             for entry in NER_LANGUAGE_REGISTRY:
                 if entry.is_text(text) and entry.is_available():
                     t0 = time.perf_counter()
                     try:
-                        lang_matches = _xlate(entry.detect(det_text))
-                        if lang_matches:
-                            added = 0
-                            for lm in lang_matches:
-                                if not ml_span_idx.overlaps(lm.start, lm.end):
-                                    ner_matches.append(lm)
-                                    ml_span_idx.add(lm.start, lm.end)
-                                    added += 1
-                            logger.info(
-                                "Page %d: %s NER found %d matches, added %d non-overlapping",
-                                page_data.page_number, entry.lang_label, len(lang_matches), added,
-                            )
+                        found.append((entry.lang_label, _xlate(entry.detect(ner_text))))
                     except Exception as e:
                         logger.error("%s NER detection failed: %s", entry.lang_label, e)
-                    timings[f"{entry.lang_code}_ner"] = (time.perf_counter() - t0) * 1000
+                    layer_timings[f"{entry.lang_code}_ner"] = (time.perf_counter() - t0) * 1000
+        return found
+
+    def _with_supplements(
+        ner_matches: list[NERMatch], supplements: list[tuple[str, list[NERMatch]]],
+    ) -> list[NERMatch]:
+        """Add supplement matches that overlap nothing found before them."""
+        ner_matches = list(ner_matches)
+        span_idx = SpanIndex([(m.start, m.end) for m in ner_matches])
+        for label, matches in supplements:
+            added = 0
+            for m in matches:
+                if not span_idx.overlaps(m.start, m.end):
+                    ner_matches.append(m)
+                    span_idx.add(m.start, m.end)
+                    added += 1
+            if matches:
+                logger.info(
+                    "Page %d: %s found %d matches, added %d non-overlapping",
+                    page_data.page_number, label, len(matches), added,
+                )
+        return ner_matches
+
+    def _ner_layer(use_bert: bool = True) -> tuple[list[NERMatch], dict[str, float]]:
+        nonlocal ner_supplements
+        layer_timings: dict[str, float] = {}
+        _report("ner")
+        if ner_text_blank:
+            return list(reused_matches.get("ner", [])), layer_timings
+        t0 = time.perf_counter()
+        ner_matches = _ner_model(use_bert)
+        layer_timings["ner"] = (time.perf_counter() - t0) * 1000
+        ner_supplements = _ner_supplement_matches(layer_timings)
+        ner_matches = _with_supplements(ner_matches, ner_supplements)
+        ner_matches.extend(reused_matches.get("ner", []))
+        return ner_matches, layer_timings
+
+    # Cascade escalation: only the BERT model call, merged with the first
+    # stage's heuristic and multilingual matches under the same rule.
+    def _bert_layer() -> tuple[list[NERMatch], dict[str, float]]:
+        layer_timings: dict[str, float] = {}
+        _report("ner")
+        if ner_text_blank:
+            return list(reused_matches.get("ner", [])), layer_timings
+        t0 = time.perf_counter()
+        ner_matches = _ner_model(use_bert=True)
+        layer_timings["ner"] = (time.perf_counter() - t0) * 1000
+        supplements = ner_supplements
+        if supplements is None:
+            supplements = _ner_supplement_matches(layer_timings)
+        ner_matches = _with_supplements(ner_matches, supplements)
+        ner_matches.extend(reused_matches.get("ner", []))
+        return ner_matches, layer_timings
 
     # Layer 2b: GLiNER
-    gliner_matches: list[GLiNERMatch] = []
-    if config.ner_enabled and is_gliner_available():
+    def _gliner_layer() -> tuple[list[GLiNERMatch], dict[str, float]]:
+        gliner_matches: list[GLiNERMatch] = []
         _report("gliner")
+        if ner_text_blank:
+            return list(reused_matches.get("gliner", [])), {}
         t0 = time.perf_counter()
         try:
-            gliner_matches = _xlate(detect_gliner(det_text))
+            gliner_matches = _xlate(detect_gliner(ner_text))
             logger.info(
                 "Page %d: GLiNER found %d matches",
                 page_data.page_number, len(gliner_matches),
             )
         except Exception as e:
             logger.error("GLiNER detection failed: %s", e)
-        timings["gliner"] = (time.perf_counter() - t0) * 1000
+        gliner_matches.extend(reused_matches.get("gliner", []))
+        return gliner_matches, {"gliner": (time.perf_counter() - t0) * 1000}
 
     # Layer 3: LLM
-    llm_matches: list[LLMMatch] = []
-    if config.llm_detection_enabled and llm_engine is not None:
+    def _llm_layer() -> tuple[list[LLMMatch], dict[str, float]]:
         _report("llm")
+        if model_text_blank:
+            return list(reused_matches.get("llm", [])), {}
         t0 = time.perf_counter()
-        llm_matches = _xlate(detect_llm(det_text, llm_engine))
-        timings["llm"] = (time.perf_counter() - t0) * 1000
+        llm_matches = _xlate(detect_llm(model_text, llm_engine))
+        elapsed = (time.perf_counter() - t0) * 1000
         logger.info(
             "Page %d: LLM found %d matches",
             page_data.page_number, len(llm_matches),
         )
+        llm_matches.extend(reused_matches.get("llm", []))
+        return llm_matches, {"llm": elapsed}
+
+    # Cheap layers always run; the expensive ones (BERT, GLiNER, LLM) are
+    # either run alongside them or, in cascade mode, only when the cheap
+    # results leave the page uncertain.
+    ner_uses_bert = settings.ner_backend != "spacy" and is_bert_ner_available()
+    cheap_jobs: list[tuple[str, Callable[[], Any]]] = []
+    expensive_jobs: list[tuple[str, Callable[[], Any]]] = []
+    if settings.regex_enabled:
+        cheap_jobs.append(("regex", _regex_layer))
+    if settings.ner_enabled:
+        cheap_jobs.append(("ner", lambda: _ner_layer(use_bert=False)))
+        if ner_uses_bert:
+            expensive_jobs.append(("bert", _bert_layer))
+    if settings.ner_enabled and is_gliner_available():
+        expensive_jobs.append(("gliner", _gliner_layer))
+    if settings.llm_detection_enabled and llm_engine is not None:
+        expensive_jobs.append(("llm", _llm_layer))
+
+    if cascade is None:
+        cascade = settings.cascade_enabled
+
+    t0 = time.perf_counter()
+    layer_jobs: list[tuple[str, Callable[[], Any]]] = []
+    layer_results: dict[str, Any] = {}
+    layers_skipped = False
+
+    # A page identical to an earlier one reuses every layer's results.
+    if cached_page is not None:
+        cheap_jobs, expensive_jobs = [], []
+        layer_results = {name: (matches, {}) for name, matches in cached_page.items()}
+        logger.info(
+            "Page %d: identical to an earlier page — reused its detection results",
+            page_data.page_number,
+        )
+
+    # Prefilter: regex runs first on its own, then pages that look
+    # PII-free (blank, separators, boilerplate) skip every model layer.
+    if settings.prefilter_enabled and cached_page is None:
+        regex_jobs = [job for job in cheap_jobs if job[0] == "regex"]
+        cheap_jobs = [job for job in cheap_jobs if job[0] != "regex"]
+        layer_jobs += regex_jobs
+        layer_results.update(_run_layers(regex_jobs, parallel=False))
+        regex_hits = len(layer_results["regex"][0]) if regex_jobs else 0
+        likelihood = score_pii_likelihood(text, regex_hits)
+        timings["prefilter_score_pct"] = likelihood.score * 100
+        if likelihood.score < settings.prefilter_threshold:
+            skipped = [name for name, _fn in cheap_jobs + expensive_jobs]
+            cheap_jobs, expensive_jobs = [], []
+            layers_skipped = bool(skipped)
+            if skipped:
+                logger.info(
+                    "Page %d: prefilter score %.2f below threshold — skipped %s",
+                    page_data.page_number, likelihood.score, ", ".join(skipped),
+                )
+
+    if cascade and expensive_jobs:
+        layer_jobs += cheap_jobs
+        layer_results.update(_run_layers(cheap_jobs, parallel_layers))
+        cheap_matches = [
+            m for name in ("regex", "ner") if name in layer_results
+            for m in layer_results[name][0]
+        ]
+        uncertainty = score_page_uncertainty(text, cheap_matches)
+        timings["cascade_score_pct"] = uncertainty.score * 100
+        if uncertainty.score >= settings.cascade_threshold:
+            layer_jobs += expensive_jobs
+            layer_results.update(_run_layers(expensive_jobs, parallel_layers))
+            timings["cascade_skip_pct"] = 0.0
+            if cascade_stats is not None:
+                cascade_stats.record(skipped=False)
+        else:
+            timings["cascade_skip_pct"] = 100.0
+            if cascade_stats is not None:
+                cascade_stats.record(skipped=True)
+            layers_skipped = True
+            logger.info(
+                "Page %d: cascade settled by cheap layers (score=%.2f) — skipped %s",
+                page_data.page_number, uncertainty.score,
+                ", ".join(name for name, _fn in expensive_jobs),
+            )
+    else:
+        # Without the cascade the NER layer uses BERT directly when available.
+        jobs = [
+            (name, _ner_layer if name == "ner" else fn) for name, fn in cheap_jobs
+        ] + [job for job in expensive_jobs if job[0] != "bert"]
+        layer_jobs += jobs
+        layer_results.update(_run_layers(jobs, parallel_layers))
+    # Merge per-layer timings in pipeline order so log lines stay stable
+    # regardless of which layer finished first.
+    for name, _fn in layer_jobs:
+        layer_timings = layer_results[name][1]
+        if name == "bert":
+            layer_timings = {f"cascade_{k}": v for k, v in layer_timings.items()}
+        timings.update(layer_timings)
+    if parallel_layers and len(layer_jobs) > 1:
+        timings["layers_wall"] = (time.perf_counter() - t0) * 1000
+
+    if fingerprints is not None and cached_page is None:
+        fingerprints.store_page(
+            text, {name: res[0] for name, res in layer_results.items()}, page=page_index or 0,
+        )
+    # Line results are only reusable when every model layer saw the line;
+    # a prefilter or cascade skip is a whole-page verdict.
+    if fingerprints is not None and cached_page is None and not layers_skipped:
+        family_layers = {
+            "ner": "bert" if "bert" in layer_results else "ner",
+            "gliner": "gliner",
+            "llm": "llm",
+        }
+        fingerprints.store_lines(text, {
+            family: layer_results[name][0]
+            for family, name in family_layers.items() if name in layer_results
+        }, skip=[line.start for line in gazetteer_lines], page=page_index or 0)
+    if paragraph_fp is not None and not layers_skipped:
+        ner_layer = "bert" if "bert" in layer_results else "ner"
+        paragraph_cache.store(text, paragraph_fp, {
+            family: layer_results[name][0]
+            for family, name in (("ner", ner_layer), ("gliner", "gliner"))
+            if name in layer_results
+        }, skip=[line.start for line in gazetteer_lines])
+    if gazetteer is not None and cached_page is None:
+        gazetteer.add(
+            (
+                m for name in ("ner", "bert", "gliner", "llm") if name in layer_results
+                for m in layer_results[name][0]
+            ),
+            page=page_index or 0,
+        )
+
+    regex_matches: list[RegexMatch] = layer_results.get("regex", ([], {}))[0]
+    # An escalated BERT pass supersedes the first-stage spaCy results.
+    ner_matches: list[NERMatch] = layer_results.get(
+        "bert", layer_results.get("ner", ([], {})),
+    )[0]
+    gliner_matches: list[GLiNERMatch] = layer_results.get("gliner", ([], {}))[0]
+    llm_matches: list[LLMMatch] = layer_results.get("llm", ([], {}))[0]
 
     # ── Per-type filtering for NER / GLiNER ──
-    if config.ner_types:
-        _allowed_ner = set(config.ner_types)
+    if settings.ner_types:
+        _allowed_ner = set(settings.ner_types)
         ner_matches = [m for m in ner_matches if (m.pii_type.value if hasattr(m.pii_type, 'value') else str(m.pii_type)) in _allowed_ner]
         gliner_matches = [m for m in gliner_matches if (m.pii_type.value if hasattr(m.pii_type, 'value') else str(m.pii_type)) in _allowed_ner]
 
     # ── Cross-layer type filtering ──
-    if config.regex_types is not None:
+    if settings.regex_types is not None:
         _regex_tab_types = {"EMAIL", "PHONE", "SSN", "CREDIT_CARD", "IBAN", "DATE",
                             "IP_ADDRESS", "PASSPORT", "DRIVER_LICENSE", "ADDRESS"}
-        _excluded_regex = _regex_tab_types - set(config.regex_types)
+        _excluded_regex = _regex_tab_types - set(settings.regex_types)
         if _excluded_regex:
             def _not_excluded(m):
                 t = m.pii_type.value if hasattr(m.pii_type, 'value') else str(m.pii_type)
@@ -370,14 +739,24 @@ def detect_pii_on_page(
     # Merge all layers
     _report("merge")
     t0 = time.perf_counter()
+    noise_hits0, noise_misses0 = noise_verdict_cache.stats()
     regions = _merge_detections(
         regex_matches, ner_matches, llm_matches, page_data,
         gliner_matches=gliner_matches,
+        settings=settings,
     )
     timings["merge"] = (time.perf_counter() - t0) * 1000
+    # Approximate when pages run concurrently: the cache is shared.
+    noise_hits, noise_misses = noise_verdict_cache.stats()
+    noise_lookups = (noise_hits - noise_hits0) + (noise_misses - noise_misses0)
+    if noise_lookups > 0:
+        timings["noise_cache_hit_pct"] = (noise_hits - noise_hits0) * 100 / noise_lookups
 
     page_total = (time.perf_counter() - page_t0) * 1000
-    timing_parts = " | ".join(f"{k}={v:.0f}ms" for k, v in timings.items())
+    timing_parts = " | ".join(
+        f"{k}={v:.0f}%" if k.endswith("_pct") else f"{k}={v:.0f}ms"
+        for k, v in timings.items()
+    )
     logger.info(
         "Page %d: %d merged PII regions (%d chars) — %s — total=%dms",
         page_data.page_number, len(regions), len(stripped),
@@ -391,13 +770,21 @@ def reanalyze_bbox(
     page_data: PageData,
     bbox: BBox,
     llm_engine: Optional[object] = None,
+    *,
+    parallel_layers: bool | None = None,
+    settings: DetectionSettings | None = None,
 ) -> dict:
     """Analyze the text content under a bounding box and return the best
     PII classification.
 
+    ``parallel_layers`` and ``settings`` have the same meaning as in
+    :func:`detect_pii_on_page`.
+
     Returns:
         Dict with keys: text, pii_type, confidence, source.
     """
+    if settings is None:
+        settings = DetectionSettings.from_config()
     overlapping_text_parts: list[str] = []
     for block in page_data.text_blocks:
         bb = block.bbox
@@ -408,17 +795,19 @@ def reanalyze_bbox(
     if not text:
         return {"text": "", "pii_type": "CUSTOM", "confidence": 0.0, "source": "MANUAL"}
 
-    _lang = config.detection_language if config.detection_language != "auto" else detect_language(text)
-    regex_matches = detect_regex(text, detection_language=_lang) if config.regex_enabled else []
+    def _regex_layer() -> list[RegexMatch]:
+        _lang = settings.detection_language if settings.detection_language != "auto" else detect_language(text)
+        return detect_regex(text, detection_language=_lang,
+                            custom_patterns_enabled=settings.custom_patterns_enabled)
 
-    ner_matches: list[NERMatch] = []
-    if config.ner_enabled:
-        if config.ner_backend == "auto" and is_bert_ner_available():
+    def _ner_layer() -> list[NERMatch]:
+        ner_matches: list[NERMatch] = []
+        if settings.ner_backend == "auto" and is_bert_ner_available():
             auto_model, _ = resolve_auto_model(text)
             bert_results = detect_bert_ner(text, model_id=auto_model)
             ner_matches = [NERMatch(*m) for m in bert_results]
-        elif config.ner_backend not in ("spacy", "auto") and is_bert_ner_available():
-            bert_results = detect_bert_ner(text)
+        elif settings.ner_backend not in ("spacy", "auto") and is_bert_ner_available():
+            bert_results = detect_bert_ner(text, ner_backend=settings.ner_backend)
             ner_matches = [NERMatch(*m) for m in bert_results]
         elif is_ner_available():
             ner_matches = detect_ner(text)
@@ -443,17 +832,34 @@ def reanalyze_bbox(
                                 ml_span_idx.add(lm.start, lm.end)
                     except Exception:
                         pass
+        return ner_matches
 
-    llm_matches: list[LLMMatch] = []
-    if config.llm_detection_enabled and llm_engine is not None:
-        llm_matches = detect_llm(text, llm_engine)
+    def _llm_layer() -> list[LLMMatch]:
+        return detect_llm(text, llm_engine)
 
-    gliner_matches: list[GLiNERMatch] = []
-    if config.ner_enabled and is_gliner_available():
+    def _gliner_layer() -> list[GLiNERMatch]:
         try:
-            gliner_matches = detect_gliner(text)
+            return detect_gliner(text)
         except Exception:
-            pass
+            return []
+
+    layer_jobs: list[tuple[str, Callable[[], Any]]] = []
+    if settings.regex_enabled:
+        layer_jobs.append(("regex", _regex_layer))
+    if settings.ner_enabled:
+        layer_jobs.append(("ner", _ner_layer))
+    if settings.llm_detection_enabled and llm_engine is not None:
+        layer_jobs.append(("llm", _llm_layer))
+    if settings.ner_enabled and is_gliner_available():
+        layer_jobs.append(("gliner", _gliner_layer))
+
+    if parallel_layers is None:
+        parallel_layers = settings.parallel_layers
+    layer_results = _run_layers(layer_jobs, parallel_layers)
+    regex_matches: list[RegexMatch] = layer_results.get("regex", [])
+    ner_matches: list[NERMatch] = layer_results.get("ner", [])
+    llm_matches: list[LLMMatch] = layer_results.get("llm", [])
+    gliner_matches: list[GLiNERMatch] = layer_results.get("gliner", [])
 
     best_type = "CUSTOM"
     best_confidence = 0.0
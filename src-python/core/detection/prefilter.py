@@ -0,0 +1,117 @@
+"""Cheap PII-likelihood prefilter for whole pages.
+
+Blank pages, separator pages, tables of figures and pure boilerplate
+carry no personal data but would otherwise get the full NER / BERT /
+GLiNER / LLM treatment.  ``score_pii_likelihood`` looks only at
+character-class statistics, capitalised tokens, digit runs and the number
+of regex hits, and ``detect_pii_on_page`` skips the model layers for
+pages scoring below ``config.prefilter_threshold``.  Regex always runs.
+
+The score is deliberately recall-biased: a single capitalised token in
+the middle of a sentence (a potential name) or a single regex hit is
+enough to keep the page.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+from core.detection import detection_config as det_cfg
+
+# Word tokens starting with a letter (no leading digit / underscore).
+_TOKEN_RE = re.compile(r"[^\W\d_][\w'’\-]*")
+
+# Runs of digits, allowing the separators IDs are usually printed with.
+_DIGIT_RUN_RE = re.compile(r"\d[\d .\-/]*\d")
+
+# Characters after which a capitalised word is sentence/line-initial and
+# therefore says nothing about being a proper noun.
+_SENTENCE_BREAKS = frozenset(".!?:;•·*–—-()[]\"“”«»\n\r")
+
+# Capitalised words that routinely appear mid-sentence in boilerplate and
+# document furniture without being names.
+_BOILERPLATE_CAPS: frozenset[str] = frozenset({
+    "agreement", "party", "parties", "section", "article", "schedule",
+    "exhibit", "appendix", "annex", "figure", "table", "page", "chapter",
+    "clause", "contract", "company", "effective", "date", "terms",
+    "conditions", "services", "product", "products", "i", "we", "you",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday",
+    "sunday", "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+})
+
+
+class PageLikelihood(NamedTuple):
+    """Prefilter statistics for one page.  ``score`` is in ``[0, 1]``."""
+    score: float
+    alpha_ratio: float
+    cap_tokens: int
+    digit_density: float
+    id_like_numbers: int
+    regex_hits: int
+
+
+def _is_sentence_initial(text: str, start: int) -> bool:
+    """True when the token at *start* begins a sentence, line or bullet."""
+    i = start - 1
+    while i >= 0 and text[i] in " \t":
+        i -= 1
+    return i < 0 or text[i] in _SENTENCE_BREAKS
+
+
+def score_pii_likelihood(text: str, regex_hits: int = 0) -> PageLikelihood:
+    """Score how likely *text* is to contain PII the model layers could find.
+
+    Args:
+        text: Page text.
+        regex_hits: Number of regex matches already found on the page.
+    """
+    non_space = 0
+    alpha = 0
+    digits = 0
+    for ch in text:
+        if ch.isspace():
+            continue
+        non_space += 1
+        if ch.isalpha():
+            alpha += 1
+        elif ch.isdigit():
+            digits += 1
+    if non_space == 0:
+        return PageLikelihood(0.0, 0.0, 0, 0.0, 0, regex_hits)
+    alpha_ratio = alpha / non_space
+    digit_density = digits / non_space
+
+    cap_tokens = 0
+    for m in _TOKEN_RE.finditer(text):
+        tok = m.group()
+        if len(tok) < 2 or not tok[0].isupper():
+            continue
+        if tok.lower() in _BOILERPLATE_CAPS:
+            continue
+        if _is_sentence_initial(text, m.start()):
+            continue
+        cap_tokens += 1
+
+    id_like = 0
+    for m in _DIGIT_RUN_RE.finditer(text):
+        if sum(c.isdigit() for c in m.group()) >= det_cfg.PREFILTER_MIN_ID_DIGITS:
+            id_like += 1
+
+    regex_score = 1.0 if regex_hits else 0.0
+    caps_score = min(1.0, cap_tokens / det_cfg.PREFILTER_CAPS_SATURATION)
+    # Pages that are mostly digits / punctuation (separators, tables of
+    # figures, page furniture) rarely hold prose entities — dampen the
+    # capitalisation signal there instead of dropping it.
+    prose_factor = min(1.0, alpha_ratio / det_cfg.PREFILTER_PROSE_ALPHA_RATIO)
+    digit_score = min(1.0, float(id_like))
+
+    return PageLikelihood(
+        score=max(regex_score, caps_score * prose_factor, digit_score),
+        alpha_ratio=alpha_ratio,
+        cap_tokens=cap_tokens,
+        digit_density=digit_density,
+        id_like_numbers=id_like,
+        regex_hits=regex_hits,
+    )
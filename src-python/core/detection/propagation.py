@@ -7,6 +7,8 @@ Performance optimisations (X1/X2):
 - Block offsets are computed once per page and cached.
 - The ``covered`` overlap check uses a per-page sorted interval list
   with binary search instead of a global linear scan.
+- (X3) Each page is normalised once and searched for every PII text in a
+  single Aho–Corasick pass instead of one regex scan per text.
 """
 
 from __future__ import annotations
@@ -18,14 +20,11 @@ import unicodedata
 import uuid
 from collections import defaultdict
 
+from core.detection.aho_corasick import AhoCorasick
 from core.detection.bbox_utils import _resolve_bbox_overlaps
 from core.detection import detection_config as det_cfg
-from core.detection.block_offsets import (
-    _clamp_bbox,
-    _compute_block_offsets,
-    _char_offset_to_bbox,
-    _char_offsets_to_line_bboxes,
-)
+from core.detection.block_offsets import _clamp_bbox
+from core.detection.fingerprint import normalize_with_positions
 from core.detection.noise_filters import (
     _is_loc_pipeline_noise,
     _is_org_pipeline_noise,
@@ -34,6 +33,8 @@ from core.detection.noise_filters import (
     has_legal_suffix,
     _STRUCTURED_MIN_DIGITS,
 )
+from core.detection.page_index import page_text_index
+from core.detection.region_index import RegionIndex
 from core.text_utils import strip_accents as _strip_accents, ws_collapse as _ws_collapse
 from models.schemas import (
     PIIRegion,
@@ -162,6 +163,97 @@ class _PageIntervals:
         self._ends.insert(idx, ce)
 
 
+# ---------------------------------------------------------------------------
+# Multi-key page search — every propagation key in one pass per page
+# ---------------------------------------------------------------------------
+
+def _is_word_char(ch: str) -> bool:
+    """Same test as the regex ``\\w`` class on ``str`` patterns."""
+    return ch.isalnum() or ch == "_"
+
+
+def _normalise_page(full_text: str) -> tuple[str, list[int]]:
+    """Normalise page text the way propagation keys are normalised.
+
+    Accents are stripped and quotes neutralised (both length-preserving),
+    the text is lowercased and whitespace runs fold to one space.  Returns
+    the normalised text and, for each of its characters, the index in
+    *full_text*.
+    """
+    norm = _neutralise_quotes(_strip_accents(full_text))
+    low = norm.lower()
+    if len(low) != len(norm):
+        # A few characters lowercase to two; keep those as they are.
+        low = "".join(c.lower() if len(c.lower()) == 1 else c for c in norm)
+    return normalize_with_positions(low)
+
+
+class _KeyMatcher:
+    """Find whole-word occurrences of many normalised keys in page text.
+
+    Gives the same spans as scanning each page with
+    ``_build_flex_pattern(key).finditer`` for every key: case-insensitive,
+    any whitespace run between words, no word character on either side,
+    and non-overlapping occurrences per key.  The page is normalised once
+    and all keys are found in a single Aho–Corasick pass.
+    """
+
+    __slots__ = ("_automaton",)
+
+    def __init__(self, keys: list[str]) -> None:
+        self._automaton = AhoCorasick(keys)
+
+    def find(
+        self,
+        full_text: str,
+        normalised: tuple[str, list[int]] | None = None,
+    ) -> list[tuple[int, int, int]]:
+        """``(key_index, char_start, char_end)`` in *full_text* offsets,
+        sorted by key then start.  *normalised* is
+        ``_normalise_page(full_text)`` when the caller already has it."""
+        folded, positions = normalised if normalised is not None else _normalise_page(full_text)
+        n = len(folded)
+        automaton = self._automaton
+        out: list[tuple[int, int, int]] = []
+        last_key, last_end = -1, 0
+        for start, ki in automaton.find_all(folded):
+            if ki != last_key:
+                last_key, last_end = ki, 0
+            if start < last_end:
+                continue
+            end = start + automaton.pattern_length(ki)
+            if start > 0 and _is_word_char(folded[start - 1]):
+                continue
+            if end < n and _is_word_char(folded[end]):
+                continue
+            last_end = end
+            out.append((ki, positions[start], positions[end - 1] + 1))
+        return out
+
+
+def _drop_contained_regions(regions: list[PIIRegion]) -> tuple[list[PIIRegion], int]:
+    """Drop regions whose char span lies inside a same-type region on the
+    same page with equal-or-higher confidence.
+
+    Regions are visited longest span first; each is checked against the
+    ones already kept in its (page, type) ``RegionIndex``.  Returns the
+    surviving regions in their original order and the number dropped.
+    """
+    kept: dict[tuple[int, PIIType], RegionIndex] = defaultdict(RegionIndex)
+    dropped_ids: set[str] = set()
+    for r in sorted(regions, key=lambda r: -(r.char_end - r.char_start)):
+        if r.id in dropped_ids:
+            continue
+        index = kept[(r.page_number, r.pii_type)]
+        if any(o.confidence >= r.confidence for o in index.containing(r.char_start, r.char_end)):
+            dropped_ids.add(r.id)
+        else:
+            index.add(r.char_start, r.char_end, r)
+    if not dropped_ids:
+        return regions, 0
+    return [r for r in regions if r.id not in dropped_ids], len(dropped_ids)
+
+
 def propagate_regions_across_pages(
     regions: list[PIIRegion],
     pages: list[PageData],
@@ -222,71 +314,56 @@ def propagate_regions_across_pages(
     for r in regions:
         page_intervals[(r.pii_type, r.page_number)].add(r.char_start, r.char_end)
 
-    # X1: Cache block offsets per page (computed once, reused for all texts)
-    block_offsets_cache: dict[int, list] = {}
-    # Cache accent-stripped full_text per page for accent-agnostic search
-    norm_full_cache: dict[int, str] = {}
-
-    propagated: list[PIIRegion] = []
-
-    for norm_pii_text, template in text_to_template.items():
-        # Whitespace-flexible, case-insensitive regex for this key
-        _pat = _build_flex_pattern(norm_pii_text)
+    # X3: one pass per page finds every key; hits come back grouped by key
+    # in insertion order, so intervals are claimed in the same order as a
+    # per-key scan of every page.  Results are regrouped by key below to
+    # keep the output order of that scan.
+    keys = list(text_to_template)
+    matcher = _KeyMatcher(keys)
+    propagated_by_key: list[list[PIIRegion]] = [[] for _ in keys]
+
+    for page_data in pages:
+        full_text = page_data.full_text
+        if not full_text:
+            continue
 
-        for page_data in pages:
-            full_text = page_data.full_text
-            if not full_text:
-                continue
+        pn = page_data.page_number
+        index = page_text_index(page_data)
 
-            pn = page_data.page_number
+        for ki, char_start, char_end in matcher.find(full_text, index.text_view(_normalise_page)):
+            template = text_to_template[keys[ki]]
             intervals = page_intervals[(template.pii_type, pn)]
 
-            # Accent-agnostic search: compare stripped versions
-            if pn not in norm_full_cache:
-                norm_full_cache[pn] = _neutralise_quotes(_strip_accents(full_text))
-            norm_full = norm_full_cache[pn]
-
-            for _m in _pat.finditer(norm_full):
-                char_start = _m.start()
-                char_end = _m.end()
+            if intervals.has_overlap(char_start, char_end, 0.5):
+                continue
 
-                if intervals.has_overlap(char_start, char_end, 0.5):
+            line_bboxes = index.geometry.line_bboxes(char_start, char_end)
+            if not line_bboxes:
+                bbox = index.geometry.bbox(char_start, char_end)
+                if bbox is None:
                     continue
+                line_bboxes = [bbox]
 
-                # X1: Get cached block offsets for this page
-                if pn not in block_offsets_cache:
-                    block_offsets_cache[pn] = _compute_block_offsets(
-                        page_data.text_blocks, full_text,
-                    )
-                block_offsets = block_offsets_cache[pn]
-
-                line_bboxes = _char_offsets_to_line_bboxes(
-                    char_start, char_end, block_offsets,
+            for bbox in line_bboxes:
+                clamped = _clamp_bbox(bbox, page_data.width, page_data.height)
+                if clamped.x1 - clamped.x0 < _MIN_BBOX_DIMENSION or clamped.y1 - clamped.y0 < _MIN_BBOX_DIMENSION:
+                    continue
+                new_region = PIIRegion(
+                    id=uuid.uuid4().hex[:12],
+                    page_number=page_data.page_number,
+                    bbox=clamped,
+                    text=full_text[char_start:char_end],
+                    pii_type=template.pii_type,
+                    confidence=template.confidence,
+                    source=template.source,
+                    char_start=char_start,
+                    char_end=char_end,
+                    action=template.action,
                 )
-                if not line_bboxes:
-                    bbox = _char_offset_to_bbox(char_start, char_end, block_offsets)
-                    if bbox is None:
-                        continue
-                    line_bboxes = [bbox]
-
-                for bbox in line_bboxes:
-                    clamped = _clamp_bbox(bbox, page_data.width, page_data.height)
-                    if clamped.x1 - clamped.x0 < _MIN_BBOX_DIMENSION or clamped.y1 - clamped.y0 < _MIN_BBOX_DIMENSION:
-                        continue
-                    new_region = PIIRegion(
-                        id=uuid.uuid4().hex[:12],
-                        page_number=page_data.page_number,
-                        bbox=clamped,
-                        text=full_text[char_start:char_end],
-                        pii_type=template.pii_type,
-                        confidence=template.confidence,
-                        source=template.source,
-                        char_start=char_start,
-                        char_end=char_end,
-                        action=template.action,
-                    )
-                    propagated.append(new_region)
-                intervals.add(char_start, char_end)  # type-scoped: won't block other types
+                propagated_by_key[ki].append(new_region)
+            intervals.add(char_start, char_end)  # type-scoped: won't block other types
+
+    propagated = [r for key_regions in propagated_by_key for r in key_regions]
 
     if propagated:
         logger.info(
@@ -298,10 +375,11 @@ def propagate_regions_across_pages(
 
     # Final overlap resolution per page
     result: list[PIIRegion] = []
-    pages_with_regions: set[int] = {r.page_number for r in all_regions}
-    for pn in sorted(pages_with_regions):
-        page_regions = [r for r in all_regions if r.page_number == pn]
-        result.extend(_resolve_bbox_overlaps(page_regions))
+    by_page: dict[int, list[PIIRegion]] = defaultdict(list)
+    for r in all_regions:
+        by_page[r.page_number].append(r)
+    for pn in sorted(by_page):
+        result.extend(_resolve_bbox_overlaps(by_page[pn]))
 
     # Char-span containment dedup: drop any region whose char span is
     # strictly contained within a same-type region on the same page with
@@ -309,33 +387,11 @@ def propagate_regions_across_pages(
     # where bbox-based dedup cannot catch sub-phrase overlaps (e.g. when
     # a partial "GASPE INC." region nestles within a full
     # "CLUB NAUTIQUE JACQUES-CARTIER DE GASPE INC." region).
-    if result:
-        # Group by page for efficient per-page processing
-        _page_buckets: dict[int, list[PIIRegion]] = defaultdict(list)
-        for r in result:
-            _page_buckets[r.page_number].append(r)
-        _dominated_ids: set[str] = set()
-        for _regs in _page_buckets.values():
-            # Sort by span length descending so longer spans come first
-            _regs_sorted = sorted(_regs, key=lambda r: -(r.char_end - r.char_start))
-            for i, ri in enumerate(_regs_sorted):
-                if ri.id in _dominated_ids:
-                    continue
-                for rj in _regs_sorted[:i]:
-                    if rj.id in _dominated_ids:
-                        continue
-                    if (rj.pii_type == ri.pii_type
-                            and rj.char_start <= ri.char_start
-                            and rj.char_end >= ri.char_end
-                            and rj.confidence >= ri.confidence):
-                        _dominated_ids.add(ri.id)
-                        break
-        if _dominated_ids:
-            logger.info(
-                "Char-span containment dedup dropped %d sub-phrase region(s)",
-                len(_dominated_ids),
-            )
-            result = [r for r in result if r.id not in _dominated_ids]
+    result, dropped = _drop_contained_regions(result)
+    if dropped:
+        logger.info(
+            "Char-span containment dedup dropped %d sub-phrase region(s)", dropped,
+        )
 
     # Clamp every region to its page bounds 
     clamped_result: list[PIIRegion] = []
@@ -592,82 +648,66 @@ def propagate_partial_org_names(
     for r in regions:
         page_intervals[(r.pii_type, r.page_number)].add(r.char_start, r.char_end)
 
-    # Block-offset cache
-    block_offsets_cache: dict[int, list] = {}
-    # Cache accent-stripped full_text per page
-    norm_full_cache: dict[int, str] = {}
-
-    propagated: list[PIIRegion] = []
-
     # Process longer sub-phrases first so they claim intervals before
-    # shorter overlapping ones.
+    # shorter overlapping ones.  All sub-phrases of every ORG share one
+    # automaton, so each page is scanned once; a hit maps back to the
+    # sub-phrase's best source ORG through its key index.
     sorted_subs = sorted(sub_to_template.items(), key=lambda kv: -len(kv[0]))
+    matcher = _KeyMatcher([sub for sub, _template in sorted_subs])
+    confs = [
+        round(template.confidence * _PROPAGATION_CONF_FACTOR, 4)
+        for _sub, template in sorted_subs
+    ]
+    propagated_by_sub: list[list[PIIRegion]] = [[] for _ in sorted_subs]
+
+    for page_data in pages:
+        full_text = page_data.full_text
+        if not full_text:
+            continue
 
-    for sub_text, template in sorted_subs:
-        conf = round(template.confidence * _PROPAGATION_CONF_FACTOR, 4)
-        # Whitespace-flexible, case-insensitive regex with word boundaries
-        _sub_pat = _build_flex_pattern(sub_text)
+        pn = page_data.page_number
+        intervals = page_intervals[(PIIType.ORG, pn)]
+        index = page_text_index(page_data)
 
-        for page_data in pages:
-            full_text = page_data.full_text
-            if not full_text:
+        for si, char_start, char_end in matcher.find(full_text, index.text_view(_normalise_page)):
+            # Require word boundaries to avoid matching inside words
+            if char_start > 0 and full_text[char_start - 1].isalnum():
+                continue
+            if char_end < len(full_text) and full_text[char_end].isalnum():
                 continue
 
-            pn = page_data.page_number
-            intervals = page_intervals[(PIIType.ORG, pn)]
-
-            # Accent-agnostic search
-            if pn not in norm_full_cache:
-                norm_full_cache[pn] = _neutralise_quotes(_strip_accents(full_text))
-            norm_full = norm_full_cache[pn]
-
-            for _m in _sub_pat.finditer(norm_full):
-                char_start = _m.start()
-                char_end = _m.end()
+            if intervals.has_overlap(char_start, char_end, _PROPAGATION_OVERLAP_RATIO):
+                continue
 
-                # Require word boundaries to avoid matching inside words
-                if char_start > 0 and full_text[char_start - 1].isalnum():
-                    continue
-                if char_end < len(full_text) and full_text[char_end].isalnum():
+            # Compute bbox
+            line_bboxes = index.geometry.line_bboxes(char_start, char_end)
+            if not line_bboxes:
+                bbox = index.geometry.bbox(char_start, char_end)
+                if bbox is None:
                     continue
+                line_bboxes = [bbox]
 
-                if intervals.has_overlap(char_start, char_end, _PROPAGATION_OVERLAP_RATIO):
+            template = sorted_subs[si][1]
+            for bbox in line_bboxes:
+                clamped = _clamp_bbox(bbox, page_data.width, page_data.height)
+                if clamped.x1 - clamped.x0 < _MIN_BBOX_DIMENSION or clamped.y1 - clamped.y0 < _MIN_BBOX_DIMENSION:
                     continue
-
-                # Compute bbox
-                if pn not in block_offsets_cache:
-                    block_offsets_cache[pn] = _compute_block_offsets(
-                        page_data.text_blocks, full_text,
-                    )
-                block_offsets = block_offsets_cache[pn]
-
-                line_bboxes = _char_offsets_to_line_bboxes(
-                    char_start, char_end, block_offsets,
+                new_region = PIIRegion(
+                    id=uuid.uuid4().hex[:12],
+                    page_number=page_data.page_number,
+                    bbox=clamped,
+                    text=full_text[char_start:char_end],
+                    pii_type=PIIType.ORG,
+                    confidence=confs[si],
+                    source=template.source,
+                    char_start=char_start,
+                    char_end=char_end,
+                    action=template.action,
                 )
-                if not line_bboxes:
-                    bbox = _char_offset_to_bbox(char_start, char_end, block_offsets)
-                    if bbox is None:
-                        continue
-                    line_bboxes = [bbox]
-
-                for bbox in line_bboxes:
-                    clamped = _clamp_bbox(bbox, page_data.width, page_data.height)
-                    if clamped.x1 - clamped.x0 < _MIN_BBOX_DIMENSION or clamped.y1 - clamped.y0 < _MIN_BBOX_DIMENSION:
-                        continue
-                    new_region = PIIRegion(
-                        id=uuid.uuid4().hex[:12],
-                        page_number=page_data.page_number,
-                        bbox=clamped,
-                        text=full_text[char_start:char_end],
-                        pii_type=PIIType.ORG,
-                        confidence=conf,
-                        source=template.source,
-                        char_start=char_start,
-                        char_end=char_end,
-                        action=template.action,
-                    )
-                    propagated.append(new_region)
-                intervals.add(char_start, char_end)
+                propagated_by_sub[si].append(new_region)
+            intervals.add(char_start, char_end)
+
+    propagated = [r for sub_regions in propagated_by_sub for r in sub_regions]
 
     if propagated:
         logger.info(
@@ -683,37 +723,17 @@ def propagate_partial_org_names(
     # Overlap resolution + clamping (same as main propagation)
     page_map: dict[int, PageData] = {p.page_number: p for p in pages}
     result: list[PIIRegion] = []
-    pages_with_regions: set[int] = {r.page_number for r in all_regions}
-    for pn in sorted(pages_with_regions):
-        page_regions = [r for r in all_regions if r.page_number == pn]
-        result.extend(_resolve_bbox_overlaps(page_regions))
+    by_page: dict[int, list[PIIRegion]] = defaultdict(list)
+    for r in all_regions:
+        by_page[r.page_number].append(r)
+    for pn in sorted(by_page):
+        result.extend(_resolve_bbox_overlaps(by_page[pn]))
 
     # Char-span containment dedup: drop sub-phrase regions that are contained
     # within a longer same-type region on the same page (safety net).
-    if result:
-        _page_bkts: dict[int, list[PIIRegion]] = defaultdict(list)
-        for r in result:
-            _page_bkts[r.page_number].append(r)
-        _dom_ids: set[str] = set()
-        for _regs in _page_bkts.values():
-            _regs_s = sorted(_regs, key=lambda r: -(r.char_end - r.char_start))
-            for i, ri in enumerate(_regs_s):
-                if ri.id in _dom_ids:
-                    continue
-                for rj in _regs_s[:i]:
-                    if rj.id in _dom_ids:
-                        continue
-                    if (rj.pii_type == ri.pii_type
-                            and rj.char_start <= ri.char_start
-                            and rj.char_end >= ri.char_end
-                            and rj.confidence >= ri.confidence):
-                        _dom_ids.add(ri.id)
-                        break
-        if _dom_ids:
-            logger.info(
-                "Partial-ORG containment dedup dropped %d region(s)", len(_dom_ids)
-            )
-            result = [r for r in result if r.id not in _dom_ids]
+    result, dropped = _drop_contained_regions(result)
+    if dropped:
+        logger.info("Partial-ORG containment dedup dropped %d region(s)", dropped)
 
     clamped_result: list[PIIRegion] = []
     for r in result:
@@ -19,10 +19,16 @@ Design philosophy:
 
 from __future__ import annotations
 
+import logging
 import re
+import threading
+import time
 from typing import NamedTuple
 
+import regex
+
 from models.schemas import PIIType
+from core.detection.detection_config import CUSTOM_PATTERN_MAX_TIMEOUTS, CUSTOM_PATTERN_TIMEOUT_S
 from core.detection.regex_patterns import (
     CONTEXT_KEYWORDS as _CONTEXT_KEYWORDS,
     CTX_WINDOW as _CTX_WINDOW,
@@ -31,6 +37,8 @@ from core.detection.regex_patterns import (
     LABEL_NAME_PATTERNS as _LABEL_NAME_PATTERNS,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class RegexMatch(NamedTuple):
     start: int
@@ -412,11 +420,313 @@ _COMPILED_PATTERNS: list[tuple[re.Pattern, PIIType, float, frozenset[str] | None
 # Custom patterns — user-defined regexes loaded from persistence
 # ---------------------------------------------------------------------------
 
-# Compiled custom patterns: (pattern, pii_type, confidence, case_sensitive, pattern_id, pattern_name)
-_CUSTOM_PATTERNS: list[tuple[re.Pattern, PIIType, float, str, str]] = []
+# Compiled custom patterns: (pattern, pii_type, confidence, pattern_id, pattern_name).
+# Compiled with the ``regex`` module so every scan can be given a timeout.
+_CUSTOM_PATTERNS: list[tuple[regex.Pattern, PIIType, float, str, str]] = []
 _CUSTOM_PATTERNS_LOADED: bool = False
 
 
+class _PatternStats:
+    """Running cost counters for one custom pattern."""
+
+    __slots__ = ("pattern", "runs", "total_s", "max_s", "timeouts", "consecutive_timeouts")
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+        self.runs = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.timeouts = 0
+        self.consecutive_timeouts = 0
+
+
+# pattern_id → stats; reset when a pattern's source changes
+_CUSTOM_PATTERN_STATS: dict[str, _PatternStats] = {}
+_CUSTOM_PATTERN_STATS_LOCK = threading.Lock()
+
+
+# Pattern structure for ``check_pattern_complexity``, from a small
+# tokenizer over the pattern string (the ``regex`` module exposes no
+# public parse tree).  Nodes are hashable tuples so alternatives can be
+# compared item by item:
+#   ("atom", text)                  one character, class, escape or opaque
+#                                   construct (backreference, atomic group,
+#                                   possessive repeat, conditional)
+#   ("at", text)                    zero-width anchor
+#   ("group", look, alternatives)   alternatives: tuple of item tuples;
+#                                   *look* is True for lookarounds
+#   ("repeat", min, max, node)      max is None when unbounded
+_ANCHOR_ESCAPES = frozenset("bBAZzGmM")
+_BRACED_ESCAPES = frozenset("pPNxgkuU")
+
+
+class _PatternSyntax(Exception):
+    """The tokenizer could not read the pattern."""
+
+
+class _PatternTokenizer:
+    def __init__(self, pattern: str) -> None:
+        self.p = pattern
+        self.i = 0
+
+    def parse(self) -> tuple:
+        alts = self._alternatives()
+        if self.i != len(self.p):
+            raise _PatternSyntax("unbalanced parenthesis")
+        return alts
+
+    def _alternatives(self) -> tuple:
+        alts = [self._sequence()]
+        while self.i < len(self.p) and self.p[self.i] == "|":
+            self.i += 1
+            alts.append(self._sequence())
+        return tuple(alts)
+
+    def _sequence(self) -> tuple:
+        items: list[tuple] = []
+        p = self.p
+        while self.i < len(p) and p[self.i] not in "|)":
+            node = self._atom()
+            if node is None:
+                continue
+            quant = self._quantifier()
+            if quant is not None:
+                lo, hi, possessive = quant
+                node = ("repeat", lo, hi, node)
+                if possessive:
+                    node = ("atom", repr(node))
+            items.append(node)
+        return tuple(items)
+
+    def _atom(self) -> tuple | None:
+        p, start = self.p, self.i
+        ch = p[start]
+        if ch == "\\":
+            if start + 1 >= len(p):
+                raise _PatternSyntax("trailing backslash")
+            esc = p[start + 1]
+            self.i = start + 2
+            if esc in _BRACED_ESCAPES and self.i < len(p) and p[self.i] in "{<":
+                self.i = self._skip_to(">" if p[self.i] == "<" else "}")
+            return ("at" if esc in _ANCHOR_ESCAPES else "atom", p[start:self.i])
+        if ch == "[":
+            self.i = self._class_end(start)
+            return ("atom", p[start:self.i])
+        if ch == "(":
+            return self._group()
+        self.i = start + 1
+        if ch in "^$":
+            return ("at", ch)
+        if ch in "*+?":
+            raise _PatternSyntax("nothing to repeat")
+        return ("atom", ch)
+
+    def _group(self) -> tuple | None:
+        p, start = self.p, self.i
+        self.i += 1
+        look = False
+        if p.startswith("?", self.i):
+            head = p[self.i + 1:self.i + 3]
+            if head[:1] == "#":                         # comment
+                self.i = self._skip_to(")")
+                return None
+            if head[:1] in ("=", "!") or head in ("<=", "<!"):
+                look = True
+                self.i += 1 + (2 if head[:1] == "<" else 1)
+            elif head[:1] == ":":
+                self.i += 2
+            elif head[:2] == "P<" or (head[:1] == "<" and head not in ("<=", "<!")):
+                self.i = self._skip_to(">")             # named group
+            elif head[:1] in (">", "(", "|") or head[:2] == "P=" or head[:1] == "R" or head[:1].isdigit():
+                # Atomic group, conditional, branch reset, backreference or
+                # recursion: treated as one opaque item.
+                self.i = start
+                self.i = self._group_end(start)
+                return ("atom", p[start:self.i])
+            else:                                       # inline flags
+                j = self.i + 1
+                while j < len(p) and (p[j].isalpha() or p[j] == "-"):
+                    j += 1
+                if j >= len(p) or p[j] not in ":)":
+                    raise _PatternSyntax("unknown group")
+                self.i = j + 1
+                if p[j] == ")":
+                    return None
+        alts = self._alternatives()
+        if self.i >= len(p) or p[self.i] != ")":
+            raise _PatternSyntax("missing )")
+        self.i += 1
+        return ("group", look, alts)
+
+    def _quantifier(self) -> tuple[int, int | None, bool] | None:
+        p, i = self.p, self.i
+        if i >= len(p):
+            return None
+        ch = p[i]
+        if ch in "*+?":
+            lo, hi = {"*": (0, None), "+": (1, None), "?": (0, 1)}[ch]
+            i += 1
+        elif ch == "{":
+            close = p.find("}", i)
+            body = p[i + 1:close] if close > 0 else ""
+            lo_s, sep, hi_s = body.partition(",")
+            if not body or not (lo_s or hi_s) or not (lo_s.isdigit() or not lo_s) \
+                    or not (hi_s.isdigit() or not hi_s) or (not sep and not lo_s):
+                return None                             # a literal "{"
+            lo = int(lo_s) if lo_s else 0
+            hi = (int(hi_s) if hi_s else None) if sep else lo
+            i = close + 1
+        else:
+            return None
+        possessive = False
+        if i < len(p) and p[i] in "?+":
+            possessive = p[i] == "+"
+            i += 1
+        self.i = i
+        return lo, hi, possessive
+
+    def _skip_to(self, closing: str) -> int:
+        end = self.p.find(closing, self.i)
+        if end < 0:
+            raise _PatternSyntax(f"missing {closing}")
+        return end + 1
+
+    def _class_end(self, start: int) -> int:
+        """Index just past the character class opening at *start*."""
+        p, i, depth = self.p, start + 1, 1
+        if i < len(p) and p[i] == "^":
+            i += 1
+        if i < len(p) and p[i] == "]":
+            i += 1                                      # leading literal "]"
+        while i < len(p):
+            ch = p[i]
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == "[":
+                if p.startswith("[:", i):               # POSIX class
+                    end = p.find(":]", i + 2)
+                    if end >= 0:
+                        i = end + 2
+                        continue
+                depth += 1                              # nested set (V1)
+            elif ch == "]":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        raise _PatternSyntax("unterminated character class")
+
+    def _group_end(self, start: int) -> int:
+        """Index just past the group opening at *start*."""
+        p, i, depth = self.p, start, 0
+        while i < len(p):
+            ch = p[i]
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == "[":
+                i = self._class_end(i)
+                continue
+            if ch == "(":
+                depth += 1
+            elif ch == ")":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            i += 1
+        raise _PatternSyntax("missing )")
+
+
+def check_pattern_complexity(pattern: str) -> str | None:
+    """Static check for patterns prone to catastrophic backtracking.
+
+    Returns a human-readable reason, or ``None`` when nothing risky was
+    found.  Flags an unbounded repeat whose body is made only of other
+    unbounded repeats and optional parts (``(a+)+``, ``(\\w+\\s?)*``),
+    and an unbounded repeat over alternatives where one is a prefix of
+    another (``(a|aa)+``).  A delimiter inside the repeat, as in
+    ``[a-z]+(?:-[a-z]+)*``, keeps it unambiguous and is accepted.
+    Atomic groups and possessive quantifiers never backtrack and are
+    not looked into.  Patterns the tokenizer cannot read are not judged
+    here; the runtime timeout still applies to them.
+    """
+    try:
+        parsed = _PatternTokenizer(pattern).parse()
+    except (_PatternSyntax, RecursionError):
+        return None
+
+    def _unbounded(node) -> bool:
+        return node[0] == "repeat" and node[2] is None
+
+    def _walk(items, inside_unbounded: bool) -> str | None:
+        for node in items:
+            kind = node[0]
+            if kind == "repeat":
+                body = (node[3],)
+                if _unbounded(node):
+                    if inside_unbounded:
+                        continue  # judged by the enclosing repeat
+                    if _only_repeats(body):
+                        return "nested unbounded quantifiers without a delimiter, e.g. (a+)+"
+                    if _ambiguous_branch(body):
+                        return "repeated alternatives where one is a prefix of another, e.g. (a|aa)+"
+                    reason = _walk(body, True)
+                else:
+                    reason = _walk(body, inside_unbounded)
+            elif kind == "group":
+                reason = next(
+                    (r for alt in node[2] if (r := _walk(alt, inside_unbounded))), None,
+                )
+            else:
+                reason = None
+            if reason:
+                return reason
+        return None
+
+    def _inline(items):
+        """*items* with single-alternative groups spliced in."""
+        for node in items:
+            if node[0] == "group" and not node[1] and len(node[2]) == 1:
+                yield from _inline(node[2][0])
+            else:
+                yield node
+
+    def _only_repeats(body) -> bool:
+        """Every mandatory item of *body* is itself an unbounded repeat."""
+        has_repeat = False
+        for node in _inline(body):
+            kind = node[0]
+            if _unbounded(node):
+                has_repeat = True
+            elif kind == "repeat" and node[1] == 0:
+                continue  # optional part
+            elif kind == "at":
+                continue
+            else:
+                return False
+        return has_repeat
+
+    def _branches(alt):
+        """*alt*, or the alternatives of the lone group it consists of."""
+        if len(alt) == 1 and alt[0][0] == "group" and not alt[0][1]:
+            return [b for inner in alt[0][2] for b in _branches(inner)]
+        return [alt]
+
+    def _ambiguous_branch(body) -> bool:
+        """Some alternative of a group in *body* is a prefix of all the
+        others, so a repeat can split the same text in several ways."""
+        for node in _inline(body):
+            if node[0] != "group" or node[1]:
+                continue
+            alts = [b for alt in node[2] for b in _branches(alt)]
+            if any(all(b[:len(a)] == a for b in alts) for a in alts):
+                return True
+        return False
+
+    return next((r for alt in parsed if (r := _walk(alt, False))), None)
+
+
 def _load_custom_patterns() -> None:
     """Load and compile custom patterns from disk."""
     global _CUSTOM_PATTERNS, _CUSTOM_PATTERNS_LOADED
@@ -427,11 +737,9 @@ def _load_custom_patterns() -> None:
         patterns = store.load_custom_patterns()
     except Exception:
         # During startup or tests, store may not be available
-        _CUSTOM_PATTERNS = []
-        _CUSTOM_PATTERNS_LOADED = True
-        return
+        patterns = []
     
-    compiled: list[tuple[re.Pattern, PIIType, float, str, str]] = []
+    compiled: list[tuple[regex.Pattern, PIIType, float, str, str]] = []
     
     for p in patterns:
         if not p.get("enabled", True):
@@ -442,8 +750,8 @@ def _load_custom_patterns() -> None:
             continue
         
         try:
-            flags = 0 if p.get("case_sensitive", False) else re.IGNORECASE
-            compiled_re = re.compile(pattern_str, flags)
+            flags = 0 if p.get("case_sensitive", False) else regex.IGNORECASE
+            compiled_re = regex.compile(pattern_str, flags)
             
             # Map pii_type string to PIIType enum
             pii_type_str = p.get("pii_type", "CUSTOM")
@@ -459,10 +767,24 @@ def _load_custom_patterns() -> None:
                 p.get("id", ""),
                 p.get("name", "Custom"),
             ))
-        except re.error:
+        except regex.error:
             # Skip invalid patterns
             continue
     
+    # Fresh counters for new or edited patterns; saving also re-enables
+    # patterns that were skipped after repeated timeouts.
+    with _CUSTOM_PATTERN_STATS_LOCK:
+        stats: dict[str, _PatternStats] = {}
+        for compiled_re, _t, _c, pattern_id, _n in compiled:
+            old = _CUSTOM_PATTERN_STATS.get(pattern_id)
+            if old is not None and old.pattern == compiled_re.pattern:
+                old.consecutive_timeouts = 0
+                stats[pattern_id] = old
+            else:
+                stats[pattern_id] = _PatternStats(compiled_re.pattern)
+        _CUSTOM_PATTERN_STATS.clear()
+        _CUSTOM_PATTERN_STATS.update(stats)
+
     _CUSTOM_PATTERNS = compiled
     _CUSTOM_PATTERNS_LOADED = True
 
@@ -480,6 +802,64 @@ def get_custom_pattern_count() -> int:
         _load_custom_patterns()
     return len(_CUSTOM_PATTERNS)
 
+
+def get_custom_pattern_stats() -> dict[str, dict]:
+    """Per-pattern runtime counters (pattern_id → stats) for the API."""
+    if not _CUSTOM_PATTERNS_LOADED:
+        _load_custom_patterns()
+    with _CUSTOM_PATTERN_STATS_LOCK:
+        return {
+            pattern_id: {
+                "runs": st.runs,
+                "avg_ms": round(st.total_s * 1000 / st.runs, 3) if st.runs else 0.0,
+                "max_ms": round(st.max_s * 1000, 3),
+                "timeouts": st.timeouts,
+                "suspended": st.consecutive_timeouts >= CUSTOM_PATTERN_MAX_TIMEOUTS,
+            }
+            for pattern_id, st in _CUSTOM_PATTERN_STATS.items()
+        }
+
+
+def _run_custom_pattern(compiled_re: regex.Pattern, pattern_id: str, pattern_name: str,
+                        text: str) -> list[regex.Match]:
+    """All matches of one custom pattern, bounded by ``CUSTOM_PATTERN_TIMEOUT_S``.
+
+    A pattern that times out on ``CUSTOM_PATTERN_MAX_TIMEOUTS`` pages in
+    a row is skipped until the patterns are saved again.
+    """
+    with _CUSTOM_PATTERN_STATS_LOCK:
+        st = _CUSTOM_PATTERN_STATS.get(pattern_id)
+        if st is None:
+            st = _CUSTOM_PATTERN_STATS[pattern_id] = _PatternStats(compiled_re.pattern)
+        if st.consecutive_timeouts >= CUSTOM_PATTERN_MAX_TIMEOUTS:
+            return []
+    t0 = time.perf_counter()
+    timed_out = False
+    try:
+        matches = list(compiled_re.finditer(text, timeout=CUSTOM_PATTERN_TIMEOUT_S))
+    except TimeoutError:
+        matches = []
+        timed_out = True
+    elapsed = time.perf_counter() - t0
+    with _CUSTOM_PATTERN_STATS_LOCK:
+        st.runs += 1
+        st.total_s += elapsed
+        st.max_s = max(st.max_s, elapsed)
+        if timed_out:
+            st.timeouts += 1
+            st.consecutive_timeouts += 1
+            suspended = st.consecutive_timeouts >= CUSTOM_PATTERN_MAX_TIMEOUTS
+        else:
+            st.consecutive_timeouts = 0
+    if timed_out:
+        logger.warning(
+            "Custom pattern %r (%s) timed out after %.2fs on %d chars%s",
+            pattern_name, pattern_id, elapsed, len(text),
+            " — skipping it until patterns are saved again" if suspended else "",
+        )
+    return matches
+
+
 def _validate_match(text: str, matched_text: str, pii_type: PIIType,
                     match_start: int = 0) -> float:
     """
@@ -561,7 +941,8 @@ def _validate_match(text: str, matched_text: str, pii_type: PIIType,
 
 
 def detect_regex(text: str, allowed_types: list[str] | None = None,
-                 detection_language: str | None = None) -> list[RegexMatch]:
+                 detection_language: str | None = None,
+                 custom_patterns_enabled: bool | None = None) -> list[RegexMatch]:
     """
     Scan text with all regex patterns and return matches.
 
@@ -573,6 +954,8 @@ def detect_regex(text: str, allowed_types: list[str] | None = None,
                            When set, only patterns tagged for that language (or
                            tagged with None = all languages) are executed.
                            When None or "auto", all patterns run.
+        custom_patterns_enabled: Whether user-defined patterns run.  None
+                           falls back to ``config.custom_patterns_enabled``.
 
     Applies validation, context-keyword boosting, and exclusion
     filtering to reduce false positives. Returns non-overlapping
@@ -645,15 +1028,17 @@ def detect_regex(text: str, allowed_types: list[str] | None = None,
             ))
 
     # ── Custom user-defined patterns ──
-    from core.config import config as _cfg
-    if _cfg.custom_patterns_enabled:
+    if custom_patterns_enabled is None:
+        from core.config import config as _cfg
+        custom_patterns_enabled = _cfg.custom_patterns_enabled
+    if custom_patterns_enabled:
         if not _CUSTOM_PATTERNS_LOADED:
             _load_custom_patterns()
 
         for compiled_re, pii_type, base_confidence, pattern_id, pattern_name in _CUSTOM_PATTERNS:
             if _allowed and pii_type.value not in _allowed:
                 continue
-            for m in compiled_re.finditer(text):
+            for m in _run_custom_pattern(compiled_re, pattern_id, pattern_name, text):
                 matched_text = m.group()
 
                 # Skip empty or whitespace-only matches
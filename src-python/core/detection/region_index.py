@@ -0,0 +1,90 @@
+"""Per-page interval index for deduplicating region lists.
+
+The post-detection passes (propagation containment dedup, blacklist and
+highlight-all merges) used to test every new region against every
+existing region of its page.  ``RegionIndex`` keeps the intervals of one
+page sorted by ``(start, end)`` so that containment and overlap queries
+are a bisection plus a scan of the entries that can actually qualify.
+
+Intervals are closed and may be char offsets or a bbox's ``(y0, y1)``
+band; callers apply their own finer checks to the returned items.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Iterator
+
+
+class RegionIndex:
+    """Intervals of one page sorted by ``(start, end)``, each carrying an item.
+
+    A query only scans entries whose start lies within one maximum stored
+    interval length of the query bounds, so it costs O(log n + k) with *k*
+    the size of that window.
+    """
+
+    __slots__ = ("_keys", "_items", "_max_len")
+
+    def __init__(self) -> None:
+        self._keys: list[tuple[float, float]] = []
+        self._items: list[Any] = []
+        self._max_len: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, start: float, end: float, item: Any) -> None:
+        """Insert an interval; equal intervals keep insertion order."""
+        i = bisect.bisect_right(self._keys, (start, end))
+        self._keys.insert(i, (start, end))
+        self._items.insert(i, item)
+        if end - start > self._max_len:
+            self._max_len = end - start
+
+    def remove(self, start: float, end: float, item: Any) -> bool:
+        """Remove *item* stored under ``(start, end)``; False if absent."""
+        keys = self._keys
+        i = bisect.bisect_left(keys, (start, end))
+        while i < len(keys) and keys[i] == (start, end):
+            if self._items[i] is item:
+                del keys[i]
+                del self._items[i]
+                return True
+            i += 1
+        return False
+
+    def starting_in(self, lo: float, hi: float) -> Iterator[Any]:
+        """Items whose interval starts within ``[lo, hi]``."""
+        keys, items = self._keys, self._items
+        i = bisect.bisect_left(keys, (lo,))
+        n = len(keys)
+        while i < n and keys[i][0] <= hi:
+            yield items[i]
+            i += 1
+
+    def overlapping(self, start: float, end: float) -> Iterator[Any]:
+        """Items whose interval shares at least one point with ``[start, end]``."""
+        keys, items = self._keys, self._items
+        i = bisect.bisect_left(keys, (start - self._max_len,))
+        n = len(keys)
+        while i < n:
+            k_start, k_end = keys[i]
+            if k_start > end:
+                break
+            if k_end >= start:
+                yield items[i]
+            i += 1
+
+    def containing(self, start: float, end: float) -> Iterator[Any]:
+        """Items whose interval contains ``[start, end]``."""
+        keys, items = self._keys, self._items
+        lo = end - self._max_len
+        i = bisect.bisect_right(keys, (start, float("inf"))) - 1
+        while i >= 0:
+            k_start, k_end = keys[i]
+            if k_start < lo:
+                break
+            if k_end >= end:
+                yield items[i]
+            i -= 1
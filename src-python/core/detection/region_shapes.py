@@ -9,11 +9,12 @@ from __future__ import annotations
 
 import logging
 import uuid
+from typing import Sequence
 
-from core.config import config
+from core.config import DetectionSettings, config
 from core.detection.regex_detector import detect_regex
 from core.detection.ner_detector import (
-    detect_ner,
+    detect_ner_batch,
     is_ner_available,
     detect_names_heuristic,
 )
@@ -80,33 +81,57 @@ def _max_lines_for_type(pii_type: PIIType | str) -> int:
 # ---------------------------------------------------------------------------
 
 
-def _redetect_pii(text: str) -> tuple[PIIType, float, DetectionSource] | None:
+def _redetect_pii(
+    text: str,
+    settings: DetectionSettings | None = None,
+) -> tuple[PIIType, float, DetectionSource] | None:
     """Run lightweight regex + NER re-detection on *text*.
 
     Returns ``(pii_type, confidence, source)`` for the highest-confidence
     match, or ``None`` if nothing exceeds the confidence threshold.
+    *settings* defaults to the global config.
     """
-    best: tuple[PIIType, float, DetectionSource] | None = None
+    return _redetect_pii_batch([text], settings)[0]
 
-    if config.regex_enabled:
-        _lang = config.detection_language if config.detection_language != "auto" else detect_language(text)
-        for m in detect_regex(text, detection_language=_lang):
-            if best is None or m.confidence > best[1]:
-                best = (m.pii_type, m.confidence, DetectionSource.REGEX)
 
-    if config.ner_enabled and is_ner_available():
-        for m in detect_ner(text):
-            if best is None or m.confidence > best[1]:
-                best = (m.pii_type, m.confidence, DetectionSource.NER)
+def _redetect_pii_batch(
+    texts: Sequence[str],
+    settings: DetectionSettings | None = None,
+) -> list[tuple[PIIType, float, DetectionSource] | None]:
+    """:func:`_redetect_pii` for many snippets at once.
 
-    if config.ner_enabled:
-        for m in detect_names_heuristic(text):
-            if best is None or m.confidence > best[1]:
-                best = (m.pii_type, m.confidence, DetectionSource.NER)
+    Regex and the name heuristic are cheap and run per snippet; spaCy runs
+    once over the whole batch (``detect_ner_batch``), so re-validating the
+    chunks of many split regions costs one model call instead of one per
+    chunk.  Results are identical to calling ``_redetect_pii`` on each.
+    """
+    s = settings if settings is not None else config
+    best: list[tuple[PIIType, float, DetectionSource] | None] = [None] * len(texts)
+
+    def _offer(i: int, matches, source: DetectionSource) -> None:
+        for m in matches:
+            if best[i] is None or m.confidence > best[i][1]:
+                best[i] = (m.pii_type, m.confidence, source)
+
+    if s.regex_enabled:
+        for i, text in enumerate(texts):
+            _lang = s.detection_language if s.detection_language != "auto" else detect_language(text)
+            _offer(i, detect_regex(text, detection_language=_lang,
+                                   custom_patterns_enabled=s.custom_patterns_enabled),
+                   DetectionSource.REGEX)
+
+    if s.ner_enabled and texts and is_ner_available():
+        for i, matches in enumerate(detect_ner_batch(texts)):
+            _offer(i, matches, DetectionSource.NER)
+
+    if s.ner_enabled:
+        for i, text in enumerate(texts):
+            _offer(i, detect_names_heuristic(text), DetectionSource.NER)
 
-    if best is not None and best[1] >= config.confidence_threshold:
-        return best
-    return None
+    return [
+        b if b is not None and b[1] >= s.confidence_threshold else None
+        for b in best
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -118,20 +143,29 @@ def _enforce_region_shapes(
     regions: list[PIIRegion],
     page_data: PageData,
     block_offsets: list[tuple[int, int, TextBlock]],
+    settings: DetectionSettings | None = None,
 ) -> list[PIIRegion]:
     """Post-process regions to enforce shape-quality constraints.
 
+    *settings* supplies the confidence threshold and gap fuzziness;
+    ``None`` reads them from the global config.
+
     Rules (applied in order):
     1. Bounds clamping — bbox cannot exceed page dimensions.
     2. Word-gap splitting — consecutive words with large gaps split.
     3. Word-count limit — regions exceeding the per-type limit are
-       split into chunks and re-validated.
+       split into chunks and re-validated (all chunks of the page in one
+       batch, see :func:`_redetect_pii_batch`).
     """
     if not block_offsets:
         return regions
 
+    _settings = settings if settings is not None else config
     page_w, page_h = page_data.width, page_data.height
-    result: list[PIIRegion] = []
+    result: list[PIIRegion | None] = []
+    # (result slot, source region, bbox, text, char_start, char_end) of
+    # chunks awaiting re-detection
+    pending: list[tuple[int, PIIRegion, BBox, str, int, int]] = []
 
     for region in regions:
         # 1. Clamp to page bounds
@@ -209,7 +243,10 @@ def _enforce_region_shapes(
                 ))
             continue
 
-        gap_groups = _split_blocks_at_gaps(triples, page_data.full_text)
+        gap_groups = _split_blocks_at_gaps(
+            triples, page_data.full_text,
+            fuzziness=_settings.detection_fuzziness,
+        )
 
         if len(gap_groups) == 1 and len(gap_groups[0]) <= _wlimit:
             result.append(region)
@@ -254,29 +291,38 @@ def _enforce_region_shapes(
                     cs = min(t[0] for t in chunk)
                     ce = max(t[1] for t in chunk)
 
-                    detection = _redetect_pii(sub_text)
-                    if detection is not None:
-                        pii_type, confidence, source = detection
-                    else:
-                        pii_type = region.pii_type
-                        confidence = region.confidence * 0.5
-                        source = region.source
-                        if confidence < config.confidence_threshold:
-                            continue
-
-                    result.append(PIIRegion(
-                        id=uuid.uuid4().hex[:16],
-                        page_number=region.page_number,
-                        bbox=sub_bbox,
-                        text=sub_text,
-                        pii_type=pii_type,
-                        confidence=confidence,
-                        source=source,
-                        char_start=cs,
-                        char_end=ce,
-                        action=region.action,
-                        linked_group=region.linked_group,
-                    ))
+                    # Re-validated in one batch below; keep the slot so
+                    # the output order is unchanged.
+                    pending.append((len(result), region, sub_bbox, sub_text, cs, ce))
+                    result.append(None)
+
+    # 5. Re-detect every word-limit chunk of the page in one batch
+    if pending:
+        detections = _redetect_pii_batch([p[3] for p in pending], _settings)
+        for (slot, region, sub_bbox, sub_text, cs, ce), detection in zip(pending, detections):
+            if detection is not None:
+                pii_type, confidence, source = detection
+            else:
+                pii_type = region.pii_type
+                confidence = region.confidence * 0.5
+                source = region.source
+                if confidence < _settings.confidence_threshold:
+                    continue
+
+            result[slot] = PIIRegion(
+                id=uuid.uuid4().hex[:16],
+                page_number=region.page_number,
+                bbox=sub_bbox,
+                text=sub_text,
+                pii_type=pii_type,
+                confidence=confidence,
+                source=source,
+                char_start=cs,
+                char_end=ce,
+                action=region.action,
+                linked_group=region.linked_group,
+            )
+        result = [r for r in result if r is not None]
 
     logger.debug(
         "Shape enforcement: %d regions → %d (page %d)",
@@ -0,0 +1,184 @@
+"""Process-wide detection scheduler.
+
+Every page detection in the process — full ``/detect`` runs, redetects,
+resets and interactive single-region re-analysis — goes through one
+bounded worker pool instead of each request spinning up its own
+``ThreadPoolExecutor``.  This keeps the number of concurrent model calls
+bounded no matter how many documents are being processed.
+
+Scheduling rules:
+
+- **Two priority classes.**  Interactive work (``reanalyze_bbox``,
+  single-page redetect) is always picked before bulk work.
+- **Fair round-robin per document.**  Within a priority class each
+  document has its own FIFO queue and workers take one task from each
+  document in turn, so a 300-page upload cannot starve a 2-page one
+  submitted after it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, TypeVar
+
+from core.detection.detection_config import DETECTION_MAX_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 1
+_PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BULK)
+
+
+class DetectionScheduler:
+    """Bounded worker pool with per-document round-robin queues.
+
+    Workers are started lazily on first submit and run as daemon threads
+    for the lifetime of the process.
+    """
+
+    def __init__(self, max_workers: int = DETECTION_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._max_workers = max_workers
+        self._cond = threading.Condition()
+        # priority → doc_id → pending (fn, future) tasks
+        self._queues: dict[int, dict[str, deque[tuple[Callable[[], Any], Future]]]] = {
+            p: {} for p in _PRIORITIES
+        }
+        # priority → round-robin order of doc_ids with pending work
+        self._rr: dict[int, deque[str]] = {p: deque() for p in _PRIORITIES}
+        self._workers: list[threading.Thread] = []
+        self._queued = 0
+        self._idle = 0
+        self._running = 0
+        self._shutdown = False
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def submit(
+        self,
+        doc_id: str,
+        fn: Callable[[], T],
+        *,
+        interactive: bool = False,
+    ) -> Future[T]:
+        """Queue *fn* on behalf of *doc_id* and return its Future."""
+        priority = PRIORITY_INTERACTIVE if interactive else PRIORITY_BULK
+        fut: Future[T] = Future()
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Detection scheduler has been shut down")
+            queues = self._queues[priority]
+            q = queues.get(doc_id)
+            if q is None:
+                q = queues[doc_id] = deque()
+                self._rr[priority].append(doc_id)
+            q.append((fn, fut))
+            self._queued += 1
+            if self._queued > self._idle and len(self._workers) < self._max_workers:
+                self._spawn_worker()
+            self._cond.notify()
+        return fut
+
+    def pending(self, doc_id: str | None = None) -> int:
+        """Number of queued (not yet started) tasks, optionally for one document."""
+        with self._cond:
+            if doc_id is None:
+                return self._queued
+            return sum(len(queues.get(doc_id, ())) for queues in self._queues.values())
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of pool utilisation for diagnostics."""
+        with self._cond:
+            return {
+                "max_workers": self._max_workers,
+                "workers": len(self._workers),
+                "running": self._running,
+                "queued_interactive": sum(len(q) for q in self._queues[PRIORITY_INTERACTIVE].values()),
+                "queued_bulk": sum(len(q) for q in self._queues[PRIORITY_BULK].values()),
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work, cancel queued tasks and stop the workers."""
+        with self._cond:
+            self._shutdown = True
+            for priority in _PRIORITIES:
+                for q in self._queues[priority].values():
+                    for _fn, fut in q:
+                        fut.cancel()
+                self._queues[priority].clear()
+                self._rr[priority].clear()
+            self._queued = 0
+            self._cond.notify_all()
+            workers = list(self._workers)
+        if wait:
+            for t in workers:
+                t.join()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _spawn_worker(self) -> None:
+        t = threading.Thread(
+            target=self._worker_loop,
+            name=f"pii-detect-{len(self._workers)}",
+            daemon=True,
+        )
+        self._workers.append(t)
+        t.start()
+
+    def _next_task(self) -> tuple[Callable[[], Any], Future] | None:
+        """Pop the next task (caller holds the lock)."""
+        for priority in _PRIORITIES:
+            rr = self._rr[priority]
+            if not rr:
+                continue
+            doc_id = rr.popleft()
+            q = self._queues[priority][doc_id]
+            task = q.popleft()
+            self._queued -= 1
+            if q:
+                rr.append(doc_id)
+            else:
+                del self._queues[priority][doc_id]
+            return task
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                task = self._next_task()
+                while task is None:
+                    if self._shutdown:
+                        return
+                    self._idle += 1
+                    self._cond.wait()
+                    self._idle -= 1
+                    task = self._next_task()
+                self._running += 1
+
+            fn, fut = task
+            try:
+                if fut.set_running_or_notify_cancel():
+                    try:
+                        result = fn()
+                    except BaseException as exc:
+                        fut.set_exception(exc)
+                    else:
+                        fut.set_result(result)
+            finally:
+                with self._cond:
+                    self._running -= 1
+
+
+# Singleton — shared by every detection entry point in the process
+detection_scheduler = DetectionScheduler()
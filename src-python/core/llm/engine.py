@@ -47,6 +47,11 @@ class LLMEngine:
     def gpu_enabled(self) -> bool:
         return self._gpu_enabled
 
+    @property
+    def max_concurrency(self) -> int:
+        """One llama.cpp context — calls are serialised by ``_lock``."""
+        return 1
+
     def load_model(self, model_path: str, force_cpu: bool = False) -> None:
         """
         Load a GGUF model file.
@@ -6,6 +6,12 @@ local vLLM / Ollama servers, etc.
 
 Only the ``httpx`` library is required (already a transitive dependency
 of ``fastapi[standard]``).
+
+Requests from every detection thread share one pooled client and run
+concurrently, up to ``config.llm_api_max_concurrency`` in flight; remote
+servers batch concurrent requests far better than they serve a queue.
+Reconfiguring swaps in a new client for later requests; the old one is
+closed once the requests still using it have finished.
 """
 
 from __future__ import annotations
@@ -32,6 +38,8 @@ class RemoteLLMEngine:
     OpenAI-compatible remote LLM wrapper.
 
     Uses a **persistent** ``httpx.Client`` for connection pooling and keep-alive.
+    ``generate`` is thread-safe; at most :attr:`max_concurrency` calls are
+    in flight at once and the rest wait for a slot.
 
     Usage:
         engine = RemoteLLMEngine()
@@ -44,8 +52,14 @@ class RemoteLLMEngine:
         self._api_key: str = ""
         self._model: str = ""
         self._timeout: float = _DEFAULT_REQUEST_TIMEOUT
-        self._lock = threading.Lock()  # serialise for safety
+        self._lock = threading.Lock()  # guards configuration and the clients
         self._client: httpx.Client | None = None
+        # client → requests currently posting through it
+        self._client_users: dict[httpx.Client, int] = {}
+        # replaced clients to close when their last request finishes
+        self._retired: set[httpx.Client] = set()
+        self._slot_limit = 0
+        self._slots: threading.BoundedSemaphore | None = None
 
     # ── Configuration ─────────────────────────────────────────────
 
@@ -59,7 +73,10 @@ class RemoteLLMEngine:
         """Set or update remote API parameters.
 
         Recreates the persistent HTTP client when the URL or key changes.
+        Requests already in flight finish on the old client, which is
+        closed after the last of them.
         """
+        stale: httpx.Client | None = None
         with self._lock:
             url_changed = api_url.rstrip("/") != self._api_url
             key_changed = api_key != self._api_key
@@ -72,18 +89,21 @@ class RemoteLLMEngine:
             # Rebuild the pooled client when credentials change
             if url_changed or key_changed or self._client is None:
                 if self._client is not None:
-                    try:
-                        self._client.close()
-                    except Exception:
-                        pass
+                    if self._client_users.get(self._client):
+                        self._retired.add(self._client)
+                    else:
+                        stale = self._client
                 self._client = httpx.Client(
                     timeout=self._timeout,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
                     headers={
                         "Authorization": f"Bearer {self._api_key}",
                         "Content-Type": "application/json",
                     },
                 )
 
+        if stale is not None:
+            _close_quietly(stale)
         logger.info(
             "Remote LLM configured: url=%s model=%s timeout=%ss",
             self._api_url, self._model, self._timeout,
@@ -105,6 +125,45 @@ class RemoteLLMEngine:
     def gpu_enabled(self) -> bool:
         return False  # not applicable
 
+    @property
+    def max_concurrency(self) -> int:
+        """Requests allowed in flight at once (``config.llm_api_max_concurrency``)."""
+        return max(1, config.llm_api_max_concurrency)
+
+    def _request_slots(self) -> threading.BoundedSemaphore:
+        """The semaphore bounding in-flight requests, resized when the
+        setting changes (calls already waiting keep the old one)."""
+        limit = self.max_concurrency
+        with self._lock:
+            if self._slots is None or limit != self._slot_limit:
+                self._slots = threading.BoundedSemaphore(limit)
+                self._slot_limit = limit
+            return self._slots
+
+    def _acquire_client(self) -> tuple[httpx.Client | None, str, str]:
+        """The current client, URL and model, counted as in use until
+        :meth:`_release_client`."""
+        with self._lock:
+            client = self._client
+            if client is not None:
+                self._client_users[client] = self._client_users.get(client, 0) + 1
+            return client, self._api_url, self._model
+
+    def _release_client(self, client: httpx.Client | None) -> None:
+        """Drop one use of *client*; close it if it was replaced meanwhile."""
+        if client is None:
+            return
+        with self._lock:
+            users = self._client_users[client] - 1
+            if users:
+                self._client_users[client] = users
+                return
+            del self._client_users[client]
+            if client not in self._retired:
+                return
+            self._retired.discard(client)
+        _close_quietly(client)
+
     # ── Generation ────────────────────────────────────────────────
 
     def generate(
@@ -132,7 +191,6 @@ class RemoteLLMEngine:
         messages.append({"role": "user", "content": user_prompt})
 
         payload: dict = {
-            "model": self._model,
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature,
@@ -141,20 +199,22 @@ class RemoteLLMEngine:
         if stop:
             payload["stop"] = stop
 
-        url = f"{self._api_url}/chat/completions"
-
-        with self._lock:
-            return self._call(url, payload)
+        with self._request_slots():
+            client, api_url, payload["model"] = self._acquire_client()
+            try:
+                return self._call(client, f"{api_url}/chat/completions", payload)
+            finally:
+                self._release_client(client)
 
-    def _call(self, url: str, payload: dict) -> str:
+    def _call(self, client: httpx.Client | None, url: str, payload: dict) -> str:
         """HTTP POST with retries and exponential backoff."""
-        if self._client is None:
+        if client is None:
             raise RuntimeError("Remote LLM HTTP client not initialised — call configure() first")
 
         last_error: Exception | None = None
         for attempt in range(_MAX_RETRIES):
             try:
-                resp = self._client.post(url, json=payload)
+                resp = client.post(url, json=payload)
                 resp.raise_for_status()
                 data = resp.json()
 
@@ -229,5 +289,12 @@ class RemoteLLMEngine:
             }
 
 
+def _close_quietly(client: httpx.Client) -> None:
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
 # Singleton
 remote_llm_engine = RemoteLLMEngine()
@@ -29,6 +29,23 @@ _SPECIAL: dict[str, str] = {
 }
 
 
+class _StripAccentsTable(dict):
+    """``str.translate`` table for :func:`strip_accents`, filled on demand."""
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        if ch in _SPECIAL:
+            base = _SPECIAL[ch]
+        else:
+            nfd = _unicodedata.normalize("NFD", ch)
+            base = "".join(c for c in nfd if _unicodedata.category(c) != "Mn") or ch
+        self[code] = base
+        return base
+
+
+_STRIP_ACCENTS_TABLE = _StripAccentsTable()
+
+
 def strip_accents(text: str) -> str:
     """Strip diacritics/accents while preserving string length.
 
@@ -38,15 +55,37 @@ def strip_accents(text: str) -> str:
 
     Examples: é→e, ü→u, ñ→n, ö→o, ç→c, ß→s, æ→a, œ→o.
     """
-    out: list[str] = []
-    for ch in text:
-        if ch in _SPECIAL:
-            out.append(_SPECIAL[ch])
-        else:
-            nfd = _unicodedata.normalize("NFD", ch)
-            base = "".join(c for c in nfd if _unicodedata.category(c) != "Mn")
-            out.append(base if base else ch)
-    return "".join(out)
+    if text.isascii():
+        return text
+    return text.translate(_STRIP_ACCENTS_TABLE)
+
+
+def accent_fold_with_map(text: str, *, quotes: bool = False) -> tuple[str, list[int]]:
+    """Accent-stripped lowercase *text* plus a map back to it.
+
+    NFD decomposes accented chars (é→e+combining-accent), then combining
+    marks are dropped.  The returned list maps each position in the
+    stripped string to its original char index, with a trailing sentinel
+    of ``len(text)``.  With *quotes*, apostrophe and double-quote
+    variants are first normalised to ASCII (the blacklist folding, so
+    smart quotes in user input match OCR text).
+    """
+    lowered = text.lower()
+    if quotes:
+        lowered = lowered.translate(_FOLD_QUOTE_MAP)
+    nfd = _unicodedata.normalize("NFD", lowered)
+    norm_chars: list[str] = []
+    n2o: list[int] = []
+    seen = 0
+    for ci in range(len(text)):
+        clen = len(_unicodedata.normalize("NFD", text[ci]))
+        for _ in range(clen):
+            if seen < len(nfd) and _unicodedata.category(nfd[seen]) != "Mn":
+                norm_chars.append(nfd[seen])
+                n2o.append(ci)
+            seen += 1
+    n2o.append(len(text))  # sentinel
+    return "".join(norm_chars), n2o
 
 
 def remove_accents(text: str) -> str:
@@ -128,3 +167,18 @@ _DASH_MAP: dict[int, int] = {
         "\uFF0D",  # FULLWIDTH HYPHEN-MINUS
     )
 }
+
+# Apostrophe / quote variants for ``accent_fold_with_map(quotes=True)``;
+# unlike ``_QUOTE_MAP`` double quotes are kept as ASCII double quotes.
+_FOLD_QUOTE_MAP: dict[int, str] = str.maketrans({
+    0x2018: "'",  # LEFT SINGLE QUOTATION MARK
+    0x2019: "'",  # RIGHT SINGLE QUOTATION MARK
+    0x201A: "'",  # SINGLE LOW-9 QUOTATION MARK
+    0x02BC: "'",  # MODIFIER LETTER APOSTROPHE
+    0x02BB: "'",  # MODIFIER LETTER TURNED COMMA
+    0xFF07: "'",  # FULLWIDTH APOSTROPHE
+    0x201C: '"',  # LEFT DOUBLE QUOTATION MARK
+    0x201D: '"',  # RIGHT DOUBLE QUOTATION MARK
+    0x201E: '"',  # DOUBLE LOW-9 QUOTATION MARK
+    0xFF02: '"',  # FULLWIDTH QUOTATION MARK
+})
@@ -5,9 +5,9 @@ from __future__ import annotations
 import enum
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # ---------------------------------------------------------------------------
@@ -108,6 +108,14 @@ class PageData(BaseModel):
     bitmap_path: str                  # Path to rendered bitmap file
     text_blocks: list[TextBlock] = []
     full_text: str = ""               # Concatenated text of all blocks
+    # Derived caches, never serialised.  Both are keyed by
+    # core.detection.layout.layout_fingerprint (width, full_text and every
+    # block's text and bbox) and rebuilt on mismatch, so replaced lists,
+    # appended blocks and in-place bbox or text edits all invalidate them.
+    # Derived text index (core.detection.page_index).
+    _text_index: Any = PrivateAttr(default=None)
+    # Column bands + detection text (core.detection.layout.page_layout).
+    _layout: Any = PrivateAttr(default=None)
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,48 @@
+"""Shared builders for the detection pipeline tests."""
+
+from __future__ import annotations
+
+from core.detection.llm_detector import LLMMatch
+from core.ingestion.loader import _build_full_text
+from models.schemas import BBox, PageData, PIIType, TextBlock
+
+
+def make_page(lines: list[str], page_number: int = 1) -> PageData:
+    """Build a PageData with one TextBlock per word, laid out line by line."""
+    blocks: list[TextBlock] = []
+    for li, line in enumerate(lines):
+        x = 50.0
+        y0 = 50.0 + li * 20.0
+        for wi, word in enumerate(line.split()):
+            w = 6.0 * len(word)
+            blocks.append(TextBlock(
+                text=word,
+                bbox=BBox(x0=x, y0=y0, x1=x + w, y1=y0 + 12.0),
+                block_index=0,
+                line_index=li,
+                word_index=wi,
+            ))
+            x += w + 4.0
+    return PageData(
+        page_number=page_number,
+        width=612,
+        height=792,
+        bitmap_path="/tmp/page.png",
+        text_blocks=blocks,
+        full_text=_build_full_text(blocks),
+    )
+
+
+SAMPLE_LINES = [
+    "Please contact John Smith at john.smith@example.com today.",
+    "His phone number is 555-123-4567 and his SSN is 123-45-6789.",
+    "The meeting with Acme Corporation is scheduled for next week.",
+]
+
+
+def fake_llm(text: str, engine: object) -> list[LLMMatch]:
+    """Stand-in for ``detect_llm`` that finds "Acme Corporation"."""
+    start = text.find("Acme Corporation")
+    if start < 0:
+        return []
+    return [LLMMatch(start, start + len("Acme Corporation"), "Acme Corporation", PIIType.ORG, 0.9)]
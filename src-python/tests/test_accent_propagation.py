@@ -18,6 +18,9 @@ from models.schemas import (
     TextBlock,
 )
 from core.detection.propagation import (
+    _KeyMatcher,
+    _build_flex_pattern,
+    _neutralise_quotes,
     _strip_accents,
     propagate_regions_across_pages,
     propagate_partial_org_names,
@@ -290,3 +293,54 @@ class TestAccentPartialOrgPropagation:
         # No sub-phrase of only function words should appear
         for t in all_texts:
             assert t.lower().strip() not in {"für über", "fur uber"}
+
+
+# ---------------------------------------------------------------------------
+# Single-pass key matcher
+# ---------------------------------------------------------------------------
+
+class TestKeyMatcher:
+    """_KeyMatcher finds the same spans as one flex regex per key."""
+
+    @staticmethod
+    def _per_key_regex(keys: list[str], text: str) -> list[tuple[int, int, int]]:
+        norm = _neutralise_quotes(_strip_accents(text))
+        return [
+            (ki, m.start(), m.end())
+            for ki, key in enumerate(keys)
+            for m in _build_flex_pattern(key).finditer(norm)
+        ]
+
+    def test_whitespace_case_and_quotes(self):
+        keys = ["jean tremblay", "acme inc.", "l esprit"]
+        text = "JEAN\n  Tremblay of ACME Inc. and \u00abL\u2019ESPRIT\u00bb; acme inc.x"
+        assert _KeyMatcher(keys).find(text) == self._per_key_regex(keys, text)
+        assert [ki for ki, _, _ in _KeyMatcher(keys).find(text)] == [0, 1, 2]
+
+    def test_random_pages_match_regex(self):
+        import random
+
+        vocab = [
+            "Société", "societe", "Générale", "ACME", "Inc.", "inc", "S.A.", "sa",
+            "L'Esprit", "\u00abDixie", "Lee\u00bb", "jean", "Jean-Luc", "aa", "a",
+            "Tremblay", "_x", "x_", "42", "(Canada)", "\u00c9cole", "ecole",
+        ]
+        seps = [" ", "  ", "\n", " \t", ", ", "-", ""]
+        rng = random.Random(7)
+        for _ in range(200):
+            words = [rng.choice(vocab) for _ in range(rng.randint(1, 30))]
+            text = "".join(w + rng.choice(seps) for w in words)
+            keys = []
+            for _ in range(rng.randint(1, 8)):
+                i = rng.randrange(len(vocab))
+                phrase = " ".join(vocab[i:i + rng.randint(1, 3)])
+                key = " ".join(_strip_accents(_neutralise_quotes(phrase)).split()).lower()
+                if len(key) >= 2 and key not in keys:
+                    keys.append(key)
+            if keys:
+                assert _KeyMatcher(keys).find(text) == self._per_key_regex(keys, text), (keys, text)
+
+    def test_many_keys_use_automaton(self):
+        keys = [f"client {n}" for n in range(300)] + ["acme inc.", "client 1 2"]
+        text = "Client 12, client\n1 2 and CLIENT 299 (ACME Inc.) client 3x client 30"
+        assert _KeyMatcher(keys).find(text) == self._per_key_regex(keys, text)
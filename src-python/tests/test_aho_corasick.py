@@ -0,0 +1,59 @@
+"""Tests for the Aho–Corasick multi-pattern matcher."""
+
+from __future__ import annotations
+
+import random
+
+from core.detection.aho_corasick import AhoCorasick
+
+
+def _naive(patterns: list[str], text: str) -> list[tuple[int, int]]:
+    """Per-pattern ``str.find`` loop, overlaps included — the old blacklist scan."""
+    out: list[tuple[int, int]] = []
+    for pid, p in enumerate(patterns):
+        if not p:
+            continue
+        i = text.find(p)
+        while i != -1:
+            out.append((i, pid))
+            i = text.find(p, i + 1)
+    return out
+
+
+class TestAhoCorasick:
+    def test_overlapping_and_suffix_patterns(self):
+        patterns = ["he", "she", "his", "hers"]
+        ac = AhoCorasick(patterns)
+        assert ac.find_all("ushers") == [(2, 0), (1, 1), (2, 3)]
+        # The automaton walk reports by end position.
+        assert list(ac.iter_matches("ushers")) == [(1, 1), (2, 0), (2, 3)]
+        assert len(ac) == 4
+        assert ac.pattern_length(3) == 4
+
+    def test_repeated_pattern_overlaps_itself(self):
+        assert AhoCorasick(["aa"]).find_all("aaaa") == [(0, 0), (1, 0), (2, 0)]
+        assert list(AhoCorasick(["aa"]).iter_matches("aaaa")) == [(0, 0), (1, 0), (2, 0)]
+
+    def test_empty_and_duplicate_patterns(self):
+        ac = AhoCorasick(["", "ab", "ab"])
+        assert ac.find_all("xabx") == [(1, 1), (1, 2)]
+        assert sorted(ac.iter_matches("xabx")) == [(1, 1), (1, 2)]
+        assert AhoCorasick([]).find_all("anything") == []
+
+    def test_matches_naive_scan(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            patterns = [
+                "".join(rng.choice("abc ") for _ in range(rng.randint(1, 5)))
+                for _ in range(rng.randint(1, 20))
+            ]
+            text = "".join(rng.choice("abcd ") for _ in range(200))
+            ac = AhoCorasick(patterns)
+            assert ac.find_all(text) == _naive(patterns, text)
+            assert sorted(ac.iter_matches(text), key=lambda m: (m[1], m[0])) == _naive(patterns, text)
+
+    def test_large_pattern_list_uses_automaton(self):
+        rng = random.Random(11)
+        patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 8))) for _ in range(500)]
+        text = "".join(rng.choice("abcd") for _ in range(500))
+        assert AhoCorasick(patterns).find_all(text) == _naive(patterns, text)
@@ -30,6 +30,35 @@ def _region(x0: float, y0: float, x1: float, y1: float,
     )
 
 
+def _brute_force_resolve(regions: list[PIIRegion]) -> list[PIIRegion]:
+    """Reference resolver: every keeper checked in acceptance order."""
+    final: list[PIIRegion] = []
+    for region in sorted(regions, key=lambda r: -r.confidence):
+        b = region.bbox
+        x0, y0, x1, y1 = b.x0, b.y0, b.x1, b.y1
+        for k in final:
+            kb = k.bbox
+            ox = min(x1, kb.x1) - max(x0, kb.x0)
+            oy = min(y1, kb.y1) - max(y0, kb.y0)
+            if ox <= 0 or oy <= 0:
+                continue
+            if oy <= ox:
+                if (y0 + y1) / 2 < (kb.y0 + kb.y1) / 2:
+                    y1 = kb.y0
+                else:
+                    y0 = kb.y1
+            elif (x0 + x1) / 2 < (kb.x0 + kb.x1) / 2:
+                x1 = kb.x0
+            else:
+                x0 = kb.x1
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            continue
+        final.append(region.model_copy(
+            update={"bbox": BBox(x0=x0, y0=y0, x1=x1, y1=y1)},
+        ))
+    return final
+
+
 # ---------------------------------------------------------------------------
 # _bbox_area
 # ---------------------------------------------------------------------------
@@ -199,3 +228,39 @@ class TestResolveBboxOverlaps:
         )
         result = _resolve_bbox_overlaps([r1, r2])
         assert isinstance(result, list)
+
+    def test_grid_matches_brute_force(self):
+        """The adaptive grid only prunes pairs: results equal checking every
+        keeper in acceptance order."""
+        import random
+
+        rng = random.Random(5)
+        for _ in range(30):
+            regions = []
+            for _ in range(rng.randint(2, 300)):
+                x0, y0 = rng.uniform(0, 300), rng.uniform(0, 300)
+                w = rng.choice([rng.uniform(3, 20), rng.uniform(100, 300)])
+                regions.append(_region(
+                    x0, y0, x0 + w, y0 + rng.uniform(3, 12),
+                    confidence=round(rng.uniform(0.3, 1.0), 2),
+                ))
+            got = _resolve_bbox_overlaps(regions)
+            assert [(r.id, r.bbox) for r in got] == [(r.id, r.bbox) for r in _brute_force_resolve(regions)]
+            for i, a in enumerate(got):
+                for b in got[i + 1:]:
+                    assert _bbox_overlap_area(a.bbox, b.bbox) == 0
+
+    def test_large_regions_outside_grid_match_brute_force(self):
+        """Page-sized boxes over tiny marks skip the grid but clip the same."""
+        import random
+
+        rng = random.Random(7)
+        regions = []
+        for _ in range(200):
+            x0, y0 = rng.uniform(0, 590), rng.uniform(0, 830)
+            regions.append(_region(x0, y0, x0 + 3, y0 + 3, confidence=round(rng.uniform(0.3, 1.0), 2)))
+        for _ in range(20):
+            x0, y0 = rng.uniform(0, 20), rng.uniform(0, 20)
+            regions.append(_region(x0, y0, x0 + 595, y0 + 842, confidence=round(rng.uniform(0.3, 1.0), 2)))
+        got = _resolve_bbox_overlaps(regions)
+        assert [(r.id, r.bbox) for r in got] == [(r.id, r.bbox) for r in _brute_force_resolve(regions)]
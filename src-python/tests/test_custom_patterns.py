@@ -0,0 +1,118 @@
+"""Tests for the cost guards on user-defined regex patterns."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+import core.detection.regex_detector as rd
+from core.detection.regex_detector import check_pattern_complexity, detect_regex
+
+_BACKTRACKING = r"(a|aa)+$"   # parses fine, explodes on "aaa…b"
+
+
+class _PatternStore:
+    def __init__(self, patterns: list[dict]) -> None:
+        self.patterns = patterns
+
+    def load_custom_patterns(self) -> list[dict]:
+        return self.patterns
+
+
+@pytest.fixture
+def custom_patterns(monkeypatch):
+    """Install custom patterns for detect_regex; restores the real set afterwards."""
+    def _install(patterns: list[dict]) -> None:
+        monkeypatch.setattr("api.deps.get_store", lambda: _PatternStore(patterns))
+        rd.reload_custom_patterns()
+
+    yield _install
+    monkeypatch.undo()
+    rd.reload_custom_patterns()
+
+
+class TestComplexityCheck:
+    @pytest.mark.parametrize("pattern", [
+        r"(a+)+", r"(\w+\s?)*$", r"(x+x+)+y", _BACKTRACKING,
+        r"(\p{L}+)+", r"(?:a|(?:ab|a))+",
+    ])
+    def test_flags_backtracking_shapes(self, pattern):
+        assert check_pattern_complexity(pattern)
+
+    @pytest.mark.parametrize("pattern", [
+        r"\d{3}-\d{2}-\d{4}", r"[a-z]+(?:-[a-z]+)*", r"(?:ab|cd)*",
+        r"(?:Mr|Mrs)\.?\s+\w+", r"\p{L}+", r"(?>a+)+", r"(a++)+",
+        r"(?:de|van|den|der)\s+\w+",
+    ])
+    def test_accepts_ordinary_patterns(self, pattern):
+        assert check_pattern_complexity(pattern) is None
+
+
+class TestRuntimeGuards:
+    def test_timeout_suspends_pattern_and_records_stats(self, custom_patterns, monkeypatch):
+        monkeypatch.setattr(rd, "CUSTOM_PATTERN_TIMEOUT_S", 0.02)
+        monkeypatch.setattr(rd, "CUSTOM_PATTERN_MAX_TIMEOUTS", 2)
+        custom_patterns([
+            {"id": "slow", "name": "Slow", "pattern": _BACKTRACKING},
+            {"id": "ref", "name": "Ref", "pattern": r"ZX-\d{4}"},
+        ])
+        text = "ZX-1234 " + "a" * 40 + "b"
+
+        for _ in range(3):
+            matches = detect_regex(text, custom_patterns_enabled=True)
+            assert "ZX-1234" in [m.text for m in matches]
+
+        stats = rd.get_custom_pattern_stats()
+        assert stats["slow"]["timeouts"] == 2
+        assert stats["slow"]["runs"] == 2          # third page skipped
+        assert stats["slow"]["suspended"] is True
+        assert stats["ref"]["runs"] == 3
+        assert stats["ref"]["timeouts"] == 0
+        assert stats["ref"]["avg_ms"] >= 0.0
+
+        # Saving the patterns again lifts the suspension.
+        rd.reload_custom_patterns()
+        assert rd.get_custom_pattern_stats()["slow"]["suspended"] is False
+
+
+@pytest_asyncio.fixture
+async def client():
+    from api.server import app
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"X-Requested-With": "XMLHttpRequest"},
+    ) as ac:
+        yield ac
+
+
+class TestPatternEndpoints:
+    @pytest.mark.asyncio
+    async def test_save_rejects_backtracking_pattern(self, client, monkeypatch):
+        monkeypatch.setattr("api.routers.settings.get_store", lambda: _PatternStore([]))
+        resp = await client.put("/api/settings/patterns", json=[
+            {"name": "Bad", "pattern": r"(\w+\s?)*$"},
+        ])
+        assert resp.status_code == 400
+        assert "backtracking" in resp.json()["detail"]
+
+        resp = await client.post("/api/settings/patterns", json={"name": "Bad", "pattern": r"(a+)+"})
+        assert resp.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_test_endpoint_times_out(self, client):
+        resp = await client.post("/api/settings/patterns/test", json={
+            "pattern": _BACKTRACKING, "test_text": "a" * 40 + "b",
+        })
+        assert resp.status_code == 400
+        assert "timed out" in resp.json()["detail"]
+
+    @pytest.mark.asyncio
+    async def test_stats(self, client, custom_patterns):
+        custom_patterns([{"id": "ref", "name": "Ref", "pattern": r"ZX-\d{4}"}])
+        detect_regex("see ZX-1234", custom_patterns_enabled=True)
+        resp = await client.get("/api/settings/patterns/stats")
+        assert resp.status_code == 200
+        assert resp.json()["ref"]["runs"] == 1
@@ -0,0 +1,231 @@
+"""Tests for repeated-line / duplicate-page result reuse."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from unittest.mock import patch
+
+import pytest
+
+from api.deps import detection_progress
+from api.routers.detection import _detect_pages
+from core.config import DetectionSettings, config
+from core.detection.fingerprint import (
+    FingerprintCache,
+    iter_lines,
+    mask_lines,
+    normalize_with_positions,
+)
+from core.detection.llm_detector import LLMMatch
+from core.detection.pipeline import detect_pii_on_page
+from core.detection.scheduler import DetectionScheduler
+from models.schemas import PIIType
+from tests.helpers import SAMPLE_LINES, fake_llm, make_page
+
+
+def _shifted(page, dy: float):
+    """Same page content laid out *dy* points lower."""
+    blocks = [
+        b.model_copy(update={"bbox": b.bbox.model_copy(update={"y0": b.bbox.y0 + dy, "y1": b.bbox.y1 + dy})})
+        for b in page.text_blocks
+    ]
+    return page.model_copy(update={"text_blocks": blocks, "page_number": page.page_number + 1})
+
+
+def _span_key(regions):
+    return sorted((r.char_start, r.char_end, r.pii_type.value, r.source.value) for r in regions)
+
+
+class TestNormalization:
+    def test_collapses_whitespace_and_keeps_positions(self):
+        src = "  Acme \t Corp\n"
+        norm, pos = normalize_with_positions(src)
+        assert norm == "Acme Corp"
+        assert "".join(src[i] for i in pos) == "Acme Corp"
+
+    def test_short_lines_are_not_fingerprinted(self):
+        lines = list(iter_lines("Page 3\nCONFIDENTIAL — Acme Corporation\n"))
+        assert len(lines) == 1
+        assert lines[0].start == 7
+
+
+class TestFingerprintCache:
+    def test_page_roundtrip_remaps_offsets(self):
+        cache = FingerprintCache()
+        src = "Contact John Smith today please"
+        m = LLMMatch(8, 18, "John Smith", PIIType.PERSON, 0.9)
+        cache.store_page(src, {"llm": [m]})
+
+        dst = "Contact   John  Smith today please"
+        hit = cache.lookup_page(dst)
+        assert hit is not None
+        (got,) = hit["llm"]
+        assert dst[got.start:got.end] == "John  Smith"
+        assert got.text == "John  Smith"
+        assert isinstance(got, LLMMatch)
+        assert cache.lookup_page("something else entirely") is None
+        assert cache.stats()["page_hits"] == 1
+
+    def test_only_earlier_waves_visible_lowest_page_wins(self):
+        cache = FingerprintCache(wave=2)
+        text = "Contact John Smith today please"
+        for page, conf in ((3, 0.7), (2, 0.8), (1, 0.6)):
+            cache.store_page(text, {"llm": [LLMMatch(8, 18, "John Smith", PIIType.PERSON, conf)]}, page=page)
+        assert cache.lookup_page(text, page=1) is None      # own wave
+        assert cache.lookup_page(text, page=2)["llm"][0].confidence == 0.6
+        assert cache.lookup_page(text, page=4)["llm"][0].confidence == 0.6
+        cache.store_lines(text, {"llm": []}, page=2)
+        assert cache.lookup_lines(text, page=3) == ([], {})
+        assert len(cache.lookup_lines(text, page=4)[0]) == 1
+
+    def test_lines_crossed_by_a_match_are_not_stored(self):
+        cache = FingerprintCache()
+        text = "The agreement is with Northwind\nTraders Limited of Ontario ok\nnothing to see on this line"
+        start = text.index("Northwind")
+        end = text.index(" of Ontario")
+        cache.store_lines(text, {"ner": [LLMMatch(start, end, "x", PIIType.ORG, 0.9)]})
+
+        reused, matches = cache.lookup_lines(text)
+        assert [text[line.start:line.end] for line in reused] == ["nothing to see on this line"]
+        assert matches == {"ner": []}
+
+    def test_line_matches_are_remapped(self):
+        cache = FingerprintCache()
+        header = "CONFIDENTIAL — Acme Corporation"
+        first = f"{header}\nfirst page body text here"
+        start = first.index("Acme")
+        cache.store_lines(first, {"llm": [LLMMatch(start, start + 16, "Acme Corporation", PIIType.ORG, 0.9)]})
+
+        second = f"some other opening line\n{header}"
+        reused, matches = cache.lookup_lines(second)
+        assert len(reused) == 1
+        (m,) = matches["llm"]
+        assert second[m.start:m.end] == "Acme Corporation"
+
+    def test_mask_lines_keeps_offsets(self):
+        text = "keep this line here\nmask this line please"
+        (line,) = [ln for ln in iter_lines(text) if ln.start > 0]
+        masked = mask_lines(text, list(range(len(text))), [line])
+        assert len(masked) == len(text)
+        assert masked.startswith("keep this line here\n")
+        assert not masked[line.start:].strip()
+
+
+class TestFingerprintReuseInPipeline:
+    @pytest.fixture(autouse=True)
+    def _layers(self, monkeypatch):
+        monkeypatch.setattr(config, "llm_detection_enabled", True)
+
+    def test_duplicate_page_skips_every_layer(self):
+        settings = DetectionSettings.from_config(fingerprint_reuse=True)
+        cache = FingerprintCache()
+        page1 = make_page(SAMPLE_LINES)
+        page2 = _shifted(page1, 300.0)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm:
+            r1 = detect_pii_on_page(page1, llm_engine=object(), settings=settings, fingerprints=cache)
+            with patch("core.detection.pipeline.detect_regex") as regex:
+                r2 = detect_pii_on_page(page2, llm_engine=object(), settings=settings, fingerprints=cache)
+        assert llm.call_count == 1
+        assert regex.call_count == 0
+
+        assert _span_key(r1) == _span_key(r2)
+        # Bboxes come from the second page's own layout.
+        by_span = {(r.char_start, r.char_end): r for r in r1}
+        for r in r2:
+            assert r.page_number == 2
+            assert r.bbox.y0 == pytest.approx(by_span[(r.char_start, r.char_end)].bbox.y0 + 300.0)
+
+    def test_repeated_header_is_masked_and_reused(self):
+        settings = DetectionSettings.from_config(fingerprint_reuse=True)
+        cache = FingerprintCache()
+        header = "Prepared for Acme Corporation shareholders"
+        page1 = make_page([header, "the first page talks about the annual results."])
+        page2 = make_page([header, "the second page covers the outlook for next year."], page_number=2)
+
+        seen: list[str] = []
+
+        def _llm(text, engine):
+            seen.append(text)
+            return fake_llm(text, engine)
+
+        with patch("core.detection.pipeline.detect_llm", side_effect=_llm):
+            detect_pii_on_page(page1, llm_engine=object(), settings=settings, fingerprints=cache)
+            r2 = detect_pii_on_page(page2, llm_engine=object(), settings=settings, fingerprints=cache)
+
+        assert "Acme Corporation" in seen[0]
+        assert "Acme Corporation" not in seen[1]
+        assert "outlook" in seen[1]
+        assert cache.stats()["line_hits"] == 1
+        acme = [r for r in r2 if r.text == "Acme Corporation"]
+        assert acme and acme[0].page_number == 2
+
+    def test_without_cache_every_page_runs(self):
+        settings = DetectionSettings.from_config()
+        page1 = make_page(SAMPLE_LINES)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm:
+            detect_pii_on_page(page1, llm_engine=object(), settings=settings)
+            detect_pii_on_page(_shifted(page1, 10.0), llm_engine=object(), settings=settings)
+        assert llm.call_count == 2
+
+
+class TestFingerprintReuseOrder:
+    """Which copy of repeated content seeds the cache must not depend on
+    which page a worker finishes first."""
+
+    @staticmethod
+    def _context_llm(text, engine):
+        # Confidence depends on the rest of the page, like a real model's.
+        section = int(re.search(r"section (\d+)", text).group(1)) if "section" in text else 0
+        start = text.find("Acme Corporation")
+        if start < 0:
+            return []
+        return [LLMMatch(start, start + 16, "Acme Corporation", PIIType.ORG, 0.5 + 0.04 * section)]
+
+    def _run(self, seed: int) -> list[tuple]:
+        settings = DetectionSettings.from_config(fingerprint_reuse=True, gazetteer_enabled=False)
+        header = "Prepared for Acme Corporation shareholders"
+        pages = [
+            make_page([header, f"section {i} covers the results of the year."], page_number=i + 1)
+            for i in range(6)
+        ]
+        pages.append(pages[1].model_copy(update={"page_number": 7}))
+        doc_id = f"fingerprint-order-{seed}"
+        detection_progress[doc_id] = {
+            "page_statuses": [{} for _ in pages], "_started_at": time.time(),
+        }
+        rng = random.Random(seed)
+        delays = {i: rng.uniform(0, 0.03) for i in range(len(pages))}
+
+        def _shuffled(page, *, page_index, **kwargs):
+            time.sleep(delays[page_index])
+            return detect_pii_on_page(page, page_index=page_index, **kwargs)
+
+        scheduler = DetectionScheduler(max_workers=4)
+        try:
+            with patch("api.routers.detection.detection_scheduler", scheduler), \
+                 patch("core.detection.fingerprint.FingerprintCache", lambda: FingerprintCache(wave=2)), \
+                 patch("core.detection.pipeline.detect_llm", side_effect=self._context_llm), \
+                 patch("core.detection.pipeline.detect_pii_on_page", side_effect=_shuffled):
+                regions = asyncio.run(_detect_pages(
+                    doc_id, pages, engine=object(), language="en", settings=settings,
+                ))
+        finally:
+            scheduler.shutdown()
+            detection_progress.pop(doc_id, None)
+        return sorted(
+            (r.page_number, r.char_start, r.char_end, r.text, r.pii_type.value, round(r.confidence, 6))
+            for r in regions
+        )
+
+    def test_shuffled_completion_gives_identical_regions(self, monkeypatch):
+        monkeypatch.setattr(config, "llm_detection_enabled", True)
+        runs = [self._run(seed) for seed in range(4)]
+        assert all(run == runs[0] for run in runs[1:])
+        acme = {page: conf for page, _s, _e, text, _t, conf in runs[0] if text == "Acme Corporation"}
+        # Later waves reuse page 1's header (the lowest page of the first
+        # wave); page 7 duplicates page 2 and reuses that whole page.
+        assert {acme[p] for p in range(3, 7)} == {acme[1]}
+        assert acme[7] == acme[2] != acme[1]
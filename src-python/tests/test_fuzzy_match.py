@@ -0,0 +1,71 @@
+"""Tests for core.detection.fuzzy_match — SequenceMatcher-parity filters."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from difflib import SequenceMatcher
+
+from core.detection.fuzzy_match import FuzzyNeedle, lcs_length
+
+
+def _lcs_dp(a: str, b: str) -> int:
+    prev = [0] * (len(b) + 1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b):
+            cur.append(prev[j] + 1 if x == y else max(prev[j + 1], cur[j]))
+        prev = cur
+    return prev[-1]
+
+
+def _random_text(rng: random.Random, alphabet: str, lo: int, hi: int) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(lo, hi)))
+
+
+class TestLcsLength:
+    def test_known(self):
+        assert lcs_length("dupont", "dupond") == 5
+        assert lcs_length("", "abc") == 0
+        assert lcs_length("abc", "") == 0
+
+    def test_matches_dynamic_programming(self):
+        rng = random.Random(1)
+        for _ in range(500):
+            a = _random_text(rng, "abcdé ", 0, 40)
+            b = _random_text(rng, "abcdé ", 0, 40)
+            assert lcs_length(a, b) == _lcs_dp(a, b)
+
+
+class TestFuzzyNeedle:
+    def test_ratio_at_least_matches_sequence_matcher(self):
+        rng = random.Random(2)
+        for _ in range(2000):
+            a = _random_text(rng, "abcde ", 0, 20)
+            b = _random_text(rng, "abcde ", 0, 20)
+            threshold = rng.choice([0.5, 0.75, 0.9])
+            expected = SequenceMatcher(None, a, b).ratio() >= threshold
+            assert FuzzyNeedle(a, threshold).ratio_at_least(b) == expected
+
+    def test_windows_match_sliding_sequence_matcher(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            needle = _random_text(rng, "abcdef", 2, 14)
+            text = _random_text(rng, "abcdefgh ", 0, 250)
+            n = len(needle)
+            sizes = [n, n + 1, n - 1, n + 2, n - 2]
+            min_shared = n * 0.6
+            expected = []
+            for size in sizes:
+                if size <= 0 or size > len(text):
+                    continue
+                for start in range(len(text) - size + 1):
+                    chunk = text[start:start + size]
+                    if sum((Counter(needle) & Counter(chunk)).values()) < min_shared:
+                        continue
+                    if SequenceMatcher(None, needle, chunk).ratio() >= 0.75:
+                        expected.append((start, size))
+            assert list(FuzzyNeedle(needle, 0.75).windows(text, sizes, min_shared)) == expected
+
+    def test_shared_chars(self):
+        assert FuzzyNeedle("aab", 0.75).shared_chars(Counter("abbb")) == 2
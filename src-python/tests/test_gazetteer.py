@@ -0,0 +1,171 @@
+"""Tests for the per-document running gazetteer."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+from api.deps import detection_progress
+from api.routers.detection import _detect_pages
+from core.config import DetectionSettings
+from core.detection.gazetteer import DocumentGazetteer, name_candidates
+from core.detection.llm_detector import LLMMatch
+from core.detection.ner_types import NERMatch
+from core.detection.pipeline import detect_pii_on_page
+from core.detection.scheduler import DetectionScheduler
+from models.schemas import PIIType
+from tests.helpers import make_page
+
+
+def _m(text: str, pii_type=PIIType.PERSON, confidence=0.95) -> LLMMatch:
+    return LLMMatch(0, len(text), text, pii_type, confidence)
+
+
+class TestDocumentGazetteer:
+    def test_seeding_filters(self):
+        g = DocumentGazetteer()
+        added = g.add([
+            _m("Marlowe Pendry"),
+            _m("Marlowe  Pendry"),                      # same term after normalisation
+            _m("Ombrin Vask", confidence=0.5),          # not confident enough
+            _m("Bob"),                                  # too short
+            _m("marlowe@example.com", PIIType.EMAIL),   # regex territory
+            _m("Halder Quist Holdings", PIIType.ORG),
+        ])
+        assert added == 2
+        assert len(g) == 2
+
+    def test_find_longest_term_and_whitespace(self):
+        g = DocumentGazetteer()
+        g.add([_m("Halder Quist"), _m("Halder Quist Holdings", PIIType.ORG)])
+        text = "paid to Halder  Quist\nHoldings, and Halder Quist personally; Halder Quistian no"
+        hits = g.find(text)
+        assert [(h.text, h.pii_type) for h in hits] == [
+            ("Halder  Quist Holdings", PIIType.ORG),
+            ("Halder Quist", PIIType.PERSON),
+        ]
+        assert all(isinstance(h, NERMatch) for h in hits)
+
+    def test_find_empty(self):
+        assert DocumentGazetteer().find("anything at all") == []
+
+    def test_covered_lines_require_every_candidate(self):
+        g = DocumentGazetteer()
+        g.add([_m("Marlowe Pendry")])
+        text = (
+            "we thanked Marlowe Pendry for the work.\n"
+            "later Marlowe Pendry met Ombrin Vask downtown.\n"
+            "nothing capitalised on this line at all."
+        )
+        lines, hits = g.covered_lines(text, g.find(text))
+        assert [text[ln.start:ln.end] for ln in lines] == ["we thanked Marlowe Pendry for the work."]
+        assert [h.text for h in hits] == ["Marlowe Pendry"]
+        assert g.stats() == {"terms": 1, "lines_skipped": 1}
+
+    def test_find_only_sees_earlier_waves(self):
+        g = DocumentGazetteer(wave=2)
+        g.add([_m("Marlowe Pendry")], page=2)
+        text = "signed by Marlowe Pendry"
+        assert g.find(text, page=2) == []           # same wave
+        assert g.find(text, page=3) == []
+        assert [h.text for h in g.find(text, page=4)] == ["Marlowe Pendry"]
+        assert [h.text for h in g.find(text)] == ["Marlowe Pendry"]
+
+    def test_result_independent_of_finish_order(self):
+        pages = [
+            (0, [_m("Halder Quist", confidence=0.9)]),
+            (1, [_m("Halder Quist", PIIType.ORG, confidence=0.9)]),
+            (2, [_m("Ombrin Vask")]),
+            (3, [_m("Halder Quist", PIIType.LOCATION, confidence=0.99)]),
+        ]
+        text = "Halder Quist met Ombrin Vask"
+        results = []
+        for order in (pages, pages[::-1], [pages[2], pages[0], pages[3], pages[1]]):
+            g = DocumentGazetteer(wave=2)
+            for page, matches in order:
+                g.add(matches, page=page)
+            results.append([(h.text, h.pii_type) for h in g.find(text, page=4)])
+            results.append([(h.text, h.pii_type) for h in g.find(text, page=2)])
+        assert results[0] == [("Halder Quist", PIIType.LOCATION), ("Ombrin Vask", PIIType.PERSON)]
+        assert results[1] == [("Halder Quist", PIIType.PERSON)]    # tie → earliest page
+        assert results[::2] == [results[0]] * 3
+        assert results[1::2] == [results[1]] * 3
+
+    def test_name_candidates(self):
+        text = "Name: zorblax quentin\nwe met Velmora Tessik and Vask."
+        spans = {text[s:e] for s, e in name_candidates(text)}
+        assert {"zorblax quentin", "Velmora Tessik", "Vask"} <= spans
+        assert "Name" not in spans
+
+
+class TestGazetteerInPipeline:
+    def test_later_page_skips_models_on_known_lines(self):
+        settings = DetectionSettings.from_config(
+            gazetteer_enabled=True, llm_detection_enabled=False,
+        )
+        g = DocumentGazetteer()
+        page1 = make_page(["the report was prepared by Marlowe Pendry last spring."])
+        page2 = make_page([
+            "we thanked Marlowe Pendry for the excellent work again.",
+            "",
+            "the remaining sections cover budget and staffing plans.",
+        ], page_number=2)
+        seen: list[str] = []
+
+        def _heuristic(text):
+            seen.append(text)
+            start = text.find("Marlowe Pendry")
+            if start < 0:
+                return []
+            return [NERMatch(start, start + 14, "Marlowe Pendry", PIIType.PERSON, 0.9)]
+
+        with patch("core.detection.pipeline.is_ner_available", return_value=False), \
+             patch("core.detection.pipeline.is_bert_ner_available", return_value=False), \
+             patch("core.detection.pipeline.is_gliner_available", return_value=False), \
+             patch("core.detection.pipeline.detect_names_heuristic", side_effect=_heuristic):
+            detect_pii_on_page(page1, settings=settings, gazetteer=g)
+            regions = detect_pii_on_page(page2, settings=settings, gazetteer=g)
+
+        assert len(g) == 1
+        assert "Marlowe Pendry" not in seen[1]
+        assert "budget and staffing" in seen[1]
+        assert [r.text for r in regions if r.pii_type == PIIType.PERSON] == ["Marlowe Pendry"]
+
+
+class TestGazetteerWaves:
+    def test_pages_wait_for_earlier_waves(self):
+        settings = DetectionSettings.from_config(gazetteer_enabled=True)
+        pages = [make_page([f"page {i}"], page_number=i + 1) for i in range(5)]
+        doc_id = "gazetteer-waves"
+        detection_progress[doc_id] = {
+            "page_statuses": [{} for _ in pages], "_started_at": time.time(),
+        }
+        lock = threading.Lock()
+        done: set[int] = set()
+        seen_done: dict[int, set[int]] = {}
+
+        def _detect(page, *, gazetteer, page_index, **kwargs):
+            with lock:
+                seen_done[page_index] = set(done)
+            time.sleep(0.01 * (5 - page_index))     # later pages finish first
+            with lock:
+                done.add(page_index)
+            return []
+
+        scheduler = DetectionScheduler(max_workers=4)
+        try:
+            with patch("api.routers.detection.detection_scheduler", scheduler), \
+                 patch("core.detection.gazetteer.DocumentGazetteer", lambda: DocumentGazetteer(wave=2)), \
+                 patch("core.detection.pipeline.detect_pii_on_page", side_effect=_detect):
+                asyncio.run(_detect_pages(
+                    doc_id, pages, engine=None, language="en", settings=settings,
+                ))
+        finally:
+            scheduler.shutdown()
+            detection_progress.pop(doc_id, None)
+
+        for idx, before in seen_done.items():
+            wave_start = idx - idx % 2
+            assert set(range(wave_start)) <= before
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
 from core.detection.layout import (
@@ -10,10 +12,13 @@ from core.detection.layout import (
     _std,
     detect_column_bands,
     build_detection_text,
+    layout_fingerprint,
+    page_layout,
     translate_match,
 )
 from core.detection.regex_detector import RegexMatch
 from core.detection.block_offsets import _compute_block_offsets
+from core.ingestion.loader import _build_full_text
 from models.schemas import BBox, PageData, PIIType, TextBlock
 
 
@@ -149,7 +154,7 @@ class TestBuildDetectionText:
         om = build_detection_text(page, bo)
         assert om.detection_text == "MARTIN"
         # All positions should map to full_text[0..5]
-        assert om.dt_to_ft == [0, 1, 2, 3, 4, 5]
+        assert list(om.dt_to_ft) == [0, 1, 2, 3, 4, 5]
 
     def test_cross_line_join_with_space(self):
         """Two consecutive lines in a single column are joined with a space."""
@@ -283,3 +288,119 @@ class TestTranslateMatch:
         assert tm.text == "A B"  # \\n replaced by space
         assert tm.start == 0
         assert tm.end == 3
+
+
+# ---------------------------------------------------------------------------
+# OffsetMap.translate_matches
+# ---------------------------------------------------------------------------
+
+def _two_column_page(rng: random.Random) -> PageData:
+    blocks = []
+    for line in range(rng.randint(1, 15)):
+        y = 50 + 14 * line + (40 if line > 7 else 0)
+        for col_x in (60.0, 320.0):
+            x = col_x
+            for _ in range(rng.randint(0, 5)):
+                w = rng.choice(["Jean", "Dupont", "SA", "Zoë", "12", "Montréal"])
+                blocks.append(_block(w, x, y, x + 6 * len(w), y + 10))
+                x += 6 * len(w) + 4
+    return _page(blocks, _build_full_text(blocks))
+
+
+class TestTranslateMatches:
+    def _make_match(self, start: int, end: int) -> RegexMatch:
+        return RegexMatch(
+            start=start, end=end, text="", pii_type=PIIType.ORG, confidence=0.9,
+        )
+
+    def test_matches_per_match_translation(self):
+        rng = random.Random(4)
+        for _ in range(80):
+            page = _two_column_page(rng)
+            bo = _compute_block_offsets(page.text_blocks, page.full_text)
+            om = build_detection_text(page, bo)
+            n = len(om.detection_text)
+            matches = []
+            for _ in range(50):
+                start = rng.randint(-2, n + 2)
+                matches.append(self._make_match(start, start + rng.randint(-1, 30)))
+            expected = [
+                tm for m in matches
+                if (tm := translate_match(m, om.dt_to_ft, page.full_text)) is not None
+            ]
+            assert om.translate_matches(matches, page.full_text) == expected
+
+    def test_runs_match_offset_map(self):
+        rng = random.Random(9)
+        for _ in range(40):
+            page = _two_column_page(rng)
+            bo = _compute_block_offsets(page.text_blocks, page.full_text)
+            om = build_detection_text(page, bo)
+            expected = [-1] * len(om.detection_text)
+            for d, e, f in zip(om.run_dt, om.run_end, om.run_ft):
+                expected[d:e] = range(f, f + e - d)
+            assert list(om.dt_to_ft) == expected
+            for i, v in enumerate(om.dt_to_ft):
+                if v >= 0:
+                    assert om.detection_text[i] == page.full_text[v]
+
+    def test_empty_page(self):
+        om = build_detection_text(_page([], ""), [])
+        assert om.translate_matches([self._make_match(0, 3)], "") == []
+
+    def test_identity_without_blocks(self):
+        om = build_detection_text(_page([], "Jean Dupont"), [])
+        [tm] = om.translate_matches([self._make_match(5, 11)], "Jean Dupont")
+        assert (tm.start, tm.end, tm.text) == (5, 11, "Dupont")
+
+
+# ---------------------------------------------------------------------------
+# page_layout
+# ---------------------------------------------------------------------------
+
+class TestPageLayout:
+    def _layout(self, page: PageData):
+        return page_layout(page, _compute_block_offsets(page.text_blocks, page.full_text))
+
+    def test_matches_uncached_build(self):
+        page = _two_column_page(random.Random(2))
+        layout = self._layout(page)
+        bo = _compute_block_offsets(page.text_blocks, page.full_text)
+        assert layout.offset_map == build_detection_text(page, bo)
+        assert [(b.x_left, b.x_right) for b in layout.bands] == [
+            (b.x_left, b.x_right) for b in detect_column_bands(page.text_blocks, page.width)
+        ]
+
+    def test_reused_while_geometry_unchanged(self):
+        page = _two_column_page(random.Random(3))
+        first = self._layout(page)
+        assert self._layout(page) is first
+        copy = page.model_copy(update={
+            "text_blocks": [b.model_copy(deep=True) for b in page.text_blocks],
+        })
+        assert self._layout(copy) is first
+
+    def test_recomputed_after_bbox_edit(self):
+        page = _page(
+            [_block("Jean", 72, 50, 100, 62), _block("Dupont", 72, 64, 110, 76)],
+            "Jean\nDupont",
+        )
+        first = self._layout(page)
+        assert first.offset_map.detection_text == "Jean Dupont"
+        page.text_blocks[1].bbox.y0, page.text_blocks[1].bbox.y1 = 300, 312
+        second = self._layout(page)
+        assert second is not first
+        assert second.offset_map.detection_text == "Jean\nDupont"
+
+    def test_fingerprint_covers_text_and_width(self):
+        page = _page([_block("Jean", 72, 50, 100, 62)], "Jean")
+        base = layout_fingerprint(page)
+        assert layout_fingerprint(page.model_copy(update={"width": 612.0})) != base
+        assert layout_fingerprint(page.model_copy(update={"full_text": "Jean "})) != base
+        renamed = page.model_copy(update={"text_blocks": [_block("Joan", 72, 50, 100, 62)]})
+        assert layout_fingerprint(renamed) != base
+
+    def test_not_serialised(self):
+        page = _two_column_page(random.Random(5))
+        self._layout(page)
+        assert PageData.model_validate(page.model_dump())._layout is None
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import random
+from difflib import SequenceMatcher
+
 import pytest
 from core.detection.llm_detector import (
     LLMMatch,
@@ -35,6 +38,93 @@ class TestFuzzyFind:
         assert idx == 8  # "John Smith" starts at index 8
 
 
+def _reference_fuzzy_find(needle: str, haystack: str, threshold: float = 0.75) -> int | None:
+    """The plain sliding-window matcher _fuzzy_find must agree with."""
+    idx = haystack.find(needle)
+    if idx != -1:
+        return idx
+    lower_hay, lower_needle = haystack.lower(), needle.lower()
+    idx = lower_hay.find(lower_needle)
+    if idx != -1:
+        return idx
+    n = len(needle)
+    if n < 3 or n > len(haystack):
+        return None
+    best_ratio, best_idx = 0.0, -1
+    step = max(1, n // 6)
+    for i in range(0, len(haystack) - n + 1, step):
+        ratio = SequenceMatcher(None, lower_needle, haystack[i:i + n].lower()).ratio()
+        if ratio > best_ratio:
+            best_ratio, best_idx = ratio, i
+    if best_idx >= 0 and best_ratio >= threshold * 0.9:
+        for i in range(max(0, best_idx - step), min(len(haystack) - n + 1, best_idx + step + 1)):
+            ratio = SequenceMatcher(None, lower_needle, haystack[i:i + n].lower()).ratio()
+            if ratio > best_ratio:
+                best_ratio, best_idx = ratio, i
+    return best_idx if best_ratio >= threshold else None
+
+
+# A page chunk and entity strings as returned by local models without
+# offsets: exact, re-cased, re-spaced, abbreviated, misspelled, or not
+# on the page at all.
+_RECORDED_CHUNK = (
+    "CONTRAT DE BAIL COMMERCIAL\n"
+    "Entre : Société Immobilière Laurentide Inc., 1250 boul. René-Lévesque Ouest,\n"
+    "Montréal (Québec) H3B 4W8, représentée par M. Jean-François Tremblay, ci-après\n"
+    "le « Bailleur », et Mme Zoë Ångström-Gagnon, née le 14 mars 1987, NAS 123 456 789,\n"
+    "courriel zoe.angstrom@example.com, tél. 514-555-0199, ci-après le « Locataire ».\n"
+    "Le loyer est payable au compte IBAN FR76 3000 6000 0112 3456 7890 189 chaque mois.\n"
+    "Signed in the presence of Dr. Michael O'Connor, notary, on behalf of Club Nautique\n"
+    "Jacques-Cartier, 33 rue Saint-Paul, Québec G1K 3V8.\n"
+)
+_RECORDED_ENTITIES = [
+    "Jean-François Tremblay", "jean-francois tremblay", "Jean Francois Tremblay",
+    "Zoë Ångström-Gagnon", "Zoe Angstrom Gagnon", "ZOË ÅNGSTRÖM",
+    "14 mars 1987", "14 March 1987", "123 456 789", "123-456-789",
+    "zoe.angstrom@example.com", "zoe.angstrom@exemple.com", "514-555-0199", "(514) 555-0199",
+    "FR76 3000 6000 0112 3456 7890 189", "FR7630006000011234567890189",
+    "Michael O'Connor", "Michael O’Connor", "Dr Michael OConnor",
+    "Club Nautique Jacques-Cartier", "Club Nautique\nJacques-Cartier", "Club Nautique Jacques Cartier",
+    "1250 boul. René-Lévesque Ouest", "1250 boulevard René-Lévesque O.",
+    "Société Immobilière Laurentide", "Societe Immobiliere Laurentienne",
+    "33 rue Saint-Paul, Québec G1K 3V8", "G1K 3V8", "H3B4W8",
+    "Marie Curie", "Paris", "İstanbul Holding", "ab", "Montréal",
+]
+
+
+class TestFuzzyFindParity:
+    def test_recorded_llm_outputs(self):
+        for entity in _RECORDED_ENTITIES:
+            assert _fuzzy_find(entity, _RECORDED_CHUNK) == _reference_fuzzy_find(entity, _RECORDED_CHUNK), entity
+
+    def test_recorded_outputs_across_chunk_offsets(self):
+        for cut in range(0, len(_RECORDED_CHUNK), 37):
+            chunk = _RECORDED_CHUNK[cut:]
+            for entity in _RECORDED_ENTITIES:
+                assert _fuzzy_find(entity, chunk) == _reference_fuzzy_find(entity, chunk), (entity, cut)
+
+    def test_random_mutations(self):
+        rng = random.Random(6)
+        alphabet = "abcdeéABCDE -'"
+        for _ in range(400):
+            hay = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300)))
+            if hay and rng.random() < 0.7:
+                start = rng.randrange(len(hay))
+                needle = list(hay[start:start + rng.randint(3, 30)])
+                for _ in range(rng.randint(0, 4)):
+                    if needle:
+                        needle[rng.randrange(len(needle))] = rng.choice(alphabet)
+                needle = "".join(needle)
+            else:
+                needle = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+            assert _fuzzy_find(needle, hay) == _reference_fuzzy_find(needle, hay), (needle, hay)
+
+    def test_length_changing_lowercase(self):
+        hay = "Signé à İzmir par İbrahim Yılmaz et Ayşe Demir"
+        for needle in ("Ibrahim Yilmaz", "İbrahım Yılmaz", "Ayse Demirr"):
+            assert _fuzzy_find(needle, hay) == _reference_fuzzy_find(needle, hay)
+
+
 # ── _parse_llm_response ─────────────────────────────────────────────────
 
 class TestParseLLMResponse:
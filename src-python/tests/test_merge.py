@@ -31,7 +31,12 @@ from core.detection.regex_detector import RegexMatch
 from core.detection.ner_detector import NERMatch
 from core.detection.gliner_detector import GLiNERMatch
 from core.detection.llm_detector import LLMMatch
-from core.detection.merge import _merge_detections, _split_bboxes_by_proximity
+from core.detection.merge import (
+    _Candidate,
+    _cross_layer_counts,
+    _merge_detections,
+    _split_bboxes_by_proximity,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -194,6 +199,40 @@ class TestCrossLayerBoost:
         if regex_email:
             assert regex_email[0].confidence <= 1.0  # no boost beyond expected range
 
+    def test_layer_counts_match_forward_walk(self):
+        """The interval index agrees with the original quadratic walk."""
+        import random
+
+        def _walk(cands):
+            order = sorted(range(len(cands)), key=lambda k: cands[k].start)
+            counts = [0] * len(cands)
+            for ii, i in enumerate(order):
+                c = cands[i]
+                sources = {c.source}
+                for j in order[ii + 1:]:
+                    o = cands[j]
+                    if o.start >= c.end:
+                        break
+                    overlap = min(c.end, o.end) - max(c.start, o.start)
+                    c_len, o_len = c.end - c.start, o.end - o.start
+                    if overlap > 0 and c_len > 0 and o_len > 0 and overlap / min(c_len, o_len) >= 0.5:
+                        sources.add(o.source)
+                counts[i] = len(sources)
+            return counts
+
+        rng = random.Random(3)
+        sources = list(DetectionSource)[:4]
+        for _ in range(200):
+            cands = []
+            for _ in range(rng.randint(0, 40)):
+                start = rng.randint(0, 60)
+                end = start + rng.choice([0, 1, 2, 3, 5, 8, 13, 40])
+                cands.append(_Candidate(
+                    start, end, "", PIIType.PERSON, 0.5,
+                    source=rng.choice(sources), priority=1,
+                ))
+            assert _cross_layer_counts(cands) == _walk(cands)
+
 
 # ---------------------------------------------------------------------------
 # NER digit-count pre-filter
@@ -33,3 +33,28 @@ class TestNERDetector:
         results = detect_ner("The quick brown fox jumps over the lazy dog.")
         # spaCy may or may not find entities here; just ensure no crash
         assert isinstance(results, list)
+
+
+class TestNERBatch:
+    @pytest.fixture
+    def ruler_nlp(self, monkeypatch):
+        """A small rule-based English pipeline standing in for the statistical model."""
+        nlp = spacy.blank("en")
+        ruler = nlp.add_pipe("entity_ruler")
+        ruler.add_patterns([
+            {"label": "PERSON", "pattern": "Marlowe Pendry"},
+            {"label": "ORG", "pattern": "Halder Quist Holdings"},
+        ])
+        monkeypatch.setattr("core.detection.ner_detector._load_model", lambda: nlp)
+        return nlp
+
+    def test_batch_matches_per_text_calls(self, ruler_nlp):
+        from core.detection.ner_detector import detect_ner_batch
+        texts = [
+            "we met Marlowe Pendry at the office",
+            "",
+            "the invoice from Halder Quist Holdings is due",
+            "le rapport de la société est prêt pour la réunion de demain",
+        ]
+        assert detect_ner_batch(texts) == [detect_ner(t) for t in texts]
+        assert [m.text for m in detect_ner_batch(texts)[0]] == ["Marlowe Pendry"]
@@ -10,6 +10,8 @@ from core.detection.noise_filters import (
     _is_person_pipeline_noise,
     _is_address_number_only,
     _strip_phone_labels_from_address,
+    NoiseVerdictCache,
+    noise_verdict_cache,
 )
 
 
@@ -183,6 +185,50 @@ class TestLocNoise:
         assert _is_loc_pipeline_noise("") is True
 
 
+# ── Verdict cache ────────────────────────────────────────────────────────
+
+class TestNoiseVerdictCache:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        noise_verdict_cache.clear()
+        yield
+        noise_verdict_cache.clear()
+
+    def test_repeats_are_hits(self):
+        assert _is_org_pipeline_noise("International") is True
+        assert _is_org_pipeline_noise("  International\n") is True
+        assert _is_person_pipeline_noise("Jean Tremblay") is False
+        assert _is_person_pipeline_noise("Jean Tremblay") is False
+        assert noise_verdict_cache.stats() == (2, 2)
+
+    def test_type_is_part_of_key(self):
+        """The same text gets an independent verdict per filter."""
+        assert _is_address_number_only("12345") is True
+        assert _is_loc_pipeline_noise("12345") is True
+        assert noise_verdict_cache.stats() == (0, 2)
+
+    @pytest.mark.parametrize("fn, texts", [
+        (_is_org_pipeline_noise, ["International", "Acme Inc", "Filets Sports Gaspésiens"]),
+        (_is_loc_pipeline_noise, ["building", "Paris", "A"]),
+        (_is_person_pipeline_noise, ["Jean Tremblay", "nous avons", "Bonjour"]),
+        (_is_address_number_only, ["12345", "123 Main St", "terme de 5 ans"]),
+    ])
+    def test_cached_verdict_matches_uncached(self, fn, texts):
+        for text in texts:
+            expected = fn.__wrapped__(text)
+            assert fn(text) is expected
+            assert fn(text) is expected
+
+    def test_lru_bound(self):
+        cache = NoiseVerdictCache(max_entries=2)
+        cache.put(("a", "ORG", 1), True)
+        cache.put(("b", "ORG", 1), False)
+        assert cache.get(("a", "ORG", 1)) is True     # refresh "a"
+        cache.put(("c", "ORG", 1), True)              # evicts "b"
+        assert cache.get(("b", "ORG", 1)) is None
+        assert len(cache) == 2
+
+
 # ── SpanIndex (from pipeline) ────────────────────────────────────────────
 
 class TestSpanIndex:
@@ -0,0 +1,169 @@
+"""Tests for core.detection.page_index (the cached per-page text index)
+and the PageGeometry it carries."""
+
+from __future__ import annotations
+
+import random
+
+from core.detection.block_offsets import (
+    PageGeometry,
+    _char_offset_to_bbox,
+    _char_offsets_to_line_bboxes,
+    _compute_block_offsets,
+)
+from core.detection.layout import layout_fingerprint
+from core.detection.page_index import page_text_index
+from core.ingestion.loader import _build_full_text
+from models.schemas import BBox, PageData, TextBlock
+
+
+def _page(words: list[str]) -> PageData:
+    blocks, x = [], 50.0
+    for w in words:
+        blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+        x += 6 * len(w) + 4
+    return PageData(
+        page_number=1, width=612, height=792, bitmap_path="",
+        text_blocks=blocks, full_text=" ".join(words),
+    )
+
+
+def _calls(counter: list[int]):
+    def build(text: str) -> str:
+        counter.append(1)
+        return text.upper()
+    return build
+
+
+class TestPageTextIndex:
+    def test_matches_uncached_offsets(self):
+        page = _page(["Invoice", "for", "Zoë", "Ångström"])
+        index = page_text_index(page)
+        assert index.block_offsets == _compute_block_offsets(page.text_blocks, page.full_text)
+        assert index.ends == [e for _s, e, _b in index.block_offsets]
+        assert [[b.text for b in line] for line in index.lines] == [["Invoice", "for", "Zoë", "Ångström"]]
+
+    def test_reused_across_calls(self):
+        page = _page(["Jean", "Dupont"])
+        assert page_text_index(page) is page_text_index(page)
+
+    def test_text_view_built_once(self):
+        page = _page(["Jean", "Dupont"])
+        counter: list[int] = []
+        build = _calls(counter)
+        assert page_text_index(page).text_view(build) == "JEAN DUPONT"
+        assert page_text_index(page).text_view(build) == "JEAN DUPONT"
+        assert len(counter) == 1
+
+    def test_rebuilt_when_blocks_replaced(self):
+        page = _page(["Jean", "Dupont"])
+        old = page_text_index(page)
+        other = _page(["Marie", "Curie"])
+        copy = page.model_copy(update={"text_blocks": other.text_blocks, "full_text": other.full_text})
+        index = page_text_index(copy)
+        assert index is not old
+        assert [b.text for _s, _e, b in index.block_offsets] == ["Marie", "Curie"]
+        assert page_text_index(page) is old
+
+    def test_rebuilt_when_blocks_appended(self):
+        page = _page(["Jean", "Dupont"])
+        old = page_text_index(page)
+        page.text_blocks.append(TextBlock(text="Paris", bbox=BBox(x0=200, y0=50, x1=230, y1=62)))
+        page.full_text += " Paris"
+        index = page_text_index(page)
+        assert index is not old
+        assert index.block_offsets[-1][:2] == (12, 17)
+
+    def test_rebuilt_after_in_place_bbox_edit(self):
+        page = _page(["Jean", "Dupont"])
+        old = page_text_index(page)
+        assert len(old.lines) == 1
+        page.text_blocks[1].bbox.y0, page.text_blocks[1].bbox.y1 = 300, 312
+        index = page_text_index(page)
+        assert index is not old
+        assert [[b.text for b in line] for line in index.lines] == [["Jean"], ["Dupont"]]
+
+    def test_shares_staleness_rule_with_layout(self):
+        page = _page(["Jean", "Dupont"])
+        assert page_text_index(page).fingerprint == layout_fingerprint(page)
+        page.text_blocks[0].text = "Joan"
+        assert page_text_index(page).fingerprint == layout_fingerprint(page)
+
+    def test_not_serialised(self):
+        page = _page(["Jean"])
+        page_text_index(page)
+        dumped = page.model_dump()
+        assert "_text_index" not in dumped
+        assert PageData.model_validate(dumped)._text_index is None
+
+
+def _jittered_page(rng: random.Random) -> PageData:
+    """Two columns of lines with uneven baselines and font sizes."""
+    blocks = []
+    for line in range(rng.randint(1, 12)):
+        for col_x in (40.0, 330.0):
+            x = col_x
+            for _ in range(rng.randint(0, 6)):
+                w = rng.choice(["Jean", "Dupont", "12", "rue", "Zoë", "Montréal"])
+                h = rng.choice([8.0, 10.0, 14.0])
+                y = 40 + 16 * line + rng.uniform(-3, 3)
+                blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=y, x1=x + 6 * len(w), y1=y + h)))
+                x += 6 * len(w) + rng.choice([4, 4, 4, 60])
+    full_text = _build_full_text(blocks)
+    return PageData(
+        page_number=1, width=612, height=792, bitmap_path="",
+        text_blocks=blocks, full_text=full_text,
+    )
+
+
+class TestPageGeometry:
+    def test_matches_per_call_functions(self):
+        rng = random.Random(11)
+        for _ in range(60):
+            page = _jittered_page(rng)
+            offsets = _compute_block_offsets(page.text_blocks, page.full_text)
+            geometry = PageGeometry(offsets)
+            n = len(page.full_text)
+            spans = []
+            for _ in range(40):
+                start = rng.randint(0, n + 5)
+                spans.append((start, start + rng.randint(0, 80)))
+            for start, end in spans:
+                assert geometry.line_bboxes(start, end) == _char_offsets_to_line_bboxes(start, end, offsets)
+                assert geometry.bbox(start, end) == _char_offset_to_bbox(start, end, offsets)
+            assert geometry.line_bboxes_many(spans) == [
+                _char_offsets_to_line_bboxes(s, e, offsets) for s, e in spans
+            ]
+
+    def test_matches_with_stacked_and_aligned_blocks(self):
+        """Blocks sharing x0 or overlapping vertically take the full
+        clustering path; results must still be identical."""
+        rng = random.Random(5)
+        for _ in range(200):
+            blocks = []
+            for _ in range(rng.randint(1, 30)):
+                x = rng.choice([10.0, 20.0, 30.0, 100.0])
+                y = rng.choice([10.0, 12.0, 15.0, 30.0, 31.0])
+                blocks.append(TextBlock(
+                    text=rng.choice(["a", "bb", "ccc"]),
+                    bbox=BBox(x0=x, y0=y, x1=x + rng.choice([5, 50]), y1=y + rng.choice([4.0, 8.0, 12.0])),
+                ))
+            full_text = _build_full_text(blocks)
+            offsets = _compute_block_offsets(blocks, full_text)
+            geometry = PageGeometry(offsets)
+            for _ in range(30):
+                start = rng.randint(0, len(full_text))
+                end = start + rng.randint(0, len(full_text))
+                assert geometry.line_bboxes(start, end) == _char_offsets_to_line_bboxes(start, end, offsets)
+
+    def test_results_are_fresh_objects(self):
+        page = _page(["Jean", "Dupont"])
+        geometry = page_text_index(page).geometry
+        first = geometry.line_bboxes(0, 4)
+        first[0].x0 = -1
+        assert geometry.line_bboxes(0, 4)[0].x0 == 50
+
+    def test_empty_page(self):
+        geometry = PageGeometry([])
+        assert geometry.line_bboxes(0, 5) == []
+        assert geometry.bbox(0, 5) is None
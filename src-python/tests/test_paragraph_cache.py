@@ -0,0 +1,255 @@
+"""Tests for the persistent cross-document paragraph cache."""
+
+from __future__ import annotations
+
+import os
+import stat
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from core.config import DetectionSettings
+from core.detection.ner_types import NERMatch
+from core.detection.paragraph_cache import ParagraphCache, settings_fingerprint
+from core.detection.pipeline import detect_pii_on_page
+from models.schemas import PIIType
+from tests.helpers import make_page
+
+_PARAGRAPH = (
+    "This engagement letter confirms that Marlowe Pendry will act as the "
+    "responsible partner for all services described below."
+)
+
+
+def _paragraph_match(text: str) -> NERMatch:
+    start = text.index("Marlowe Pendry")
+    return NERMatch(start, start + 14, "Marlowe Pendry", PIIType.PERSON, 0.85)
+
+
+class TestParagraphCache:
+    def test_hit_remaps_spans_and_counts(self, tmp_path):
+        cache = ParagraphCache(tmp_path / "cache.json")
+        first = f"Dear client,\n{_PARAGRAPH}"
+        cache.store(first, "fp", {"ner": [_paragraph_match(first)]})
+
+        second = f"{_PARAGRAPH}\nKind regards"
+        hits, matches = cache.lookup(second, "fp")
+        assert len(hits) == 1
+        (m,) = matches["ner"]
+        assert second[m.start:m.end] == "Marlowe Pendry"
+        assert cache.stats()["hits"] == 1
+
+        assert cache.lookup(second, "other-settings") == ([], {})
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_short_and_skipped_paragraphs_are_ignored(self, tmp_path):
+        cache = ParagraphCache(tmp_path / "cache.json")
+        cache.store(f"short line\n{_PARAGRAPH}", "fp", {"ner": []})
+        assert cache.stats()["entries"] == 1
+        assert cache.lookup(_PARAGRAPH, "fp", skip=[0]) == ([], {})
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ParagraphCache(tmp_path / "cache.json", max_entries=2)
+        paragraphs = [f"{_PARAGRAPH} Variant {i}." for i in range(3)]
+        cache.store(paragraphs[0], "fp", {"ner": []})
+        cache.store(paragraphs[1], "fp", {"ner": []})
+        cache.lookup(paragraphs[0], "fp")          # refresh 0 → 1 is now oldest
+        cache.store(paragraphs[2], "fp", {"ner": []})
+
+        assert cache.stats()["evictions"] == 1
+        assert cache.lookup(paragraphs[1], "fp")[0] == []
+        assert len(cache.lookup(paragraphs[0], "fp")[0]) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = ParagraphCache(path)
+        cache.store(_PARAGRAPH, "fp", {"ner": [_paragraph_match(_PARAGRAPH)]})
+        cache.save()
+
+        reloaded = ParagraphCache(path)
+        _hits, matches = reloaded.lookup(_PARAGRAPH, "fp")
+        (m,) = matches["ner"]
+        assert isinstance(m, NERMatch)
+        assert m.pii_type == PIIType.PERSON
+        assert m.text == "Marlowe Pendry"
+
+    def test_clear(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = ParagraphCache(path)
+        cache.store(_PARAGRAPH, "fp", {"ner": []})
+        cache.clear()
+        assert cache.stats()["entries"] == 0
+        assert ParagraphCache(path).lookup(_PARAGRAPH, "fp") == ([], {})
+
+    def test_file_holds_no_plain_paragraph_digest(self, tmp_path):
+        from core.detection.fingerprint import iter_lines
+
+        path = tmp_path / "cache.json"
+        cache = ParagraphCache(path)
+        cache.store(_PARAGRAPH, "fp", {"ner": [_paragraph_match(_PARAGRAPH)]})
+        cache.save()
+        (line,) = iter_lines(_PARAGRAPH)
+        content = path.read_text(encoding="utf-8")
+        assert line.key.hex() not in content
+        assert "Marlowe" not in content
+        key_path = tmp_path / "cache.key"
+        assert len(key_path.read_bytes()) == 32
+        if os.name == "posix":
+            assert stat.S_IMODE(key_path.stat().st_mode) == 0o600
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_entries_unusable_with_another_key(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = ParagraphCache(path)
+        cache.store(_PARAGRAPH, "fp", {"ner": []})
+        cache.save()
+        assert len(ParagraphCache(path).lookup(_PARAGRAPH, "fp")[0]) == 1
+
+        (tmp_path / "cache.key").unlink()
+        other = ParagraphCache(path)
+        assert other.lookup(_PARAGRAPH, "fp") == ([], {})
+        assert other.stats()["entries"] == 0
+        # The stale entries are dropped from disk on the next save.
+        other.save()
+        assert '"entries": []' in path.read_text(encoding="utf-8")
+
+    def test_clear_rotates_key(self, tmp_path):
+        path = tmp_path / "cache.json"
+        cache = ParagraphCache(path)
+        cache.store(_PARAGRAPH, "fp", {"ner": []})
+        old_key = (tmp_path / "cache.key").read_bytes()
+        cache.clear()
+        assert (tmp_path / "cache.key").read_bytes() != old_key
+
+    def test_settings_fingerprint(self):
+        a = DetectionSettings(ner_backend="spacy")
+        b = DetectionSettings(ner_backend="dslim/bert-base-NER")
+        assert settings_fingerprint(a) != settings_fingerprint(b)
+        # Post-layer filters don't invalidate cached spans.
+        c = DetectionSettings(ner_backend="spacy", confidence_threshold=0.9, ner_types=("PERSON",))
+        assert settings_fingerprint(a) == settings_fingerprint(c)
+
+    def test_settings_fingerprint_covers_language_and_models(self):
+        s = DetectionSettings(ner_backend="auto")
+        base = settings_fingerprint(s, "en", ["bert:dslim/bert-base-NER", "spacy:en_core_web_lg"])
+        assert base == settings_fingerprint(s, "en", ("bert:dslim/bert-base-NER", "spacy:en_core_web_lg"))
+        assert base != settings_fingerprint(s, "fr", ["bert:dslim/bert-base-NER", "spacy:en_core_web_lg"])
+        assert base != settings_fingerprint(s, "en", ["bert:dslim/bert-base-NER", "spacy:en_core_web_sm"])
+        assert base != settings_fingerprint(s, "en", ["bert:Davlan/bert-base-multilingual-cased-ner-hrl"])
+
+
+class TestParagraphCacheInPipeline:
+    def test_second_document_skips_ner_on_cached_paragraph(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "core.detection.pipeline.paragraph_cache", ParagraphCache(tmp_path / "cache.json"),
+        )
+        settings = DetectionSettings.from_config(
+            paragraph_cache_enabled=True, llm_detection_enabled=False,
+        )
+        doc1 = make_page([_PARAGRAPH, "", "Invoice for the first client follows."])
+        doc2 = make_page([_PARAGRAPH, "", "A different client gets this closing."])
+        seen: list[str] = []
+
+        def _heuristic(text):
+            seen.append(text)
+            return [_paragraph_match(text)] if "Marlowe Pendry" in text else []
+
+        with patch("core.detection.pipeline.is_ner_available", return_value=False), \
+             patch("core.detection.pipeline.is_bert_ner_available", return_value=False), \
+             patch("core.detection.pipeline.is_gliner_available", return_value=False), \
+             patch("core.detection.pipeline.detect_names_heuristic", side_effect=_heuristic):
+            r1 = detect_pii_on_page(doc1, settings=settings)
+            r2 = detect_pii_on_page(doc2, settings=settings)
+
+        assert "Marlowe Pendry" in seen[0]
+        assert "Marlowe Pendry" not in seen[1]
+        assert "different client" in seen[1]
+        assert any(r.text == "Marlowe Pendry" for r in r1)
+        assert any(r.text == "Marlowe Pendry" for r in r2)
+
+    def test_language_or_model_change_misses(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            "core.detection.pipeline.paragraph_cache", ParagraphCache(tmp_path / "cache.json"),
+        )
+        doc = make_page([_PARAGRAPH, "", "Invoice for the first client follows."])
+        seen: list[str] = []
+
+        def _heuristic(text):
+            seen.append(text)
+            return [_paragraph_match(text)] if "Marlowe Pendry" in text else []
+
+        def _run(language: str, spacy_model: str) -> None:
+            settings = DetectionSettings.from_config(
+                paragraph_cache_enabled=True, llm_detection_enabled=False,
+                ner_backend="spacy", detection_language=language,
+            )
+            with patch("core.detection.pipeline.is_ner_available", return_value=True), \
+                 patch("core.detection.pipeline.get_active_model_names", return_value={"en": spacy_model}), \
+                 patch("core.detection.pipeline.detect_ner", return_value=[]), \
+                 patch("core.detection.pipeline.is_bert_ner_available", return_value=False), \
+                 patch("core.detection.pipeline.is_gliner_available", return_value=False), \
+                 patch("core.detection.pipeline.detect_names_heuristic", side_effect=_heuristic):
+                detect_pii_on_page(doc, settings=settings)
+
+        _run("en", "en_core_web_lg")
+        _run("en", "en_core_web_lg")
+        _run("fr", "en_core_web_lg")
+        _run("en", "en_core_web_sm")
+        assert ["Marlowe Pendry" in text for text in seen] == [True, False, True, True]
+
+
+class TestNERModelIds:
+    def test_auto_backend_uses_resolved_bert_model(self):
+        from core.detection.pipeline import _ner_model_ids
+
+        settings = DetectionSettings(ner_backend="auto")
+        with patch("core.detection.pipeline.is_bert_ner_available", return_value=True), \
+             patch("core.detection.pipeline.resolve_auto_model", return_value=("some/model", "en")), \
+             patch("core.detection.pipeline.is_ner_available", return_value=True), \
+             patch("core.detection.pipeline.get_active_model_names", return_value={"en": "en_core_web_lg"}), \
+             patch("core.detection.pipeline.is_gliner_available", return_value=True):
+            ids = _ner_model_ids(_PARAGRAPH, settings)
+        assert ids == ["bert:some/model", "spacy:en_core_web_lg", "gliner:urchade/gliner_multi_pii-v1"]
+
+    def test_explicit_backend_and_spacy_only(self):
+        from core.detection.pipeline import _ner_model_ids
+
+        with patch("core.detection.pipeline.is_bert_ner_available", return_value=True), \
+             patch("core.detection.pipeline.is_ner_available", return_value=False), \
+             patch("core.detection.pipeline.is_gliner_available", return_value=False):
+            assert _ner_model_ids(_PARAGRAPH, DetectionSettings(ner_backend="dslim/bert-base-NER")) == [
+                "bert:dslim/bert-base-NER",
+            ]
+            assert _ner_model_ids(_PARAGRAPH, DetectionSettings(ner_backend="spacy")) == []
+
+
+@pytest_asyncio.fixture
+async def client():
+    from api.server import app
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"X-Requested-With": "XMLHttpRequest"},
+    ) as ac:
+        yield ac
+
+
+class TestDetectionCacheEndpoints:
+    @pytest.mark.asyncio
+    async def test_stats_and_clear(self, client, tmp_path, monkeypatch):
+        cache = ParagraphCache(tmp_path / "cache.json")
+        cache.store(_PARAGRAPH, "fp", {"ner": []})
+        monkeypatch.setattr("core.detection.paragraph_cache.paragraph_cache", cache)
+
+        resp = await client.get("/api/settings/detection-cache")
+        assert resp.status_code == 200
+        assert resp.json()["entries"] == 1
+
+        resp = await client.delete("/api/settings/detection-cache")
+        assert resp.status_code == 200
+        assert cache.stats()["entries"] == 0
@@ -284,6 +284,25 @@ class TestPartialOrgPropagation:
                 assert r.pii_type == PIIType.ORG
 
 
+    def test_many_orgs_attributed_to_their_source(self):
+        """With hundreds of sub-phrases (one shared automaton), each hit takes
+        the confidence of the ORG it came from, longest sub-phrase first."""
+        names = [f"Zorvex Kalmora Trading{n} Holdings" for n in range(120)]
+        text = ", ".join(names)
+        page = _make_page(text)
+        regions = [
+            _make_region(name, char_start=text.find(name), confidence=0.5 + n / 400)
+            for n, name in enumerate(names)
+        ]
+        page2 = _make_page("Zorvex Kalmora Trading7 met us\nso did Kalmora Trading42", page_number=2)
+        result = propagate_partial_org_names(regions, [page, page2])
+        new = sorted((r.char_start, r.text, r.confidence) for r in result if r.page_number == 2)
+        assert new == [
+            (0, "Zorvex Kalmora Trading7", round((0.5 + 7 / 400) * 0.85, 4)),
+            (38, "Kalmora Trading42", round((0.5 + 42 / 400) * 0.85, 4)),
+        ]
+
+
 class TestSingleWordOrgSubsetPropagation:
     """Single-word subsets of confirmed ORG names are propagated when they are
     distinctive (not in the common-word dictionary, proper-noun shaped)."""
@@ -0,0 +1,351 @@
+"""Tests for the page-level detection orchestrator in core.detection.pipeline."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from models.schemas import BBox, PIIType
+from core.config import config
+from core.detection.llm_detector import LLMMatch
+from core.detection.ner_types import NERMatch
+from core.detection.pipeline import _run_layers, detect_pii_on_page
+from tests.helpers import SAMPLE_LINES, fake_llm, make_page
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _signature(regions) -> list[tuple]:
+    return sorted(
+        (r.char_start, r.char_end, r.text, r.pii_type.value, r.source.value, round(r.confidence, 6))
+        for r in regions
+    )
+
+
+# ---------------------------------------------------------------------------
+# _run_layers
+# ---------------------------------------------------------------------------
+
+class TestRunLayers:
+    def test_sequential_returns_all_results(self):
+        order: list[str] = []
+
+        def job(name):
+            def _fn():
+                order.append(name)
+                return name.upper()
+            return _fn
+
+        jobs = [("a", job("a")), ("b", job("b")), ("c", job("c"))]
+        assert _run_layers(jobs, parallel=False) == {"a": "A", "b": "B", "c": "C"}
+        assert order == ["a", "b", "c"]
+
+    def test_parallel_runs_layers_concurrently(self):
+        # Every job waits on the same barrier — this can only complete if
+        # all three run at the same time.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def job(value):
+            def _fn():
+                barrier.wait()
+                return value
+            return _fn
+
+        jobs = [("regex", job(1)), ("ner", job(2)), ("llm", job(3))]
+        assert _run_layers(jobs, parallel=True) == {"regex": 1, "ner": 2, "llm": 3}
+
+    def test_parallel_propagates_exceptions(self):
+        def boom():
+            raise RuntimeError("layer failed")
+
+        jobs = [("regex", lambda: []), ("llm", boom)]
+        with pytest.raises(RuntimeError, match="layer failed"):
+            _run_layers(jobs, parallel=True)
+
+    def test_empty_jobs(self):
+        assert _run_layers([], parallel=True) == {}
+
+
+# ---------------------------------------------------------------------------
+# detect_pii_on_page(parallel_layers=...)
+# ---------------------------------------------------------------------------
+
+class TestParallelLayers:
+    @pytest.fixture(autouse=True)
+    def _llm_enabled(self, monkeypatch):
+        monkeypatch.setattr(config, "llm_detection_enabled", True)
+        monkeypatch.setattr(config, "regex_enabled", True)
+        monkeypatch.setattr(config, "ner_enabled", True)
+
+    def test_parallel_matches_sequential(self):
+        page = make_page(SAMPLE_LINES)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            seq = detect_pii_on_page(page, llm_engine=object(), parallel_layers=False)
+            par = detect_pii_on_page(page, llm_engine=object(), parallel_layers=True)
+        assert _signature(par) == _signature(seq)
+        assert any(r.text == "Acme Corporation" for r in par)
+
+    def test_parallel_reports_every_step(self):
+        page = make_page(SAMPLE_LINES)
+        steps: list[str] = []
+        lock = threading.Lock()
+
+        def _cb(step):
+            with lock:
+                steps.append(step)
+
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            detect_pii_on_page(
+                page, llm_engine=object(), parallel_layers=True, progress_callback=_cb,
+            )
+        assert {"regex", "ner", "llm"} <= set(steps)
+        assert steps[-1] == "merge"
+
+    def test_parallel_keeps_per_layer_timings(self, caplog):
+        page = make_page(SAMPLE_LINES)
+        with caplog.at_level(logging.INFO, logger="core.detection.pipeline"), \
+             patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            detect_pii_on_page(page, llm_engine=object(), parallel_layers=True)
+        summary = [r.getMessage() for r in caplog.records if "merged PII regions" in r.getMessage()]
+        assert summary
+        for key in ("regex=", "ner=", "heuristic=", "llm=", "layers_wall=", "merge="):
+            assert key in summary[-1]
+
+    def test_noise_cache_hit_rate_in_timings(self, caplog):
+        from core.detection.noise_filters import noise_verdict_cache
+        noise_verdict_cache.clear()
+        page = make_page(SAMPLE_LINES)
+        with caplog.at_level(logging.INFO, logger="core.detection.pipeline"):
+            detect_pii_on_page(page)
+            detect_pii_on_page(page)
+        summary = [r.getMessage() for r in caplog.records if "merged PII regions" in r.getMessage()]
+        assert "noise_cache_hit_pct=100%" in summary[-1]
+
+
+# ---------------------------------------------------------------------------
+# Cascade mode
+# ---------------------------------------------------------------------------
+
+class TestCascadeScore:
+    def test_no_matches_plain_text_is_settled(self):
+        from core.detection.cascade import score_page_uncertainty
+        text = "the quick brown fox jumps over the lazy dog. nothing to see here."
+        assert score_page_uncertainty(text, []).score == 0.0
+
+    def test_unmatched_label_value_escalates(self):
+        from core.detection.cascade import score_page_uncertainty
+        text = "Patient: zorblax quentin\nvisit on tuesday"
+        result = score_page_uncertainty(text, [])
+        assert result.unresolved_labels == 1.0
+        assert result.score == 1.0
+
+    def test_matched_label_value_is_settled(self):
+        from core.detection.cascade import score_page_uncertainty
+        text = "Patient: zorblax quentin\nvisit on tuesday"
+        start = text.index("zorblax")
+        m = LLMMatch(start, start + len("zorblax quentin"), "zorblax quentin", PIIType.PERSON, 0.95)
+        assert score_page_uncertainty(text, [m]).unresolved_labels == 0.0
+
+    def test_leading_function_word_is_ignored(self):
+        from core.detection.cascade import score_page_uncertainty
+        assert score_page_uncertainty("The Agreement is binding.", []).unresolved_caps == 0.0
+        assert score_page_uncertainty("We met Quentin Zorblax.", []).unresolved_caps > 0.0
+
+    def test_low_confidence_share(self):
+        from core.detection.cascade import score_page_uncertainty
+        text = "x" * 40
+        ms = [
+            LLMMatch(0, 5, "xxxxx", PIIType.PERSON, 0.4),
+            LLMMatch(10, 15, "xxxxx", PIIType.PERSON, 0.95),
+        ]
+        assert score_page_uncertainty(text, ms).low_confidence == pytest.approx(0.5)
+
+
+class TestCascadeMode:
+    @pytest.fixture(autouse=True)
+    def _llm_enabled(self, monkeypatch):
+        monkeypatch.setattr(config, "llm_detection_enabled", True)
+        monkeypatch.setattr(config, "regex_enabled", True)
+        monkeypatch.setattr(config, "ner_enabled", True)
+        monkeypatch.setattr(config, "cascade_threshold", 0.5)
+
+    def test_settled_page_skips_llm(self, caplog):
+        page = make_page([
+            "reach us at info@example.com or call 555-123-4567 for details.",
+            "our office hours are nine to five on working days only.",
+        ])
+        with caplog.at_level(logging.INFO, logger="core.detection.pipeline"), \
+             patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm:
+            regions = detect_pii_on_page(page, llm_engine=object(), cascade=True)
+        assert llm.call_count == 0
+        assert any(r.pii_type == PIIType.EMAIL for r in regions)
+        summary = [r.getMessage() for r in caplog.records if "merged PII regions" in r.getMessage()]
+        assert "cascade_skip_pct=100%" in summary[-1]
+
+    def test_uncertain_page_escalates_to_llm(self, caplog):
+        page = make_page([
+            "the board thanked Velmora Tessik, Ombrin Vask and Halder Quist warmly.",
+            "reach us at info@example.com for any further details.",
+        ])
+        with caplog.at_level(logging.INFO, logger="core.detection.pipeline"), \
+             patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm:
+            detect_pii_on_page(page, llm_engine=object(), cascade=True)
+        assert llm.call_count == 1
+        summary = [r.getMessage() for r in caplog.records if "merged PII regions" in r.getMessage()]
+        assert "cascade_skip_pct=0%" in summary[-1]
+
+    def test_document_skip_ratio(self):
+        from core.detection.cascade import CascadeStats
+
+        settled = make_page([
+            "reach us at info@example.com or call 555-123-4567 for details.",
+            "our office hours are nine to five on working days only.",
+        ])
+        uncertain = make_page([
+            "the board thanked Velmora Tessik, Ombrin Vask and Halder Quist warmly.",
+            "reach us at info@example.com for any further details.",
+        ], page_number=2)
+        stats = CascadeStats()
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            for page in (settled, settled, uncertain, settled):
+                detect_pii_on_page(page, llm_engine=object(), cascade=True, cascade_stats=stats)
+        assert stats.stats() == {"pages_scored": 4, "pages_skipped": 3, "skip_pct": 75.0}
+
+    def test_escalation_runs_only_the_bert_model(self, monkeypatch):
+        """The escalated BERT job reuses the first stage's heuristic and
+        multilingual matches instead of running them again."""
+        from core.detection import pipeline
+
+        page = make_page([
+            "the board thanked Velmora Tessik, Ombrin Vask and Halder Quist warmly.",
+            "reach us at info@example.com for any further details.",
+        ])
+        text = page.full_text
+        vs = text.find("Velmora Tessik")
+        hq = text.find("Halder Quist")
+        heuristic_calls: list[str] = []
+
+        def _heuristic(t):
+            heuristic_calls.append(t)
+            return [
+                NERMatch(vs, vs + 14, "Velmora Tessik", PIIType.PERSON, 0.6),
+                NERMatch(hq, hq + 12, "Halder Quist", PIIType.PERSON, 0.6),
+            ]
+
+        monkeypatch.setattr(config, "ner_backend", "dslim/bert-base-NER")
+        monkeypatch.setattr(pipeline, "is_bert_ner_available", lambda: True)
+        monkeypatch.setattr(pipeline, "detect_names_heuristic", _heuristic)
+        bert = [(vs, vs + 14, "Velmora Tessik", PIIType.PERSON, 0.95)]
+        with patch("core.detection.pipeline.detect_bert_ner", return_value=bert) as bert_call, \
+             patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            regions = detect_pii_on_page(page, llm_engine=object(), cascade=True)
+
+        assert bert_call.call_count == 1
+        assert len(heuristic_calls) == 1
+        people = {r.text: r.confidence for r in regions if r.pii_type == PIIType.PERSON}
+        # BERT's span wins where they overlap; the heuristic fills the rest.
+        assert "Velmora Tessik" in people and "Halder Quist" in people
+
+    def test_cascade_off_always_runs_llm(self):
+        page = make_page([
+            "reach us at info@example.com or call 555-123-4567 for details.",
+            "our office hours are nine to five on working days only.",
+        ])
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm:
+            detect_pii_on_page(page, llm_engine=object(), cascade=False)
+        assert llm.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# DetectionSettings snapshots
+# ---------------------------------------------------------------------------
+
+class TestDetectionSettings:
+    def test_snapshot_is_immutable(self):
+        from pydantic import ValidationError
+        from core.config import DetectionSettings
+
+        s = DetectionSettings.from_config(regex_types=["EMAIL"])
+        assert s.regex_types == ("EMAIL",)
+        with pytest.raises(ValidationError):
+            s.regex_enabled = False
+
+    def test_unknown_override_rejected(self):
+        from pydantic import ValidationError
+        from core.config import DetectionSettings
+
+        with pytest.raises(ValidationError):
+            DetectionSettings.from_config(not_a_setting=True)
+
+    def test_snapshot_overrides_do_not_touch_config(self, monkeypatch):
+        from core.config import DetectionSettings
+
+        monkeypatch.setattr(config, "confidence_threshold", 0.55)
+        s = DetectionSettings.from_config(confidence_threshold=0.99)
+        assert s.confidence_threshold == 0.99
+        assert config.confidence_threshold == 0.55
+
+    def test_concurrent_runs_with_different_settings(self, monkeypatch):
+        """Concurrent pages with different snapshots never see each other's settings."""
+        from concurrent.futures import ThreadPoolExecutor
+        from core.config import DetectionSettings
+
+        monkeypatch.setattr(config, "llm_detection_enabled", False)
+        page = make_page(SAMPLE_LINES)
+        variants = {
+            "default": DetectionSettings.from_config(),
+            "strict": DetectionSettings.from_config(confidence_threshold=0.99),
+            "no_regex": DetectionSettings.from_config(regex_enabled=False),
+            "email_only": DetectionSettings.from_config(regex_types=["EMAIL"], ner_enabled=False),
+        }
+        expected = {
+            name: _signature(detect_pii_on_page(page, settings=s))
+            for name, s in variants.items()
+        }
+        # The variants must actually differ for the test to mean anything.
+        assert len({tuple(v) for v in expected.values()}) == len(variants)
+
+        jobs = [name for name in variants for _ in range(6)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda name: (name, _signature(detect_pii_on_page(page, settings=variants[name]))),
+                jobs,
+            ))
+        for name, sig in results:
+            assert sig == expected[name], name
+
+    def test_bert_model_follows_snapshot_backend(self, monkeypatch):
+        """A redetect overriding ner_backend loads that BERT model, not the
+        one in the global config."""
+        from core.config import DetectionSettings
+        from core.detection import bert_detector, pipeline
+
+        loaded: list[str | None] = []
+
+        def fake_load(model_id=None, ner_backend=None):
+            loaded.append(model_id if model_id not in (None, "auto") else ner_backend)
+            return object()
+
+        monkeypatch.setattr(config, "ner_backend", "spacy")
+        monkeypatch.setattr(pipeline, "is_bert_ner_available", lambda: True)
+        monkeypatch.setattr(bert_detector, "_load_pipeline", fake_load)
+        monkeypatch.setattr(bert_detector, "_process_chunk", lambda pipe, text, global_offset: [])
+
+        settings = DetectionSettings.from_config(ner_backend="dslim/bert-base-NER", llm_detection_enabled=False)
+        page = make_page(SAMPLE_LINES)
+        pipeline.reanalyze_bbox(page, BBox(x0=0, y0=0, x1=612, y1=792), settings=settings)
+        assert loaded and set(loaded) == {"dslim/bert-base-NER"}
+
+    def test_load_pipeline_reads_backend_argument(self, monkeypatch):
+        from core.detection import bert_detector
+
+        sentinel = object()
+        monkeypatch.setattr(config, "ner_backend", "auto")
+        monkeypatch.setattr(bert_detector, "_pipeline", sentinel)
+        monkeypatch.setattr(bert_detector, "_active_model_id", "dslim/bert-base-NER")
+        assert bert_detector._load_pipeline(ner_backend="dslim/bert-base-NER") is sentinel
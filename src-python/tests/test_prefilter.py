@@ -0,0 +1,161 @@
+"""Tests for the PII-likelihood page prefilter."""
+
+from __future__ import annotations
+
+import ast
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.config import DetectionSettings, config
+from core.detection.pipeline import detect_pii_on_page
+from core.detection.prefilter import PageLikelihood, score_pii_likelihood
+from core.detection.regex_detector import detect_regex
+from tests.helpers import SAMPLE_LINES, fake_llm, make_page
+
+
+_THRESHOLD = DetectionSettings().prefilter_threshold
+
+# Suites whose detector inputs make up the recall corpus.
+_CORPUS_SUITES = (
+    "test_accent_propagation", "test_cross_line", "test_german_compound",
+    "test_italian", "test_merge", "test_ner_detector", "test_noise_filters",
+    "test_partial_org_propagation", "test_pipeline", "test_regex_bulletproof",
+    "test_regex_detector",
+)
+# Test names marking inputs expected to hold no PII.
+_NEGATIVE_TEST_RE = re.compile(
+    r"no_|not_|empty|clean|exclu|false_pos|invalid|dropped|reject|ignor"
+    r"|skip|filter|noise|boilerplate|too_short|short_text|none_engine"
+)
+
+
+def _literal_text(node: ast.AST) -> str | None:
+    """A string literal, or a list of them joined as lines."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.List) and node.elts and all(
+        isinstance(e, ast.Constant) and isinstance(e.value, str) for e in node.elts
+    ):
+        return "\n".join(e.value for e in node.elts)
+    return None
+
+
+def _suite_corpus() -> list[str]:
+    """Texts the existing suites feed to detectors and page builders.
+
+    Read from the suites' source, so the corpus follows them as they
+    change.  Inputs of tests named as negative cases are left out.
+    """
+    texts: dict[str, None] = {}
+    for suite in _CORPUS_SUITES:
+        tree = ast.parse((Path(__file__).parent / f"{suite}.py").read_text(encoding="utf-8"))
+        for fn in ast.walk(tree):
+            if not isinstance(fn, ast.FunctionDef) or not fn.name.startswith("test"):
+                continue
+            if _NEGATIVE_TEST_RE.search(fn.name):
+                continue
+            for node in ast.walk(fn):
+                text = None
+                if isinstance(node, ast.Call) and node.args:
+                    name = getattr(node.func, "id", None) or getattr(node.func, "attr", "")
+                    if name.lstrip("_").startswith(("detect", "make_page")):
+                        text = _literal_text(node.args[0])
+                elif isinstance(node, ast.Assign) and getattr(node.targets[0], "id", "") == "text":
+                    text = _literal_text(node.value)
+                if text and text.strip():
+                    texts[text] = None
+    return list(texts)
+
+
+_PII_CORPUS = _suite_corpus()
+
+_BOILERPLATE = [
+    "",
+    "   \n\n   ",
+    "— — — — — — — — — — — — — — — — — — — —",
+    "* * *\n\n* * *",
+    "Table of figures\nFigure 1 .......... 3\nFigure 2 .......... 5\nFigure 3 .......... 9",
+    "this page intentionally left blank.",
+    "1. definitions and interpretation. in this agreement, unless the context "
+    "otherwise requires, words importing the singular include the plural.",
+    "This Agreement shall be governed by the laws applicable to the Parties. "
+    "Each Party shall bear its own costs under this Agreement.",
+]
+
+
+def _span_key(regions):
+    return sorted((r.char_start, r.char_end, r.pii_type.value) for r in regions)
+
+
+class TestScorePIILikelihood:
+    def test_corpus_is_collected(self):
+        assert len(_PII_CORPUS) > 100
+        assert "Barack Obama visited Paris last Tuesday." in _PII_CORPUS
+        assert "Nome: Giovanni Rossi" in _PII_CORPUS
+
+    @pytest.mark.parametrize("text", _PII_CORPUS)
+    def test_recall_safety_over_test_corpora(self, text):
+        hits = len(detect_regex(text))
+        assert score_pii_likelihood(text, hits).score >= _THRESHOLD, text
+
+    @pytest.mark.parametrize("text", _BOILERPLATE)
+    def test_boilerplate_is_skipped(self, text):
+        hits = len(detect_regex(text))
+        assert score_pii_likelihood(text, hits).score < _THRESHOLD, text
+
+    def test_regex_hit_alone_keeps_page(self):
+        assert score_pii_likelihood("nothing capitalised here at all", 1).score == 1.0
+
+    def test_statistics(self):
+        r = score_pii_likelihood("call Anna at 12345", 0)
+        assert r.cap_tokens == 1
+        assert r.id_like_numbers == 1
+        assert 0 < r.digit_density < 1
+        assert 0 < r.alpha_ratio < 1
+
+    def test_sentence_initial_caps_ignored(self):
+        assert score_pii_likelihood("Hello there. Another line.\nStart here", 0).cap_tokens == 0
+
+
+class TestPrefilterInPipeline:
+    @pytest.fixture(autouse=True)
+    def _layers(self, monkeypatch):
+        monkeypatch.setattr(config, "llm_detection_enabled", True)
+
+    def test_boilerplate_page_skips_model_layers(self):
+        page = make_page([
+            "1. definitions and interpretation. in this agreement, unless the",
+            "context otherwise requires, words importing the singular include the plural.",
+        ])
+        settings = DetectionSettings.from_config(prefilter_enabled=True)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm, \
+             patch("core.detection.pipeline.detect_names_heuristic", return_value=[]) as heur:
+            assert detect_pii_on_page(page, llm_engine=object(), settings=settings) == []
+        assert llm.call_count == 0
+        assert heur.call_count == 0
+
+    def test_regex_still_runs_on_skipped_page(self):
+        page = make_page([
+            "please write to info@example.com with any further questions about",
+            "the programme or the schedule for the coming weeks of the season.",
+        ])
+        settings = DetectionSettings.from_config(prefilter_enabled=True)
+        # Force a skip: a regex hit would otherwise always keep the page.
+        skip = PageLikelihood(0.0, 1.0, 0, 0.0, 0, 1)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm) as llm, \
+             patch("core.detection.pipeline.score_pii_likelihood", return_value=skip):
+            regions = detect_pii_on_page(page, llm_engine=object(), settings=settings)
+        assert llm.call_count == 0
+        assert any(r.text == "info@example.com" for r in regions)
+
+    def test_pii_page_matches_unfiltered_run(self):
+        page = make_page(SAMPLE_LINES)
+        on = DetectionSettings.from_config(prefilter_enabled=True)
+        off = DetectionSettings.from_config(prefilter_enabled=False)
+        with patch("core.detection.pipeline.detect_llm", side_effect=fake_llm):
+            filtered = detect_pii_on_page(page, llm_engine=object(), settings=on)
+            unfiltered = detect_pii_on_page(page, llm_engine=object(), settings=off)
+        assert _span_key(filtered) == _span_key(unfiltered)
@@ -0,0 +1,118 @@
+"""Tests for core.detection.region_index and the containment dedup built on it."""
+
+from __future__ import annotations
+
+import random
+
+from core.detection.propagation import _drop_contained_regions
+from core.detection.region_index import RegionIndex
+from models.schemas import BBox, DetectionSource, PIIRegion, PIIType
+
+
+def _random_intervals(rng: random.Random, n: int) -> list[tuple[int, int]]:
+    out = []
+    for _ in range(n):
+        start = rng.randrange(200)
+        out.append((start, start + rng.choice([0, 1, 3, 8, 20, 90])))
+    return out
+
+
+class TestRegionIndex:
+    def test_empty(self):
+        index = RegionIndex()
+        assert len(index) == 0
+        assert list(index.overlapping(0, 10)) == []
+        assert list(index.containing(0, 10)) == []
+
+    def test_closed_intervals(self):
+        index = RegionIndex()
+        index.add(10, 20, "a")
+        assert list(index.overlapping(20, 30)) == ["a"]
+        assert list(index.overlapping(0, 10)) == ["a"]
+        assert list(index.overlapping(21, 30)) == []
+        assert list(index.containing(10, 20)) == ["a"]
+        assert list(index.containing(9, 20)) == []
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            spans = _random_intervals(rng, 60)
+            index = RegionIndex()
+            for i, (s, e) in enumerate(spans):
+                index.add(s, e, i)
+            for qs, qe in _random_intervals(rng, 30):
+                assert sorted(index.overlapping(qs, qe)) == [
+                    i for i, (s, e) in enumerate(spans) if s <= qe and e >= qs
+                ]
+                assert sorted(index.containing(qs, qe)) == [
+                    i for i, (s, e) in enumerate(spans) if s <= qs and e >= qe
+                ]
+                assert sorted(index.starting_in(qs, qe)) == [
+                    i for i, (s, _e) in enumerate(spans) if qs <= s <= qe
+                ]
+
+    def test_remove_by_identity(self):
+        index = RegionIndex()
+        a, b = ["a"], ["b"]
+        index.add(5, 9, a)
+        index.add(5, 9, b)
+        assert index.remove(5, 9, b)
+        assert not index.remove(5, 9, b)
+        assert list(index.overlapping(0, 100)) == [a]
+
+
+def _region(page: int, start: int, end: int, pii_type: PIIType, conf: float) -> PIIRegion:
+    return PIIRegion(
+        page_number=page, bbox=BBox(x0=0, y0=0, x1=10, y1=10), text="x" * (end - start),
+        pii_type=pii_type, confidence=conf, source=DetectionSource.NER,
+        char_start=start, char_end=end,
+    )
+
+
+def _quadratic_dedup(regions: list[PIIRegion]) -> list[PIIRegion]:
+    """The pairwise containment dedup the propagation passes used to run."""
+    dominated: set[str] = set()
+    for pn in {r.page_number for r in regions}:
+        regs = sorted(
+            (r for r in regions if r.page_number == pn),
+            key=lambda r: -(r.char_end - r.char_start),
+        )
+        for i, ri in enumerate(regs):
+            for rj in regs[:i]:
+                if rj.id in dominated:
+                    continue
+                if (rj.pii_type == ri.pii_type
+                        and rj.char_start <= ri.char_start
+                        and rj.char_end >= ri.char_end
+                        and rj.confidence >= ri.confidence):
+                    dominated.add(ri.id)
+                    break
+    return [r for r in regions if r.id not in dominated]
+
+
+class TestDropContainedRegions:
+    def test_drops_contained_same_type(self):
+        full = _region(1, 0, 40, PIIType.ORG, 0.9)
+        part = _region(1, 25, 40, PIIType.ORG, 0.8)
+        other_type = _region(1, 25, 40, PIIType.PERSON, 0.8)
+        other_page = _region(2, 25, 40, PIIType.ORG, 0.8)
+        stronger = _region(1, 5, 20, PIIType.ORG, 0.95)
+        kept, dropped = _drop_contained_regions([part, full, other_type, other_page, stronger])
+        assert dropped == 1
+        assert kept == [full, other_type, other_page, stronger]
+
+    def test_matches_pairwise_dedup(self):
+        rng = random.Random(3)
+        types = [PIIType.ORG, PIIType.PERSON]
+        for _ in range(30):
+            regions = []
+            for _ in range(80):
+                start = rng.randrange(300)
+                regions.append(_region(
+                    rng.randint(1, 3), start, start + rng.randint(1, 60),
+                    rng.choice(types), rng.choice([0.5, 0.7, 0.9]),
+                ))
+            kept, dropped = _drop_contained_regions(regions)
+            expected = _quadratic_dedup(regions)
+            assert kept == expected
+            assert dropped == len(regions) - len(expected)
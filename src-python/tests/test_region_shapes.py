@@ -22,7 +22,7 @@ from core.detection.pipeline import (
     _MAX_WORDS_DEFAULT,
     _max_words_for_type,
 )
-from core.config import config
+from core.config import DetectionSettings, config
 
 
 # ---------------------------------------------------------------------------
@@ -317,6 +317,58 @@ class TestEnforceRegionShapes:
         for reg in result:
             assert len(reg.text.split()) <= _MAX_WORDS_DEFAULT
 
+    def test_word_limit_chunks_redetected_in_one_batch(self, monkeypatch):
+        """Chunks of every split region on a page share one NER call."""
+        from core.detection import region_shapes
+        from core.detection.ner_types import NERMatch
+
+        lines = [
+            "alpha beta gamma delta Marlowe Pendry",
+            "one two three four five Quist",
+        ]
+        blocks, offsets_list, regions = [], [], []
+        pos = 0
+        for li, line in enumerate(lines):
+            y = 10 + li * 20
+            x = 10
+            start = pos
+            for w in line.split():
+                bw = len(w) * 6
+                b = _tb(w, x, y, x + bw, y + 10)
+                blocks.append(b)
+                offsets_list.append((pos, pos + len(w), b))
+                x += bw + 4
+                pos += len(w) + 1
+            regions.append(_region(
+                BBox(x0=10, y0=y, x1=x - 4, y1=y + 10), text=line,
+                char_start=start, char_end=pos - 1,
+            ))
+        page = self._make_page_data(blocks, "\n".join(lines))
+
+        calls: list[list[str]] = []
+
+        def _batch(texts):
+            calls.append(list(texts))
+            return [
+                [NERMatch(0, len(t), t, PIIType.PERSON, 0.95)] if "Pendry" in t else []
+                for t in texts
+            ]
+
+        monkeypatch.setattr(region_shapes, "is_ner_available", lambda: True)
+        monkeypatch.setattr(region_shapes, "detect_ner_batch", _batch)
+        settings = DetectionSettings.from_config(
+            ner_enabled=True, regex_enabled=False, confidence_threshold=0.4,
+        )
+        result = _enforce_region_shapes(regions, page, offsets_list, settings=settings)
+
+        assert calls == [[
+            "alpha beta gamma delta", "Marlowe Pendry", "one two three four", "five Quist",
+        ]]
+        assert [r.text for r in result] == [
+            "alpha beta gamma delta", "Marlowe Pendry", "one two three four", "five Quist",
+        ]
+        assert result[1].confidence == 0.95
+
     def test_manual_region_no_blocks(self):
         """Region with no overlapping blocks (manual draw) passes through."""
         page = self._make_page_data([], "")
@@ -0,0 +1,226 @@
+"""Tests for core.llm.remote_engine against an in-process stub of an
+OpenAI-compatible server.
+
+Overlap is made deterministic with a barrier in the stub: the first
+requests wait until enough of them are being handled at once."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.config import config
+from core.detection import llm_detector
+from core.detection.llm_detector import detect_llm
+from core.llm.remote_engine import RemoteLLMEngine
+
+_LATENCY = 0.02
+_WAIT = 5.0
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+        self.keys: list[str] = []
+        self._gate: threading.Barrier | None = None
+        self._gated = 0
+        self.hold: threading.Event | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1"
+
+    def expect_overlap(self, n: int) -> None:
+        """Hold the next *n* requests until all of them have arrived."""
+        with self.lock:
+            self._gate = threading.Barrier(n)
+            self._gated = 0
+
+    def wait_in_flight(self, n: int) -> None:
+        deadline = time.monotonic() + _WAIT
+        while self.in_flight < n:
+            assert time.monotonic() < deadline, f"only {self.in_flight} of {n} requests arrived"
+            time.sleep(0.005)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: _StubServer
+
+    def do_POST(self) -> None:
+        srv = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with srv.lock:
+            srv.in_flight += 1
+            srv.requests += 1
+            srv.peak = max(srv.peak, srv.in_flight)
+            srv.keys.append(self.headers["Authorization"])
+            gate = srv._gate
+            if gate is not None and srv._gated < gate.parties:
+                srv._gated += 1
+            else:
+                gate = None
+        if gate is not None:
+            try:
+                gate.wait(_WAIT)
+            except threading.BrokenBarrierError:
+                pass  # too few arrived; the peak assertion reports it
+        if srv.hold is not None:
+            srv.hold.wait(_WAIT)
+        time.sleep(_LATENCY)
+        prompt = body["messages"][-1]["content"]
+        found = [
+            {"text": name, "type": "PERSON", "reason": "name"}
+            for name in ("John Smith", "Marie Curie")
+            if name in prompt
+        ]
+        out = json.dumps({"choices": [{"message": {"content": json.dumps(found)}}]}).encode()
+        # Leave before answering: the client frees its slot only after
+        # reading the response, so the count never outlives the request.
+        with srv.lock:
+            srv.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub():
+    server = _StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def engine(stub):
+    eng = RemoteLLMEngine()
+    eng.configure(stub.url, "sk-test", "stub-model", timeout=10)
+    return eng
+
+
+def _generate_from_threads(engine: RemoteLLMEngine, n: int) -> list[str]:
+    results: list[str] = [""] * n
+
+    def call(i: int) -> None:
+        results[i] = engine.generate(user_prompt=f"hello John Smith {i}")
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def _long_text() -> str:
+    parts = []
+    for i in range(8):
+        name = "John Smith" if i % 2 else "Marie Curie"
+        parts.append(f"Section {i}: the report was reviewed by {name} on site. " + "Lorem ipsum dolor. " * 45)
+    return "\n".join(parts)
+
+
+class TestRemoteConcurrency:
+    def test_requests_overlap_up_to_limit(self, monkeypatch, stub, engine):
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 3)
+        stub.expect_overlap(3)
+        results = _generate_from_threads(engine, 8)
+        assert all("John Smith" in r for r in results)
+        assert stub.requests == 8
+        assert stub.peak == 3
+
+    def test_limit_one_is_serial(self, monkeypatch, stub, engine):
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 1)
+        _generate_from_threads(engine, 4)
+        assert stub.peak == 1
+
+    def test_limit_change_takes_effect(self, monkeypatch, stub, engine):
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 1)
+        _generate_from_threads(engine, 3)
+        assert stub.peak == 1
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 4)
+        assert engine.max_concurrency == 4
+        stub.expect_overlap(4)
+        _generate_from_threads(engine, 4)
+        assert stub.peak == 4
+
+    def test_unconfigured_engine_raises(self):
+        with pytest.raises(RuntimeError):
+            RemoteLLMEngine().generate(user_prompt="x")
+
+
+class TestRemoteReconfigure:
+    def test_reconfigure_during_requests(self, monkeypatch, stub, engine):
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 4)
+        stub.hold = threading.Event()
+        old_client = engine._client
+        results: list[str] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(engine.generate(user_prompt="John Smith")))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        stub.wait_in_flight(4)
+
+        engine.configure(stub.url, "sk-other", "stub-model", timeout=10)
+        assert engine._client is not old_client
+        assert not old_client.is_closed          # still carrying four requests
+
+        stub.hold.set()
+        for t in threads:
+            t.join()
+        assert len(results) == 4 and all("John Smith" in r for r in results)
+        assert old_client.is_closed              # closed after the last one
+        assert engine.generate(user_prompt="John Smith")
+        assert stub.keys == ["Bearer sk-test"] * 4 + ["Bearer sk-other"]
+        assert not engine._client.is_closed
+
+    def test_idle_client_closed_at_once(self, stub, engine):
+        old_client = engine._client
+        engine.configure(stub.url, "sk-other", "stub-model", timeout=10)
+        assert old_client.is_closed
+
+
+class TestDetectLLMRemote:
+    def test_chunks_sent_together_same_result(self, monkeypatch, stub, engine):
+        text = _long_text()
+
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 1)
+        serial = detect_llm(text, engine)
+        n_chunks = stub.requests
+        assert n_chunks > 3 and stub.peak == 1
+
+        monkeypatch.setattr(config, "llm_api_max_concurrency", n_chunks)
+        stub.expect_overlap(n_chunks)
+        concurrent = detect_llm(text, engine)
+
+        assert stub.requests == 2 * n_chunks
+        assert stub.peak == n_chunks
+        assert concurrent == serial
+        assert {m.text for m in serial} == {"John Smith", "Marie Curie"}
+
+    def test_pages_share_one_executor(self, monkeypatch, stub, engine):
+        monkeypatch.setattr(config, "llm_api_max_concurrency", 4)
+        detect_llm(_long_text(), engine)
+        pool = llm_detector._CHUNK_EXECUTOR
+        assert pool is not None
+        detect_llm(_long_text(), engine)
+        assert llm_detector._CHUNK_EXECUTOR is pool
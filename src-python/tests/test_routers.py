@@ -226,6 +226,70 @@ class TestDetection:
         )
         assert resp.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_redetect_does_not_take_config_lock(self, client: AsyncClient, monkeypatch):
+        """Redetect uses a settings snapshot, so a held config lock doesn't block it."""
+        from core.config import config
+        from models.schemas import BBox, DocumentInfo, PageData, TextBlock
+
+        words = "Reach Jane at jane.doe@example.com or 555-123-4567 today please".split()
+        blocks, x = [], 50.0
+        for w in words:
+            blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+            x += 6 * len(w) + 4
+        doc = DocumentInfo(
+            doc_id="redetect-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=1,
+            pages=[PageData(page_number=1, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=" ".join(words))],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr(config, "llm_detection_enabled", False)
+        threshold_before = config.confidence_threshold
+
+        assert deps.acquire_config_lock("other")
+        try:
+            resp = await client.post(
+                f"/api/documents/{doc.doc_id}/redetect",
+                json={"confidence_threshold": 0.9, "ner_enabled": False},
+            )
+        finally:
+            deps.release_config_lock()
+        assert resp.status_code == 200
+        assert any(r["pii_type"] == "EMAIL" for r in resp.json()["regions"])
+        assert config.confidence_threshold == threshold_before
+
+    @pytest.mark.asyncio
+    async def test_redetect_blacklist_exact_and_fuzzy(self, client: AsyncClient, monkeypatch):
+        from core.config import config
+        from models.schemas import BBox, DocumentInfo, PageData, TextBlock
+
+        words = "Paid Zoë Ångström then Zoe Angstrem and Ångström Ltd today".split()
+        blocks, x = [], 50.0
+        for w in words:
+            blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+            x += 6 * len(w) + 4
+        doc = DocumentInfo(
+            doc_id="redetect-blacklist-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=1,
+            pages=[PageData(page_number=1, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=" ".join(words))],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr(config, "llm_detection_enabled", False)
+
+        async def _blacklisted(fuzziness: float) -> list[str]:
+            resp = await client.post(
+                f"/api/documents/{doc.doc_id}/redetect",
+                json={"ner_enabled": False, "blacklist_terms": ["zoe angstrom", "Angstrom Ltd"],
+                      "blacklist_fuzziness": fuzziness},
+            )
+            assert resp.status_code == 200
+            return [r["text"] for r in resp.json()["regions"] if r["source"] == "MANUAL"]
+
+        assert await _blacklisted(1.0) == ["Zoë Ångström", "Ångström Ltd"]
+        assert await _blacklisted(0.9) == ["Zoë Ångström", "Zoe Angstrem", "Ångström Ltd"]
+
     @pytest.mark.asyncio
     async def test_reset_detection_missing_doc(self, client: AsyncClient):
         resp = await client.post("/api/documents/no-doc/reset-detection")
@@ -258,6 +322,166 @@ class TestRegions:
         resp = await client.get("/api/documents/no-doc/debug-detections")
         assert resp.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_blacklist_offsets(self, client: AsyncClient, monkeypatch):
+        """Blacklist terms match accent- and case-insensitively, overlaps included."""
+        from models.schemas import BBox, DocumentInfo, PageData, TextBlock
+
+        words = "Invoice for Zoë Ångström and ZOE ANGSTROM via Angstrom Ltd".split()
+        blocks, x = [], 50.0
+        for w in words:
+            blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+            x += 6 * len(w) + 4
+        full_text = " ".join(words)
+        doc = DocumentInfo(
+            doc_id="blacklist-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=1,
+            pages=[PageData(page_number=1, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=full_text)],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr("api.routers.regions.save_doc", lambda _doc: None)
+
+        resp = await client.post(
+            f"/api/documents/{doc.doc_id}/regions/blacklist",
+            json={"terms": ["zoe angstrom", "Angstrom Ltd", "ZOE ANGSTROM"]},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 3
+        spans = [(r["char_start"], r["char_end"], r["text"]) for r in resp.json()["regions"]]
+        first = full_text.index("Zoë")
+        second = full_text.index("ZOE")
+        ltd = full_text.index("Angstrom Ltd")
+        assert spans == [
+            (first, first + 12, "Zoë Ångström"),
+            (second, second + 12, "ZOE ANGSTROM"),
+            (ltd, ltd + 12, "Angstrom Ltd"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_blacklist_accented_term_folds_like_page_text(self, client: AsyncClient, monkeypatch):
+        """Upper-case accented terms fold with the same helper as the page text."""
+        from models.schemas import BBox, DocumentInfo, PageData, TextBlock
+
+        words = "Payee zoe angstrom".split()
+        blocks, x = [], 50.0
+        for w in words:
+            blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+            x += 6 * len(w) + 4
+        full_text = " ".join(words)
+        doc = DocumentInfo(
+            doc_id="blacklist-fold-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=1,
+            pages=[PageData(page_number=1, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=full_text)],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr("api.routers.regions.save_doc", lambda _doc: None)
+
+        resp = await client.post(
+            f"/api/documents/{doc.doc_id}/regions/blacklist",
+            json={"terms": ["ZOË ÅNGSTRÖM"]},
+        )
+        assert resp.status_code == 200
+        assert [r["text"] for r in resp.json()["regions"]] == ["zoe angstrom"]
+
+    @pytest.mark.asyncio
+    async def test_highlight_all_skips_covered_and_cancels_partials(self, client: AsyncClient, monkeypatch):
+        """Each line gets one region: covered occurrences are skipped and
+        contained partial detections are cancelled."""
+        from models.schemas import (
+            BBox, DetectionSource, DocumentInfo, PageData, PIIRegion, PIIType, RegionAction, TextBlock,
+        )
+
+        lines = ["Club Nautique Gaspé", "signed Club Nautique Gaspé", "Club Nautique Gaspé again"]
+        blocks, parts = [], []
+        for li, line in enumerate(lines):
+            x = 50.0
+            for w in line.split():
+                blocks.append(TextBlock(
+                    text=w, bbox=BBox(x0=x, y0=50 + 20 * li, x1=x + 6 * len(w), y1=62 + 20 * li),
+                ))
+                x += 6 * len(w) + 4
+            parts.append(line)
+        full_text = "\n".join(parts)
+
+        def region(text: str, line: int, source=DetectionSource.NER, conf=0.8):
+            start = full_text.index(text, full_text.index(lines[line]))
+            hits = [b for b in blocks if 50 + 20 * line == b.bbox.y0 and b.text in text.split()]
+            return PIIRegion(
+                page_number=1,
+                bbox=BBox(x0=min(b.bbox.x0 for b in hits), y0=hits[0].bbox.y0,
+                          x1=max(b.bbox.x1 for b in hits), y1=hits[0].bbox.y1),
+                text=text, pii_type=PIIType.ORG, confidence=conf, source=source,
+                char_start=start, char_end=start + len(text),
+            )
+
+        source = region("Club Nautique Gaspé", 0, DetectionSource.MANUAL, 1.0)
+        partial = region("Nautique Gaspé", 1)
+        doc = DocumentInfo(
+            doc_id="highlight-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=1,
+            pages=[PageData(page_number=1, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=full_text)],
+            regions=[source, partial],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr("api.routers.regions.save_doc", lambda _doc: None)
+
+        resp = await client.post(
+            f"/api/documents/{doc.doc_id}/regions/highlight-all",
+            json={"region_id": source.id},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["created"] == 2
+        assert body["cancelled_ids"] == [partial.id]
+        assert partial.action == RegionAction.CANCEL
+        live = [r for r in doc.regions if r.action != RegionAction.CANCEL]
+        assert sorted(r.bbox.y0 for r in live) == [50, 70, 90]
+
+    @pytest.mark.asyncio
+    async def test_highlight_all_fuzzy_finds_ocr_variant(self, client: AsyncClient, monkeypatch):
+        """A page without an exact occurrence falls back to the fuzzy
+        window search; unrelated pages yield nothing."""
+        from models.schemas import (
+            BBox, DetectionSource, DocumentInfo, PageData, PIIRegion, PIIType, TextBlock,
+        )
+
+        def page(pn: int, words: list[str]) -> PageData:
+            blocks, x = [], 50.0
+            for w in words:
+                blocks.append(TextBlock(text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62)))
+                x += 6 * len(w) + 4
+            return PageData(page_number=pn, width=612, height=792, bitmap_path="/tmp/p.png",
+                            text_blocks=blocks, full_text=" ".join(words))
+
+        pages = [
+            page(1, ["signed", "Montgomery", "Baxter"]),
+            page(2, ["by", "Montgomerv", "Baxler", "today"]),
+            page(3, ["nothing", "to", "see", "here"]),
+        ]
+        source = PIIRegion(
+            page_number=1, bbox=BBox(x0=90, y0=50, x1=186, y1=62), text="Montgomery Baxter",
+            pii_type=PIIType.PERSON, confidence=1.0, source=DetectionSource.MANUAL,
+            char_start=7, char_end=24,
+        )
+        doc = DocumentInfo(
+            doc_id="fuzzy-doc", original_filename="t.pdf", file_path="/tmp/t.pdf",
+            page_count=3, pages=pages, regions=[source],
+        )
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+        monkeypatch.setattr("api.routers.regions.save_doc", lambda _doc: None)
+
+        resp = await client.post(
+            f"/api/documents/{doc.doc_id}/regions/highlight-all",
+            json={"region_id": source.id},
+        )
+        assert resp.status_code == 200
+        [new] = resp.json()["new_regions"]
+        assert new["page_number"] == 2
+        assert "Montgomerv Bax" in new["text"]
+
 
 # ───────────────────────── Anonymize ─────────────────────────
 
@@ -0,0 +1,176 @@
+"""Tests for the process-wide detection scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+from core.detection.scheduler import DetectionScheduler
+from models.schemas import BBox, DocumentInfo, PageData, TextBlock
+
+
+@pytest.fixture
+def scheduler():
+    s = DetectionScheduler(max_workers=1)
+    yield s
+    s.shutdown()
+
+
+def _gate(scheduler: DetectionScheduler) -> threading.Event:
+    """Occupy the single worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def _block():
+        started.set()
+        release.wait(5)
+
+    scheduler.submit("gate", _block)
+    assert started.wait(5)
+    return release
+
+
+class TestDetectionScheduler:
+    def test_returns_results_and_exceptions(self, scheduler):
+        ok = scheduler.submit("doc", lambda: 42)
+        assert ok.result(timeout=5) == 42
+
+        def boom():
+            raise ValueError("bad page")
+
+        failed = scheduler.submit("doc", boom)
+        with pytest.raises(ValueError, match="bad page"):
+            failed.result(timeout=5)
+
+    def test_round_robin_between_documents(self, scheduler):
+        order: list[str] = []
+        release = _gate(scheduler)
+
+        futures = [scheduler.submit("big", lambda i=i: order.append(f"big{i}")) for i in range(4)]
+        futures += [scheduler.submit("small", lambda i=i: order.append(f"small{i}")) for i in range(2)]
+        release.set()
+        for f in futures:
+            f.result(timeout=5)
+
+        # The small document is interleaved instead of waiting behind all
+        # four pages of the big one.
+        assert order == ["big0", "small0", "big1", "small1", "big2", "big3"]
+
+    def test_interactive_runs_before_bulk(self, scheduler):
+        order: list[str] = []
+        release = _gate(scheduler)
+
+        bulk = [scheduler.submit("bulk", lambda i=i: order.append(f"bulk{i}")) for i in range(3)]
+        interactive = scheduler.submit("doc", lambda: order.append("reanalyze"), interactive=True)
+        assert scheduler.stats()["queued_interactive"] == 1
+        release.set()
+        for f in bulk + [interactive]:
+            f.result(timeout=5)
+
+        assert order[0] == "reanalyze"
+
+    def test_cancelled_tasks_are_skipped(self, scheduler):
+        ran: list[int] = []
+        release = _gate(scheduler)
+        f1 = scheduler.submit("doc", lambda: ran.append(1))
+        f2 = scheduler.submit("doc", lambda: ran.append(2))
+        assert f1.cancel()
+        release.set()
+        f2.result(timeout=5)
+        assert ran == [2]
+        assert scheduler.pending() == 0
+
+    def test_concurrency_is_bounded(self):
+        s = DetectionScheduler(max_workers=3)
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def _task():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+
+        try:
+            futures = [s.submit(f"doc{i % 5}", _task) for i in range(30)]
+            for f in futures:
+                f.result(timeout=10)
+            assert peak <= 3
+            assert s.stats()["workers"] <= 3
+        finally:
+            s.shutdown()
+
+    def test_submit_after_shutdown_raises(self):
+        s = DetectionScheduler(max_workers=1)
+        s.shutdown()
+        with pytest.raises(RuntimeError):
+            s.submit("doc", lambda: None)
+
+    def test_invalid_worker_count(self):
+        with pytest.raises(ValueError):
+            DetectionScheduler(max_workers=0)
+
+
+# ---------------------------------------------------------------------------
+# /detect goes through the shared scheduler and keeps reporting progress
+# ---------------------------------------------------------------------------
+
+@pytest_asyncio.fixture
+async def client():
+    from api.server import app
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url="http://test",
+        headers={"X-Requested-With": "XMLHttpRequest"},
+    ) as ac:
+        yield ac
+
+
+def _make_doc(doc_id: str, n_pages: int) -> DocumentInfo:
+    pages = []
+    for i in range(n_pages):
+        words = f"Contact page{i} at person{i}@example.com or 555-123-45{i:02d} today".split()
+        blocks = []
+        x = 50.0
+        for wi, w in enumerate(words):
+            blocks.append(TextBlock(
+                text=w, bbox=BBox(x0=x, y0=50, x1=x + 6 * len(w), y1=62), word_index=wi,
+            ))
+            x += 6 * len(w) + 4
+        pages.append(PageData(
+            page_number=i + 1, width=612, height=792, bitmap_path="/tmp/p.png",
+            text_blocks=blocks, full_text=" ".join(words),
+        ))
+    return DocumentInfo(
+        doc_id=doc_id, original_filename="t.pdf", file_path="/tmp/t.pdf",
+        page_count=n_pages, pages=pages,
+    )
+
+
+class TestDetectEndpointScheduling:
+    @pytest.mark.asyncio
+    async def test_detect_reports_progress_through_scheduler(self, client, monkeypatch):
+        from api import deps
+        from core.config import config
+
+        monkeypatch.setattr(config, "llm_detection_enabled", False)
+        doc = _make_doc("sched-doc", 3)
+        monkeypatch.setitem(deps.documents, doc.doc_id, doc)
+
+        resp = await client.post(f"/api/documents/{doc.doc_id}/detect")
+        assert resp.status_code == 200
+        assert any(r["pii_type"] == "EMAIL" for r in resp.json()["regions"])
+
+        progress = deps.detection_progress[doc.doc_id]
+        assert progress["status"] == "complete"
+        assert progress["pages_done"] == 3
+        assert [p["status"] for p in progress["page_statuses"]] == ["done"] * 3
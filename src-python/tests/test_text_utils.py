@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from core.text_utils import (
+    accent_fold_with_map,
     strip_accents,
     remove_accents,
     ws_collapse,
@@ -77,6 +78,31 @@ class TestRemoveAccents:
         assert remove_accents("") == ""
 
 
+# ---------------------------------------------------------------------------
+# accent_fold_with_map
+# ---------------------------------------------------------------------------
+
+class TestAccentFoldWithMap:
+    def test_folds_and_maps_back(self):
+        text = "Zoë Ångström"
+        folded, n2o = accent_fold_with_map(text)
+        assert folded == "zoe angstrom"
+        assert len(n2o) == len(folded) + 1
+        assert n2o[-1] == len(text)
+        i = folded.index("angstrom")
+        assert text[n2o[i]:n2o[i + len("angstrom")]] == "Ångström"
+
+    def test_quotes_option(self):
+        text = "L\u2019Esprit \u201cSA\u201d"
+        assert accent_fold_with_map(text)[0] == "l\u2019esprit \u201csa\u201d"
+        folded, n2o = accent_fold_with_map(text, quotes=True)
+        assert folded == "l'esprit \"sa\""
+        assert len(n2o) == len(text) + 1
+
+    def test_empty(self):
+        assert accent_fold_with_map("") == ("", [0])
+
+
 # ---------------------------------------------------------------------------
 # ws_collapse
 # ---------------------------------------------------------------------------